@@ -11,7 +11,7 @@ from courier.domain.exceptions import (
     TokenExpiredError,
     TokenInvalidError,
 )
-from courier.domain.value_objects import ChannelName
+from courier.domain.value_objects import ChannelName, ChannelPattern
 from courier.infrastructure.auth import JWTVerifier
 
 
@@ -60,9 +60,30 @@ class AuthenticateWebSocketUseCase:
                 raise TokenExpiredError(str(e))
             raise TokenInvalidError(str(e))
 
+        self.authorize_channel(payload, channel_name)
+
+        return payload
+
+    def authorize_channel(self, payload: TokenPayload, channel_name: str) -> None:
+        """
+        Check an authenticated connection may access a channel.
+
+        Used on connect and for every later subscribe on the connection.
+
+        Args:
+            payload: Verified token payload of the connection
+            channel_name: Channel (or ChannelPattern) to access
+
+        Raises:
+            AuthenticationError: If channel name is invalid
+            AuthorizationError: If user not authorized for channel
+        """
         # Validate channel name
         try:
-            ChannelName(channel_name)
+            if ChannelPattern.is_pattern(channel_name):
+                ChannelPattern(channel_name)
+            else:
+                ChannelName(channel_name)
         except ValueError as e:
             raise AuthenticationError(f"Invalid channel name: {e}")
 
@@ -73,5 +94,3 @@ class AuthenticateWebSocketUseCase:
                 user_id=payload.user_id,
                 resource=channel_name,
             )
-
-        return payload
@@ -2,9 +2,10 @@
 Use case for broadcasting messages to channels.
 """
 
-from typing import Any, Dict, List
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
 
-from fastapi import WebSocket
+from fastapi import WebSocket, status
 
 from courier.domain.value_objects import ChannelName, Message
 
@@ -14,8 +15,39 @@ class BroadcastMessageUseCase:
     Use case for broadcasting messages to channel subscribers.
 
     Handles message validation and delivery to all connected clients.
+    The payload is serialized once. With an enqueue function (per-client
+    outbound queues) it is handed to every subscriber's queue without
+    waiting; otherwise it is written to every subscriber concurrently, so
+    a slow client only delays its own delivery, and subscribers whose
+    send fails or exceeds the timeout are evicted.
     """
 
+    def __init__(
+        self,
+        send_timeout: float = 5.0,
+        on_dead_client: Optional[Callable[[WebSocket, str], None]] = None,
+        enqueue: Optional[Callable[[WebSocket, str, str], bool]] = None,
+    ):
+        """
+        Initialize use case.
+
+        Args:
+            send_timeout: Seconds a subscriber may take to accept the message
+            on_dead_client: Called with (websocket, channel_name) for each
+                subscriber that failed or timed out; should drop the whole
+                connection, e.g. ConnectionManager.disconnect (remove_client
+                leaves pattern subscriptions that matched the channel)
+            enqueue: Called with (websocket, payload, message_type) to queue
+                the message instead of sending it, e.g.
+                ConnectionManager.enqueue; returns whether it was queued
+        """
+        if send_timeout <= 0:
+            raise ValueError("send_timeout must be positive")
+
+        self.send_timeout = send_timeout
+        self.on_dead_client = on_dead_client
+        self.enqueue = enqueue
+
     async def execute(
         self,
         channel_name: str,
@@ -31,7 +63,7 @@ class BroadcastMessageUseCase:
             subscribers: List of WebSocket connections
 
         Returns:
-            Number of clients that received the message
+            Number of clients that received (or queued) the message
 
         Raises:
             ValueError: If channel name or message data is invalid
@@ -39,19 +71,75 @@ class BroadcastMessageUseCase:
         # Validate channel name
         ChannelName(channel_name)
 
-        # Validate and create message
+        # Validate, create and serialize message (once for all subscribers)
         message = Message(message_data)
+        payload = message.to_json()
+
+        if not subscribers:
+            return 0
+
+        if self.enqueue is not None:
+            message_type = message.get_type()
+            return sum(
+                1 for ws in list(subscribers) if self.enqueue(ws, payload, message_type)
+            )
+
+        # Snapshot: eviction below mutates the manager's subscriber list
+        targets = list(subscribers)
+        sends = [asyncio.ensure_future(self._send(ws, payload)) for ws in targets]
+        _, pending = await asyncio.wait(sends, timeout=self.send_timeout)
+
+        for send in pending:
+            send.cancel()
 
-        # Broadcast to all subscribers
         sent_count = 0
         dead_clients = []
+        slow_clients = []
 
-        for ws in subscribers:
-            try:
-                await ws.send_json(message.data)
-                sent_count += 1
-            except Exception:
-                # Track dead connections for cleanup
+        for ws, send in zip(targets, sends):
+            if send in pending:
+                slow_clients.append(ws)
+            elif send.exception() is not None:
                 dead_clients.append(ws)
+            else:
+                sent_count += 1
+
+        if dead_clients or slow_clients:
+            await self._evict(channel_name, dead_clients, slow_clients)
 
         return sent_count
+
+    @staticmethod
+    async def _send(ws: WebSocket, payload: str) -> None:
+        """Send one frame; errors stay in the task, per subscriber."""
+        await ws.send_text(payload)
+
+    async def _evict(
+        self,
+        channel_name: str,
+        dead_clients: List[WebSocket],
+        slow_clients: List[WebSocket],
+    ) -> None:
+        """
+        Remove failed subscribers and close the ones that timed out.
+
+        A cancelled send may have left a partial frame on the socket, so
+        slow clients are closed rather than kept subscribed.
+        """
+        if self.on_dead_client:
+            for ws in dead_clients + slow_clients:
+                self.on_dead_client(ws, channel_name)
+
+        if slow_clients:
+            closes = [asyncio.ensure_future(self._close(ws)) for ws in slow_clients]
+            _, pending = await asyncio.wait(closes, timeout=self.send_timeout)
+            for close in pending:
+                close.cancel()
+
+    @staticmethod
+    async def _close(ws: WebSocket) -> None:
+        """Close a slow subscriber, ignoring already-broken connections."""
+        try:
+            await ws.close(code=status.WS_1008_POLICY_VIOLATION, reason="Send timeout")
+        except Exception:
+            pass
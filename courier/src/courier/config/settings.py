@@ -91,6 +91,37 @@ class Settings(BaseSettings):
         ge=0,
         description="Max connections per user (0 = unlimited)",
     )
+    max_subscriptions_per_connection: int = Field(
+        default=50,
+        ge=0,
+        description="Max channels one connection may subscribe to (0 = unlimited)",
+    )
+
+    broadcast_send_timeout: float = Field(
+        default=5.0,
+        gt=0,
+        le=60,
+        description="Seconds a subscriber may take to accept a broadcast "
+        "(or a queued message) before it is disconnected",
+    )
+
+    outbound_queue_size: int = Field(
+        default=256,
+        ge=0,
+        le=100_000,
+        description="Messages buffered per connection (0 = send inline)",
+    )
+    outbound_overflow_policies: Dict[str, str] = Field(
+        default_factory=lambda: {
+            "backtest.progress": "drop_oldest",
+            "prophet.message_chunk": "drop_oldest",
+        },
+        description="Overflow policy per message type (drop_oldest or disconnect)",
+    )
+    outbound_default_overflow_policy: str = Field(
+        default="disconnect",
+        description="Overflow policy for message types not listed above",
+    )
 
     # JWT Authentication
     jwt_secret: Optional[str] = Field(
@@ -228,6 +259,27 @@ class Settings(BaseSettings):
         description="Trace sampling rate (0.0-1.0)",
     )
 
+    @field_validator("outbound_default_overflow_policy")
+    @classmethod
+    def validate_overflow_policy(cls, v: str) -> str:
+        """Validate default overflow policy."""
+        allowed = ["drop_oldest", "disconnect"]
+        if v not in allowed:
+            raise ValueError(f"Invalid overflow policy. Must be one of: {allowed}")
+        return v
+
+    @field_validator("outbound_overflow_policies")
+    @classmethod
+    def validate_overflow_policies(cls, v: Dict[str, str]) -> Dict[str, str]:
+        """Validate per-type overflow policies."""
+        allowed = ["drop_oldest", "disconnect"]
+        invalid = {t: p for t, p in v.items() if p not in allowed}
+        if invalid:
+            raise ValueError(
+                f"Invalid overflow policies {invalid}. Must be one of: {allowed}"
+            )
+        return v
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
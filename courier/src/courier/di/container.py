@@ -80,6 +80,15 @@ class Container:
                 max_connections_per_user=self.settings.max_connections_per_user,
                 max_clients_per_channel=self.settings.max_clients_per_channel,
                 reporter=self.reporter,
+                max_subscriptions_per_connection=(
+                    self.settings.max_subscriptions_per_connection
+                ),
+                outbound_queue_size=self.settings.outbound_queue_size,
+                overflow_policies=self.settings.outbound_overflow_policies,
+                default_overflow_policy=(
+                    self.settings.outbound_default_overflow_policy
+                ),
+                send_timeout=self.settings.broadcast_send_timeout,
             )
         return self._connection_manager
 
@@ -184,12 +193,19 @@ class Container:
 
     def get_broadcast_use_case(self) -> BroadcastMessageUseCase:
         """
-        Get BroadcastMessageUseCase.
+        Get BroadcastMessageUseCase that evicts dead subscribers.
+
+        Delivers through per-connection outbound queues when enabled.
 
         Returns:
             Use case instance
         """
-        return BroadcastMessageUseCase()
+        manager = self.connection_manager
+        return BroadcastMessageUseCase(
+            send_timeout=self.settings.broadcast_send_timeout,
+            on_dead_client=lambda ws, channel: manager.disconnect(ws),
+            enqueue=manager.enqueue if manager.outbound_queue_size > 0 else None,
+        )
 
     def get_manage_channel_use_case(self) -> ManageChannelUseCase:
         """
@@ -3,6 +3,7 @@ Domain value objects for Courier.
 """
 
 from courier.domain.value_objects.channel_name import ChannelName
+from courier.domain.value_objects.channel_pattern import ChannelPattern
 from courier.domain.value_objects.message import Message
 
-__all__ = ["ChannelName", "Message"]
+__all__ = ["ChannelName", "ChannelPattern", "Message"]
@@ -0,0 +1,111 @@
+"""
+ChannelPattern value object - immutable wildcard channel pattern.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import ClassVar, Tuple
+
+from courier.domain.value_objects.channel_name import ChannelName
+
+
+@dataclass(frozen=True)
+class ChannelPattern:
+    """
+    Value object representing a validated channel subscription pattern.
+
+    Pattern rules:
+    - Dot-separated segments, like channel names
+    - "*" matches exactly one segment
+    - "#" matches zero or more segments (last segment only)
+    - At least one wildcard (exact names are ChannelName)
+
+    Examples:
+        - forge.job.*     (forge.job.abc, not forge.job.abc.logs)
+        - user.123.#      (user.123, user.123.orders, user.123.orders.filled)
+        - backtest.*.progress
+    """
+
+    pattern: str
+
+    SEGMENT: ClassVar[re.Pattern] = re.compile(r"^[a-z0-9\-]+$")
+    MAX_LENGTH: ClassVar[int] = ChannelName.MAX_LENGTH
+    ONE: ClassVar[str] = "*"
+    REST: ClassVar[str] = "#"
+
+    def __post_init__(self):
+        """Validate pattern on creation."""
+        if not self.pattern:
+            raise ValueError("Channel pattern cannot be empty")
+
+        if len(self.pattern) > self.MAX_LENGTH:
+            raise ValueError(
+                f"Channel pattern too long (max {self.MAX_LENGTH} characters)"
+            )
+
+        segments = self.pattern.split(".")
+        for index, segment in enumerate(segments):
+            if segment == self.REST and index != len(segments) - 1:
+                raise ValueError("'#' is only allowed as the last segment")
+            if segment not in (self.ONE, self.REST) and not self.SEGMENT.match(segment):
+                raise ValueError(
+                    "Pattern segments must be '*', '#' or lowercase letters, "
+                    "numbers and hyphens"
+                )
+
+        if not self.is_pattern(self.pattern):
+            raise ValueError("Channel pattern must contain '*' or '#'")
+
+    @staticmethod
+    def is_pattern(name: str) -> bool:
+        """Check if a subscription name is a pattern rather than a channel."""
+        return "*" in name or "#" in name
+
+    @property
+    def value(self) -> str:
+        """Get pattern value."""
+        return self.pattern
+
+    @property
+    def segments(self) -> Tuple[str, ...]:
+        """Get pattern segments."""
+        return tuple(self.pattern.split("."))
+
+    @property
+    def literal_prefix(self) -> str:
+        """Get the segments before the first wildcard ('' if none)."""
+        prefix = []
+        for segment in self.segments:
+            if segment in (self.ONE, self.REST):
+                break
+            prefix.append(segment)
+        return ".".join(prefix)
+
+    def matches(self, channel_name: str) -> bool:
+        """
+        Check if a channel name matches this pattern.
+
+        Args:
+            channel_name: Exact channel name
+
+        Returns:
+            True if the pattern matches the channel
+        """
+        segments = self.segments
+        parts = channel_name.split(".")
+        for index, segment in enumerate(segments):
+            if segment == self.REST:
+                return True
+            if index >= len(parts):
+                return False
+            if segment != self.ONE and segment != parts[index]:
+                return False
+        return len(parts) == len(segments)
+
+    def __str__(self) -> str:
+        """String representation."""
+        return self.pattern
+
+    def __repr__(self) -> str:
+        """Detailed representation."""
+        return f"ChannelPattern({self.pattern!r})"
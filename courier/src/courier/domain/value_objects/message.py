@@ -2,9 +2,10 @@
 Message value object - immutable message with validation.
 """
 
+import json
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 class Message:
@@ -38,6 +39,7 @@ class Message:
         # Deep copy to protect from external modifications after creation
         self._data = deepcopy(data)
         self._timestamp = timestamp or datetime.utcnow()
+        self._json: Optional[str] = None
 
     @property
     def data(self) -> Dict[str, Any]:
@@ -55,6 +57,25 @@ class Message:
         """Get message timestamp."""
         return self._timestamp
 
+    def to_json(self) -> str:
+        """
+        Get message data as compact JSON text (encoded once, then cached).
+
+        Same encoding as WebSocket.send_json(), so broadcasting the
+        result with send_text() delivers identical frames.
+
+        Raises:
+            ValueError: If data is not JSON serializable
+        """
+        if self._json is None:
+            try:
+                self._json = json.dumps(
+                    self._data, ensure_ascii=False, separators=(",", ":")
+                )
+            except TypeError as e:
+                raise ValueError(f"Message data is not JSON serializable: {e}") from e
+        return self._json
+
     def get_type(self) -> str:
         """
         Get message type.
@@ -7,6 +7,7 @@ Handles JWT token validation and channel access authorization.
 import jwt
 
 from courier.domain.auth import TokenPayload
+from courier.domain.value_objects import ChannelPattern
 
 
 class JWTVerifier:
@@ -64,14 +65,27 @@ class JWTVerifier:
         - backtest.{id}: Ephemeral, allow access
         - forge.job.{id}: Ephemeral, allow access
         - Public channels: Allow access
+        - Patterns (see ChannelPattern): wildcards only below a namespace
+          the user may read entirely: strategy., backtest., forge.job.
+          and user.{user_id}.
 
         Args:
             user_id: User ID from JWT token
-            channel: Channel name to access
+            channel: Channel name (or pattern) to access
 
         Returns:
             True if authorized, False otherwise
         """
+        # Pattern - every channel it can match must be readable
+        if ChannelPattern.is_pattern(channel):
+            try:
+                prefix = ChannelPattern(channel).literal_prefix + "."
+            except ValueError:
+                return False
+            return prefix.startswith(
+                ("strategy.", "backtest.", "forge.job.", f"user.{user_id}.")
+            )
+
         # Global channel - everyone can read
         if channel == "global":
             return True
@@ -2,9 +2,20 @@
 WebSocket infrastructure for Courier.
 """
 
+from courier.infrastructure.websocket.channel_trie import ChannelTrie
 from courier.infrastructure.websocket.connection_manager import (
     ConnectionLimitExceeded,
     ConnectionManager,
 )
+from courier.infrastructure.websocket.outbound_queue import (
+    OutboundQueue,
+    OutboundQueueFull,
+)
 
-__all__ = ["ConnectionManager", "ConnectionLimitExceeded"]
+__all__ = [
+    "ChannelTrie",
+    "ConnectionManager",
+    "ConnectionLimitExceeded",
+    "OutboundQueue",
+    "OutboundQueueFull",
+]
@@ -0,0 +1,147 @@
+"""
+Segment trie routing channel names to wildcard pattern subscribers.
+
+Patterns are stored one node per dot-separated segment, so resolving a
+published channel walks the trie along the channel's segments (plus the
+"*" and "#" branches) instead of testing every registered pattern.
+"""
+
+from typing import Dict, List
+
+from fastapi import WebSocket
+
+from courier.domain.value_objects import ChannelPattern
+
+_ONE = ChannelPattern.ONE
+_REST = ChannelPattern.REST
+
+
+class _Node:
+    """Trie node: child per segment, subscribers of patterns ending here."""
+
+    __slots__ = ("children", "subscribers")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.subscribers: Dict[int, WebSocket] = {}
+
+
+class ChannelTrie:
+    """
+    Pattern subscriptions indexed by segment.
+
+    match() costs O(depth x wildcard branches), independent of how many
+    patterns are registered. A connection subscribed through several
+    matching patterns is returned once.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._patterns = 0
+
+    def __len__(self) -> int:
+        """Number of patterns with at least one subscriber."""
+        return self._patterns
+
+    def add(self, pattern: str, websocket: WebSocket) -> bool:
+        """
+        Subscribe a connection to a pattern.
+
+        Args:
+            pattern: Validated channel pattern
+            websocket: Subscriber connection
+
+        Returns:
+            True if added, False if already subscribed
+        """
+        node = self._root
+        for segment in pattern.split("."):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+
+        ws_id = id(websocket)
+        if ws_id in node.subscribers:
+            return False
+        if not node.subscribers:
+            self._patterns += 1
+        node.subscribers[ws_id] = websocket
+        return True
+
+    def remove(self, pattern: str, websocket: WebSocket) -> bool:
+        """
+        Unsubscribe a connection from a pattern, pruning empty nodes.
+
+        Returns:
+            True if the connection was subscribed to the pattern
+        """
+        path = [self._root]
+        segments = pattern.split(".")
+        for segment in segments:
+            child = path[-1].children.get(segment)
+            if child is None:
+                return False
+            path.append(child)
+
+        node = path[-1]
+        if node.subscribers.pop(id(websocket), None) is None:
+            return False
+        if not node.subscribers:
+            self._patterns -= 1
+
+        # Prune the branch back to the first node still in use
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.subscribers or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+        return True
+
+    def subscriber_count(self, pattern: str) -> int:
+        """Get number of connections subscribed to a pattern."""
+        node = self._root
+        for segment in pattern.split("."):
+            node = node.children.get(segment)
+            if node is None:
+                return 0
+        return len(node.subscribers)
+
+    def match(self, channel_name: str) -> Dict[int, WebSocket]:
+        """
+        Find connections with a pattern matching a channel.
+
+        Args:
+            channel_name: Exact channel name
+
+        Returns:
+            Matching connections keyed by id (each connection once)
+        """
+        found: Dict[int, WebSocket] = {}
+        nodes: List[_Node] = [self._root]
+
+        for segment in channel_name.split("."):
+            next_nodes = []
+            for node in nodes:
+                children = node.children
+                # "#" also matches this and all remaining segments
+                rest = children.get(_REST)
+                if rest is not None:
+                    found.update(rest.subscribers)
+                child = children.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+                child = children.get(_ONE)
+                if child is not None:
+                    next_nodes.append(child)
+            nodes = next_nodes
+            if not nodes:
+                return found
+
+        for node in nodes:
+            found.update(node.subscribers)
+            # "#" matching zero segments
+            rest = node.children.get(_REST)
+            if rest is not None:
+                found.update(rest.subscribers)
+        return found
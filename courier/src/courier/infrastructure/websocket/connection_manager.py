@@ -2,13 +2,24 @@
 WebSocket connection manager infrastructure with production logging.
 """
 
-from typing import Dict, List, Optional
+import asyncio
+from typing import Any, Dict, List, Optional, Set
 
-from fastapi import WebSocket
+from fastapi import WebSocket, status
 from shared.reporter import SystemReporter
 
 from courier.domain.entities import Client
-from courier.domain.value_objects import ChannelName
+from courier.domain.value_objects import ChannelName, ChannelPattern
+from courier.infrastructure.websocket.channel_trie import ChannelTrie
+from courier.infrastructure.websocket.outbound_queue import (
+    DISCONNECT,
+    OVERFLOW_POLICIES,
+    OutboundQueue,
+    OutboundQueueFull,
+)
+
+# Seconds to wait for a disconnected slow client to accept the close frame
+_CLOSE_TIMEOUT = 5.0
 
 
 class ConnectionLimitExceeded(Exception):
@@ -20,7 +31,35 @@ class ConnectionLimitExceeded(Exception):
 
 
 class ConnectionManager:
-    """Manages WebSocket connections and channel subscriptions."""
+    """
+    Manages WebSocket connections and channel subscriptions.
+
+    A connection is registered once (one Client, counted once against
+    the global and per-user limits) and can be subscribed to many
+    channels: channels maps channel -> connections, and a per-connection
+    index maps connection -> channels. A connection appears at most once
+    in a channel, so a publish reaches it once.
+
+    Subscriptions may also be wildcard patterns (forge.job.*, user.123.#,
+    see ChannelPattern). Patterns live in a segment trie, so resolving a
+    channel's subscribers costs O(name depth) however many patterns are
+    registered; a connection matched by its exact subscription and by
+    patterns is still returned once.
+
+    Connection accounting is incremental: the connection registry, a
+    per-user connection count and a per-channel position index
+    (websocket id -> index in the channel list, swap-removed) keep
+    connect, subscribe, unsubscribe and limit checks O(1). Channel lists
+    must therefore be changed only through add_client/subscribe/
+    unsubscribe/remove_client/disconnect/remove_channel.
+
+    With outbound_queue_size > 0 every connection gets a bounded
+    OutboundQueue drained by its own writer task; enqueue() then
+    delivers without waiting for the client. Overflow handling is chosen
+    per message type from overflow_policies (default_overflow_policy
+    otherwise). A writer whose send fails or exceeds send_timeout
+    disconnects its client and closes it with 1008, like an overflow.
+    """
 
     def __init__(
         self,
@@ -28,18 +67,47 @@ class ConnectionManager:
         max_connections_per_user: int = 0,
         max_clients_per_channel: int = 0,
         reporter: Optional[SystemReporter] = None,
+        max_subscriptions_per_connection: int = 0,
+        outbound_queue_size: int = 0,
+        overflow_policies: Optional[Dict[str, str]] = None,
+        default_overflow_policy: str = DISCONNECT,
+        send_timeout: Optional[float] = None,
     ):
+        overflow_policies = dict(overflow_policies or {})
+        for policy in [default_overflow_policy, *overflow_policies.values()]:
+            if policy not in OVERFLOW_POLICIES:
+                raise ValueError(
+                    f"Unknown overflow policy: {policy!r} "
+                    f"(expected one of {OVERFLOW_POLICIES})"
+                )
+
         self.channels: Dict[str, List[WebSocket]] = {}
         self.client_registry: Dict[int, Client] = {}
+        self._positions: Dict[str, Dict[int, int]] = {}
+        self._patterns = ChannelTrie()
+        self._connections: Dict[int, WebSocket] = {}
+        self._subscriptions: Dict[int, Set[str]] = {}
+        self._user_connections: Dict[str, int] = {}
         self.max_total_connections = max_total_connections
         self.max_connections_per_user = max_connections_per_user
         self.max_clients_per_channel = max_clients_per_channel
+        self.max_subscriptions_per_connection = max_subscriptions_per_connection
         self.reporter = reporter
 
+        self.outbound_queue_size = outbound_queue_size
+        self.overflow_policies = overflow_policies
+        self.default_overflow_policy = default_overflow_policy
+        self.send_timeout = send_timeout
+        self.dropped_messages: Dict[str, int] = {}
+        self.overflow_disconnects = 0
+        self._outbound: Dict[int, OutboundQueue] = {}
+        self._closing: Set[asyncio.Task] = set()
+
         if self.reporter:
             self.reporter.info(
                 f"ConnectionManager initialized (limits: total={max_total_connections}, "
-                f"per_user={max_connections_per_user}, per_channel={max_clients_per_channel})",
+                f"per_user={max_connections_per_user}, per_channel={max_clients_per_channel}, "
+                f"per_connection={max_subscriptions_per_connection})",
                 context="ConnectionManager",
                 verbose_level=2,
             )
@@ -85,21 +153,7 @@ class ConnectionManager:
                 )
 
         # Check per-channel limit
-        if self.max_clients_per_channel > 0:
-            channel_count = self.get_channel_count(channel_name)
-            if channel_count >= self.max_clients_per_channel:
-                if self.reporter:
-                    self.reporter.warning(
-                        f"Per-channel connection limit exceeded "
-                        f"(channel={channel_name}, current={channel_count}, "
-                        f"limit={self.max_clients_per_channel}, user={user_id})",
-                        context="ConnectionManager",
-                        verbose_level=1,
-                    )
-                raise ConnectionLimitExceeded(
-                    f"Channel connection limit reached: {self.max_clients_per_channel}",
-                    limit_type="per_channel",
-                )
+        self._check_channel_limit(channel_name, user_id)
 
     def add_client(
         self,
@@ -108,7 +162,18 @@ class ConnectionManager:
         user_id: Optional[str] = None,
         wallet_address: Optional[str] = None,
     ) -> Client:
-        """Add client to channel."""
+        """
+        Register a connection and subscribe it to a channel.
+
+        A connection that is already registered is only subscribed to
+        the channel (see subscribe()); its Client is returned unchanged.
+        """
+        ws_id = id(websocket)
+        client = self.client_registry.get(ws_id)
+        if client is not None:
+            self.subscribe(websocket, channel_name)
+            return client
+
         # Check limits
         self.check_connection_limits(channel_name, user_id)
 
@@ -122,15 +187,23 @@ class ConnectionManager:
             wallet_address=wallet_address,
         )
 
-        # Add to channel
-        is_new_channel = channel_name not in self.channels
-        if channel_name not in self.channels:
-            self.channels[channel_name] = []
-        self.channels[channel_name].append(websocket)
-
         # Register client
-        ws_id = id(websocket)
         self.client_registry[ws_id] = client
+        self._connections[ws_id] = websocket
+        self._subscriptions[ws_id] = set()
+        self._count_user(user_id, 1)
+
+        if self.outbound_queue_size > 0:
+            self._outbound[ws_id] = OutboundQueue(
+                websocket,
+                self.outbound_queue_size,
+                on_send_error=self._disconnect_failed_writer,
+                send_timeout=self.send_timeout,
+            )
+
+        # Add to channel
+        is_new_channel = channel_name not in self.channels
+        self._join(websocket, channel_name)
 
         # Log
         if self.reporter:
@@ -149,21 +222,111 @@ class ConnectionManager:
 
         return client
 
-    def remove_client(self, websocket: WebSocket, channel_name: str) -> None:
-        """Remove client from channel."""
+    def subscribe(self, websocket: WebSocket, channel_name: str) -> bool:
+        """
+        Subscribe a registered connection to another channel or pattern.
+
+        Args:
+            websocket: Registered connection
+            channel_name: Channel (or ChannelPattern) to join
+
+        Returns:
+            True if subscribed, False if it already was
+
+        Raises:
+            ValueError: If channel name/pattern is invalid or connection
+                unknown
+            ConnectionLimitExceeded: If per-connection or per-channel
+                limit is reached
+        """
         ws_id = id(websocket)
         client = self.client_registry.get(ws_id)
+        if client is None:
+            raise ValueError("Connection is not registered")
+
+        is_pattern = ChannelPattern.is_pattern(channel_name)
+        if is_pattern:
+            ChannelPattern(channel_name)
+        else:
+            ChannelName(channel_name)
+
+        channels = self._subscriptions[ws_id]
+        if channel_name in channels:
+            return False
+
+        limit = self.max_subscriptions_per_connection
+        if limit > 0 and len(channels) >= limit:
+            if self.reporter:
+                self.reporter.warning(
+                    f"Per-connection subscription limit exceeded "
+                    f"(client={client.id}, current={len(channels)}, "
+                    f"limit={limit}, channel={channel_name})",
+                    context="ConnectionManager",
+                    verbose_level=1,
+                )
+            raise ConnectionLimitExceeded(
+                f"Subscription limit reached: {limit}",
+                limit_type="per_connection",
+            )
+        if not is_pattern:
+            self._check_channel_limit(channel_name, client.user_id)
+
+        self._join(websocket, channel_name)
+
+        if self.reporter:
+            ch_count = (
+                self._patterns.subscriber_count(channel_name)
+                if is_pattern
+                else self.get_channel_count(channel_name)
+            )
+            self.reporter.info(
+                f"Client subscribed: channel={channel_name}, client={client.id}, "
+                f"subscriptions={len(channels)}, channel_subs={ch_count}",
+                context="ConnectionManager",
+                verbose_level=2,
+            )
+
+        return True
+
+    def unsubscribe(self, websocket: WebSocket, channel_name: str) -> bool:
+        """
+        Unsubscribe a connection from one channel; it stays connected.
+
+        Returns:
+            True if the connection was subscribed to the channel
+        """
+        if not self._leave(websocket, channel_name):
+            return False
+
+        if self.reporter:
+            client = self.client_registry.get(id(websocket))
+            self.reporter.info(
+                f"Client unsubscribed: channel={channel_name}, "
+                f"client={client.id if client else None}, "
+                f"channel_subs={self.get_channel_count(channel_name)}",
+                context="ConnectionManager",
+                verbose_level=2,
+            )
+
+        return True
+
+    def remove_client(self, websocket: WebSocket, channel_name: str) -> None:
+        """
+        Remove client from channel.
 
-        # Remove from channel
-        if channel_name in self.channels and websocket in self.channels[channel_name]:
-            self.channels[channel_name].remove(websocket)
+        The connection is unregistered once it has no channels left; use
+        disconnect() to drop it from all of its channels at once.
+        """
+        ws_id = id(websocket)
+        client = self.client_registry.get(ws_id)
+        if client is None or not self._leave(websocket, channel_name):
+            return
 
-        # Remove from registry
-        if ws_id in self.client_registry:
-            del self.client_registry[ws_id]
+        if not self._subscriptions[ws_id]:
+            self._unregister(ws_id)
 
         # Log
-        if self.reporter and client:
+        if self.reporter:
             total = self.get_total_connections()
             ch_count = self.get_channel_count(channel_name)
 
@@ -175,26 +338,189 @@ class ConnectionManager:
                 verbose_level=2,
             )
 
+    def disconnect(self, websocket: WebSocket) -> List[str]:
+        """
+        Remove a connection from all of its channels and unregister it.
+
+        Returns:
+            Channels the connection was subscribed to
+        """
+        ws_id = id(websocket)
+        client = self.client_registry.get(ws_id)
+        if client is None:
+            return []
+
+        channels = list(self._subscriptions[ws_id])
+        for channel_name in channels:
+            self._leave(websocket, channel_name)
+        self._unregister(ws_id)
+
+        if self.reporter:
+            self.reporter.info(
+                f"Client disconnected: client={client.id}, user={client.user_id}, "
+                f"channels={channels}, total={self.get_total_connections()}",
+                context="ConnectionManager",
+                verbose_level=2,
+            )
+
+        return channels
+
+    def enqueue(self, websocket: WebSocket, payload: str, message_type: str) -> bool:
+        """
+        Queue an encoded message on a connection's outbound queue.
+
+        Returns immediately; the connection's writer task sends it. If the
+        queue is full, the message type's overflow policy either drops a
+        message (counted in dropped_messages) or disconnects the client.
+
+        Args:
+            websocket: Subscriber connection
+            payload: Encoded message text
+            message_type: Message type (selects the overflow policy)
+
+        Returns:
+            True if the message was queued for the client
+        """
+        queue = self._outbound.get(id(websocket))
+        if queue is None:
+            return False
+
+        policy = self.overflow_policies.get(message_type, self.default_overflow_policy)
+        dropped = queue.dropped
+        try:
+            queued = queue.put(payload, message_type, policy)
+        except OutboundQueueFull as e:
+            self._disconnect_slow_client(websocket, e.depth)
+            return False
+
+        if queue.dropped != dropped:
+            self.dropped_messages[message_type] = (
+                self.dropped_messages.get(message_type, 0) + 1
+            )
+        return queued
+
+    def get_outbound_stats(self) -> Dict[str, Any]:
+        """Get outbound queue depth and overflow statistics."""
+        depths = [queue.depth for queue in self._outbound.values()]
+        return {
+            "enabled": self.outbound_queue_size > 0,
+            "queue_size": self.outbound_queue_size,
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "full_queues": sum(
+                1 for depth in depths if depth >= self.outbound_queue_size
+            ),
+            "dropped_messages": sum(self.dropped_messages.values()),
+            "dropped_by_type": dict(self.dropped_messages),
+            "overflow_disconnects": self.overflow_disconnects,
+        }
+
+    def _disconnect_slow_client(self, websocket: WebSocket, depth: int) -> None:
+        """Remove a client whose queue overflowed and close it in background."""
+        client = self.client_registry.get(id(websocket))
+        if client is None:
+            return
+
+        self.overflow_disconnects += 1
+        channels = self.disconnect(websocket)
+
+        if self.reporter:
+            self.reporter.warning(
+                f"Slow client disconnected: outbound queue full "
+                f"(client={client.id}, channels={channels}, "
+                f"user={client.user_id}, depth={depth})",
+                context="ConnectionManager",
+                verbose_level=1,
+            )
+
+        self._close_in_background(websocket, "Outbound queue overflow")
+
+    def _disconnect_failed_writer(self, websocket: WebSocket) -> None:
+        """Remove a client whose writer send failed and close it in background."""
+        client = self.client_registry.get(id(websocket))
+        if client is None:
+            return
+
+        channels = self.disconnect(websocket)
+
+        if self.reporter:
+            self.reporter.warning(
+                f"Client disconnected: outbound send failed or timed out "
+                f"(client={client.id}, channels={channels}, "
+                f"user={client.user_id})",
+                context="ConnectionManager",
+                verbose_level=1,
+            )
+
+        # A cancelled send may have left a partial frame; close, don't reuse
+        self._close_in_background(websocket, "Outbound send failed")
+
+    def _close_in_background(self, websocket: WebSocket, reason: str) -> None:
+        task = asyncio.get_running_loop().create_task(
+            self._close_quietly(websocket, reason)
+        )
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket, reason: str) -> None:
+        try:
+            await asyncio.wait_for(
+                websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=reason),
+                timeout=_CLOSE_TIMEOUT,
+            )
+        except Exception:
+            pass
+
     def get_channel_subscribers(self, channel_name: str) -> List[WebSocket]:
-        """Get all subscribers for a channel."""
-        return self.channels.get(channel_name, [])
+        """
+        Get all subscribers for a channel, each connection once.
+
+        Includes connections whose pattern subscriptions match the
+        channel. Without matching patterns the channel's own list is
+        returned as is (not copied).
+        """
+        subscribers = self.channels.get(channel_name, [])
+        if not self._patterns:
+            return subscribers
+
+        matched = self._patterns.match(channel_name)
+        if not matched:
+            return subscribers
+
+        positions = self._positions.get(channel_name, {})
+        return subscribers + [
+            ws for ws_id, ws in matched.items() if ws_id not in positions
+        ]
 
     def get_client(self, websocket: WebSocket) -> Optional[Client]:
         """Get client entity for WebSocket connection."""
         ws_id = id(websocket)
         return self.client_registry.get(ws_id)
 
+    def get_connections(self) -> List[WebSocket]:
+        """Get all registered connections (each once)."""
+        return list(self._connections.values())
+
+    def get_subscriptions(self, websocket: WebSocket) -> List[str]:
+        """Get the channels a connection is subscribed to."""
+        return sorted(self._subscriptions.get(id(websocket), ()))
+
     def get_total_connections(self) -> int:
         """Get total number of active connections."""
-        return sum(len(subs) for subs in self.channels.values())
+        return len(self._connections)
 
     def get_channel_count(self, channel_name: str) -> int:
         """Get subscriber count for specific channel."""
         return len(self.channels.get(channel_name, []))
 
+    def get_pattern_count(self) -> int:
+        """Get number of subscribed wildcard patterns."""
+        return len(self._patterns)
+
     def get_user_connection_count(self, user_id: str) -> int:
         """Get total connection count for specific user."""
-        return sum(1 for c in self.client_registry.values() if c.user_id == user_id)
+        return self._user_connections.get(user_id, 0)
 
     def get_all_channels(self) -> Dict[str, int]:
         """Get all channels with subscriber counts."""
@@ -204,11 +530,20 @@ class ConnectionManager:
         """Check if channel exists."""
         return channel_name in self.channels
 
+    def remove_channel(self, channel_name: str) -> bool:
+        """Remove a channel if it has no subscribers."""
+        subscribers = self.channels.get(channel_name)
+        if subscribers is None or subscribers:
+            return False
+        del self.channels[channel_name]
+        self._positions.pop(channel_name, None)
+        return True
+
     def cleanup_empty_channels(self) -> List[str]:
         """Remove channels with no subscribers."""
         empty = [ch for ch, subs in self.channels.items() if len(subs) == 0]
         for ch in empty:
-            del self.channels[ch]
+            self.remove_channel(ch)
 
         if self.reporter and empty:
             self.reporter.info(
@@ -219,3 +554,79 @@ class ConnectionManager:
             )
 
         return empty
+
+    def _check_channel_limit(
+        self, channel_name: str, user_id: Optional[str] = None
+    ) -> None:
+        """Check if one more subscriber would exceed the per-channel limit."""
+        if self.max_clients_per_channel > 0:
+            channel_count = self.get_channel_count(channel_name)
+            if channel_count >= self.max_clients_per_channel:
+                if self.reporter:
+                    self.reporter.warning(
+                        f"Per-channel connection limit exceeded "
+                        f"(channel={channel_name}, current={channel_count}, "
+                        f"limit={self.max_clients_per_channel}, user={user_id})",
+                        context="ConnectionManager",
+                        verbose_level=1,
+                    )
+                raise ConnectionLimitExceeded(
+                    f"Channel connection limit reached: {self.max_clients_per_channel}",
+                    limit_type="per_channel",
+                )
+
+    def _join(self, websocket: WebSocket, channel_name: str) -> None:
+        """Append a registered connection to a channel and both indexes."""
+        ws_id = id(websocket)
+        self._subscriptions[ws_id].add(channel_name)
+        if ChannelPattern.is_pattern(channel_name):
+            self._patterns.add(channel_name, websocket)
+            return
+
+        subscribers = self.channels.setdefault(channel_name, [])
+        positions = self._positions.setdefault(channel_name, {})
+        positions[ws_id] = len(subscribers)
+        subscribers.append(websocket)
+
+    def _leave(self, websocket: WebSocket, channel_name: str) -> bool:
+        """Swap-remove a connection from a channel (O(1)) and both indexes."""
+        ws_id = id(websocket)
+        if ChannelPattern.is_pattern(channel_name):
+            if not self._patterns.remove(channel_name, websocket):
+                return False
+            self._subscriptions[ws_id].discard(channel_name)
+            return True
+
+        positions = self._positions.get(channel_name)
+        if positions is None or ws_id not in positions:
+            return False
+
+        subscribers = self.channels[channel_name]
+        index = positions.pop(ws_id)
+        last = subscribers.pop()
+        if last is not websocket:
+            subscribers[index] = last
+            positions[id(last)] = index
+        self._subscriptions[ws_id].discard(channel_name)
+        return True
+
+    def _unregister(self, ws_id: int) -> None:
+        """Drop a connection with no subscriptions left."""
+        client = self.client_registry.pop(ws_id)
+        del self._connections[ws_id]
+        del self._subscriptions[ws_id]
+        self._count_user(client.user_id, -1)
+
+        queue = self._outbound.pop(ws_id, None)
+        if queue is not None:
+            queue.close()
+
+    def _count_user(self, user_id: Optional[str], delta: int) -> None:
+        """Adjust the per-user connection index."""
+        if not user_id:
+            return
+        count = self._user_connections.get(user_id, 0) + delta
+        if count > 0:
+            self._user_connections[user_id] = count
+        else:
+            self._user_connections.pop(user_id, None)
@@ -0,0 +1,152 @@
+"""
+Bounded per-connection outbound queue with its own writer task.
+
+Publishing enqueues the encoded message and returns immediately; each
+connection's writer task sends queued messages in order, so a slow
+client only fills its own queue instead of delaying the publisher.
+"""
+
+import asyncio
+from collections import deque
+from typing import Callable, Deque, Optional, Tuple
+
+from fastapi import WebSocket
+
+# Overflow policies
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+OVERFLOW_POLICIES = (DROP_OLDEST, DISCONNECT)
+
+
+class OutboundQueueFull(Exception):
+    """Raised when a message overflows a queue under the disconnect policy."""
+
+    def __init__(self, message: str, depth: int):
+        super().__init__(message)
+        self.depth = depth
+
+
+class OutboundQueue:
+    """
+    Bounded FIFO of encoded messages for one WebSocket connection.
+
+    On overflow, a message under the drop_oldest policy replaces the
+    oldest queued message of the same type (progress updates supersede
+    each other), or is dropped itself if there is none; it never
+    displaces messages of other types. A message under the disconnect
+    policy raises OutboundQueueFull so the caller can drop the client.
+
+    The writer task is started on the first put(), from the event loop.
+    A send that fails or exceeds send_timeout closes the queue and
+    reports the connection through on_send_error.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        maxsize: int,
+        on_send_error: Optional[Callable[[WebSocket], None]] = None,
+        send_timeout: Optional[float] = None,
+    ):
+        """
+        Initialize queue.
+
+        Args:
+            websocket: Connection the writer sends to
+            maxsize: Maximum queued messages (> 0)
+            on_send_error: Called with the websocket when a send fails
+            send_timeout: Seconds one send may take (None = no limit)
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if send_timeout is not None and send_timeout <= 0:
+            raise ValueError("send_timeout must be positive")
+
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.on_send_error = on_send_error
+        self.send_timeout = send_timeout
+        self.dropped = 0
+        self.sent = 0
+        self._items: Deque[Tuple[str, str]] = deque()
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.Task] = None
+        self._closed = False
+
+    @property
+    def depth(self) -> int:
+        """Messages waiting to be sent."""
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        """Queue no longer accepts messages."""
+        return self._closed
+
+    def put(self, payload: str, message_type: str, policy: str = DISCONNECT) -> bool:
+        """
+        Queue an encoded message for sending.
+
+        Args:
+            payload: Encoded message text
+            message_type: Message type (matched for drop_oldest replacement)
+            policy: Overflow policy for this message
+
+        Returns:
+            True if the message was queued, False if it was dropped
+
+        Raises:
+            OutboundQueueFull: If full and policy is disconnect
+        """
+        if self._closed:
+            return False
+
+        items = self._items
+        if len(items) >= self.maxsize:
+            if policy != DROP_OLDEST:
+                raise OutboundQueueFull(
+                    f"Outbound queue full ({self.maxsize} messages)", len(items)
+                )
+            self.dropped += 1
+            for index, (queued_type, _) in enumerate(items):
+                if queued_type == message_type:
+                    del items[index]
+                    break
+            else:
+                return False
+
+        items.append((message_type, payload))
+        self._ready.set()
+        if self._writer is None:
+            self._writer = asyncio.get_running_loop().create_task(self._drain())
+        return True
+
+    def close(self) -> None:
+        """Stop accepting messages and cancel the writer task."""
+        self._closed = True
+        self._items.clear()
+        if self._writer is not None:
+            self._writer.cancel()
+
+    async def _drain(self) -> None:
+        """Writer task: send queued messages in order until closed."""
+        items = self._items
+        while not self._closed:
+            if not items:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+
+            _, payload = items.popleft()
+            try:
+                # A stalled client must not hold its writer (and queue) forever
+                await asyncio.wait_for(
+                    self.websocket.send_text(payload), self.send_timeout
+                )
+            except Exception:
+                self._closed = True
+                items.clear()
+                if self.on_send_error:
+                    self.on_send_error(self.websocket)
+                return
+            self.sent += 1
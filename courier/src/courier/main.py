@@ -316,12 +316,11 @@ class CourierApp:
             "code": 1001,
         }
 
-        for channel, subscribers in conn_manager.channels.items():
-            for ws in list(subscribers):
-                try:
-                    await ws.send_json(shutdown_msg)
-                except Exception:
-                    pass
+        for ws in conn_manager.get_connections():
+            try:
+                await ws.send_json(shutdown_msg)
+            except Exception:
+                pass
 
     async def _close_all_connections_gracefully(self):
         """
@@ -343,15 +342,14 @@ class CourierApp:
 
         # Force close remaining connections
         total_closed = 0
-        for channel, subscribers in conn_manager.channels.items():
-            for ws in list(subscribers):
-                try:
-                    await ws.close(code=1001, reason="Server shutdown")
-                    total_closed += 1
-                except Exception:
-                    pass
+        for ws in conn_manager.get_connections():
+            try:
+                await ws.close(code=1001, reason="Server shutdown")
+                total_closed += 1
+            except Exception:
+                pass
 
-            subscribers.clear()
+            conn_manager.disconnect(ws)
 
         if total_closed > 0:
             self.reporter.info(
@@ -401,19 +399,18 @@ class CourierApp:
                 verbose_level=3,
             )
 
-            # Send ping to all connections
-            for channel, subscribers in conn_manager.channels.items():
-                dead_clients = []
+            # Send ping to every connection once, whatever its channels
+            dead_clients = []
 
-                for ws in subscribers:
-                    try:
-                        await ws.send_json({"type": "ping"})
-                    except Exception:
-                        dead_clients.append(ws)
+            for ws in conn_manager.get_connections():
+                try:
+                    await ws.send_json({"type": "ping"})
+                except Exception:
+                    dead_clients.append(ws)
 
-                # Cleanup dead connections
-                for ws in dead_clients:
-                    conn_manager.remove_client(ws, channel)
+            # Cleanup dead connections
+            for ws in dead_clients:
+                conn_manager.disconnect(ws)
 
     async def serve(self):
         """
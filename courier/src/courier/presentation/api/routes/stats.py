@@ -25,6 +25,7 @@ def get_stats(connection_manager=Depends(get_connection_manager)):
     - Total active connections
     - Active channels and their subscriber counts
     - Message delivery statistics (future)
+    - Outbound queue depth, drops and overflow disconnects
 
     Returns:
         Statistics dict
@@ -34,11 +35,16 @@ def get_stats(connection_manager=Depends(get_connection_manager)):
     return {
         "total_connections": connection_manager.get_total_connections(),
         "active_channels": len(channels),
+        "active_patterns": connection_manager.get_pattern_count(),
         "channels": channels,
         "total_messages_sent": 0,  # TODO: Implement message counter
+        "outbound": connection_manager.get_outbound_stats(),
         "limits": {
             "max_total_connections": connection_manager.max_total_connections,
             "max_connections_per_user": connection_manager.max_connections_per_user,
             "max_clients_per_channel": connection_manager.max_clients_per_channel,
+            "max_subscriptions_per_connection": (
+                connection_manager.max_subscriptions_per_connection
+            ),
         },
     }
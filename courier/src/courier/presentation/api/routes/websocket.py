@@ -12,6 +12,8 @@ from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 from shared.reporter import SystemReporter
 
 from courier.di import Container
+from courier.domain.exceptions import AuthenticationError, AuthorizationError
+from courier.domain.value_objects import ChannelName, ChannelPattern
 from courier.infrastructure.websocket import ConnectionLimitExceeded
 from courier.presentation.api.dependencies import (
     authenticate_websocket,
@@ -41,10 +43,12 @@ async def websocket_endpoint(
     Validates all incoming messages.
     Enforces per-message-type rate limiting.
     Enforces connection limits (global, per-user, per-channel).
+    Further channels are joined and left over the same connection with
+    subscribe/unsubscribe control messages.
 
     Args:
         websocket: WebSocket connection
-        channel: Channel name to subscribe to
+        channel: Channel name to subscribe to first
         auth_payload: Authentication payload (from dependency)
         container: DI container (from dependency)
 
@@ -256,6 +260,8 @@ async def websocket_endpoint(
                         user_id,
                         client.id,
                         reporter,
+                        container,
+                        auth_payload,
                     )
                 else:
                     ack_response = {
@@ -296,15 +302,18 @@ async def websocket_endpoint(
         )
 
         if client:
-            conn_manager.remove_client(websocket, channel)
+            for left_channel in conn_manager.disconnect(websocket):
+                _cleanup_channel(container, left_channel)
 
-            if manage_uc.should_cleanup_channel(channel):
-                if channel in conn_manager.channels:
-                    reporter.debug(
-                        f"Ephemeral channel cleaned up [channel={channel}]",
-                        context="WebSocket",
-                    )
-                    del conn_manager.channels[channel]
+
+def _cleanup_channel(container: Container, channel: str) -> None:
+    """Remove an ephemeral channel once its last subscriber has left."""
+    if container.get_manage_channel_use_case().should_cleanup_channel(channel):
+        if container.connection_manager.remove_channel(channel):
+            container.reporter.debug(
+                f"Ephemeral channel cleaned up [channel={channel}]",
+                context="WebSocket",
+            )
 
 
 async def _handle_control_message(
@@ -316,6 +325,8 @@ async def _handle_control_message(
     user_id: Optional[str],
     client_id: Optional[str],
     reporter: SystemReporter,
+    container: Container,
+    auth_payload=None,
 ) -> None:
     """
     Handle control messages (ping, subscribe, etc.).
@@ -329,6 +340,8 @@ async def _handle_control_message(
         user_id: Optional user ID
         client_id: Optional client ID
         reporter: SystemReporter for logging
+        container: DI container
+        auth_payload: Token payload of the connection (None if anonymous)
     """
     try:
         message = json.loads(raw_data)
@@ -349,22 +362,105 @@ async def _handle_control_message(
 
     elif message_type == "subscribe":
         target_channel = message.get("channel")
+        error = _subscribe(websocket, target_channel, container, auth_payload)
+        if error:
+            await websocket.send_json(
+                {"type": "error", "channel": target_channel, **error}
+            )
+            reporter.warning(
+                f"Channel subscription rejected [conn={connection_id}] "
+                f"[target={target_channel}] [code={error['code']}]",
+                context="WebSocket",
+            )
+            return
+
         await websocket.send_json(
-            {"type": "subscribed", "channel": target_channel}
+            {
+                "type": "subscribed",
+                "channel": target_channel,
+                "channels": container.connection_manager.get_subscriptions(websocket),
+            }
         )
         reporter.info(
-            f"Channel subscription requested "
-            f"[conn={connection_id}] [target={target_channel}]",
+            f"Channel subscribed [conn={connection_id}] [target={target_channel}]",
             context="WebSocket",
         )
 
     elif message_type == "unsubscribe":
         target_channel = message.get("channel")
+        conn_manager = container.connection_manager
+        if isinstance(target_channel, str) and conn_manager.unsubscribe(
+            websocket, target_channel
+        ):
+            _cleanup_channel(container, target_channel)
+
         await websocket.send_json(
-            {"type": "unsubscribed", "channel": target_channel}
+            {
+                "type": "unsubscribed",
+                "channel": target_channel,
+                "channels": conn_manager.get_subscriptions(websocket),
+            }
         )
         reporter.info(
-            f"Channel unsubscription requested "
-            f"[conn={connection_id}] [target={target_channel}]",
+            f"Channel unsubscribed [conn={connection_id}] [target={target_channel}]",
             context="WebSocket",
         )
+
+
+def _subscribe(
+    websocket: WebSocket,
+    target_channel,
+    container: Container,
+    auth_payload=None,
+) -> Optional[dict]:
+    """
+    Subscribe a connection to one more channel or wildcard pattern.
+
+    Applies the same channel validation, authorization and limits as
+    connecting to /ws/{channel}.
+
+    Returns:
+        None on success, otherwise error fields for the client
+    """
+    if not isinstance(target_channel, str):
+        target_channel = ""
+    is_pattern = ChannelPattern.is_pattern(target_channel)
+    try:
+        if is_pattern:
+            ChannelPattern(target_channel)
+        else:
+            ChannelName(target_channel)
+    except ValueError as e:
+        return {"code": "INVALID_CHANNEL", "message": str(e)}
+
+    auth_use_case = container.get_authenticate_use_case()
+    if auth_use_case and auth_payload:
+        try:
+            auth_use_case.authorize_channel(auth_payload, target_channel)
+        except (AuthenticationError, AuthorizationError) as e:
+            return {"code": "UNAUTHORIZED", "message": str(e)}
+    elif auth_use_case and is_pattern:
+        # A pattern can match private channels (e.g. "#" covers user.*)
+        return {
+            "code": "UNAUTHORIZED",
+            "message": "Channel patterns require an authenticated connection",
+        }
+
+    if not is_pattern:
+        container.get_manage_channel_use_case().create_or_get_channel(
+            target_channel
+        )
+    try:
+        container.connection_manager.subscribe(websocket, target_channel)
+    except ConnectionLimitExceeded as e:
+        _cleanup_channel(container, target_channel)
+        return {
+            "code": "CONNECTION_LIMIT_EXCEEDED",
+            "message": str(e),
+            "limit_type": e.limit_type,
+        }
+    except ValueError as e:
+        # Already dropped by the manager (overflow, failed send, dead client)
+        _cleanup_channel(container, target_channel)
+        return {"code": "CONNECTION_CLOSED", "message": str(e)}
+    return None
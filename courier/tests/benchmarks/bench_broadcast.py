@@ -0,0 +1,181 @@
+"""
+Benchmark: serial send_json loop vs concurrent vs queued broadcast.
+
+Delivers one event to every subscriber of a channel, with the previous
+loop (Message.data copy and send_json() per subscriber, awaited one
+after another), with BroadcastMessageUseCase sending concurrently
+(payload encoded once, all sends in flight together) and with
+per-connection outbound queues (publish returns once the message is
+queued; writer tasks deliver). Fake sockets encode text like Starlette
+and yield to the event loop on every send; optionally one subscriber
+stalls to show its effect on the publisher and everyone else.
+
+"publish" is the time until execute() returns, p50/p99 the delivery
+time of the non-stalled subscribers.
+
+Usage:
+    python tests/benchmarks/bench_broadcast.py
+    python tests/benchmarks/bench_broadcast.py --subscribers 1000 10000 --stall 0.5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Sequence
+
+from courier.application.use_cases import BroadcastMessageUseCase
+from courier.domain.value_objects import ChannelName, Message
+from courier.infrastructure.websocket import ConnectionManager
+
+
+class _FakeWebSocket:
+    """Records when a frame was handed to the transport."""
+
+    def __init__(self, stall: float = 0.0):
+        self.stall = stall
+        self.delivered_at = None
+
+    async def send_text(self, data: str) -> None:
+        data.encode("utf-8")
+        await asyncio.sleep(self.stall)
+        self.delivered_at = time.perf_counter()
+
+    async def send_json(self, data: Any) -> None:
+        # Starlette's WebSocket.send_json() encoding
+        await self.send_text(
+            json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        )
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        pass
+
+
+def _event(payload_items: int) -> Dict[str, Any]:
+    return {
+        "type": "backtest.progress",
+        "data": {
+            "job_id": "job-123",
+            "progress": 0.42,
+            "trades": [
+                {"symbol": "SOL/USDC", "price": 100.0 + i, "size": 1.5, "side": "buy"}
+                for i in range(payload_items)
+            ],
+        },
+        "metadata": {"source": "forge", "timestamp": "2025-10-16T12:00:00Z"},
+    }
+
+
+async def _serial_broadcast(
+    channel: str, data: Dict[str, Any], subscribers: List[_FakeWebSocket]
+) -> int:
+    """Previous BroadcastMessageUseCase.execute() loop."""
+    ChannelName(channel)
+    message = Message(data)
+    sent_count = 0
+    for ws in subscribers:
+        try:
+            await ws.send_json(message.data)
+            sent_count += 1
+        except Exception:
+            pass
+    return sent_count
+
+
+async def _run_case(
+    mode: str, subscribers: int, payload_items: int, stall: float, timeout: float
+) -> Dict[str, float]:
+    sockets = [_FakeWebSocket() for _ in range(subscribers)]
+    if stall:
+        sockets[0].stall = stall
+    data = _event(payload_items)
+    channel = "backtest.progress"
+
+    use_case = BroadcastMessageUseCase(send_timeout=timeout)
+    if mode == "queued":
+        manager = ConnectionManager(outbound_queue_size=64)
+        for ws in sockets:
+            manager.add_client(ws, channel)
+        use_case = BroadcastMessageUseCase(
+            send_timeout=timeout, enqueue=manager.enqueue
+        )
+
+    start = time.perf_counter()
+    if mode == "serial":
+        await _serial_broadcast(channel, data, sockets)
+    else:
+        await use_case.execute(channel, data, sockets)
+    total = time.perf_counter() - start
+
+    if mode == "queued":
+        while any(ws.delivered_at is None for ws in sockets[1:]):
+            await asyncio.sleep(0)
+        for ws in sockets:
+            manager.remove_client(ws, channel)
+
+    # Delivery latency of everyone except the stalled subscriber
+    latencies = sorted(
+        (ws.delivered_at - start) * 1000 for ws in sockets[1:] if ws.delivered_at
+    )
+    return {
+        "publish_ms": total * 1000,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+    }
+
+
+def run_benchmark(
+    counts: Sequence[int] = (1_000, 10_000),
+    payload_items: int = 20,
+    stall: float = 0.0,
+    timeout: float = 0.25,
+) -> List[Dict[str, Any]]:
+    """
+    Time one broadcast per channel size and delivery mode.
+
+    Args:
+        counts: Subscribers per channel
+        payload_items: Trades in the event payload (sets its size)
+        stall: Seconds the first subscriber blocks its send (0 = none)
+        timeout: Send timeout of the concurrent broadcast
+
+    Returns:
+        List of result dicts (subscribers, mode, publish_ms, p50_ms, p99_ms)
+    """
+    results = []
+    for count in counts:
+        for mode in ("serial", "concurrent", "queued"):
+            timings = asyncio.run(_run_case(mode, count, payload_items, stall, timeout))
+            results.append({"subscribers": count, "mode": mode, **timings})
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--payload-items", type=int, default=20)
+    parser.add_argument("--stall", type=float, default=0.0)
+    parser.add_argument("--timeout", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = run_benchmark(
+        args.subscribers, args.payload_items, args.stall, args.timeout
+    )
+
+    payload = len(json.dumps(_event(args.payload_items)))
+    print(f"payload {payload} bytes, stalled subscriber {args.stall}s")
+    print(
+        f"{'subscribers':>12}{'mode':>12}{'publish (ms)':>14}"
+        f"{'p50 (ms)':>11}{'p99 (ms)':>11}"
+    )
+    for r in results:
+        print(
+            f"{r['subscribers']:>12}{r['mode']:>12}{r['publish_ms']:>14.1f}"
+            f"{r['p50_ms']:>11.1f}{r['p99_ms']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark: connection accounting, full scans vs incremental indexes.
+
+Prefills a ConnectionManager with N connections spread over channels and
+users, then times connect (with all limits enabled) and disconnect
+against the previous implementation, which summed every channel for the
+global limit, scanned the client registry for the per-user limit and
+removed subscribers with list.remove().
+
+Usage:
+    python tests/benchmarks/bench_connections.py
+    python tests/benchmarks/bench_connections.py --connections 1000 100000 --ops 500
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from courier.domain.entities import Client
+from courier.domain.value_objects import ChannelName
+from courier.infrastructure.websocket import ConnectionManager
+
+
+class _FakeWebSocket:
+    """Identity-only stand-in for a WebSocket."""
+
+
+class _ScanningConnectionManager(ConnectionManager):
+    """Previous O(n) accounting: sums, registry scans and list.remove()."""
+
+    def add_client(
+        self,
+        websocket: Any,
+        channel_name: str,
+        user_id: Optional[str] = None,
+        wallet_address: Optional[str] = None,
+    ) -> Client:
+        self.check_connection_limits(channel_name, user_id)
+        validated_channel = ChannelName(channel_name)
+        client = Client(
+            channel_name=validated_channel.value,
+            user_id=user_id,
+            wallet_address=wallet_address,
+        )
+        self.channels.setdefault(channel_name, [])
+        if websocket not in self.channels[channel_name]:
+            self.channels[channel_name].append(websocket)
+        self.client_registry[id(websocket)] = client
+        return client
+
+    def remove_client(self, websocket: Any, channel_name: str) -> None:
+        if channel_name in self.channels:
+            if websocket in self.channels[channel_name]:
+                self.channels[channel_name].remove(websocket)
+        self.client_registry.pop(id(websocket), None)
+
+    def get_total_connections(self) -> int:
+        return sum(len(subs) for subs in self.channels.values())
+
+    def get_user_connection_count(self, user_id: str) -> int:
+        return sum(
+            1 for client in self.client_registry.values() if client.user_id == user_id
+        )
+
+
+def _time_ops(
+    manager: ConnectionManager,
+    connections: int,
+    ops: int,
+    channels: int,
+    users: int,
+) -> Dict[str, float]:
+    rand = random.Random(1)
+    names = [f"strategy.s{i}" for i in range(channels)]
+    user_ids = [f"user-{i}" for i in range(users)]
+
+    # Prefill without limits, then enable them for the timed operations
+    connected: List[tuple] = []
+    for i in range(connections):
+        ws = _FakeWebSocket()
+        channel = names[i % channels]
+        manager.add_client(ws, channel, user_ids[i % users])
+        connected.append((ws, channel))
+    manager.max_total_connections = connections + ops + 1
+    manager.max_connections_per_user = connections + ops + 1
+    manager.max_clients_per_channel = connections + ops + 1
+
+    new = [
+        (_FakeWebSocket(), rand.choice(names), rand.choice(user_ids))
+        for _ in range(ops)
+    ]
+    start = time.perf_counter()
+    for ws, channel, user_id in new:
+        manager.add_client(ws, channel, user_id)
+    connect = time.perf_counter() - start
+
+    victims = rand.sample(connected, ops)
+    start = time.perf_counter()
+    for ws, channel in victims:
+        manager.remove_client(ws, channel)
+    disconnect = time.perf_counter() - start
+
+    return {
+        "connect_us": connect / ops * 1e6,
+        "disconnect_us": disconnect / ops * 1e6,
+    }
+
+
+def run_benchmark(
+    counts: Sequence[int] = (1_000, 10_000, 100_000),
+    ops: int = 1_000,
+    channels: int = 100,
+    users: int = 1_000,
+) -> List[Dict[str, Any]]:
+    """
+    Time connect/disconnect per registry size and implementation.
+
+    Args:
+        counts: Connections registered before timing
+        ops: Connects and disconnects timed per case
+        channels: Channels the connections are spread over
+        users: Users the connections are spread over
+
+    Returns:
+        List of result dicts (connections, mode, connect_us, disconnect_us)
+    """
+    results = []
+    for count in counts:
+        for mode, cls in (
+            ("scan", _ScanningConnectionManager),
+            ("indexed", ConnectionManager),
+        ):
+            timings = _time_ops(cls(), count, min(ops, count), channels, users)
+            results.append({"connections": count, "mode": mode, **timings})
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--connections", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--ops", type=int, default=1_000)
+    parser.add_argument("--channels", type=int, default=100)
+    parser.add_argument("--users", type=int, default=1_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.connections, args.ops, args.channels, args.users)
+
+    print(f"{'connections':>12}{'mode':>10}{'connect (us)':>15}{'disconnect (us)':>18}")
+    for r in results:
+        print(
+            f"{r['connections']:>12}{r['mode']:>10}"
+            f"{r['connect_us']:>15.1f}{r['disconnect_us']:>18.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark: resolving pattern subscribers, linear scan vs segment trie.
+
+Registers N wildcard patterns (user.{n}.#, backtest.{n}.*,
+strategy.{n}.*.fills, ...), one connection each, then times resolving
+the subscribers of published channel names by testing every pattern
+(ChannelPattern.matches) and through ConnectionManager's ChannelTrie.
+
+Usage:
+    python tests/benchmarks/bench_patterns.py
+    python tests/benchmarks/bench_patterns.py --patterns 1000 100000 --publishes 200
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Sequence
+
+from courier.domain.value_objects import ChannelPattern
+from courier.infrastructure.websocket import ConnectionManager
+
+
+class _FakeWebSocket:
+    """Identity-only stand-in for a WebSocket."""
+
+
+_PATTERN_TEMPLATES = (
+    "user.{n}.#",
+    "backtest.{n}.*",
+    "strategy.{n}.*.fills",
+    "forge.job.{n}.#",
+)
+_CHANNEL_TEMPLATES = (
+    "user.{n}",
+    "user.{n}.orders.filled",
+    "backtest.{n}.progress",
+    "strategy.{n}.sol-usdc.fills",
+    "forge.job.{n}.logs",
+)
+
+
+def _patterns(count: int) -> List[str]:
+    return [
+        _PATTERN_TEMPLATES[i % len(_PATTERN_TEMPLATES)].format(
+            n=i // len(_PATTERN_TEMPLATES)
+        )
+        for i in range(count)
+    ]
+
+
+def _channels(count: int, publishes: int) -> List[str]:
+    rand = random.Random(1)
+    ids = max(1, count // len(_PATTERN_TEMPLATES))
+    return [
+        rand.choice(_CHANNEL_TEMPLATES).format(n=rand.randrange(ids))
+        for _ in range(publishes)
+    ]
+
+
+def _time_case(count: int, publishes: int) -> Dict[str, float]:
+    patterns = _patterns(count)
+    channels = _channels(count, publishes)
+
+    manager = ConnectionManager()
+    start = time.perf_counter()
+    for pattern in patterns:
+        ws = _FakeWebSocket()
+        manager.add_client(ws, "global")
+        manager.subscribe(ws, pattern)
+    subscribe = time.perf_counter() - start
+
+    compiled = [ChannelPattern(pattern) for pattern in patterns]
+    start = time.perf_counter()
+    scan_hits = 0
+    for channel in channels:
+        scan_hits += sum(1 for pattern in compiled if pattern.matches(channel))
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    trie_hits = 0
+    for channel in channels:
+        trie_hits += len(manager.get_channel_subscribers(channel))
+    trie = time.perf_counter() - start
+
+    assert scan_hits == trie_hits
+    return {
+        "subscribe_us": subscribe / count * 1e6,
+        "scan_us": scan / publishes * 1e6,
+        "trie_us": trie / publishes * 1e6,
+        "matches": trie_hits / publishes,
+    }
+
+
+def run_benchmark(
+    counts: Sequence[int] = (1_000, 10_000, 100_000),
+    publishes: int = 200,
+) -> List[Dict[str, Any]]:
+    """
+    Time subscriber resolution per number of registered patterns.
+
+    Args:
+        counts: Patterns registered (one connection each)
+        publishes: Channel names resolved per case
+
+    Returns:
+        List of result dicts (patterns, subscribe_us, scan_us, trie_us, matches)
+    """
+    return [{"patterns": count, **_time_case(count, publishes)} for count in counts]
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--patterns", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--publishes", type=int, default=200)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.patterns, args.publishes)
+
+    print(
+        f"{'patterns':>10}{'subscribe (us)':>16}{'scan (us)':>12}"
+        f"{'trie (us)':>12}{'matches':>9}"
+    )
+    for r in results:
+        print(
+            f"{r['patterns']:>10}{r['subscribe_us']:>16.1f}{r['scan_us']:>12.1f}"
+            f"{r['trie_us']:>12.1f}{r['matches']:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
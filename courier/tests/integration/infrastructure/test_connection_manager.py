@@ -8,12 +8,16 @@ Usage:
     laborant courier --integration
 """
 
+import random
 from unittest.mock import Mock
 
 from shared.tests import LaborantTest
 
 from courier.domain.entities import Client
-from courier.infrastructure.websocket.connection_manager import ConnectionManager
+from courier.infrastructure.websocket.connection_manager import (
+    ConnectionLimitExceeded,
+    ConnectionManager,
+)
 
 
 class TestConnectionManager(LaborantTest):
@@ -388,6 +392,298 @@ class TestConnectionManager(LaborantTest):
 
         self.reporter.info("Multiple clients lifecycle completed", context="Test")
 
+    # ================================================================
+    # Incremental accounting tests
+    # ================================================================
+
+    def test_counters_match_full_scan(self):
+        """Test O(1) counters and indexes equal a full scan after churn."""
+        self.reporter.info("Testing incremental counters", context="Test")
+
+        rand = random.Random(7)
+        manager = ConnectionManager()
+        channels = ["global", "user.1", "strategy.abc", "backtest.x"]
+        users = [None, "u1", "u2", "u3"]
+        connected = {}
+
+        for _ in range(3000):
+            action = rand.random()
+            if connected and action < 0.25:
+                ws = rand.choice(list(connected))
+                assert sorted(manager.disconnect(ws)) == sorted(connected.pop(ws))
+            elif connected and action < 0.45:
+                ws = rand.choice(list(connected))
+                channel = rand.choice(channels)
+                manager.remove_client(ws, channel)
+                connected[ws].discard(channel)
+                if not connected[ws]:
+                    del connected[ws]
+            elif connected and action < 0.7:
+                ws = rand.choice(list(connected))
+                channel = rand.choice(channels)
+                added = manager.subscribe(ws, channel)
+                assert added == (channel not in connected[ws])
+                connected[ws].add(channel)
+            else:
+                ws = self._create_mock_websocket()
+                channel = rand.choice(channels)
+                manager.add_client(ws, channel, user_id=rand.choice(users))
+                connected[ws] = {channel}
+
+            if rand.random() < 0.05:
+                manager.cleanup_empty_channels()
+
+        assert manager.get_total_connections() == len(connected)
+        assert len(manager.client_registry) == len(connected)
+        for user in users[1:]:
+            expected = sum(
+                1 for c in manager.client_registry.values() if c.user_id == user
+            )
+            assert manager.get_user_connection_count(user) == expected
+        for channel, subs in manager.channels.items():
+            assert sorted(map(id, subs)) == sorted(
+                id(ws) for ws, chs in connected.items() if channel in chs
+            )
+            assert len(set(map(id, subs))) == len(subs)
+        for ws, chs in connected.items():
+            assert manager.get_subscriptions(ws) == sorted(chs)
+
+        self.reporter.info("Counters match full scan", context="Test")
+
+    def test_swap_remove_keeps_other_subscribers(self):
+        """Test removing from the middle keeps every other subscriber."""
+        self.reporter.info("Testing swap remove", context="Test")
+
+        manager = ConnectionManager()
+        sockets = [self._create_mock_websocket() for _ in range(5)]
+        for ws in sockets:
+            manager.add_client(ws, "global")
+
+        manager.remove_client(sockets[1], "global")
+        manager.remove_client(sockets[4], "global")
+        manager.remove_client(sockets[1], "global")  # already gone
+
+        remaining = manager.get_channel_subscribers("global")
+        assert sorted(map(id, remaining)) == sorted(
+            id(ws) for ws in (sockets[0], sockets[2], sockets[3])
+        )
+        manager.remove_client(sockets[0], "global")
+        assert manager.get_channel_subscribers("global") == [sockets[2], sockets[3]]
+        assert manager.get_total_connections() == 2
+
+        self.reporter.info("Swap remove correct", context="Test")
+
+    def test_user_index_and_limits(self):
+        """Test per-user index drives limits and ignores extra channels."""
+        self.reporter.info("Testing per-user index", context="Test")
+
+        manager = ConnectionManager(max_connections_per_user=2)
+        ws1 = self._create_mock_websocket()
+        ws2 = self._create_mock_websocket()
+
+        manager.add_client(ws1, "global", "alice")
+        manager.add_client(ws2, "user.1", "alice")
+        try:
+            manager.add_client(self._create_mock_websocket(), "global", "alice")
+            assert False, "Should have raised ConnectionLimitExceeded"
+        except ConnectionLimitExceeded as e:
+            assert e.limit_type == "per_user"
+
+        # More channels on an open connection do not use up the user limit
+        manager.subscribe(ws1, "strategy.abc")
+        manager.add_client(ws2, "strategy.abc", "alice")
+        assert manager.get_user_connection_count("alice") == 2
+        assert manager.get_channel_count("strategy.abc") == 2
+
+        manager.disconnect(ws1)
+        manager.disconnect(ws2)
+        assert manager.get_user_connection_count("alice") == 0
+        assert manager.get_total_connections() == 0
+
+        assert manager.remove_channel("global") is True
+        assert manager.remove_channel("global") is False
+        manager.add_client(ws1, "user.1")
+        assert manager.remove_channel("user.1") is False
+        assert manager.channel_exists("user.1")
+
+        self.reporter.info("Per-user index consistent", context="Test")
+
+    # ================================================================
+    # Multi-channel subscription tests
+    # ================================================================
+
+    def test_subscribe_and_unsubscribe(self):
+        """Test one connection joins and leaves several channels."""
+        self.reporter.info("Testing dynamic subscriptions", context="Test")
+
+        manager = ConnectionManager()
+        ws = self._create_mock_websocket()
+        client = manager.add_client(ws, "global", "123")
+
+        assert manager.subscribe(ws, "user.123") is True
+        assert manager.subscribe(ws, "backtest.abc") is True
+        assert manager.subscribe(ws, "user.123") is False
+
+        assert manager.get_subscriptions(ws) == ["backtest.abc", "global", "user.123"]
+        assert manager.get_channel_subscribers("user.123") == [ws]
+        assert manager.get_total_connections() == 1
+        assert manager.get_client(ws) is client
+
+        assert manager.unsubscribe(ws, "global") is True
+        assert manager.unsubscribe(ws, "global") is False
+        assert ws not in manager.channels["global"]
+        assert manager.get_subscriptions(ws) == ["backtest.abc", "user.123"]
+
+        # Leaving the last channel keeps the connection open
+        manager.unsubscribe(ws, "user.123")
+        manager.unsubscribe(ws, "backtest.abc")
+        assert manager.get_subscriptions(ws) == []
+        assert manager.get_total_connections() == 1
+        assert manager.subscribe(ws, "global") is True
+
+        self.reporter.info("Subscriptions follow control messages", context="Test")
+
+    def test_subscribe_validation_and_limits(self):
+        """Test subscribe validates names and enforces limits."""
+        self.reporter.info("Testing subscription limits", context="Test")
+
+        manager = ConnectionManager(
+            max_clients_per_channel=1, max_subscriptions_per_connection=2
+        )
+        ws = self._create_mock_websocket()
+        other = self._create_mock_websocket()
+        manager.add_client(ws, "global")
+        manager.add_client(other, "user.1")
+
+        try:
+            manager.subscribe(ws, "Bad Channel")
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        try:
+            manager.subscribe(self._create_mock_websocket(), "global")
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        try:
+            manager.subscribe(ws, "user.1")
+            assert False, "Should have raised ConnectionLimitExceeded"
+        except ConnectionLimitExceeded as e:
+            assert e.limit_type == "per_channel"
+
+        manager.subscribe(ws, "strategy.abc")
+        try:
+            manager.subscribe(ws, "strategy.def")
+            assert False, "Should have raised ConnectionLimitExceeded"
+        except ConnectionLimitExceeded as e:
+            assert e.limit_type == "per_connection"
+
+        assert manager.get_subscriptions(ws) == ["global", "strategy.abc"]
+        self.reporter.info("Subscription limits enforced", context="Test")
+
+    def test_disconnect_leaves_all_channels(self):
+        """Test disconnect removes a connection from every channel."""
+        self.reporter.info("Testing disconnect", context="Test")
+
+        manager = ConnectionManager()
+        ws = self._create_mock_websocket()
+        other = self._create_mock_websocket()
+        manager.add_client(ws, "global", "123")
+        manager.subscribe(ws, "user.123")
+        manager.add_client(other, "global")
+
+        # Removing from one channel keeps the connection on the others
+        manager.remove_client(ws, "global")
+        assert id(ws) in manager.client_registry
+        assert manager.get_subscriptions(ws) == ["user.123"]
+
+        manager.subscribe(ws, "backtest.abc")
+        left = manager.disconnect(ws)
+
+        assert sorted(left) == ["backtest.abc", "user.123"]
+        assert id(ws) not in manager.client_registry
+        assert manager.get_channel_count("user.123") == 0
+        assert manager.get_user_connection_count("123") == 0
+        assert manager.get_connections() == [other]
+        assert manager.disconnect(ws) == []
+
+        self.reporter.info("Connection left all channels", context="Test")
+
+    # ================================================================
+    # Pattern subscription tests
+    # ================================================================
+
+    def test_pattern_subscribers_resolved(self):
+        """Test publish resolution includes matching pattern subscribers."""
+        self.reporter.info("Testing pattern subscriptions", context="Test")
+
+        manager = ConnectionManager(max_clients_per_channel=1)
+        dashboard = self._create_mock_websocket()
+        owner = self._create_mock_websocket()
+        exact = self._create_mock_websocket()
+
+        manager.add_client(dashboard, "global")
+        assert manager.subscribe(dashboard, "backtest.*") is True
+        assert manager.subscribe(dashboard, "backtest.#") is True
+        manager.add_client(owner, "user.123", "123")
+        manager.subscribe(owner, "user.123.#")
+        manager.add_client(exact, "backtest.abc")
+
+        # Patterns are not channels and ignore the per-channel limit
+        assert manager.get_pattern_count() == 3
+        assert "backtest.*" not in manager.channels
+
+        subscribers = manager.get_channel_subscribers("backtest.abc")
+        assert sorted(map(id, subscribers)) == sorted(map(id, [exact, dashboard]))
+
+        # Exact and pattern subscription on one connection: delivered once
+        manager.subscribe(owner, "backtest.*")
+        manager.unsubscribe(exact, "backtest.abc")
+        manager.subscribe(owner, "backtest.abc")
+        subscribers = manager.get_channel_subscribers("backtest.abc")
+        assert sorted(map(id, subscribers)) == sorted(map(id, [owner, dashboard]))
+
+        assert manager.get_channel_subscribers("user.123.orders") == [owner]
+        assert manager.get_channel_subscribers("user.123") == [owner]
+        assert manager.get_channel_subscribers("global") == [dashboard]
+
+        self.reporter.info("Pattern subscribers resolved once", context="Test")
+
+    def test_pattern_unsubscribe_and_disconnect(self):
+        """Test pattern subscriptions are left on unsubscribe and disconnect."""
+        self.reporter.info("Testing pattern removal", context="Test")
+
+        manager = ConnectionManager(max_subscriptions_per_connection=3)
+        ws = self._create_mock_websocket()
+        manager.add_client(ws, "global")
+        manager.subscribe(ws, "forge.job.*")
+        manager.subscribe(ws, "user.1.#")
+
+        try:
+            manager.subscribe(ws, "forge.#")
+            assert False, "Should have raised ConnectionLimitExceeded"
+        except ConnectionLimitExceeded as e:
+            assert e.limit_type == "per_connection"
+
+        try:
+            manager.subscribe(ws, "user.#.x")
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        assert manager.get_subscriptions(ws) == ["forge.job.*", "global", "user.1.#"]
+        assert manager.unsubscribe(ws, "forge.job.*") is True
+        assert manager.unsubscribe(ws, "forge.job.*") is False
+        assert manager.get_channel_subscribers("forge.job.x") == []
+
+        assert sorted(manager.disconnect(ws)) == ["global", "user.1.#"]
+        assert manager.get_pattern_count() == 0
+        assert manager.get_channel_subscribers("user.1.x") == []
+
+        self.reporter.info("Pattern subscriptions removed", context="Test")
+
 
 if __name__ == "__main__":
     TestConnectionManager.run_as_main()
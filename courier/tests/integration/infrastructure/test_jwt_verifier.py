@@ -231,6 +231,22 @@ class TestJWTVerifier(LaborantTest):
         assert verifier.verify_channel_access("123", "unknown.channel") is False
         self.reporter.info("Unknown channel access denied", context="Test")
 
+    def test_verify_pattern_access(self):
+        """Test wildcard patterns only within fully readable namespaces."""
+        self.reporter.info("Testing pattern access", context="Test")
+
+        verifier = JWTVerifier(secret=self.SECRET_KEY)
+
+        for pattern in ("forge.job.*", "backtest.#", "strategy.*", "user.123.#"):
+            assert verifier.verify_channel_access("123", pattern) is True
+
+        # Patterns that could match channels the user may not read
+        for pattern in ("user.*", "user.456.#", "#", "forge.*", "*.progress"):
+            assert verifier.verify_channel_access("123", pattern) is False
+
+        assert verifier.verify_channel_access("123", "user.#.x") is False
+        self.reporter.info("Pattern access restricted", context="Test")
+
     # ================================================================
     # End-to-end integration tests
     # ================================================================
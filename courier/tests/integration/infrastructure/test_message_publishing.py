@@ -8,6 +8,8 @@ Usage:
     laborant courier --integration
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock
 
 from fastapi import WebSocket
@@ -69,8 +71,8 @@ class TestMessagePublishing(LaborantTest):
         )
 
         assert sent_count == 1
-        assert ws.send_json.called
-        assert ws.send_json.call_count == 1
+        assert ws.send_text.called
+        assert ws.send_text.call_count == 1
 
         self.reporter.info("Message broadcast successfully", context="Test")
 
@@ -95,9 +97,9 @@ class TestMessagePublishing(LaborantTest):
         )
 
         assert sent_count == 3
-        assert ws1.send_json.call_count == 1
-        assert ws2.send_json.call_count == 1
-        assert ws3.send_json.call_count == 1
+        assert ws1.send_text.call_count == 1
+        assert ws2.send_text.call_count == 1
+        assert ws3.send_text.call_count == 1
 
         self.reporter.info("Broadcast to all subscribers successful", context="Test")
 
@@ -126,7 +128,7 @@ class TestMessagePublishing(LaborantTest):
         ws3 = self._create_mock_websocket()
         channel = "user.123"
 
-        ws2.send_json = AsyncMock(side_effect=Exception("Connection closed"))
+        ws2.send_text = AsyncMock(side_effect=Exception("Connection closed"))
 
         self.manager.add_client(ws1, channel)
         self.manager.add_client(ws2, channel)
@@ -140,12 +142,160 @@ class TestMessagePublishing(LaborantTest):
         )
 
         assert sent_count == 2
-        assert ws1.send_json.call_count == 1
-        assert ws2.send_json.call_count == 1
-        assert ws3.send_json.call_count == 1
+        assert ws1.send_text.call_count == 1
+        assert ws2.send_text.call_count == 1
+        assert ws3.send_text.call_count == 1
 
         self.reporter.info("Dead connection skipped successfully", context="Test")
 
+    async def test_broadcast_evicts_dead_connection_from_manager(self):
+        """Test dead connections are removed from the channel and registry."""
+        self.reporter.info("Testing dead connection eviction", context="Test")
+
+        broadcast = BroadcastMessageUseCase(
+            on_dead_client=lambda ws, channel: self.manager.disconnect(ws)
+        )
+        alive = self._create_mock_websocket()
+        dead = self._create_mock_websocket()
+        dead.send_text = AsyncMock(side_effect=Exception("Connection closed"))
+        channel = "user.456"
+
+        self.manager.add_client(alive, channel, user_id="456")
+        self.manager.add_client(dead, channel, user_id="456")
+
+        message = {"type": "alert", "message": "Balance low"}
+        subscribers = self.manager.get_channel_subscribers(channel)
+        assert await broadcast.execute(channel, message, subscribers) == 1
+
+        assert self.manager.get_channel_subscribers(channel) == [alive]
+        assert self.manager.get_client(dead) is None
+        assert self.manager.get_user_connection_count("456") == 1
+
+        # Next broadcast no longer tries the dead connection
+        subscribers = self.manager.get_channel_subscribers(channel)
+        assert await broadcast.execute(channel, message, subscribers) == 1
+        assert dead.send_text.call_count == 1
+
+        self.reporter.info("Dead connection evicted from manager", context="Test")
+
+    async def test_queued_broadcast_not_delayed_by_slow_client(self):
+        """Test queued delivery returns before a stalled client reads."""
+        self.reporter.info("Testing queued broadcast", context="Test")
+
+        manager = ConnectionManager(
+            outbound_queue_size=4,
+            overflow_policies={"backtest.progress": "drop_oldest"},
+        )
+        broadcast = BroadcastMessageUseCase(
+            on_dead_client=lambda ws, channel: manager.disconnect(ws),
+            enqueue=manager.enqueue,
+        )
+
+        async def stall(payload):
+            await asyncio.sleep(3600)
+
+        stalled = self._create_mock_websocket()
+        stalled.send_text = AsyncMock(side_effect=stall)
+        fast = self._create_mock_websocket()
+        channel = "backtest.abc"
+
+        manager.add_client(stalled, channel, user_id="1")
+        manager.add_client(fast, channel, user_id="2")
+
+        start = time.perf_counter()
+        for i in range(10):
+            message = {"type": "backtest.progress", "progress": i / 10}
+            subscribers = manager.get_channel_subscribers(channel)
+            assert await broadcast.execute(channel, message, subscribers) >= 1
+            await asyncio.sleep(0)  # next publish request
+        assert time.perf_counter() - start < 0.5
+
+        await asyncio.sleep(0.01)
+        assert fast.send_text.call_count == 10
+
+        # Stalled client: 1 in flight, 4 queued, 5 progress updates dropped
+        stats = manager.get_outbound_stats()
+        assert stats["max_queue_depth"] == 4
+        assert stats["full_queues"] == 1
+        assert stats["dropped_by_type"] == {"backtest.progress": 5}
+        assert stats["overflow_disconnects"] == 0
+
+        # A message under the disconnect policy drops the stalled client
+        message = {"type": "backtest.completed", "progress": 1.0}
+        subscribers = manager.get_channel_subscribers(channel)
+        assert await broadcast.execute(channel, message, subscribers) == 1
+        await asyncio.sleep(0.01)
+
+        assert manager.get_channel_subscribers(channel) == [fast]
+        assert manager.get_outbound_stats()["overflow_disconnects"] == 1
+        stalled.close.assert_called_once()
+        manager.remove_client(fast, channel)
+
+        self.reporter.info("Slow client isolated by its queue", context="Test")
+
+    async def test_writer_timeout_closes_socket(self):
+        """Test a writer send timeout unregisters and closes the socket."""
+        self.reporter.info("Testing writer timeout close", context="Test")
+
+        manager = ConnectionManager(outbound_queue_size=4, send_timeout=0.05)
+
+        async def stall(payload):
+            await asyncio.sleep(3600)
+
+        stalled = self._create_mock_websocket()
+        stalled.send_text = AsyncMock(side_effect=stall)
+        channel = "backtest.abc"
+        manager.add_client(stalled, channel, user_id="1")
+
+        assert manager.enqueue(stalled, '{"type": "custom.event"}', "custom.event")
+        await asyncio.sleep(0.15)
+
+        # Not left open as a connection that silently receives nothing
+        assert manager.get_client(stalled) is None
+        assert manager.get_channel_subscribers(channel) == []
+        stalled.close.assert_awaited_once()
+        assert stalled.close.await_args.kwargs["code"] == 1008
+
+        self.reporter.info("Timed-out writer closed its socket", context="Test")
+
+    async def test_multi_channel_connection_receives_each_publish_once(self):
+        """Test one connection on several channels gets each publish once."""
+        self.reporter.info("Testing multi-channel delivery", context="Test")
+
+        manager = ConnectionManager(outbound_queue_size=8)
+        broadcast = BroadcastMessageUseCase(
+            on_dead_client=lambda ws, channel: manager.disconnect(ws),
+            enqueue=manager.enqueue,
+        )
+        ws = self._create_mock_websocket()
+        other = self._create_mock_websocket()
+
+        manager.add_client(ws, "global", user_id="1")
+        manager.subscribe(ws, "user.1")
+        manager.add_client(ws, "user.1", user_id="1")  # repeated subscribe
+        manager.add_client(other, "global", user_id="2")
+
+        for channel in ("global", "user.1", "user.1"):
+            subscribers = manager.get_channel_subscribers(channel)
+            await broadcast.execute(channel, {"channel": channel}, subscribers)
+        await asyncio.sleep(0.01)
+
+        assert ws.send_text.call_count == 3
+        assert other.send_text.call_count == 1
+
+        # A failed write drops the connection from every channel
+        ws.send_text = AsyncMock(side_effect=Exception("Connection closed"))
+        subscribers = manager.get_channel_subscribers("global")
+        await broadcast.execute("global", {"n": 1}, subscribers)
+        await asyncio.sleep(0.01)
+
+        assert manager.get_client(ws) is None
+        assert manager.get_channel_subscribers("user.1") == []
+        assert manager.get_channel_subscribers("global") == [other]
+        manager.disconnect(other)
+
+        self.reporter.info("Each publish delivered once", context="Test")
+
     async def test_broadcast_message_validation(self):
         """Test message data validation during broadcast."""
         self.reporter.info("Testing message validation", context="Test")
@@ -186,7 +336,7 @@ class TestMessagePublishing(LaborantTest):
         sent = await self.broadcast_use_case.execute(channel, notif_msg, subscribers)
         assert sent == 1
 
-        assert ws.send_json.call_count == 3
+        assert ws.send_text.call_count == 3
 
         self.reporter.info(
             "Different message types broadcast successfully", context="Test"
@@ -209,7 +359,7 @@ class TestMessagePublishing(LaborantTest):
         )
 
         assert sent_count == 1
-        assert ws.send_json.call_count == 1
+        assert ws.send_text.call_count == 1
 
         self.reporter.info("User-specific broadcast successful", context="Test")
 
@@ -233,8 +383,8 @@ class TestMessagePublishing(LaborantTest):
         )
 
         assert sent_count == 2
-        assert ws1.send_json.call_count == 1
-        assert ws2.send_json.call_count == 1
+        assert ws1.send_text.call_count == 1
+        assert ws2.send_text.call_count == 1
 
         self.reporter.info("Strategy channel broadcast successful", context="Test")
 
@@ -0,0 +1,74 @@
+"""
+Integration tests for the publish route.
+
+Tests that publish errors raised while encoding a message map to HTTP
+4xx responses and reach no subscriber.
+
+Usage:
+    python -m courier.tests.integration.presentation.test_publish_routes
+    laborant courier --integration
+"""
+
+import json
+from unittest.mock import Mock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from shared.tests import LaborantTest
+
+from courier.config.settings import Settings
+from courier.di import Container
+from courier.presentation.api.dependencies import get_container
+from courier.presentation.api.routes.publish import router as publish_router
+from courier.presentation.api.routes.websocket import router as websocket_router
+
+
+class TestPublishRoutes(LaborantTest):
+    """Integration tests for POST /publish."""
+
+    component_name = "courier"
+    test_category = "integration"
+
+    def setup(self):
+        """Build an app with the publish and WebSocket routes."""
+        self.container = Container(Settings(rate_limit_enabled=False), self.reporter)
+
+        app = FastAPI()
+        app.include_router(publish_router)
+        app.include_router(websocket_router)
+        app.dependency_overrides[get_container] = lambda: self.container
+        self.client = TestClient(app)
+
+    # ================================================================
+    # Message encoding tests
+    # ================================================================
+
+    def test_unserializable_data_returns_400(self):
+        """Test data that cannot be encoded is rejected before any send."""
+        self.reporter.info("Testing unserializable publish data", context="Test")
+
+        # A validated event whose dump holds a value JSON cannot encode
+        event = Mock()
+        event.model_dump.return_value = {"type": "custom.event", "at": object()}
+        validate_uc = Mock()
+        validate_uc.execute.return_value = event
+        self.container.get_validate_event_use_case = lambda: validate_uc
+
+        with self.client.websocket_connect("/ws/backtest.abc") as ws:
+            response = self.client.post(
+                "/publish",
+                json={"channel": "backtest.abc", "data": {"type": "custom.event"}},
+            )
+
+            assert response.status_code == 400
+            assert "Invalid message data" in response.json()["detail"]
+
+            # The next frame is the pong, so nothing was broadcast first
+            ws.send_text(json.dumps({"type": "ping"}))
+            assert ws.receive_json() == {"type": "pong"}
+
+        self.reporter.info("Unserializable data rejected with 400", context="Test")
+
+
+if __name__ == "__main__":
+    TestPublishRoutes.run_as_main()
@@ -0,0 +1,125 @@
+"""
+Integration tests for the WebSocket route.
+
+Tests subscribe control messages through the FastAPI app with
+authentication required, including connections already dropped by the
+connection manager.
+
+Usage:
+    python -m courier.tests.integration.presentation.test_websocket_routes
+    laborant courier --integration
+"""
+
+import json
+import time
+
+import jwt
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from shared.tests import LaborantTest
+
+from courier.config.settings import Settings
+from courier.di import Container
+from courier.presentation.api.dependencies import get_container
+from courier.presentation.api.routes.websocket import router
+
+
+class TestWebSocketRoutes(LaborantTest):
+    """Integration tests for WebSocket subscriptions."""
+
+    component_name = "courier"
+    test_category = "integration"
+
+    SECRET_KEY = "test-secret-key-for-route-tests"
+
+    def setup(self):
+        """Build an app that requires authentication."""
+        settings = Settings(
+            require_auth=True,
+            jwt_secret=self.SECRET_KEY,
+            rate_limit_enabled=False,
+        )
+        self.container = Container(settings, self.reporter)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_container] = lambda: self.container
+        self.client = TestClient(app)
+
+    def _token(self, user_id: str) -> str:
+        """Create a valid JWT for user_id."""
+        now = int(time.time())
+        payload = {
+            "user_id": user_id,
+            "wallet_address": "test_wallet",
+            "exp": now + 3600,
+            "iat": now,
+        }
+        return jwt.encode(payload, self.SECRET_KEY, algorithm="HS256")
+
+    def _subscribe(self, ws, channel: str) -> dict:
+        """Send a subscribe control message and return the reply."""
+        ws.send_text(json.dumps({"type": "subscribe", "channel": channel}))
+        return ws.receive_json()
+
+    # ================================================================
+    # Pattern authorization tests
+    # ================================================================
+
+    def test_anonymous_pattern_rejected(self):
+        """Test unauthenticated connections cannot subscribe to patterns."""
+        self.reporter.info("Testing anonymous pattern subscribe", context="Test")
+
+        with self.client.websocket_connect("/ws/global") as ws:
+            for pattern in ("#", "user.*", "backtest.*"):
+                reply = self._subscribe(ws, pattern)
+                assert reply["type"] == "error", pattern
+                assert reply["code"] == "UNAUTHORIZED"
+
+            # Exact public channels keep working anonymously
+            reply = self._subscribe(ws, "backtest.abc")
+            assert reply["type"] == "subscribed"
+            assert reply["channels"] == ["backtest.abc", "global"]
+
+        self.reporter.info("Anonymous patterns rejected", context="Test")
+
+    def test_authenticated_pattern_authorized(self):
+        """Test authenticated connections get patterns within their namespace."""
+        self.reporter.info("Testing authenticated pattern subscribe", context="Test")
+
+        token = self._token("123")
+        with self.client.websocket_connect(f"/ws/global?token={token}") as ws:
+            assert self._subscribe(ws, "user.123.#")["type"] == "subscribed"
+            assert self._subscribe(ws, "#")["code"] == "UNAUTHORIZED"
+            assert self._subscribe(ws, "user.*")["code"] == "UNAUTHORIZED"
+
+        self.reporter.info("Authenticated patterns authorized", context="Test")
+
+    # ================================================================
+    # Dropped connection tests
+    # ================================================================
+
+    def test_subscribe_after_manager_drop(self):
+        """Test subscribe on a connection the manager dropped returns an error."""
+        self.reporter.info("Testing subscribe after drop", context="Test")
+
+        manager = self.container.connection_manager
+        with self.client.websocket_connect("/ws/global") as ws:
+            # e.g. evicted after an outbound queue overflow
+            (server_ws,) = manager._connections.values()
+            manager.disconnect(server_ws)
+
+            reply = self._subscribe(ws, "backtest.abc")
+            assert reply["type"] == "error"
+            assert reply["code"] == "CONNECTION_CLOSED"
+            assert "backtest.abc" not in manager.channels
+
+            # The endpoint keeps serving the socket instead of failing
+            ws.send_text(json.dumps({"type": "ping"}))
+            assert ws.receive_json() == {"type": "pong"}
+
+        self.reporter.info("Dropped connection answered", context="Test")
+
+
+if __name__ == "__main__":
+    TestWebSocketRoutes.run_as_main()
@@ -310,6 +310,40 @@ class TestAuthenticateWebSocketUseCase(LaborantTest):
         except AuthorizationError:
             self.reporter.info("Cross-user access blocked", context="Test")
 
+    def test_authorize_channel_for_subscription(self):
+        """Test authorize_channel checks later subscriptions of a connection."""
+        self.reporter.info("Testing subscription authorization", context="Test")
+
+        mock_verifier = Mock()
+        current_time = int(time.time())
+        payload = TokenPayload(
+            user_id="123",
+            wallet_address="test",
+            exp=current_time + 3600,
+            iat=current_time,
+        )
+        mock_verifier.verify_channel_access.side_effect = (
+            lambda user_id, channel: channel != "user.999"
+        )
+
+        use_case = AuthenticateWebSocketUseCase(jwt_verifier=mock_verifier)
+        use_case.authorize_channel(payload, "user.123")
+
+        try:
+            use_case.authorize_channel(payload, "user.999")
+            assert False, "Should have raised AuthorizationError"
+        except AuthorizationError as e:
+            assert e.resource == "user.999"
+
+        try:
+            use_case.authorize_channel(payload, "Bad Channel")
+            assert False, "Should have raised AuthenticationError"
+        except AuthenticationError:
+            pass
+
+        mock_verifier.verify_token.assert_not_called()
+        self.reporter.info("Subscription authorization enforced", context="Test")
+
     # ================================================================
     # Edge cases
     # ================================================================
@@ -8,6 +8,9 @@ Usage:
     laborant courier --unit
 """
 
+import asyncio
+import json
+import time
 from unittest.mock import AsyncMock, Mock
 
 from shared.tests import LaborantTest
@@ -15,6 +18,12 @@ from shared.tests import LaborantTest
 from courier.application.use_cases.broadcast_message import BroadcastMessageUseCase
 
 
+def _sent(ws: Mock) -> dict:
+    """Decode the JSON text frame sent to a mock WebSocket."""
+    ws.send_text.assert_called_once()
+    return json.loads(ws.send_text.call_args.args[0])
+
+
 class TestBroadcastMessageUseCase(LaborantTest):
     """Unit tests for BroadcastMessageUseCase."""
 
@@ -31,14 +40,14 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         message_data = {"type": "trade", "amount": 100}
         sent_count = await use_case.execute("user.123", message_data, subscribers)
 
         assert sent_count == 1
-        mock_ws.send_json.assert_called_once_with(message_data)
+        assert _sent(mock_ws) == message_data
         self.reporter.info("Message sent to single subscriber", context="Test")
 
     async def test_broadcast_to_multiple_subscribers(self):
@@ -47,20 +56,20 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws1 = Mock()
-        mock_ws1.send_json = AsyncMock()
+        mock_ws1.send_text = AsyncMock()
         mock_ws2 = Mock()
-        mock_ws2.send_json = AsyncMock()
+        mock_ws2.send_text = AsyncMock()
         mock_ws3 = Mock()
-        mock_ws3.send_json = AsyncMock()
+        mock_ws3.send_text = AsyncMock()
         subscribers = [mock_ws1, mock_ws2, mock_ws3]
 
         message_data = {"type": "notification", "text": "hello"}
         sent_count = await use_case.execute("global", message_data, subscribers)
 
         assert sent_count == 3
-        mock_ws1.send_json.assert_called_once_with(message_data)
-        mock_ws2.send_json.assert_called_once_with(message_data)
-        mock_ws3.send_json.assert_called_once_with(message_data)
+        assert _sent(mock_ws1) == message_data
+        assert _sent(mock_ws2) == message_data
+        assert _sent(mock_ws3) == message_data
         self.reporter.info("Message sent to all subscribers", context="Test")
 
     async def test_broadcast_to_empty_subscriber_list(self):
@@ -82,7 +91,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         complex_data = {
@@ -97,7 +106,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
         sent_count = await use_case.execute("strategy.abc", complex_data, subscribers)
 
         assert sent_count == 1
-        mock_ws.send_json.assert_called_once_with(complex_data)
+        assert _sent(mock_ws) == complex_data
         self.reporter.info("Complex message broadcasted successfully", context="Test")
 
     # ================================================================
@@ -110,11 +119,11 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws1 = Mock()
-        mock_ws1.send_json = AsyncMock()
+        mock_ws1.send_text = AsyncMock()
         mock_ws2 = Mock()
-        mock_ws2.send_json = AsyncMock(side_effect=Exception("Connection closed"))
+        mock_ws2.send_text = AsyncMock(side_effect=Exception("Connection closed"))
         mock_ws3 = Mock()
-        mock_ws3.send_json = AsyncMock()
+        mock_ws3.send_text = AsyncMock()
         subscribers = [mock_ws1, mock_ws2, mock_ws3]
 
         message_data = {"type": "test"}
@@ -131,9 +140,9 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws1 = Mock()
-        mock_ws1.send_json = AsyncMock(side_effect=Exception("Connection closed"))
+        mock_ws1.send_text = AsyncMock(side_effect=Exception("Connection closed"))
         mock_ws2 = Mock()
-        mock_ws2.send_json = AsyncMock(side_effect=Exception("Connection closed"))
+        mock_ws2.send_text = AsyncMock(side_effect=Exception("Connection closed"))
         subscribers = [mock_ws1, mock_ws2]
 
         message_data = {"type": "test"}
@@ -148,11 +157,11 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws1 = Mock()
-        mock_ws1.send_json = AsyncMock()
+        mock_ws1.send_text = AsyncMock()
         mock_ws2 = Mock()
-        mock_ws2.send_json = AsyncMock(side_effect=Exception("Connection closed"))
+        mock_ws2.send_text = AsyncMock(side_effect=Exception("Connection closed"))
         mock_ws3 = Mock()
-        mock_ws3.send_json = AsyncMock()
+        mock_ws3.send_text = AsyncMock()
         subscribers = [mock_ws1, mock_ws2, mock_ws3]
 
         message_data = {"type": "test"}
@@ -160,10 +169,123 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         # Both ws1 and ws3 should receive message despite ws2 failing
         assert sent_count == 2
-        mock_ws1.send_json.assert_called_once()
-        mock_ws3.send_json.assert_called_once()
+        mock_ws1.send_text.assert_called_once()
+        mock_ws3.send_text.assert_called_once()
         self.reporter.info("Broadcast continued after error", context="Test")
 
+    async def test_broadcast_evicts_dead_connections(self):
+        """Test failed subscribers are passed to on_dead_client."""
+        self.reporter.info("Testing dead connection eviction", context="Test")
+
+        evicted = []
+        use_case = BroadcastMessageUseCase(
+            on_dead_client=lambda ws, channel: evicted.append((ws, channel))
+        )
+        alive = Mock()
+        alive.send_text = AsyncMock()
+        dead = Mock()
+        dead.send_text = AsyncMock(side_effect=Exception("Connection closed"))
+        subscribers = [alive, dead]
+
+        sent_count = await use_case.execute("global", {"type": "test"}, subscribers)
+
+        assert sent_count == 1
+        assert evicted == [(dead, "global")]
+        dead.close.assert_not_called()
+        self.reporter.info("Dead connection evicted", context="Test")
+
+    # ================================================================
+    # Serialization & concurrency tests
+    # ================================================================
+
+    async def test_broadcast_serializes_payload_once(self):
+        """Test every subscriber receives the same encoded payload."""
+        self.reporter.info("Testing serialize-once payload", context="Test")
+
+        use_case = BroadcastMessageUseCase()
+        subscribers = []
+        for _ in range(5):
+            ws = Mock()
+            ws.send_text = AsyncMock()
+            subscribers.append(ws)
+
+        message_data = {"type": "price", "symbol": "SOL/USDC", "note": "café"}
+        sent_count = await use_case.execute("global", message_data, subscribers)
+
+        assert sent_count == 5
+        payloads = [ws.send_text.call_args.args[0] for ws in subscribers]
+        assert all(payload is payloads[0] for payload in payloads)
+        # Same text as WebSocket.send_json() would produce
+        assert payloads[0] == json.dumps(
+            message_data, ensure_ascii=False, separators=(",", ":")
+        )
+        self.reporter.info("Payload encoded once", context="Test")
+
+    async def test_slow_subscriber_does_not_stall_others(self):
+        """Test a slow subscriber times out, is evicted and closed."""
+        self.reporter.info("Testing slow subscriber timeout", context="Test")
+
+        delivered_at = {}
+
+        def _recorder(name, delay=0.0):
+            async def send_text(payload):
+                await asyncio.sleep(delay)
+                delivered_at[name] = time.perf_counter()
+
+            return send_text
+
+        evicted = []
+        use_case = BroadcastMessageUseCase(
+            send_timeout=0.2,
+            on_dead_client=lambda ws, channel: evicted.append(ws),
+        )
+        slow = Mock()
+        slow.send_text = _recorder("slow", delay=10.0)
+        slow.close = AsyncMock()
+        fast = []
+        for i in range(3):
+            ws = Mock()
+            ws.send_text = _recorder(f"fast{i}")
+            fast.append(ws)
+
+        start = time.perf_counter()
+        sent_count = await use_case.execute(
+            "backtest.progress", {"type": "progress"}, [slow] + fast
+        )
+        elapsed = time.perf_counter() - start
+
+        assert sent_count == 3
+        assert "slow" not in delivered_at
+        assert all(delivered_at[f"fast{i}"] - start < 0.1 for i in range(3))
+        assert elapsed < 1.0
+        assert evicted == [slow]
+        slow.close.assert_called_once()
+        self.reporter.info("Slow subscriber evicted after timeout", context="Test")
+
+    async def test_broadcast_rejects_unserializable_data(self):
+        """Test non-JSON data raises ValueError before any send."""
+        self.reporter.info("Testing unserializable data", context="Test")
+
+        use_case = BroadcastMessageUseCase()
+        mock_ws = Mock()
+        mock_ws.send_text = AsyncMock()
+
+        try:
+            await use_case.execute("global", {"type": "x", "v": object()}, [mock_ws])
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        mock_ws.send_text.assert_not_called()
+
+        try:
+            BroadcastMessageUseCase(send_timeout=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Unserializable data rejected", context="Test")
+
     # ================================================================
     # Validation tests
     # ================================================================
@@ -174,7 +296,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         try:
@@ -189,7 +311,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         try:
@@ -204,7 +326,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         try:
@@ -223,7 +345,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         sent_count = await use_case.execute(
@@ -239,7 +361,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         sent_count = await use_case.execute(
@@ -255,7 +377,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         sent_count = await use_case.execute(
@@ -271,7 +393,7 @@ class TestBroadcastMessageUseCase(LaborantTest):
 
         use_case = BroadcastMessageUseCase()
         mock_ws = Mock()
-        mock_ws.send_json = AsyncMock()
+        mock_ws.send_text = AsyncMock()
         subscribers = [mock_ws]
 
         sent_count = await use_case.execute(
@@ -0,0 +1,111 @@
+"""
+Unit tests for ChannelPattern value object.
+
+Tests wildcard pattern validation and matching.
+
+Usage:
+    python -m courier.tests.unit.domain.value_objects.test_channel_pattern
+    laborant courier --unit
+"""
+
+from shared.tests import LaborantTest
+
+from courier.domain.value_objects.channel_pattern import ChannelPattern
+
+
+class TestChannelPattern(LaborantTest):
+    """Unit tests for ChannelPattern value object."""
+
+    component_name = "courier"
+    test_category = "unit"
+
+    # ================================================================
+    # Creation & Validation tests
+    # ================================================================
+
+    def test_create_valid_patterns(self):
+        """Test creating ChannelPattern with valid patterns."""
+        self.reporter.info("Testing valid patterns", context="Test")
+
+        for value in ("forge.job.*", "user.123.#", "backtest.*.progress", "#"):
+            pattern = ChannelPattern(value)
+            assert pattern.value == value
+            assert str(pattern) == value
+
+        assert ChannelPattern("user.123.#").segments == ("user", "123", "#")
+        self.reporter.info("Valid patterns accepted", context="Test")
+
+    def test_invalid_patterns_rejected(self):
+        """Test invalid patterns raise ValueError."""
+        self.reporter.info("Testing invalid patterns", context="Test")
+
+        invalid = [
+            "",
+            "user.123",  # no wildcard
+            "user.#.orders",  # '#' not last
+            "forge.job*",  # wildcard inside a segment
+            "forge..*",  # empty segment
+            "Forge.*",  # uppercase
+            "a." * 50 + "*",  # too long
+        ]
+        for value in invalid:
+            try:
+                ChannelPattern(value)
+                assert False, f"Should have raised ValueError for {value!r}"
+            except ValueError:
+                pass
+
+        self.reporter.info("Invalid patterns rejected", context="Test")
+
+    def test_is_pattern(self):
+        """Test telling patterns from exact channel names."""
+        self.reporter.info("Testing is_pattern", context="Test")
+
+        assert ChannelPattern.is_pattern("forge.job.*") is True
+        assert ChannelPattern.is_pattern("user.123.#") is True
+        assert ChannelPattern.is_pattern("user.123") is False
+        self.reporter.info("Patterns detected", context="Test")
+
+    def test_literal_prefix(self):
+        """Test literal prefix stops at the first wildcard."""
+        self.reporter.info("Testing literal prefix", context="Test")
+
+        assert ChannelPattern("forge.job.*").literal_prefix == "forge.job"
+        assert ChannelPattern("backtest.*.progress").literal_prefix == "backtest"
+        assert ChannelPattern("#").literal_prefix == ""
+        self.reporter.info("Literal prefix extracted", context="Test")
+
+    # ================================================================
+    # Matching tests
+    # ================================================================
+
+    def test_single_segment_wildcard(self):
+        """Test '*' matches exactly one segment."""
+        self.reporter.info("Testing '*' matching", context="Test")
+
+        pattern = ChannelPattern("forge.job.*")
+
+        assert pattern.matches("forge.job.abc") is True
+        assert pattern.matches("forge.job") is False
+        assert pattern.matches("forge.job.abc.logs") is False
+        assert pattern.matches("forge.task.abc") is False
+        assert ChannelPattern("backtest.*.progress").matches("backtest.x.progress")
+        self.reporter.info("'*' matches one segment", context="Test")
+
+    def test_multi_segment_wildcard(self):
+        """Test '#' matches zero or more trailing segments."""
+        self.reporter.info("Testing '#' matching", context="Test")
+
+        pattern = ChannelPattern("user.123.#")
+
+        assert pattern.matches("user.123") is True
+        assert pattern.matches("user.123.orders") is True
+        assert pattern.matches("user.123.orders.filled") is True
+        assert pattern.matches("user.1234") is False
+        assert pattern.matches("user.456.orders") is False
+        assert ChannelPattern("#").matches("global") is True
+        self.reporter.info("'#' matches trailing segments", context="Test")
+
+
+if __name__ == "__main__":
+    TestChannelPattern.run_as_main()
@@ -132,6 +132,25 @@ class TestMessage(LaborantTest):
         assert message.get_type() == "unknown"
         self.reporter.info("Default type 'unknown' returned", context="Test")
 
+    def test_to_json_encodes_once(self):
+        """Test to_json() returns cached compact JSON of the data."""
+        self.reporter.info("Testing JSON encoding", context="Test")
+
+        data = {"type": "test", "items": [1, 2], "text": "naïve"}
+        message = Message(data=data)
+
+        encoded = message.to_json()
+        assert encoded == '{"type":"test","items":[1,2],"text":"naïve"}'
+        assert message.to_json() is encoded
+
+        try:
+            Message(data={"type": "test", "when": datetime(2024, 1, 1)}).to_json()
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert isinstance(e.__cause__, TypeError)
+
+        self.reporter.info("JSON encoded once", context="Test")
+
     # ================================================================
     # Timestamp tests
     # ================================================================
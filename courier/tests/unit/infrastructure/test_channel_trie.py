@@ -0,0 +1,127 @@
+"""
+Unit tests for ChannelTrie.
+
+Tests pattern subscription, wildcard matching, de-duplication of
+connections and pruning on removal.
+
+Usage:
+    python -m courier.tests.unit.infrastructure.test_channel_trie
+    laborant courier --unit
+"""
+
+import random
+from unittest.mock import Mock
+
+from shared.tests import LaborantTest
+
+from courier.domain.value_objects import ChannelPattern
+from courier.infrastructure.websocket.channel_trie import ChannelTrie
+
+
+class TestChannelTrie(LaborantTest):
+    """Unit tests for ChannelTrie."""
+
+    component_name = "courier"
+    test_category = "unit"
+
+    # ================================================================
+    # Matching tests
+    # ================================================================
+
+    def test_match_wildcards(self):
+        """Test '*' and '#' patterns resolve the right connections."""
+        self.reporter.info("Testing wildcard matching", context="Test")
+
+        trie = ChannelTrie()
+        jobs, user, everything, progress = Mock(), Mock(), Mock(), Mock()
+        trie.add("forge.job.*", jobs)
+        trie.add("user.123.#", user)
+        trie.add("#", everything)
+        trie.add("backtest.*.progress", progress)
+
+        def match(channel):
+            return set(trie.match(channel).values())
+
+        assert match("forge.job.abc") == {jobs, everything}
+        assert match("forge.job.abc.logs") == {everything}
+        assert match("user.123") == {user, everything}
+        assert match("user.123.orders.filled") == {user, everything}
+        assert match("user.456") == {everything}
+        assert match("backtest.x.progress") == {progress, everything}
+        assert match("backtest.x") == {everything}
+        assert len(trie) == 4
+
+        self.reporter.info("Wildcards matched", context="Test")
+
+    def test_connection_returned_once(self):
+        """Test a connection matched by several patterns is returned once."""
+        self.reporter.info("Testing de-duplication", context="Test")
+
+        trie = ChannelTrie()
+        ws = Mock()
+        assert trie.add("forge.job.*", ws) is True
+        assert trie.add("forge.#", ws) is True
+        assert trie.add("forge.job.*", ws) is False
+
+        assert list(trie.match("forge.job.abc").values()) == [ws]
+        assert trie.subscriber_count("forge.job.*") == 1
+
+        self.reporter.info("Connection returned once", context="Test")
+
+    def test_matches_reference_implementation(self):
+        """Test trie matching equals ChannelPattern.matches on every pattern."""
+        self.reporter.info("Testing trie against linear scan", context="Test")
+
+        rand = random.Random(3)
+        words = ["user", "forge", "job", "a", "b", "1"]
+        trie = ChannelTrie()
+        subscriptions = []
+
+        for _ in range(300):
+            segments = [rand.choice(words + ["*"]) for _ in range(rand.randint(1, 4))]
+            if rand.random() < 0.3:
+                segments.append("#")
+            if "*" not in segments and "#" not in segments:
+                segments[-1] = "*"
+            pattern = ChannelPattern(".".join(segments))
+            ws = Mock()
+            trie.add(pattern.value, ws)
+            subscriptions.append((pattern, ws))
+
+        for _ in range(300):
+            channel = ".".join(rand.choice(words) for _ in range(rand.randint(1, 5)))
+            expected = {id(ws) for p, ws in subscriptions if p.matches(channel)}
+            assert set(trie.match(channel)) == expected, channel
+
+        self.reporter.info("Trie matches linear scan", context="Test")
+
+    # ================================================================
+    # Removal tests
+    # ================================================================
+
+    def test_remove_prunes_branches(self):
+        """Test removing the last subscriber prunes empty nodes."""
+        self.reporter.info("Testing removal", context="Test")
+
+        trie = ChannelTrie()
+        ws1, ws2 = Mock(), Mock()
+        trie.add("forge.job.*", ws1)
+        trie.add("forge.job.*", ws2)
+        trie.add("forge.#", ws2)
+
+        assert trie.remove("forge.job.*", ws1) is True
+        assert trie.remove("forge.job.*", ws1) is False
+        assert trie.remove("user.*", ws1) is False
+        assert set(trie.match("forge.job.x").values()) == {ws2}
+
+        trie.remove("forge.job.*", ws2)
+        trie.remove("forge.#", ws2)
+        assert len(trie) == 0
+        assert trie.match("forge.job.x") == {}
+        assert trie._root.children == {}
+
+        self.reporter.info("Empty branches pruned", context="Test")
+
+
+if __name__ == "__main__":
+    TestChannelTrie.run_as_main()
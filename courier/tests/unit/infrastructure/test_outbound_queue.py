@@ -0,0 +1,226 @@
+"""
+Unit tests for OutboundQueue.
+
+Tests ordered delivery by the writer task, drop_oldest and disconnect
+overflow policies, send failures and timeouts, and closing.
+
+Usage:
+    python -m courier.tests.unit.infrastructure.test_outbound_queue
+    laborant courier --unit
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from shared.tests import LaborantTest
+
+from courier.infrastructure.websocket.outbound_queue import (
+    DISCONNECT,
+    DROP_OLDEST,
+    OutboundQueue,
+    OutboundQueueFull,
+)
+
+
+def _blocked_websocket() -> Mock:
+    """Mock WebSocket whose sends wait until .release is set."""
+    ws = Mock()
+    ws.sent = []
+    ws.release = asyncio.Event()
+
+    async def send_text(payload):
+        await ws.release.wait()
+        ws.sent.append(payload)
+
+    ws.send_text = send_text
+    return ws
+
+
+class TestOutboundQueue(LaborantTest):
+    """Unit tests for OutboundQueue."""
+
+    component_name = "courier"
+    test_category = "unit"
+
+    # ================================================================
+    # Delivery tests
+    # ================================================================
+
+    async def test_writer_sends_in_order(self):
+        """Test queued messages are sent in order by the writer task."""
+        self.reporter.info("Testing ordered delivery", context="Test")
+
+        ws = _blocked_websocket()
+        ws.release.set()
+        queue = OutboundQueue(ws, maxsize=10)
+
+        for i in range(5):
+            assert queue.put(f"m{i}", "update") is True
+
+        await asyncio.sleep(0.01)
+        assert ws.sent == ["m0", "m1", "m2", "m3", "m4"]
+        assert queue.depth == 0
+        assert queue.sent == 5
+
+        queue.put("m5", "update")
+        await asyncio.sleep(0.01)
+        assert ws.sent[-1] == "m5"
+
+        queue.close()
+        self.reporter.info("Messages delivered in order", context="Test")
+
+    async def test_put_does_not_wait_for_client(self):
+        """Test put() returns while the client is not reading."""
+        self.reporter.info("Testing non-blocking put", context="Test")
+
+        ws = _blocked_websocket()
+        queue = OutboundQueue(ws, maxsize=100)
+
+        for i in range(50):
+            queue.put(f"m{i}", "update")
+        await asyncio.sleep(0.01)
+
+        # First message is in flight, the rest wait in the queue
+        assert ws.sent == []
+        assert queue.depth == 49
+
+        ws.release.set()
+        await asyncio.sleep(0.01)
+        assert len(ws.sent) == 50
+
+        queue.close()
+        self.reporter.info("Put does not wait for client", context="Test")
+
+    # ================================================================
+    # Overflow tests
+    # ================================================================
+
+    async def test_drop_oldest_replaces_same_type(self):
+        """Test drop_oldest evicts the oldest message of the same type."""
+        self.reporter.info("Testing drop_oldest policy", context="Test")
+
+        ws = _blocked_websocket()
+        queue = OutboundQueue(ws, maxsize=3)
+
+        queue.put("in-flight", "backtest.progress")
+        await asyncio.sleep(0)
+        queue.put("p1", "backtest.progress")
+        queue.put("done", "backtest.completed")
+        queue.put("p2", "backtest.progress")
+
+        assert queue.put("p3", "backtest.progress", DROP_OLDEST) is True
+        assert queue.dropped == 1
+
+        # No queued chat chunk to replace: the new one is dropped
+        assert queue.put("c1", "prophet.message_chunk", DROP_OLDEST) is False
+        assert queue.dropped == 2
+
+        ws.release.set()
+        await asyncio.sleep(0.01)
+        assert ws.sent == ["in-flight", "done", "p2", "p3"]
+
+        queue.close()
+        self.reporter.info("Oldest progress update replaced", context="Test")
+
+    async def test_disconnect_policy_raises(self):
+        """Test a full queue raises OutboundQueueFull under disconnect."""
+        self.reporter.info("Testing disconnect policy", context="Test")
+
+        ws = _blocked_websocket()
+        queue = OutboundQueue(ws, maxsize=2)
+        queue.put("a", "alert")
+        await asyncio.sleep(0)
+        queue.put("b", "alert")
+        queue.put("c", "alert")
+
+        try:
+            queue.put("d", "alert", DISCONNECT)
+            assert False, "Should have raised OutboundQueueFull"
+        except OutboundQueueFull as e:
+            assert e.depth == 2
+
+        assert queue.depth == 2
+        queue.close()
+        self.reporter.info("Overflow raised for disconnect policy", context="Test")
+
+    # ================================================================
+    # Failure & lifecycle tests
+    # ================================================================
+
+    async def test_send_error_closes_queue(self):
+        """Test a failed send closes the queue and reports the client."""
+        self.reporter.info("Testing send failure", context="Test")
+
+        failed = []
+        ws = Mock()
+        ws.send_text = AsyncMock(side_effect=Exception("Connection closed"))
+        queue = OutboundQueue(ws, maxsize=5, on_send_error=failed.append)
+
+        queue.put("a", "alert")
+        queue.put("b", "alert")
+        await asyncio.sleep(0.01)
+
+        assert failed == [ws]
+        assert queue.closed
+        assert queue.depth == 0
+        assert ws.send_text.call_count == 1
+        assert queue.put("c", "alert") is False
+
+        self.reporter.info("Failed client reported once", context="Test")
+
+    async def test_stalled_send_times_out(self):
+        """Test a send exceeding send_timeout closes the queue and reports."""
+        self.reporter.info("Testing stalled send", context="Test")
+
+        failed = []
+        ws = _blocked_websocket()
+        queue = OutboundQueue(
+            ws, maxsize=2, on_send_error=failed.append, send_timeout=0.02
+        )
+
+        # drop_oldest traffic alone never overflows into a disconnect
+        for i in range(10):
+            queue.put(f"p{i}", "backtest.progress", DROP_OLDEST)
+        await asyncio.sleep(0.1)
+
+        assert failed == [ws]
+        assert queue.closed
+        assert queue.depth == 0
+        assert ws.sent == []
+
+        try:
+            OutboundQueue(ws, maxsize=1, send_timeout=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Stalled client reported", context="Test")
+
+    async def test_close_stops_writer(self):
+        """Test close() cancels the writer and rejects new messages."""
+        self.reporter.info("Testing close", context="Test")
+
+        ws = _blocked_websocket()
+        queue = OutboundQueue(ws, maxsize=5)
+        queue.put("a", "alert")
+        queue.put("b", "alert")
+        await asyncio.sleep(0)
+
+        queue.close()
+        ws.release.set()
+        await asyncio.sleep(0.01)
+
+        assert ws.sent == []
+        assert queue.put("c", "alert") is False
+
+        try:
+            OutboundQueue(ws, maxsize=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Writer stopped on close", context="Test")
+
+
+if __name__ == "__main__":
+    TestOutboundQueue.run_as_main()
@@ -1,8 +1,21 @@
 """
 Shared utilities and configurations for Lumière platform.
+
+Exports are imported lazily on first access, so importing a subpackage
+(e.g. shared.strategy in a worker process) does not load the
+blockchain clients.
 """
 
-from shared.blockchain.wallets import Environment, PlatformWallets
+from typing import TYPE_CHECKING
+
+from shared._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from shared.blockchain.wallets import Environment, PlatformWallets
+
+__getattr__, __dir__ = lazy_exports(
+    __name__, {".blockchain.wallets": ["Environment", "PlatformWallets"]}
+)
 
 __all__ = [
     "PlatformWallets",
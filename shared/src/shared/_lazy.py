@@ -0,0 +1,60 @@
+"""
+Lazy package exports.
+
+Packages declare which submodule defines each public name; the
+submodule is imported on first attribute access (PEP 562 module
+__getattr__) instead of when the package is imported, so e.g. a worker
+importing only Position does not pay for pandas.
+
+Usage (in a package __init__.py):
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        ".position": ["Position"],
+        ".enums": ["PositionSide", "PositionStatus"],
+    })
+"""
+
+import sys
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+
+def lazy_exports(
+    package: str, modules: Mapping[str, Sequence[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ for a package.
+
+    Resolved names are stored in the package namespace, so each is
+    looked up through __getattr__ only once.
+
+    Args:
+        package: Package name (pass __name__)
+        modules: Submodule (relative to package) -> names it defines
+
+    Returns:
+        (__getattr__, __dir__) for the package module
+    """
+    origins: Dict[str, str] = {
+        name: module for module, names in modules.items() for name in names
+    }
+
+    # A name equal to its submodule's name (e.g. resilience.timeout) would
+    # be rebound to the submodule whenever that is imported, so resolve
+    # those eagerly, as a plain "from .timeout import timeout" does
+    for name, module in origins.items():
+        if module.rsplit(".", 1)[-1] == name:
+            value = getattr(import_module(module, package), name)
+            setattr(sys.modules[package], name, value)
+
+    def __getattr__(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(module, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(origins))
+
+    return __getattr__, __dir__
@@ -0,0 +1,32 @@
+"""
+Backtesting package.
+
+Event-driven simulation of TradingStrategy instances over historical
+candles, with position lifecycle, fees, slippage, trade logs, equity
+curves, parallel parameter sweeps and a parameter optimizer that
+computes each distinct indicator configuration once.
+"""
+
+from shared.backtest.engine import (
+    BacktestConfig,
+    BacktestEngine,
+    SweepResult,
+    expand_grid,
+    indicator_columns,
+)
+from shared.backtest.optimizer import ParameterOptimizer, RankedResult, SweepPlan
+from shared.backtest.results import BacktestResult, BacktestStats, Trade
+
+__all__ = [
+    "BacktestEngine",
+    "BacktestConfig",
+    "BacktestResult",
+    "BacktestStats",
+    "Trade",
+    "SweepResult",
+    "ParameterOptimizer",
+    "RankedResult",
+    "SweepPlan",
+    "expand_grid",
+    "indicator_columns",
+]
@@ -0,0 +1,510 @@
+"""
+Event-driven backtest engine.
+
+Streams candles through a TradingStrategy bar by bar, exactly as a live
+runner would call it: indicators are precomputed once per run with an
+IndicatorPipeline (all shared indicators are causal, so value t only
+depends on bars <= t), then on every bar the engine
+
+1. updates the open Position with the close (trailing stop) and exits
+   on stop loss / take profit, otherwise asks check_exit_conditions();
+2. without a position, applies the daily loss limit and asks
+   check_entry_conditions(), sizing the entry with
+   calculate_position_size() (RiskLimitError rejects the entry);
+3. stores the bar's indicator values with _update_previous_values().
+
+Fills happen at the bar close moved against the trade by the slippage
+rate; fees are charged on the notional of every fill. Daily PnL resets
+on the first bar of each calendar day (bar time, not wall-clock time).
+
+Usage:
+    engine = BacktestEngine(BacktestConfig(fee_rate=0.001))
+    result = engine.run(strategy, {"RSI": RSIIndicator(period=14)}, candles_df)
+    result.stats.total_return_pct, result.trade_log(), result.equity
+"""
+
+import itertools
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Type, Union
+
+import numpy as np
+import pandas as pd
+
+from shared.backtest.results import (
+    BacktestResult,
+    BacktestStats,
+    Trade,
+    max_drawdown_pct,
+)
+from shared.indicators.base import BaseIndicator
+from shared.indicators.pipeline import IndicatorPipeline
+from shared.market_data.candle_store import COLUMNS, CandleStore
+from shared.strategy.base_strategy import TradingStrategy
+from shared.strategy.enums import PositionSide
+from shared.strategy.exceptions import RiskLimitError
+from shared.strategy.position import Position
+
+CandleSource = Union[pd.DataFrame, CandleStore]
+IndicatorFactory = Callable[[Dict[str, Any]], Mapping[str, BaseIndicator]]
+
+
+@dataclass(frozen=True)
+class BacktestConfig:
+    """
+    Simulation settings.
+
+    Percent-based exits may also be set per strategy through
+    strategy.config with the same keys, which take precedence.
+
+    Attributes:
+        initial_balance: Starting balance in quote currency
+        fee_rate: Fee per fill as a fraction of notional (0.001 = 0.1%)
+        slippage: Adverse price move per fill as a fraction (0.0005 = 5 bps)
+        side: Direction of entries
+        stop_loss_pct: Stop loss distance from entry, in percent
+        take_profit_pct: Take profit distance from entry, in percent
+        trailing_stop_pct: Trailing stop distance, in percent
+        warmup: Leading bars that only feed history (no trading)
+        start: First candle timestamp read from a CandleStore
+        end: Last candle timestamp read from a CandleStore
+    """
+
+    initial_balance: float = 10_000.0
+    fee_rate: float = 0.001
+    slippage: float = 0.0005
+    side: PositionSide = PositionSide.LONG
+    stop_loss_pct: Optional[float] = None
+    take_profit_pct: Optional[float] = None
+    trailing_stop_pct: Optional[float] = None
+    warmup: int = 0
+    start: Optional[Any] = None
+    end: Optional[Any] = None
+
+    def __post_init__(self):
+        """Validate settings."""
+        if self.initial_balance <= 0:
+            raise ValueError(
+                f"initial_balance must be > 0, got: {self.initial_balance}"
+            )
+        if not 0 <= self.fee_rate < 1 or not 0 <= self.slippage < 1:
+            raise ValueError("fee_rate and slippage must be in [0, 1)")
+        if self.warmup < 0:
+            raise ValueError(f"warmup must be >= 0, got: {self.warmup}")
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Result of one parameter combination in a sweep.
+
+    Attributes:
+        params: Parameters merged into the strategy config
+        stats: Backtest statistics
+    """
+
+    params: Dict[str, Any]
+    stats: BacktestStats
+
+
+def expand_grid(grid: Mapping[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """
+    Cartesian product of a parameter grid.
+
+    Example:
+        >>> expand_grid({"period": [7, 14], "threshold": [30]})
+        [{'period': 7, 'threshold': 30}, {'period': 14, 'threshold': 30}]
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def build_strategy(
+    strategy_class: Type[TradingStrategy],
+    symbol: str,
+    timeframe: str,
+    params: Dict[str, Any],
+) -> TradingStrategy:
+    """Strategy instance for one parameter combination, named after it."""
+    name = ",".join(f"{k}={v}" for k, v in params.items()) or "default"
+    return strategy_class(name, symbol, timeframe, config=dict(params))
+
+
+def indicator_columns(
+    indicators: Mapping[str, BaseIndicator], df: pd.DataFrame
+) -> Dict[str, np.ndarray]:
+    """
+    Compute indicators over a frame as float64 columns.
+
+    Multi-output indicators add one column per output as "name.output".
+
+    Args:
+        indicators: Indicator name -> configured indicator
+        df: Candles with OHLCV columns
+
+    Returns:
+        Column name -> values aligned with df
+    """
+    columns: Dict[str, np.ndarray] = {}
+    results = IndicatorPipeline(list(indicators.values())).run(df)
+    for name, result in zip(indicators, results):
+        if isinstance(result, dict):
+            for output, series in result.items():
+                columns[f"{name}.{output}"] = np.asarray(series, dtype=np.float64)
+        else:
+            columns[name] = np.asarray(result, dtype=np.float64)
+    return columns
+
+
+class BacktestEngine:
+    """
+    Runs strategies over historical candles.
+
+    Example:
+        >>> engine = BacktestEngine(BacktestConfig(stop_loss_pct=2.0))
+        >>> result = engine.run(strategy, indicators, candle_store)
+        >>> result.stats.bars_per_second
+        >>>
+        >>> # Parameter sweep over 4 worker processes
+        >>> results = engine.sweep(MyStrategy, {"rsi_period": [7, 14, 21]},
+        ...                        make_indicators, candles_df,
+        ...                        "SOL/USDC", "1m", workers=4)
+    """
+
+    def __init__(self, config: Optional[BacktestConfig] = None):
+        """
+        Initialize engine.
+
+        Args:
+            config: Simulation settings (default: BacktestConfig())
+        """
+        self.config = config or BacktestConfig()
+
+    def load(self, source: CandleSource, symbol: str, timeframe: str) -> pd.DataFrame:
+        """
+        Candles for a symbol/timeframe from a DataFrame or CandleStore.
+
+        Raises:
+            KeyError: If the store has no such series or columns are missing
+        """
+        if isinstance(source, CandleStore):
+            return source.read(symbol, timeframe, self.config.start, self.config.end)
+
+        if "close" not in source.columns:
+            raise KeyError("DataFrame must have 'close' column for backtesting")
+        return source
+
+    def run(
+        self,
+        strategy: TradingStrategy,
+        indicators: Mapping[str, BaseIndicator],
+        source: CandleSource,
+    ) -> BacktestResult:
+        """
+        Backtest a strategy.
+
+        Args:
+            strategy: Fresh strategy instance (its state is advanced)
+            indicators: Indicator name as used by the strategy -> indicator
+            source: Candles as DataFrame, or a CandleStore holding
+                strategy.symbol / strategy.timeframe
+
+        Returns:
+            BacktestResult with trades, equity curve and statistics
+
+        Raises:
+            KeyError: If candles or indicator inputs are missing
+            ValueError: If there is not enough data for an indicator
+        """
+        df = self.load(source, strategy.symbol, strategy.timeframe)
+        return self.simulate(strategy, df, indicator_columns(indicators, df))
+
+    def simulate(
+        self,
+        strategy: TradingStrategy,
+        df: pd.DataFrame,
+        columns: Mapping[str, np.ndarray],
+    ) -> BacktestResult:
+        """
+        Run the bar loop over precomputed indicator columns.
+
+        Args:
+            strategy: Fresh strategy instance
+            df: Candles with OHLCV columns
+            columns: Indicator values aligned with df (see indicator_columns)
+
+        Returns:
+            BacktestResult
+        """
+        return _Simulation(self.config, strategy, df, columns).run()
+
+    def sweep(
+        self,
+        strategy_class: Type[TradingStrategy],
+        grid: Mapping[str, Sequence[Any]],
+        indicators: IndicatorFactory,
+        source: CandleSource,
+        symbol: str,
+        timeframe: str,
+        workers: int = 0,
+    ) -> List[SweepResult]:
+        """
+        Backtest every combination of a parameter grid.
+
+        Each combination builds strategy_class(name, symbol, timeframe,
+        config=params) and its indicators with indicators(params).
+        With workers > 0, candles are sent to each worker process once
+        (a CandleStore is reopened read-only in the worker instead), so
+        strategy_class and indicators must be picklable.
+
+        Args:
+            strategy_class: Strategy to instantiate per combination
+            grid: Parameter name -> candidate values
+            indicators: Factory of indicators for a parameter set
+            source: Candles as DataFrame or CandleStore
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            workers: Worker processes (0 runs in this process)
+
+        Returns:
+            SweepResult per combination, in grid order
+        """
+        combos = expand_grid(grid)
+        job = (strategy_class, indicators, symbol, timeframe)
+        if isinstance(source, CandleStore):
+            data: Any = ("store", str(source.root))
+        else:
+            data = ("frame", self.load(source, symbol, timeframe))
+
+        if workers == 0:
+            return [_sweep_one(self, source, job, params) for params in combos]
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.config, data)
+        ) as pool:
+            return list(pool.map(_sweep_worker, itertools.repeat(job), combos))
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"BacktestEngine(config={self.config})"
+
+
+# Per-process sweep state, set by the pool initializer
+_sweep_state: Dict[str, Any] = {}
+
+
+def _init_worker(config: BacktestConfig, data: tuple) -> None:
+    kind, payload = data
+    _sweep_state["engine"] = BacktestEngine(config)
+    if kind == "store":
+        _sweep_state["source"] = CandleStore(payload, readonly=True)
+    else:
+        _sweep_state["source"] = payload
+
+
+def _sweep_worker(job: tuple, params: Dict[str, Any]) -> SweepResult:
+    return _sweep_one(_sweep_state["engine"], _sweep_state["source"], job, params)
+
+
+def _sweep_one(
+    engine: BacktestEngine, source: CandleSource, job: tuple, params: Dict[str, Any]
+) -> SweepResult:
+    strategy_class, indicators, symbol, timeframe = job
+    strategy = build_strategy(strategy_class, symbol, timeframe, params)
+    result = engine.run(strategy, indicators(params), source)
+    return SweepResult(params, result.stats)
+
+
+class _Simulation:
+    """State of one backtest run."""
+
+    def __init__(
+        self,
+        config: BacktestConfig,
+        strategy: TradingStrategy,
+        df: pd.DataFrame,
+        columns: Mapping[str, np.ndarray],
+    ):
+        self.config = config
+        self.strategy = strategy
+        self.df = df
+        self.columns = columns
+        self.cash = config.initial_balance
+        self.position: Optional[Position] = None
+        self.entry_fee = 0.0
+        self.fees = 0.0
+        self.trades: List[Trade] = []
+        self.rejected = 0
+        self.day = None
+
+        risk = strategy.config
+        self.stop_loss_pct = risk.get("stop_loss_pct", config.stop_loss_pct)
+        self.take_profit_pct = risk.get("take_profit_pct", config.take_profit_pct)
+        self.trailing_stop_pct = risk.get("trailing_stop_pct", config.trailing_stop_pct)
+        self.long = config.side == PositionSide.LONG
+
+    def run(self) -> BacktestResult:
+        df = self.df
+        bars = len(df)
+        index = df.index
+        timed = isinstance(index, pd.DatetimeIndex)
+        times = index.to_pydatetime() if timed else range(bars)
+        candles = {
+            c: df[c].to_numpy(dtype=np.float64).tolist() for c in COLUMNS if c in df
+        }
+        closes = candles["close"]
+        names = list(self.columns)
+        values = [np.asarray(self.columns[n], dtype=np.float64).tolist() for n in names]
+
+        strategy = self.strategy
+        base = {"symbol": strategy.symbol, "timeframe": strategy.timeframe}
+        equity = np.empty(bars)
+        mark = math.nan
+
+        start = time.perf_counter()
+        for t in range(bars):
+            indicators = dict(zip(names, [column[t] for column in values]))
+            close = closes[t]
+            if not math.isnan(close):
+                mark = close
+                if t >= self.config.warmup:
+                    market_data = dict(base, timestamp=times[t], indicators=indicators)
+                    for c, column in candles.items():
+                        market_data[c] = column[t]
+                    self._step(t, times[t], close, market_data)
+            strategy._update_previous_values(indicators)
+            equity[t] = self._equity(mark)
+
+        if self.position is not None:
+            self._close(times[-1], mark, "end")
+            equity[-1] = self.cash
+        elapsed = time.perf_counter() - start
+
+        return BacktestResult(
+            strategy=strategy.name,
+            stats=self._stats(bars, equity, elapsed),
+            trades=self.trades,
+            equity=pd.Series(equity, index=index, name="equity"),
+        )
+
+    def _step(self, t: int, when: Any, close: float, market_data: dict) -> None:
+        strategy = self.strategy
+        position = self.position
+        # Roll before exits so a loss closed after midnight counts for its day
+        self._roll_day(when)
+        if position is not None:
+            position.update_price(close)
+            if position.should_stop_loss(close):
+                self._close(when, close, "stop_loss")
+            elif position.should_take_profit(close):
+                self._close(when, close, "take_profit")
+            elif strategy.check_exit_conditions(position, market_data):
+                self._close(when, close, "signal")
+            return
+
+        if strategy.max_daily_loss and strategy.daily_pnl <= -abs(
+            strategy.max_daily_loss
+        ):
+            return
+        if strategy.check_entry_conditions(market_data):
+            self._open(t, when, close)
+
+    def _roll_day(self, when: Any) -> None:
+        day = when.date() if isinstance(when, datetime) else None
+        if day != self.day:
+            self.day = day
+            self.strategy.daily_pnl = 0.0
+
+    def _fill_price(self, close: float, buying: bool) -> float:
+        slip = self.config.slippage
+        return close * (1 + slip) if buying else close * (1 - slip)
+
+    def _open(self, t: int, when: Any, close: float) -> None:
+        price = self._fill_price(close, buying=self.long)
+        try:
+            size = self.strategy.calculate_position_size(self.cash, price)
+        except RiskLimitError:
+            self.rejected += 1
+            return
+        if size <= 0:
+            self.rejected += 1
+            return
+
+        fee = size * price * self.config.fee_rate
+        side = PositionSide.LONG if self.long else PositionSide.SHORT
+        sign = 1 if self.long else -1
+        self.position = Position(
+            position_id=f"{self.strategy.name}-{t}",
+            symbol=self.strategy.symbol,
+            side=side,
+            entry_price=price,
+            size=size,
+            entry_time=when,
+            stop_loss=_offset(price, -sign, self.stop_loss_pct),
+            take_profit=_offset(price, sign, self.take_profit_pct),
+            trailing_stop=self.trailing_stop_pct,
+        )
+        self.cash -= sign * size * price + fee
+        self.entry_fee = fee
+        self.fees += fee
+
+    def _close(self, when: Any, close: float, reason: str) -> None:
+        position = self.position
+        price = self._fill_price(close, buying=not self.long)
+        fee = position.size * price * self.config.fee_rate
+        sign = 1 if self.long else -1
+
+        gross = position.close(price, when)
+        self.cash += sign * position.size * price - fee
+        self.fees += fee
+        pnl = gross - self.entry_fee - fee
+        self.strategy.record_trade(pnl)
+
+        self.trades.append(
+            Trade(
+                position_id=position.position_id,
+                side=str(position.side),
+                entry_time=position.entry_time,
+                exit_time=when,
+                entry_price=position.entry_price,
+                exit_price=price,
+                size=position.size,
+                fees=self.entry_fee + fee,
+                pnl=pnl,
+                reason=reason,
+            )
+        )
+        self.position = None
+
+    def _equity(self, close: float) -> float:
+        if self.position is None:
+            return self.cash
+        sign = 1 if self.long else -1
+        return self.cash + sign * self.position.size * close
+
+    def _stats(self, bars: int, equity: np.ndarray, elapsed: float) -> BacktestStats:
+        initial = self.config.initial_balance
+        final = float(equity[-1]) if bars else initial
+        return BacktestStats(
+            bars=bars,
+            trades=len(self.trades),
+            wins=sum(1 for trade in self.trades if trade.pnl > 0),
+            rejected_entries=self.rejected,
+            initial_balance=initial,
+            final_equity=final,
+            total_return_pct=(final - initial) / initial * 100,
+            max_drawdown_pct=max_drawdown_pct(equity),
+            fees=self.fees,
+            elapsed_s=elapsed,
+            bars_per_second=bars / elapsed if elapsed > 0 else 0.0,
+        )
+
+
+def _offset(price: float, direction: int, pct: Optional[float]) -> Optional[float]:
+    """Price moved by pct percent in a direction (None if pct unset)."""
+    if not pct:
+        return None
+    return price * (1 + direction * pct / 100)
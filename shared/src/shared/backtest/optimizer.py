@@ -0,0 +1,448 @@
+"""
+Parameter-sweep optimizer.
+
+Backtests a strategy over a parameter grid while doing the shared work
+once:
+
+- every distinct indicator configuration in the grid (same class and
+  parameters, e.g. RSIIndicator(period=14)) is computed exactly once,
+  by a single IndicatorPipeline that also shares intermediates such as
+  EMAs between configurations (MACD(12, 26, 9) reuses EMA(12));
+- candles and indicator columns are placed in one shared memory block
+  that worker processes map read-only instead of receiving copies;
+- results are streamed in completion order, ranked against everything
+  seen so far, so only the top-k (not every result) needs to be kept.
+
+Usage:
+    optimizer = ParameterOptimizer(MyStrategy, make_indicators,
+                                   "SOL/USDC", "1m", workers=4)
+    for result in optimizer.stream(grid, store):
+        print(result.rank, result.params, result.score)
+    best = optimizer.optimize(grid, store, top=10)
+"""
+
+import bisect
+import dataclasses
+import heapq
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from shared.backtest.engine import (
+    BacktestConfig,
+    BacktestEngine,
+    CandleSource,
+    IndicatorFactory,
+    SweepResult,
+    build_strategy,
+    expand_grid,
+    indicator_columns,
+)
+from shared.backtest.results import BacktestStats
+from shared.indicators.base import BaseIndicator, indicator_key
+from shared.market_data.candle_store import COLUMNS
+from shared.strategy.base_strategy import TradingStrategy
+
+# Indicator name -> distinct indicator key, for one parameter combination
+Binding = Dict[str, str]
+
+# BacktestStats values usable as the ranking metric
+METRICS = tuple(BacktestStats.__dataclass_fields__) + ("win_rate",)
+
+
+@dataclass(frozen=True)
+class RankedResult(SweepResult):
+    """
+    Sweep result with its ranking score.
+
+    Attributes:
+        score: Value of the optimizer's metric
+        rank: 1-based rank among results completed so far (ties share
+            a rank); final rank in optimize() output
+    """
+
+    score: float
+    rank: int
+
+
+@dataclass(frozen=True)
+class SweepPlan:
+    """
+    Indicator work of a sweep.
+
+    Attributes:
+        combinations: Parameter combinations in the grid
+        indicators: Indicator instances requested over all combinations
+        distinct: Distinct indicator configurations actually computed
+    """
+
+    combinations: int
+    indicators: int
+    distinct: int
+
+    @property
+    def reduction_pct(self) -> float:
+        """Indicator computations saved by deduplication (0-100)."""
+        if self.indicators == 0:
+            return 0.0
+        return (1 - self.distinct / self.indicators) * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (includes reduction_pct)."""
+        data = asdict(self)
+        data["reduction_pct"] = self.reduction_pct
+        return data
+
+
+class ParameterOptimizer:
+    """
+    Ranks parameter combinations of a strategy by a backtest metric.
+
+    Each combination builds strategy_class(name, symbol, timeframe,
+    config=params) and its indicators with indicators(params), like
+    BacktestEngine.sweep(). Unlike sweep(), indicators are computed once
+    per distinct configuration in this process and workers only run the
+    bar loop, so indicators(params) only needs to be cheap to call (the
+    indicators are never computed by it) and strategy_class picklable.
+
+    Example:
+        >>> def make_indicators(params):
+        ...     return {"RSI": RSIIndicator(period=params["period"])}
+        >>> optimizer = ParameterOptimizer(RsiStrategy, make_indicators,
+        ...                                "SOL/USDC", "1m",
+        ...                                metric="total_return_pct")
+        >>> grid = {"period": [7, 14, 21], "oversold": [20, 25, 30]}
+        >>> optimizer.plan(grid).distinct        # 3 RSI configurations
+        3
+        >>> best = optimizer.optimize(grid, candles_df, top=3)
+        >>> best[0].params, best[0].score
+    """
+
+    def __init__(
+        self,
+        strategy_class: Type[TradingStrategy],
+        indicators: IndicatorFactory,
+        symbol: str,
+        timeframe: str,
+        config: Optional[BacktestConfig] = None,
+        metric: str = "total_return_pct",
+        maximize: bool = True,
+        workers: int = 0,
+    ):
+        """
+        Initialize optimizer.
+
+        Args:
+            strategy_class: Strategy to instantiate per combination
+            indicators: Factory of indicators for a parameter set
+            symbol: Trading symbol
+            timeframe: Candle timeframe
+            config: Simulation settings (default: BacktestConfig())
+            metric: BacktestStats field to rank by (see METRICS)
+            maximize: Rank higher metric values first
+            workers: Worker processes (0 runs in this process)
+
+        Raises:
+            ValueError: If metric is unknown or workers < 0
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}. Available: {METRICS}")
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0, got: {workers}")
+
+        self.engine = BacktestEngine(config)
+        self.strategy_class = strategy_class
+        self.indicators = indicators
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.metric = metric
+        self.maximize = maximize
+        self.workers = workers
+
+    def plan(self, grid: Mapping[str, Sequence[Any]]) -> SweepPlan:
+        """Indicator work of a grid, without running it."""
+        combos = expand_grid(grid)
+        bindings, distinct = self._bind(combos)
+        requested = sum(len(binding) for binding in bindings)
+        return SweepPlan(len(combos), requested, len(distinct))
+
+    def stream(
+        self, grid: Mapping[str, Sequence[Any]], source: CandleSource
+    ) -> Iterator[RankedResult]:
+        """
+        Backtest every combination, yielding results as they complete.
+
+        Only the scores of completed results are retained; with
+        workers > 0 at most a few results per worker are pending.
+        Closing the iterator early cancels the remaining combinations.
+
+        Args:
+            grid: Parameter name -> candidate values
+            source: Candles as DataFrame, or CandleStore holding
+                symbol / timeframe
+
+        Yields:
+            RankedResult per combination, in completion order
+
+        Raises:
+            KeyError: If candles or indicator inputs are missing
+            ValueError: If there is not enough data for an indicator
+        """
+        combos = expand_grid(grid)
+        bindings, distinct = self._bind(combos)
+        df = self.engine.load(source, self.symbol, self.timeframe)
+        columns = indicator_columns(distinct, df)
+        outputs = _outputs(distinct, columns)
+
+        if self.workers == 0:
+            job = (self.strategy_class, self.symbol, self.timeframe, outputs)
+            completed = (
+                _run_one(self.engine, job, df, columns, params, binding)
+                for params, binding in zip(combos, bindings)
+            )
+            yield from self._rank(completed)
+            return
+
+        arrays = {c: df[c].to_numpy(dtype=np.float64) for c in COLUMNS if c in df}
+        block = _SharedColumns.create({**arrays, **columns})
+        try:
+            yield from self._rank(
+                self._run_pool(block, list(arrays), df.index, outputs, combos, bindings)
+            )
+        finally:
+            block.close()
+            block.unlink()
+
+    def optimize(
+        self, grid: Mapping[str, Sequence[Any]], source: CandleSource, top: int = 10
+    ) -> List[RankedResult]:
+        """
+        Best combinations of a grid.
+
+        Keeps a bounded heap of the top results while streaming, so
+        memory does not grow with the grid size.
+
+        Args:
+            grid: Parameter name -> candidate values
+            source: Candles as DataFrame or CandleStore
+            top: Number of results to keep
+
+        Returns:
+            Up to top results, best first (ties in completion order)
+
+        Raises:
+            ValueError: If top < 1
+        """
+        if top < 1:
+            raise ValueError(f"top must be >= 1, got: {top}")
+
+        heap: List[Tuple[float, int, RankedResult]] = []
+        for seq, result in enumerate(self.stream(grid, source)):
+            entry = (self._order(result.score), -seq, result)
+            if len(heap) < top:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heappushpop(heap, entry)
+
+        best = sorted(heap, reverse=True)
+        return [
+            dataclasses.replace(result, rank=rank)
+            for rank, (_, _, result) in enumerate(best, start=1)
+        ]
+
+    def _bind(
+        self, combos: List[Dict[str, Any]]
+    ) -> Tuple[List[Binding], Dict[str, BaseIndicator]]:
+        """Binding per combination and the distinct indicators of all."""
+        bindings: List[Binding] = []
+        distinct: Dict[str, BaseIndicator] = {}
+        for params in combos:
+            binding = {}
+            for name, indicator in self.indicators(params).items():
+                key = indicator_key(indicator)
+                distinct.setdefault(key, indicator)
+                binding[name] = key
+            bindings.append(binding)
+        return bindings, distinct
+
+    def _run_pool(
+        self,
+        block: "_SharedColumns",
+        candles: List[str],
+        index: pd.Index,
+        outputs: Dict[str, List[str]],
+        combos: List[Dict[str, Any]],
+        bindings: List[Binding],
+    ) -> Iterator[SweepResult]:
+        """Run combinations over worker processes, in completion order."""
+        job = (self.strategy_class, self.symbol, self.timeframe, outputs)
+        initargs = (self.engine.config, job, block.spec, candles, index)
+        pending_limit = self.workers * 4
+        work = iter(zip(combos, bindings))
+
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=initargs
+        )
+        try:
+            pending = set()
+            for params, binding in itertools.islice(work, pending_limit):
+                pending.add(pool.submit(_worker_run, params, binding))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for params, binding in itertools.islice(work, 1):
+                        pending.add(pool.submit(_worker_run, params, binding))
+                    yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _rank(self, results: Iterator[SweepResult]) -> Iterator[RankedResult]:
+        """Attach scores and running ranks."""
+        seen: List[float] = []
+        for result in results:
+            score = float(getattr(result.stats, self.metric))
+            order = self._order(score)
+            bisect.insort(seen, order)
+            rank = len(seen) - bisect.bisect_right(seen, order) + 1
+            yield RankedResult(result.params, result.stats, score, rank)
+
+    def _order(self, score: float) -> float:
+        """Score as a value where larger is better (NaN ranks last)."""
+        if score != score:
+            return -np.inf
+        return score if self.maximize else -score
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"ParameterOptimizer(strategy={self.strategy_class.__name__}, "
+            f"metric={self.metric}, workers={self.workers})"
+        )
+
+
+def _outputs(
+    distinct: Mapping[str, BaseIndicator], columns: Mapping[str, np.ndarray]
+) -> Dict[str, List[str]]:
+    """Column suffixes per indicator key ("" or ".output")."""
+    outputs: Dict[str, List[str]] = {key: [] for key in distinct}
+    for column in columns:
+        if column in outputs:
+            outputs[column].append("")
+        else:
+            # Keys end with ")" and output names have no ".", so the
+            # last "." separates key and output
+            key, _, output = column.rpartition(".")
+            outputs[key].append(f".{output}")
+    return outputs
+
+
+def _resolve(
+    binding: Binding,
+    outputs: Mapping[str, List[str]],
+    columns: Mapping[str, np.ndarray],
+) -> Dict[str, np.ndarray]:
+    """Indicator columns of one combination, named as its strategy expects."""
+    return {
+        f"{name}{suffix}": columns[f"{key}{suffix}"]
+        for name, key in binding.items()
+        for suffix in outputs[key]
+    }
+
+
+def _run_one(
+    engine: BacktestEngine,
+    job: tuple,
+    df: pd.DataFrame,
+    columns: Mapping[str, np.ndarray],
+    params: Dict[str, Any],
+    binding: Binding,
+) -> SweepResult:
+    strategy_class, symbol, timeframe, outputs = job
+    strategy = build_strategy(strategy_class, symbol, timeframe, params)
+    result = engine.simulate(strategy, df, _resolve(binding, outputs, columns))
+    return SweepResult(params, result.stats)
+
+
+class _SharedColumns:
+    """Equal-length float64 columns in one shared memory block."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, names: List[str], length: int):
+        self.shm = shm
+        self.names = names
+        self.length = length
+        matrix = np.ndarray((len(names), length), dtype=np.float64, buffer=shm.buf)
+        self.matrix = matrix
+
+    @classmethod
+    def create(cls, columns: Mapping[str, np.ndarray]) -> "_SharedColumns":
+        names = list(columns)
+        length = len(next(iter(columns.values()))) if names else 0
+        size = max(len(names) * length * 8, 1)
+        block = cls(shared_memory.SharedMemory(create=True, size=size), names, length)
+        for row, name in enumerate(names):
+            block.matrix[row] = columns[name]
+        return block
+
+    @classmethod
+    def attach(cls, spec: tuple) -> "_SharedColumns":
+        name, names, length = spec
+        block = cls(shared_memory.SharedMemory(name=name), names, length)
+        block.matrix.flags.writeable = False
+        return block
+
+    @property
+    def spec(self) -> tuple:
+        """Picklable description for attach()."""
+        return (self.shm.name, self.names, self.length)
+
+    def frame(self, count: int, index: pd.Index) -> pd.DataFrame:
+        """First count columns as a DataFrame viewing the block (no copy)."""
+        return pd.DataFrame(
+            self.matrix[:count].T, index=index, columns=self.names[:count], copy=False
+        )
+
+    def columns(self, start: int) -> Dict[str, np.ndarray]:
+        """Row views of the columns from start on, by name."""
+        return {
+            name: self.matrix[row]
+            for row, name in enumerate(self.names)
+            if row >= start
+        }
+
+    def close(self) -> None:
+        self.matrix = None
+        self.shm.close()
+
+    def unlink(self) -> None:
+        self.shm.unlink()
+
+
+# Per-process optimizer state, set by the pool initializer
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(
+    config: BacktestConfig,
+    job: tuple,
+    spec: tuple,
+    candles: List[str],
+    index: pd.Index,
+) -> None:
+    block = _SharedColumns.attach(spec)
+    _worker_state["block"] = block
+    _worker_state["engine"] = BacktestEngine(config)
+    _worker_state["job"] = job
+    _worker_state["df"] = block.frame(len(candles), index)
+    _worker_state["columns"] = block.columns(len(candles))
+
+
+def _worker_run(params: Dict[str, Any], binding: Binding) -> SweepResult:
+    state = _worker_state
+    return _run_one(
+        state["engine"], state["job"], state["df"], state["columns"], params, binding
+    )
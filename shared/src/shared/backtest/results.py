@@ -0,0 +1,118 @@
+"""
+Backtest result types.
+
+Trade log entries, summary statistics and the combined result of one
+backtest run.
+"""
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Trade:
+    """
+    One closed position.
+
+    Attributes:
+        position_id: Position identifier
+        side: 'long' or 'short'
+        entry_time: Bar timestamp (or bar number) of the entry fill
+        exit_time: Bar timestamp (or bar number) of the exit fill
+        entry_price: Entry fill price (after slippage)
+        exit_price: Exit fill price (after slippage)
+        size: Position size in base currency
+        fees: Entry and exit fees in quote currency
+        pnl: Realized PnL net of fees
+        reason: 'signal', 'stop_loss', 'take_profit' or 'end'
+    """
+
+    position_id: str
+    side: str
+    entry_time: Any
+    exit_time: Any
+    entry_price: float
+    exit_price: float
+    size: float
+    fees: float
+    pnl: float
+    reason: str
+
+
+@dataclass(frozen=True)
+class BacktestStats:
+    """
+    Summary statistics of a backtest.
+
+    Attributes:
+        bars: Bars simulated
+        trades: Closed trades
+        wins: Trades with positive net PnL
+        rejected_entries: Entry signals refused by risk checks
+        initial_balance: Starting balance
+        final_equity: Equity after the last bar
+        total_return_pct: Return on initial balance
+        max_drawdown_pct: Largest peak-to-trough equity decline
+        fees: Total fees paid
+        elapsed_s: Wall time of the simulation loop
+        bars_per_second: Simulation throughput
+    """
+
+    bars: int
+    trades: int
+    wins: int
+    rejected_entries: int
+    initial_balance: float
+    final_equity: float
+    total_return_pct: float
+    max_drawdown_pct: float
+    fees: float
+    elapsed_s: float
+    bars_per_second: float
+
+    @property
+    def win_rate(self) -> float:
+        """Share of winning trades (0.0 without trades)."""
+        return self.wins / self.trades if self.trades else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (includes win_rate)."""
+        data = asdict(self)
+        data["win_rate"] = self.win_rate
+        return data
+
+
+def max_drawdown_pct(equity: np.ndarray) -> float:
+    """Largest peak-to-trough decline of an equity curve, in percent."""
+    if len(equity) == 0:
+        return 0.0
+    peaks = np.maximum.accumulate(equity)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdowns = np.where(peaks > 0, (peaks - equity) / peaks, 0.0)
+    return float(drawdowns.max() * 100)
+
+
+@dataclass
+class BacktestResult:
+    """
+    Outcome of one backtest run.
+
+    Attributes:
+        strategy: Strategy name
+        stats: Summary statistics
+        trades: Closed trades in order
+        equity: Equity after each bar, indexed like the candles
+    """
+
+    strategy: str
+    stats: BacktestStats
+    trades: List[Trade] = field(default_factory=list)
+    equity: pd.Series = field(default_factory=lambda: pd.Series(dtype=float))
+
+    def trade_log(self) -> pd.DataFrame:
+        """Trades as a DataFrame, one row per trade."""
+        columns = list(Trade.__dataclass_fields__)
+        return pd.DataFrame([asdict(t) for t in self.trades], columns=columns)
@@ -1,22 +1,55 @@
 """
 Shared indicators package.
 Pure calculation implementations with zero external dependencies.
+
+Exports are imported lazily on first access, so importing one indicator
+(or a module that only needs the streaming primitives) does not import
+every indicator module.
 """
 
-from shared.indicators.adx import ADXIndicator
-from shared.indicators.atr import ATRIndicator
-from shared.indicators.base import BaseIndicator
-from shared.indicators.bb import BollingerBandsIndicator
-from shared.indicators.ema import EMAIndicator
-from shared.indicators.macd import MACDIndicator
-from shared.indicators.patterns import PatternIndicator
-from shared.indicators.rsi import RSIIndicator
-from shared.indicators.sma import SMAIndicator
-from shared.indicators.stochastic import StochasticIndicator
-from shared.indicators.volume import VolumeIndicator
+from typing import TYPE_CHECKING
+
+from shared._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from shared.indicators.adx import ADXIndicator
+    from shared.indicators.atr import ATRIndicator
+    from shared.indicators.base import BaseIndicator, indicator_key
+    from shared.indicators.batch import BatchIndicatorEngine
+    from shared.indicators.bb import BollingerBandsIndicator
+    from shared.indicators.cache import CacheStats, IndicatorCache
+    from shared.indicators.ema import EMAIndicator
+    from shared.indicators.macd import MACDIndicator
+    from shared.indicators.patterns import PatternIndicator, PatternScan, scan_patterns
+    from shared.indicators.pipeline import IndicatorPipeline, PipelineStats
+    from shared.indicators.rsi import RSIIndicator
+    from shared.indicators.sma import SMAIndicator
+    from shared.indicators.stochastic import StochasticIndicator
+    from shared.indicators.volume import VolumeIndicator
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".adx": ["ADXIndicator"],
+        ".atr": ["ATRIndicator"],
+        ".base": ["BaseIndicator", "indicator_key"],
+        ".batch": ["BatchIndicatorEngine"],
+        ".bb": ["BollingerBandsIndicator"],
+        ".cache": ["CacheStats", "IndicatorCache"],
+        ".ema": ["EMAIndicator"],
+        ".macd": ["MACDIndicator"],
+        ".patterns": ["PatternIndicator", "PatternScan", "scan_patterns"],
+        ".pipeline": ["IndicatorPipeline", "PipelineStats"],
+        ".rsi": ["RSIIndicator"],
+        ".sma": ["SMAIndicator"],
+        ".stochastic": ["StochasticIndicator"],
+        ".volume": ["VolumeIndicator"],
+    },
+)
 
 __all__ = [
     "BaseIndicator",
+    "indicator_key",
     "RSIIndicator",
     "SMAIndicator",
     "EMAIndicator",
@@ -27,4 +60,11 @@ __all__ = [
     "ADXIndicator",
     "VolumeIndicator",
     "PatternIndicator",
+    "PatternScan",
+    "scan_patterns",
+    "BatchIndicatorEngine",
+    "IndicatorPipeline",
+    "PipelineStats",
+    "IndicatorCache",
+    "CacheStats",
 ]
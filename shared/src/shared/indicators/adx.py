@@ -5,11 +5,12 @@ Measures trend strength regardless of direction.
 ADX > 25 indicates strong trend, < 20 indicates weak/ranging.
 """
 
-from typing import Dict, Union
+from typing import Any, Dict, Mapping, Tuple, Union
 
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import EWMState, divide, true_range
 
 
 class ADXIndicator(BaseIndicator):
@@ -81,7 +82,117 @@ class ADXIndicator(BaseIndicator):
             KeyError: If required columns missing
             ValueError: If insufficient data
         """
-        # Validate DataFrame
+        self._validate_frame(df)
+
+        components = self._components(df)
+        adx = components["adx"]
+        plus_di = components["plus_di"]
+        minus_di = components["minus_di"]
+
+        # Return based on configuration
+        if not self.return_components:
+            return adx
+
+        return {
+            "adx": adx,
+            "plus_di": plus_di,
+            "minus_di": minus_di,
+        }
+
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Union[pd.Series, Dict[str, pd.Series]], Dict[str, Any]]:
+        """
+        Calculate ADX and return final Wilder's smoothing state.
+
+        Args:
+            df: DataFrame with 'high', 'low', 'close' columns
+
+        Returns:
+            Tuple of (calculate() result, state dict with smoothed TR/DM/DX
+            EWMStates and previous high, low and close)
+        """
+        self._validate_frame(df)
+
+        c = self._components(df)
+        alpha = 1.0 / self.period
+
+        state = {
+            "atr": EWMState.from_series(c["tr"], c["atr"], alpha),
+            "plus_dm": EWMState.from_series(c["plus_dm"], c["plus_dm_smooth"], alpha),
+            "minus_dm": EWMState.from_series(
+                c["minus_dm"], c["minus_dm_smooth"], alpha
+            ),
+            "adx": EWMState.from_series(c["dx"], c["adx"], alpha),
+            "prev_high": float(df["high"].iloc[-1]),
+            "prev_low": float(df["low"].iloc[-1]),
+            "prev_close": float(df["close"].iloc[-1]),
+        }
+
+        if not self.return_components:
+            return c["adx"], state
+
+        result = {
+            "adx": c["adx"],
+            "plus_di": c["plus_di"],
+            "minus_di": c["minus_di"],
+        }
+
+        return result, state
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Union[float, Dict[str, float]]:
+        """Advance ADX by one candle."""
+        high = float(candle["high"])
+        low = float(candle["low"])
+        close = float(candle["close"])
+
+        tr = true_range(high, low, state["prev_close"])
+
+        # Same directional movement rules as the vectorized path
+        plus_dm = high - state["prev_high"]
+        minus_dm = state["prev_low"] - low
+        if plus_dm < 0:
+            plus_dm = 0.0
+        if minus_dm < 0:
+            minus_dm = 0.0
+        if plus_dm < minus_dm:
+            plus_dm = 0.0
+        if minus_dm < plus_dm:
+            minus_dm = 0.0
+
+        state["prev_high"] = high
+        state["prev_low"] = low
+        state["prev_close"] = close
+
+        atr = state["atr"].update(tr)
+        plus_di = 100 * divide(state["plus_dm"].update(plus_dm), atr)
+        minus_di = 100 * divide(state["minus_dm"].update(minus_dm), atr)
+
+        dx = 100 * divide(abs(plus_di - minus_di), plus_di + minus_di)
+        adx = state["adx"].update(dx)
+
+        if not self.return_components:
+            return adx
+
+        return {
+            "adx": adx,
+            "plus_di": plus_di,
+            "minus_di": minus_di,
+        }
+
+    def _validate_frame(self, df: pd.DataFrame) -> None:
+        """
+        Validate DataFrame columns and length.
+
+        Args:
+            df: DataFrame to validate
+
+        Raises:
+            KeyError: If required columns missing
+            ValueError: If insufficient data
+        """
         required_cols = ["high", "low", "close"]
         for col in required_cols:
             if col not in df.columns:
@@ -94,6 +205,16 @@ class ADXIndicator(BaseIndicator):
                 f"Insufficient data: need {self.period * 2} candles, " f"got {len(df)}"
             )
 
+    def _components(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """
+        Calculate all intermediate ADX series.
+
+        Args:
+            df: DataFrame with 'high', 'low', 'close' columns
+
+        Returns:
+            Dict with TR, raw and smoothed DM, DI, DX and ADX series
+        """
         high = df["high"]
         low = df["low"]
         close = df["close"]
@@ -116,12 +237,12 @@ class ADXIndicator(BaseIndicator):
 
         # Smooth TR and DM using Wilder's smoothing
         atr = self._wilders_smoothing(tr, self.period)
-        plus_di_smooth = self._wilders_smoothing(plus_dm, self.period)
-        minus_di_smooth = self._wilders_smoothing(minus_dm, self.period)
+        plus_dm_smooth = self._wilders_smoothing(plus_dm, self.period)
+        minus_dm_smooth = self._wilders_smoothing(minus_dm, self.period)
 
         # Calculate +DI and -DI
-        plus_di = 100 * (plus_di_smooth / atr)
-        minus_di = 100 * (minus_di_smooth / atr)
+        plus_di = 100 * (plus_dm_smooth / atr)
+        minus_di = 100 * (minus_dm_smooth / atr)
 
         # Calculate DX (Directional Index)
         dx = 100 * (abs(plus_di - minus_di) / (plus_di + minus_di))
@@ -129,14 +250,17 @@ class ADXIndicator(BaseIndicator):
         # Calculate ADX (smoothed DX)
         adx = self._wilders_smoothing(dx, self.period)
 
-        # Return based on configuration
-        if not self.return_components:
-            return adx
-
         return {
-            "adx": adx,
+            "tr": tr,
+            "plus_dm": plus_dm,
+            "minus_dm": minus_dm,
+            "atr": atr,
+            "plus_dm_smooth": plus_dm_smooth,
+            "minus_dm_smooth": minus_dm_smooth,
             "plus_di": plus_di,
             "minus_di": minus_di,
+            "dx": dx,
+            "adx": adx,
         }
 
     def _wilders_smoothing(self, series: pd.Series, period: int) -> pd.Series:
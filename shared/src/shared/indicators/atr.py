@@ -5,11 +5,12 @@ Measures market volatility using Wilder's smoothing method.
 Pure calculation with optional percentage metric.
 """
 
-from typing import Dict
+from typing import Any, Dict, Mapping, Tuple
 
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import EWMState, divide, true_range
 
 
 class ATRIndicator(BaseIndicator):
@@ -90,15 +91,8 @@ class ATRIndicator(BaseIndicator):
                 f"Insufficient data: need {self.period + 1} candles, " f"got {len(df)}"
             )
 
-        high = df["high"]
-        low = df["low"]
         close = df["close"]
-
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+        tr = self._true_range(df)
 
         alpha = 1.0 / self.period
         atr = tr.ewm(alpha=alpha, min_periods=self.period, adjust=False).mean()
@@ -112,3 +106,65 @@ class ATRIndicator(BaseIndicator):
             results["atr_percent"] = atr_percent
 
         return results
+
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Dict[str, pd.Series], Dict[str, Any]]:
+        """
+        Calculate ATR and return final smoothing state.
+
+        Args:
+            df: DataFrame with 'high', 'low', 'close' columns
+
+        Returns:
+            Tuple of (calculate() result, state dict with 'atr' EWMState
+            and 'prev_close')
+        """
+        result = self.calculate(df)
+
+        state = {
+            "atr": EWMState.from_series(
+                self._true_range(df), result["atr"], 1.0 / self.period, self.period
+            ),
+            "prev_close": float(df["close"].iloc[-1]),
+        }
+
+        return result, state
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Dict[str, float]:
+        """Advance ATR by one candle."""
+        close = float(candle["close"])
+        tr = true_range(
+            float(candle["high"]), float(candle["low"]), state["prev_close"]
+        )
+        state["prev_close"] = close
+
+        atr = state["atr"].update(tr)
+        results = {"atr": atr}
+
+        if self.compute_percent:
+            results["atr_percent"] = divide(atr, close) * 100
+
+        return results
+
+    def _true_range(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Calculate True Range series.
+
+        Args:
+            df: DataFrame with 'high', 'low', 'close' columns
+
+        Returns:
+            True Range series
+        """
+        high = df["high"]
+        low = df["low"]
+        close = df["close"]
+
+        tr1 = high - low
+        tr2 = abs(high - close.shift(1))
+        tr3 = abs(low - close.shift(1))
+
+        return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
@@ -7,7 +7,7 @@ config management, or event systems.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Union
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -25,6 +25,12 @@ class BaseIndicator(ABC):
     NO side effects, NO logging, NO external dependencies.
     Wrappers (Forger/Rebalancer) add additional functionality.
 
+    Streaming mode (optional):
+    Indicators that implement calculate_with_state() and _step() can be
+    seeded once from history with seed(df) and then advanced one candle
+    at a time with update(candle) in O(1). calculate() itself stays
+    stateless; only seed()/update() touch the streaming state.
+
     Attributes:
         params: Dictionary of indicator parameters
     """
@@ -41,6 +47,7 @@ class BaseIndicator(ABC):
         """
         self.params = params
         self.validate_params()
+        self._state: Optional[Dict[str, Any]] = None
 
     @abstractmethod
     def validate_params(self) -> None:
@@ -90,6 +97,105 @@ class BaseIndicator(ABC):
             }
         """
 
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Union[pd.Series, Dict[str, pd.Series]], Dict[str, Any]]:
+        """
+        Calculate indicator and return final streaming state.
+
+        Args:
+            df: DataFrame with OHLCV columns
+
+        Returns:
+            Tuple of (calculate() result, state dict for update())
+
+        Raises:
+            NotImplementedError: If indicator does not support streaming
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support streaming updates"
+        )
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Union[float, Dict[str, float]]:
+        """
+        Advance streaming state by one candle (mutates state).
+
+        Args:
+            state: State produced by calculate_with_state()
+            candle: New candle with OHLCV keys
+
+        Returns:
+            Latest value(s), shaped like the last row of calculate()
+
+        Raises:
+            NotImplementedError: If indicator does not support streaming
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support streaming updates"
+        )
+
+    def seed(self, df: pd.DataFrame) -> Union[pd.Series, Dict[str, pd.Series]]:
+        """
+        Calculate over history and keep final state for update().
+
+        Args:
+            df: DataFrame with OHLCV columns
+
+        Returns:
+            Same result as calculate(df)
+        """
+        result, state = self.calculate_with_state(df)
+        self._state = state
+        return result
+
+    def update(self, candle: Mapping[str, float]) -> Union[float, Dict[str, float]]:
+        """
+        Advance indicator by one closed candle in O(1).
+
+        Args:
+            candle: Mapping with OHLCV keys (dict or DataFrame row)
+
+        Returns:
+            float: Single-value indicators
+            Dict[str, float]: Multi-value indicators (same keys as calculate)
+
+        Raises:
+            ValueError: If seed() has not been called
+            KeyError: If required candle fields are missing
+        """
+        if self._state is None:
+            raise ValueError(
+                f"{self.__class__.__name__} must be seeded with seed(df) "
+                f"before update()"
+            )
+        return self._step(self._state, candle)
+
+    @property
+    def is_seeded(self) -> bool:
+        """True once seed() has initialized streaming state."""
+        return self._state is not None
+
     def __repr__(self) -> str:
         """String representation."""
         return f"{self.__class__.__name__}(params={self.params})"
+
+
+def indicator_key(indicator: BaseIndicator) -> str:
+    """
+    Identity of a configured indicator: defining class and sorted parameters.
+
+    Indicators with equal keys give equal results on the same input, so
+    callers that share calculations (IndicatorCache, StrategyFleet,
+    ParameterOptimizer) group by this key.
+
+    Args:
+        indicator: Indicator instance
+
+    Returns:
+        Key such as "shared.indicators.rsi.RSIIndicator(period=14)"
+    """
+    cls = indicator.__class__
+    params = ", ".join(f"{k}={v!r}" for k, v in sorted(indicator.params.items()))
+    return f"{cls.__module__}.{cls.__qualname__}({params})"
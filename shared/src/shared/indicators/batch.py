@@ -0,0 +1,603 @@
+"""
+Vectorized multi-symbol indicator engine.
+
+Computes indicators for many symbols at once over 2-D (symbols x bars)
+NumPy blocks instead of one pandas call per symbol DataFrame.
+Results match the per-symbol BaseIndicator.calculate() output.
+"""
+
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators.adx import ADXIndicator
+from shared.indicators.atr import ATRIndicator
+from shared.indicators.base import BaseIndicator
+from shared.indicators.bb import BollingerBandsIndicator
+from shared.indicators.ema import EMAIndicator
+from shared.indicators.macd import MACDIndicator
+from shared.indicators.rsi import RSIIndicator
+from shared.indicators.streaming import span_to_alpha
+
+BatchResult = Union[np.ndarray, Dict[str, np.ndarray]]
+
+# Bars per closed-form EWM block (one matrix multiply per block)
+_EWM_BLOCK = 64
+
+
+def _ewm(block: np.ndarray, alpha: float, min_periods: int = 0) -> np.ndarray:
+    """
+    EWM (adjust=False) along axis 0 of a time-major block.
+
+    Mirrors pandas semantics: leading NaNs are skipped, interior NaNs
+    decay the carried weight, outputs before min_periods observations
+    are NaN.
+
+    Args:
+        block: (bars, symbols) float64 array
+        alpha: Smoothing factor
+        min_periods: Observations required before a value is emitted
+
+    Returns:
+        (bars, symbols) smoothed array
+    """
+    bars, symbols = block.shape
+    out = np.empty_like(block)
+    if bars == 0:
+        return out
+
+    observed = ~np.isnan(block)
+
+    if observed.all():
+        out = _ewm_blocked(block, alpha)
+        out[: max(min_periods - 1, 0)] = np.nan
+        return out
+
+    # NaNs only before each symbol's first observation (padding, masked
+    # warm-up) allow the blocked closed-form recursion
+    if (observed[1:] >= observed[:-1]).all():
+        has_data = observed.any(axis=0)
+        first = np.where(has_data, observed.argmax(axis=0), 0)
+        filled = block.copy()
+        # Backfill warm-up with the first observation: the recursion then
+        # holds that value until the symbol starts, and is masked below
+        seed = np.where(has_data, block[first, np.arange(symbols)], 0.0)
+        np.copyto(filled, seed[None, :], where=~observed)
+        out = _ewm_blocked(filled, alpha)
+        out[~observed] = np.nan
+    else:
+        decay = 1.0 - alpha
+        value = block[0].copy()
+        weight = np.ones(symbols)
+        out[0] = value
+        for t in range(1, bars):
+            x = block[t]
+            obs = observed[t]
+            started = ~np.isnan(value)
+
+            weight = np.where(started, weight * decay, weight)
+            blended = (weight * value + alpha * x) / (weight + alpha)
+            value = np.where(obs, np.where(started, blended, x), value)
+            weight = np.where(obs, 1.0, weight)
+            out[t] = value
+
+    if min_periods > 1:
+        nobs = np.cumsum(observed, axis=0)
+        out[nobs < min_periods] = np.nan
+
+    return out
+
+
+def _ewm_blocked(block: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Gap-free EWM (adjust=False) along axis 0, evaluated in blocks.
+
+    Within a block of K bars the recursion y_t = d * y_{t-1} + alpha * x_t
+    unrolls to a lower-triangular Toeplitz product plus the decayed carry,
+    so each block costs one matrix multiply instead of K Python steps.
+
+    Args:
+        block: (bars, symbols) float64 array without NaN
+        alpha: Smoothing factor
+
+    Returns:
+        (bars, symbols) smoothed array
+    """
+    bars = block.shape[0]
+    out = np.empty_like(block)
+    out[0] = block[0]
+
+    decay = 1.0 - alpha
+    k = np.arange(_EWM_BLOCK)
+    lags = k[:, None] - k[None, :]
+    weights = np.where(lags >= 0, alpha * decay ** np.maximum(lags, 0), 0.0)
+    carry = decay ** (k + 1)
+
+    prev = block[0]
+    for start in range(1, bars, _EWM_BLOCK):
+        stop = min(start + _EWM_BLOCK, bars)
+        n = stop - start
+        segment = weights[:n, :n] @ block[start:stop]
+        segment += carry[:n, None] * prev
+        out[start:stop] = segment
+        prev = segment[-1]
+
+    return out
+
+
+def _rolling_mean_std(block: np.ndarray, window: int) -> tuple:
+    """
+    Rolling mean and sample std (ddof=1) along axis 0.
+
+    Any NaN inside a window yields NaN, matching pandas rolling with
+    min_periods=window. Uses a two-pass sum over shifted contiguous
+    slices, so cost is O(bars * symbols * window) without cumulative-sum
+    cancellation.
+
+    Args:
+        block: (bars, symbols) float64 array
+        window: Window length
+
+    Returns:
+        Tuple of (mean, std) arrays shaped like block
+    """
+    bars = block.shape[0]
+    mean = np.full_like(block, np.nan)
+    std = np.full_like(block, np.nan)
+
+    if bars < window:
+        return mean, std
+
+    valid = bars - window + 1
+    total = block[:valid].copy()
+    for lag in range(1, window):
+        total += block[lag : lag + valid]
+    window_mean = total / window
+
+    squares = np.zeros_like(window_mean)
+    deviation = np.empty_like(window_mean)
+    for lag in range(window):
+        np.subtract(block[lag : lag + valid], window_mean, out=deviation)
+        deviation *= deviation
+        squares += deviation
+
+    mean[window - 1 :] = window_mean
+    std[window - 1 :] = np.sqrt(squares / (window - 1))
+
+    return mean, std
+
+
+def _shift(block: np.ndarray) -> np.ndarray:
+    """Shift block down one bar along axis 0, filling with NaN."""
+    shifted = np.empty_like(block)
+    shifted[0] = np.nan
+    shifted[1:] = block[:-1]
+    return shifted
+
+
+class BatchIndicatorEngine:
+    """
+    Indicator engine over (symbols x bars) OHLCV blocks.
+
+    Every symbol shares the same bar axis. Symbols with shorter history
+    are padded with leading NaN; their outputs are NaN before the first
+    valid close and otherwise equal a per-symbol calculate() on the
+    unpadded frame.
+
+    Supported indicators: EMA, RSI, ATR, ADX, MACD, Bollinger Bands.
+
+    Attributes:
+        symbols: Symbol labels (row order of every block)
+        index: Optional shared bar index (column order)
+
+    Example:
+        >>> engine = BatchIndicatorEngine.from_frames({"SOL": df1, "BTC": df2})
+        >>> rsi = engine.rsi(period=14)           # shape (2, bars)
+        >>> macd = engine.macd()                  # dict of (2, bars) arrays
+        >>> results = engine.calculate_many([RSIIndicator(14), EMAIndicator(50)])
+    """
+
+    def __init__(
+        self,
+        close: np.ndarray,
+        high: Optional[np.ndarray] = None,
+        low: Optional[np.ndarray] = None,
+        volume: Optional[np.ndarray] = None,
+        symbols: Optional[Sequence[str]] = None,
+        index: Optional[pd.Index] = None,
+    ):
+        """
+        Initialize engine with column-aligned OHLCV blocks.
+
+        Args:
+            close: (symbols, bars) close prices
+            high: Optional (symbols, bars) highs (required for ATR/ADX)
+            low: Optional (symbols, bars) lows (required for ATR/ADX)
+            volume: Optional (symbols, bars) volumes
+            symbols: Optional symbol labels, one per row
+            index: Optional bar index, one entry per column
+
+        Raises:
+            ValueError: If blocks are not 2-D or shapes differ
+        """
+        self._close = self._to_time_major(close, "close")
+        shape = self._close.shape
+
+        self._high = self._to_time_major(high, "high", shape)
+        self._low = self._to_time_major(low, "low", shape)
+        self._volume = self._to_time_major(volume, "volume", shape)
+
+        bars, n_symbols = shape
+        self.symbols: List[str] = (
+            list(symbols) if symbols is not None else [str(i) for i in range(n_symbols)]
+        )
+        if len(self.symbols) != n_symbols:
+            raise ValueError(
+                f"Got {len(self.symbols)} symbol labels for {n_symbols} rows"
+            )
+
+        self.index = index
+        if index is not None and len(index) != bars:
+            raise ValueError(f"Index length {len(index)} != bars {bars}")
+
+        # Bars before each symbol's first valid close are not part of its history
+        valid = ~np.isnan(self._close)
+        first_valid = np.where(valid.any(axis=0), valid.argmax(axis=0), bars)
+        self._listed = np.arange(bars)[:, None] >= first_valid[None, :]
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame]) -> "BatchIndicatorEngine":
+        """
+        Build engine from per-symbol OHLCV DataFrames.
+
+        Frames are aligned on the union of their indexes. A symbol may
+        start later or end earlier than the others (those bars become
+        NaN), but must have every union bar inside its own range: a bar
+        missing from one frame would become a NaN row and change its
+        results versus calculate() on that frame.
+
+        Args:
+            frames: Mapping of symbol -> DataFrame with OHLCV columns
+
+        Returns:
+            BatchIndicatorEngine over the aligned blocks
+
+        Raises:
+            ValueError: If no frames given, or a frame lacks bars inside
+                its range that other frames have
+            KeyError: If a frame lacks a 'close' column
+        """
+        if not frames:
+            raise ValueError("At least one frame is required")
+
+        symbols = list(frames)
+        for symbol, df in frames.items():
+            if "close" not in df.columns:
+                raise KeyError(f"Frame for {symbol} must have 'close' column")
+
+        index = frames[symbols[0]].index
+        for symbol in symbols[1:]:
+            index = index.union(frames[symbol].index)
+
+        for symbol, df in frames.items():
+            if len(df) == 0:
+                continue
+            start = index.get_indexer(df.index[:1])[0]
+            if not index[start : start + len(df)].equals(df.index):
+                raise ValueError(
+                    f"Frame for {symbol} is missing bars inside its range that "
+                    f"other frames have; reindex it explicitly to align"
+                )
+
+        def block(column: str) -> Optional[np.ndarray]:
+            if not all(column in df.columns for df in frames.values()):
+                return None
+            return np.vstack(
+                [
+                    frames[s][column]
+                    .reindex(index)
+                    .to_numpy(dtype=np.float64, na_value=np.nan)
+                    for s in symbols
+                ]
+            )
+
+        return cls(
+            close=block("close"),
+            high=block("high"),
+            low=block("low"),
+            volume=block("volume"),
+            symbols=symbols,
+            index=index,
+        )
+
+    @staticmethod
+    def _to_time_major(
+        block: Optional[np.ndarray], name: str, shape: Optional[tuple] = None
+    ) -> Optional[np.ndarray]:
+        """Validate a (symbols, bars) block and store it as (bars, symbols)."""
+        if block is None:
+            return None
+
+        array = np.asarray(block, dtype=np.float64)
+        if array.ndim != 2:
+            raise ValueError(f"{name} must be 2-D (symbols x bars), got {array.ndim}-D")
+
+        time_major = np.ascontiguousarray(array.T)
+        if shape is not None and time_major.shape != shape:
+            raise ValueError(
+                f"{name} shape {array.shape} does not match close "
+                f"shape {(shape[1], shape[0])}"
+            )
+
+        return time_major
+
+    @property
+    def shape(self) -> tuple:
+        """Block shape as (symbols, bars)."""
+        bars, symbols = self._close.shape
+        return symbols, bars
+
+    def _require(self, name: str, block: Optional[np.ndarray]) -> np.ndarray:
+        if block is None:
+            raise KeyError(f"Engine has no '{name}' block")
+        return block
+
+    def _require_bars(self, required: int) -> None:
+        bars = self._close.shape[0]
+        if bars < required:
+            raise ValueError(
+                f"Insufficient data: need {required} candles, " f"got {bars}"
+            )
+
+    def _output(self, block: np.ndarray) -> np.ndarray:
+        """Mask pre-listing bars and return (symbols, bars) view."""
+        block[~self._listed] = np.nan
+        return block.T
+
+    def ema(self, period: int = 12, compute_distance: bool = False) -> BatchResult:
+        """
+        EMA for all symbols (see EMAIndicator).
+
+        Args:
+            period: EMA span
+            compute_distance: Also return distance from price in percent
+
+        Returns:
+            (symbols, bars) array, or dict with 'ema' and 'distance_pct'
+        """
+        self._require_bars(period)
+        close = self._close
+        ema = _ewm(close, span_to_alpha(period), period)
+
+        if not compute_distance:
+            return self._output(ema)
+
+        distance = (close - ema) / ema * 100
+        return {"ema": self._output(ema), "distance_pct": self._output(distance)}
+
+    def rsi(self, period: int = 14) -> np.ndarray:
+        """
+        RSI with Wilder's smoothing for all symbols (see RSIIndicator).
+
+        Args:
+            period: RSI period
+
+        Returns:
+            (symbols, bars) array of RSI values
+        """
+        self._require_bars(period)
+        close = self._close
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = close - _shift(close)
+            gains = np.where(delta > 0, delta, 0.0)
+            losses = np.where(delta < 0, -delta, 0.0)
+
+            # Bars before listing are absent, not zero-change observations
+            gains[~self._listed] = np.nan
+            losses[~self._listed] = np.nan
+
+            avg_gain = _ewm(gains, 1.0 / period, period)
+            avg_loss = _ewm(losses, 1.0 / period, period)
+
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        rsi[np.isnan(rsi)] = 50.0
+        return self._output(rsi)
+
+    def _true_range(self) -> np.ndarray:
+        high = self._require("high", self._high)
+        low = self._require("low", self._low)
+        prev_close = _shift(self._close)
+
+        tr = np.fmax(high - low, np.abs(high - prev_close))
+        return np.fmax(tr, np.abs(low - prev_close))
+
+    def atr(
+        self, period: int = 14, compute_percent: bool = True
+    ) -> Dict[str, np.ndarray]:
+        """
+        ATR for all symbols (see ATRIndicator).
+
+        Args:
+            period: Wilder smoothing period
+            compute_percent: Also return ATR as percent of close
+
+        Returns:
+            Dict with 'atr' and optional 'atr_percent' arrays
+        """
+        self._require_bars(period + 1)
+        atr = _ewm(self._true_range(), 1.0 / period, period)
+
+        results = {"atr": atr}
+        if compute_percent:
+            results["atr_percent"] = atr / self._close * 100
+
+        return {key: self._output(value) for key, value in results.items()}
+
+    def adx(self, period: int = 14, return_components: bool = False) -> BatchResult:
+        """
+        ADX for all symbols (see ADXIndicator).
+
+        Args:
+            period: Wilder smoothing period
+            return_components: Also return +DI and -DI
+
+        Returns:
+            (symbols, bars) ADX array, or dict with 'adx', 'plus_di', 'minus_di'
+        """
+        self._require_bars(period * 2)
+        high = self._require("high", self._high)
+        low = self._require("low", self._low)
+        alpha = 1.0 / period
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            plus_dm = high - _shift(high)
+            minus_dm = _shift(low) - low
+
+            plus_dm[plus_dm < 0] = 0
+            minus_dm[minus_dm < 0] = 0
+            plus_dm[plus_dm < minus_dm] = 0
+            minus_dm[minus_dm < plus_dm] = 0
+
+            atr = _ewm(self._true_range(), alpha)
+            plus_di = 100 * (_ewm(plus_dm, alpha) / atr)
+            minus_di = 100 * (_ewm(minus_dm, alpha) / atr)
+
+            dx = 100 * (np.abs(plus_di - minus_di) / (plus_di + minus_di))
+            adx = _ewm(dx, alpha)
+
+        if not return_components:
+            return self._output(adx)
+
+        return {
+            "adx": self._output(adx),
+            "plus_di": self._output(plus_di),
+            "minus_di": self._output(minus_di),
+        }
+
+    def macd(
+        self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
+    ) -> Dict[str, np.ndarray]:
+        """
+        MACD for all symbols (see MACDIndicator).
+
+        Args:
+            fast_period: Fast EMA span
+            slow_period: Slow EMA span
+            signal_period: Signal EMA span
+
+        Returns:
+            Dict with 'macd', 'signal' and 'histogram' arrays
+        """
+        self._require_bars(slow_period + signal_period)
+        close = self._close
+
+        ema_fast = _ewm(close, span_to_alpha(fast_period), fast_period)
+        ema_slow = _ewm(close, span_to_alpha(slow_period), slow_period)
+        macd_line = ema_fast - ema_slow
+        signal_line = _ewm(macd_line, span_to_alpha(signal_period), signal_period)
+
+        return {
+            "macd": self._output(macd_line),
+            "signal": self._output(signal_line),
+            "histogram": self._output(macd_line - signal_line),
+        }
+
+    def bollinger(
+        self,
+        period: int = 20,
+        std_multiplier: float = 2.0,
+        compute_width: bool = True,
+        compute_percent: bool = True,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Bollinger Bands for all symbols (see BollingerBandsIndicator).
+
+        Args:
+            period: Rolling window
+            std_multiplier: Band width in standard deviations
+            compute_width: Also return band width in percent
+            compute_percent: Also return %B
+
+        Returns:
+            Dict with 'middle', 'upper', 'lower' and optional metric arrays
+        """
+        self._require_bars(period)
+        close = self._close
+
+        middle, std = _rolling_mean_std(close, period)
+        upper = middle + std * std_multiplier
+        lower = middle - std * std_multiplier
+
+        results = {"middle": middle, "upper": upper, "lower": lower}
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if compute_width:
+                results["bb_width"] = (upper - lower) / middle * 100
+            if compute_percent:
+                results["bb_percent"] = (close - lower) / (upper - lower)
+
+        return {key: self._output(value) for key, value in results.items()}
+
+    def calculate(self, indicator: BaseIndicator) -> BatchResult:
+        """
+        Compute a configured indicator for all symbols.
+
+        Args:
+            indicator: Indicator instance whose params are reused
+
+        Returns:
+            Arrays keyed like indicator.calculate(), shaped (symbols, bars)
+
+        Raises:
+            NotImplementedError: If indicator type has no batch kernel
+        """
+        p = indicator.params
+
+        if isinstance(indicator, EMAIndicator):
+            return self.ema(p["period"], p["compute_distance"])
+        if isinstance(indicator, RSIIndicator):
+            return self.rsi(p["period"])
+        if isinstance(indicator, ATRIndicator):
+            return self.atr(p["period"], p["compute_percent"])
+        if isinstance(indicator, ADXIndicator):
+            return self.adx(p["period"], p["return_components"])
+        if isinstance(indicator, MACDIndicator):
+            return self.macd(p["fast_period"], p["slow_period"], p["signal_period"])
+        if isinstance(indicator, BollingerBandsIndicator):
+            return self.bollinger(
+                p["period"],
+                p["std_multiplier"],
+                p["compute_width"],
+                p["compute_percent"],
+            )
+
+        raise NotImplementedError(
+            f"{indicator.__class__.__name__} has no batch implementation"
+        )
+
+    def calculate_many(self, indicators: Sequence[BaseIndicator]) -> List[BatchResult]:
+        """
+        Compute several configured indicators for all symbols.
+
+        Args:
+            indicators: Indicator instances
+
+        Returns:
+            Results in the same order as ``indicators``
+        """
+        return [self.calculate(indicator) for indicator in indicators]
+
+    def to_frame(self, result: np.ndarray) -> pd.DataFrame:
+        """
+        Wrap a (symbols, bars) result as a DataFrame (bars x symbols).
+
+        Args:
+            result: Array returned by an engine method
+
+        Returns:
+            DataFrame indexed by bar with one column per symbol
+        """
+        return pd.DataFrame(result.T, index=self.index, columns=self.symbols)
@@ -5,11 +5,12 @@ Calculates volatility bands around a moving average.
 Pure calculation with optional width and %B metrics.
 """
 
-from typing import Dict
+from typing import Any, Dict, Mapping, Tuple
 
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import RollingWindow, divide
 
 
 class BollingerBandsIndicator(BaseIndicator):
@@ -135,3 +136,50 @@ class BollingerBandsIndicator(BaseIndicator):
             results["bb_percent"] = bb_percent
 
         return results
+
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Dict[str, pd.Series], Dict[str, Any]]:
+        """
+        Calculate Bollinger Bands and return rolling window state.
+
+        Args:
+            df: DataFrame with 'close' column
+
+        Returns:
+            Tuple of (calculate() result, state dict with close window)
+        """
+        result = self.calculate(df)
+
+        state = {
+            "window": RollingWindow(self.period, df["close"].iloc[-self.period :]),
+        }
+
+        return result, state
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Dict[str, float]:
+        """Advance Bollinger Bands by one candle."""
+        close = float(candle["close"])
+        window = state["window"]
+        window.push(close)
+
+        middle = window.mean
+        band = window.std * self.std_multiplier
+        upper = middle + band
+        lower = middle - band
+
+        results = {
+            "middle": middle,
+            "upper": upper,
+            "lower": lower,
+        }
+
+        if self.compute_width:
+            results["bb_width"] = divide(upper - lower, middle) * 100
+
+        if self.compute_percent:
+            results["bb_percent"] = divide(close - lower, upper - lower)
+
+        return results
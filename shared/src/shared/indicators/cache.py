@@ -0,0 +1,341 @@
+"""
+Memoized indicator results.
+
+LRU cache around BaseIndicator.calculate() keyed by indicator class,
+parameters and input series (caller supplied, or the frame's first row),
+with a cheap fingerprint of the input frame (columns, length, first/last
+index, last-row hash) to detect changes. When a frame only appends rows
+to a cached one, streaming indicators are extended with update steps
+instead of recomputed. Entries are evicted by estimated memory footprint.
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+import pandas as pd
+
+from shared.indicators.base import BaseIndicator, indicator_key
+
+IndicatorResult = Union[pd.Series, Dict[str, pd.Series]]
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters for an IndicatorCache.
+
+    Attributes:
+        hits: Lookups served from an identical cached frame
+        extensions: Lookups served by extending a cached prefix
+        misses: Lookups that required a full calculate()
+        evictions: Entries dropped to stay within max_bytes
+        entries: Entries currently cached
+        bytes: Estimated memory held by cached results
+    """
+
+    hits: int
+    extensions: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups that avoided a full calculate() (0-1)."""
+        total = self.hits + self.extensions + self.misses
+        if total == 0:
+            return 0.0
+        return (self.hits + self.extensions) / total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (includes hit_rate)."""
+        data = asdict(self)
+        data["hit_rate"] = self.hit_rate
+        return data
+
+
+@dataclass(frozen=True)
+class _Fingerprint:
+    """Cheap identity of a DataFrame."""
+
+    columns: Tuple[Hashable, ...]
+    length: int
+    first: Hashable
+    last: Hashable
+    last_row: int
+
+
+@dataclass
+class _Entry:
+    """Cached result for one (indicator, params, series) key."""
+
+    fingerprint: _Fingerprint
+    result: IndicatorResult
+    state: Optional[Dict[str, Any]]
+    nbytes: int
+
+
+def _row_hash(df: pd.DataFrame, position: int) -> int:
+    """Hash one row (values and index label)."""
+    return int(pd.util.hash_pandas_object(df.iloc[[position]], index=True).iloc[0])
+
+
+def _series_id(df: pd.DataFrame) -> Hashable:
+    """Default series identity: first index label and first-row hash."""
+    return (df.index[0], _row_hash(df, 0))
+
+
+def _fingerprint(df: pd.DataFrame) -> _Fingerprint:
+    return _Fingerprint(
+        columns=tuple(df.columns),
+        length=len(df),
+        first=df.index[0],
+        last=df.index[-1],
+        last_row=_row_hash(df, -1),
+    )
+
+
+def _nbytes(result: IndicatorResult) -> int:
+    """Estimate memory held by a calculate() result."""
+    if isinstance(result, pd.Series):
+        return int(result.memory_usage(index=True, deep=False))
+    return sum(_nbytes(value) for value in result.values())
+
+
+def _copy(result: IndicatorResult) -> IndicatorResult:
+    if isinstance(result, pd.Series):
+        return result.copy()
+    return {key: _copy(value) for key, value in result.items()}
+
+
+class IndicatorCache:
+    """
+    LRU cache for indicator calculate() results.
+
+    Several strategies computing the same indicator (e.g. RSI(14) on
+    SOL/USDC 1m) share one calculation. Each input series keeps its own
+    entry, so one indicator over many symbols does not thrash the cache.
+    A frame that extends a cached frame by up to max_extend_rows candles
+    is served by stepping the cached streaming state over the new rows;
+    indicators without streaming support are recomputed.
+
+    Example:
+        >>> cache = IndicatorCache(max_bytes=32 * 1024 * 1024)
+        >>> rsi = cache.calculate(RSIIndicator(period=14), df)
+        >>> rsi = cache.calculate(RSIIndicator(period=14), df)  # hit
+        >>> btc = cache.calculate(RSIIndicator(period=14), btc_df, "BTC/USDC")
+        >>> cache.stats.hits
+        1
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_extend_rows: int = 256,
+        copy_results: bool = True,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_bytes: Upper bound on estimated memory held by results
+            max_extend_rows: Max appended rows served by streaming
+                extension; larger appends are recomputed
+            copy_results: Return copies so callers cannot mutate
+                cached Series
+
+        Raises:
+            ValueError: If limits are invalid
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be > 0, got: {max_bytes}")
+        if max_extend_rows < 0:
+            raise ValueError(f"max_extend_rows must be >= 0, got: {max_extend_rows}")
+
+        self.max_bytes = max_bytes
+        self.max_extend_rows = max_extend_rows
+        self.copy_results = copy_results
+
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._extensions = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+
+    def calculate(
+        self,
+        indicator: BaseIndicator,
+        df: pd.DataFrame,
+        series: Optional[Hashable] = None,
+    ) -> IndicatorResult:
+        """
+        Return indicator.calculate(df), served from cache when possible.
+
+        Args:
+            indicator: Indicator to evaluate
+            df: DataFrame with OHLCV columns
+            series: Identity of the input series, e.g. ("SOL/USDC", "1m")
+                (default: the frame's first index label and row). Pass it
+                when windows of one series may start at different rows.
+
+        Returns:
+            Same result as indicator.calculate(df)
+
+        Raises:
+            ValueError: If DataFrame is invalid or insufficient data
+            KeyError: If required columns are missing
+        """
+        if len(df) == 0:
+            return indicator.calculate(df)
+
+        key = (indicator_key(indicator), _series_id(df) if series is None else series)
+        fingerprint = _fingerprint(df)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.fingerprint == fingerprint:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return self._output(entry.result)
+
+                extended = self._extend(indicator, entry, df, fingerprint)
+                if extended is not None:
+                    self._store(key, extended)
+                    self._extensions += 1
+                    return self._output(extended.result)
+
+            self._misses += 1
+
+        entry = self._compute(indicator, df, fingerprint)
+
+        with self._lock:
+            self._store(key, entry)
+
+        return self._output(entry.result)
+
+    def invalidate(self, indicator: Optional[BaseIndicator] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            indicator: Drop only this indicator's entries, for every
+                series (default: all)
+        """
+        with self._lock:
+            if indicator is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+
+            prefix = indicator_key(indicator)
+            for key in [key for key in self._entries if key[0] == prefix]:
+                self._bytes -= self._entries.pop(key).nbytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of cache counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                extensions=self._extensions,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"IndicatorCache(entries={len(self._entries)}, "
+            f"bytes={self._bytes}, max_bytes={self.max_bytes})"
+        )
+
+    def _output(self, result: IndicatorResult) -> IndicatorResult:
+        return _copy(result) if self.copy_results else result
+
+    def _compute(
+        self, indicator: BaseIndicator, df: pd.DataFrame, fingerprint: _Fingerprint
+    ) -> _Entry:
+        """Full calculation, keeping streaming state when supported."""
+        try:
+            result, state = indicator.calculate_with_state(df)
+        except NotImplementedError:
+            result, state = indicator.calculate(df), None
+
+        return _Entry(fingerprint, result, state, _nbytes(result))
+
+    def _extend(
+        self,
+        indicator: BaseIndicator,
+        entry: _Entry,
+        df: pd.DataFrame,
+        fingerprint: _Fingerprint,
+    ) -> Optional[_Entry]:
+        """Extend a cached prefix of df by streaming steps, if possible."""
+        cached = entry.fingerprint
+        added = fingerprint.length - cached.length
+
+        if (
+            entry.state is None
+            or added <= 0
+            or added > self.max_extend_rows
+            or fingerprint.columns != cached.columns
+            or df.index[0] != cached.first
+            or df.index[cached.length - 1] != cached.last
+            or _row_hash(df, cached.length - 1) != cached.last_row
+        ):
+            return None
+
+        tail = df.iloc[cached.length :]
+        try:
+            steps = [
+                indicator._step(entry.state, row) for row in tail.to_dict("records")
+            ]
+        except (KeyError, ValueError, TypeError):
+            # Partially stepped state is unusable; recompute from scratch
+            entry.state = None
+            return None
+
+        if isinstance(entry.result, pd.Series):
+            appended = pd.Series(steps, index=tail.index, dtype=entry.result.dtype)
+            result: IndicatorResult = pd.concat([entry.result, appended])
+            result.name = entry.result.name
+        else:
+            result = {}
+            for name, series in entry.result.items():
+                appended = pd.Series(
+                    [step[name] for step in steps], index=tail.index, dtype=series.dtype
+                )
+                result[name] = pd.concat([series, appended])
+                result[name].name = series.name
+
+        # Stepping mutated the cached state; the old entry is now stale
+        return _Entry(fingerprint, result, entry.state, _nbytes(result))
+
+    def _store(self, key: CacheKey, entry: _Entry) -> None:
+        """Insert entry as most recent and evict down to max_bytes."""
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+
+        if entry.nbytes > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._bytes += entry.nbytes
+
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self._evictions += 1
@@ -0,0 +1,220 @@
+"""
+Pure-NumPy candlestick pattern kernels.
+
+Fallback for the most common TA-Lib CDL functions when TA-Lib is not
+installed. Kernels follow TA-Lib's default candle settings (body/shadow
+averages over the preceding candles) and return int32 arrays of
+100/-100/0 (80/-80 for TA-Lib's weaker variants), like TA-Lib.
+
+All kernels take contiguous float64 open/high/low/close arrays.
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+PatternKernel = Callable[[np.ndarray, np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+
+# TA-Lib default candle settings: (average period, factor)
+_BODY_LONG = (10, 1.0)
+_BODY_SHORT = (10, 1.0)
+_BODY_DOJI = (10, 0.1)
+_SHADOW_LONG = (0, 1.0)
+_SHADOW_VERY_SHORT = (10, 0.1)
+_NEAR = (5, 0.2)
+
+
+def _average(values: np.ndarray, setting: tuple) -> np.ndarray:
+    """
+    TA-Lib candle average: factor * mean of the preceding `period` values.
+
+    A period of 0 compares against the current candle's own value.
+    """
+    period, factor = setting
+    if period == 0:
+        return factor * values
+
+    totals = np.full(len(values), np.nan)
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+    totals[period:] = cumulative[period:-1] - cumulative[: -period - 1]
+    return factor * (totals / period)
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    shifted = np.empty_like(values)
+    shifted[0] = np.nan
+    shifted[1:] = values[:-1]
+    return shifted
+
+
+def _output(signal: np.ndarray, lookback: int) -> np.ndarray:
+    """Cast to int32 and zero bars inside TA-Lib's lookback."""
+    out = signal.astype(np.int32)
+    out[:lookback] = 0
+    return out
+
+
+class _Candles:
+    """Derived candle geometry shared by the kernels."""
+
+    def __init__(self, o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+        self.open, self.high, self.low, self.close = o, h, lo, c
+        self.body = np.abs(c - o)
+        self.range = h - lo
+        self.body_top = np.maximum(o, c)
+        self.body_bottom = np.minimum(o, c)
+        self.upper_shadow = h - self.body_top
+        self.lower_shadow = self.body_bottom - lo
+        self.color = np.where(c >= o, 1, -1)
+
+
+def cdl_doji(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Doji: real body no larger than a tenth of the average range."""
+    k = _Candles(o, h, lo, c)
+    signal = k.body <= _average(k.range, _BODY_DOJI)
+    return _output(signal * 100, _BODY_DOJI[0])
+
+
+def _small_body_long_lower(k: _Candles) -> np.ndarray:
+    return (
+        (k.body < _average(k.body, _BODY_SHORT))
+        & (k.lower_shadow > _average(k.body, _SHADOW_LONG))
+        & (k.upper_shadow < _average(k.range, _SHADOW_VERY_SHORT))
+    )
+
+
+def _small_body_long_upper(k: _Candles) -> np.ndarray:
+    return (
+        (k.body < _average(k.body, _BODY_SHORT))
+        & (k.upper_shadow > _average(k.body, _SHADOW_LONG))
+        & (k.lower_shadow < _average(k.range, _SHADOW_VERY_SHORT))
+    )
+
+
+def cdl_hammer(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Hammer: small body near the prior low with a long lower shadow."""
+    k = _Candles(o, h, lo, c)
+    near = _shift(_average(k.range, _NEAR))
+    signal = _small_body_long_lower(k) & (k.body_bottom <= _shift(lo) + near)
+    return _output(signal * 100, max(_BODY_SHORT[0], _NEAR[0]) + 1)
+
+
+def cdl_hanging_man(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Hanging man: hammer shape near the prior high (bearish)."""
+    k = _Candles(o, h, lo, c)
+    near = _shift(_average(k.range, _NEAR))
+    signal = _small_body_long_lower(k) & (k.body_bottom >= _shift(h) - near)
+    return _output(signal * -100, max(_BODY_SHORT[0], _NEAR[0]) + 1)
+
+
+def cdl_inverted_hammer(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Inverted hammer: long upper shadow, body gapping below prior body."""
+    k = _Candles(o, h, lo, c)
+    gap_down = k.body_top < _shift(k.body_bottom)
+    signal = _small_body_long_upper(k) & gap_down
+    return _output(signal * 100, _BODY_SHORT[0] + 1)
+
+
+def cdl_shooting_star(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Shooting star: long upper shadow, body gapping above prior body."""
+    k = _Candles(o, h, lo, c)
+    gap_up = k.body_bottom > _shift(k.body_top)
+    signal = _small_body_long_upper(k) & gap_up
+    return _output(signal * -100, _BODY_SHORT[0] + 1)
+
+
+def cdl_engulfing(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Engulfing: body engulfs the opposite-colored prior body."""
+    k = _Candles(o, h, lo, c)
+    prev_open, prev_close = _shift(o), _shift(c)
+    prev_color = _shift(k.color.astype(np.float64))
+
+    bullish = (
+        (k.color == 1)
+        & (prev_color == -1)
+        & (
+            ((c >= prev_open) & (o < prev_close))
+            | ((c > prev_open) & (o <= prev_close))
+        )
+    )
+    bearish = (
+        (k.color == -1)
+        & (prev_color == 1)
+        & (
+            ((o >= prev_close) & (c < prev_open))
+            | ((o > prev_close) & (c <= prev_open))
+        )
+    )
+    strength = np.where((o != prev_close) & (c != prev_open), 100, 80)
+    signal = np.where(bullish | bearish, k.color * strength, 0)
+    return _output(signal, 2)
+
+
+def cdl_harami(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Harami: small body contained in the prior long body."""
+    k = _Candles(o, h, lo, c)
+    prev_top, prev_bottom = _shift(k.body_top), _shift(k.body_bottom)
+    prev_color = _shift(k.color.astype(np.float64))
+
+    setup = (_shift(k.body) > _shift(_average(k.body, _BODY_LONG))) & (
+        k.body <= _average(k.body, _BODY_SHORT)
+    )
+    inside = (k.body_top < prev_top) & (k.body_bottom > prev_bottom)
+    touching = (k.body_top <= prev_top) & (k.body_bottom >= prev_bottom)
+
+    signal = np.where(
+        setup & inside,
+        -prev_color * 100,
+        np.where(setup & touching, -prev_color * 80, 0),
+    )
+    return _output(np.nan_to_num(signal), max(_BODY_SHORT[0], _BODY_LONG[0]) + 1)
+
+
+def cdl_piercing(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Piercing line: white candle opens below and closes into prior black body."""
+    k = _Candles(o, h, lo, c)
+    prev_body = _shift(k.body)
+    prev_color = _shift(k.color.astype(np.float64))
+    body_long = _average(k.body, _BODY_LONG)
+
+    signal = (
+        (prev_color == -1)
+        & (prev_body > _shift(body_long))
+        & (k.color == 1)
+        & (k.body > body_long)
+        & (o < _shift(lo))
+        & (c < _shift(o))
+        & (c > _shift(c) + prev_body * 0.5)
+    )
+    return _output(signal * 100, _BODY_LONG[0] + 1)
+
+
+def cdl_dark_cloud_cover(o: np.ndarray, h: np.ndarray, lo: np.ndarray, c: np.ndarray):
+    """Dark cloud cover: black candle opens above and closes into prior white body."""
+    k = _Candles(o, h, lo, c)
+    prev_body = _shift(k.body)
+    prev_color = _shift(k.color.astype(np.float64))
+
+    signal = (
+        (prev_color == 1)
+        & (prev_body > _shift(_average(k.body, _BODY_LONG)))
+        & (k.color == -1)
+        & (o > _shift(h))
+        & (c > _shift(o))
+        & (c < _shift(c) - prev_body * 0.5)
+    )
+    return _output(signal * -100, _BODY_LONG[0] + 1)
+
+
+# TA-Lib function name -> NumPy kernel
+FALLBACK_PATTERNS: Dict[str, PatternKernel] = {
+    "CDLDOJI": cdl_doji,
+    "CDLHAMMER": cdl_hammer,
+    "CDLHANGINGMAN": cdl_hanging_man,
+    "CDLINVERTEDHAMMER": cdl_inverted_hammer,
+    "CDLSHOOTINGSTAR": cdl_shooting_star,
+    "CDLENGULFING": cdl_engulfing,
+    "CDLHARAMI": cdl_harami,
+    "CDLPIERCING": cdl_piercing,
+    "CDLDARKCLOUDCOVER": cdl_dark_cloud_cover,
+}
@@ -4,11 +4,12 @@ EMA (Exponential Moving Average) indicator implementation.
 Pure calculation with optional distance metric.
 """
 
-from typing import Dict, Union
+from typing import Any, Dict, Mapping, Tuple, Union
 
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import EWMState, divide, span_to_alpha
 
 
 class EMAIndicator(BaseIndicator):
@@ -32,6 +33,10 @@ class EMAIndicator(BaseIndicator):
         >>> result = ema.calculate(df)
         >>> print(result['ema'].iloc[-1])
         >>> print(result['distance_pct'].iloc[-1])
+
+        >>> # Streaming
+        >>> ema.seed(df)
+        >>> ema.update({'close': 101.5})
     """
 
     def __init__(self, period: int = 12, compute_distance: bool = False):
@@ -96,3 +101,38 @@ class EMAIndicator(BaseIndicator):
         distance = ((close - ema) / ema) * 100
 
         return {"ema": ema, "distance_pct": distance}
+
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Union[pd.Series, Dict[str, pd.Series]], Dict[str, Any]]:
+        """
+        Calculate EMA and return final smoothing state.
+
+        Args:
+            df: DataFrame with 'close' column
+
+        Returns:
+            Tuple of (calculate() result, state dict with 'ema' EWMState)
+        """
+        result = self.calculate(df)
+        ema = result["ema"] if self.compute_distance else result
+
+        state = {
+            "ema": EWMState.from_series(
+                df["close"], ema, span_to_alpha(self.period), self.period
+            ),
+        }
+
+        return result, state
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Union[float, Dict[str, float]]:
+        """Advance EMA by one candle."""
+        close = float(candle["close"])
+        ema = state["ema"].update(close)
+
+        if not self.compute_distance:
+            return ema
+
+        return {"ema": ema, "distance_pct": divide(close - ema, ema) * 100}
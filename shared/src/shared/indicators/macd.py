@@ -5,11 +5,12 @@ Calculates trend-following momentum indicator.
 Pure calculation with MACD line, signal line, and histogram.
 """
 
-from typing import Dict
+from typing import Any, Dict, Mapping, Tuple
 
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import EWMState, span_to_alpha
 
 
 class MACDIndicator(BaseIndicator):
@@ -140,3 +141,55 @@ class MACDIndicator(BaseIndicator):
             "signal": signal_line,
             "histogram": histogram,
         }
+
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Dict[str, pd.Series], Dict[str, Any]]:
+        """
+        Calculate MACD and return final EMA states.
+
+        Args:
+            df: DataFrame with 'close' column
+
+        Returns:
+            Tuple of (calculate() result, state dict with fast, slow and
+            signal EWMState)
+        """
+        result = self.calculate(df)
+        close = df["close"]
+
+        # calculate() only exposes the difference of the two EMAs,
+        # so recover the final value of each leg separately
+        ema_fast = close.ewm(span=self.fast_period, adjust=False).mean()
+        ema_slow = close.ewm(span=self.slow_period, adjust=False).mean()
+
+        state = {
+            "fast": EWMState.from_series(
+                close, ema_fast, span_to_alpha(self.fast_period), self.fast_period
+            ),
+            "slow": EWMState.from_series(
+                close, ema_slow, span_to_alpha(self.slow_period), self.slow_period
+            ),
+            "signal": EWMState.from_series(
+                result["macd"],
+                result["signal"],
+                span_to_alpha(self.signal_period),
+                self.signal_period,
+            ),
+        }
+
+        return result, state
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Dict[str, float]:
+        """Advance MACD by one candle."""
+        close = float(candle["close"])
+        macd = state["fast"].update(close) - state["slow"].update(close)
+        signal = state["signal"].update(macd)
+
+        return {
+            "macd": macd,
+            "signal": signal,
+            "histogram": macd - signal,
+        }
@@ -3,13 +3,163 @@ Pattern recognition indicator using TA-Lib.
 
 Detects candlestick patterns and generates aggregate scores.
 Pure calculation with zero dependencies except pandas and talib.
+When TA-Lib is not installed, common patterns fall back to the NumPy
+kernels in shared.indicators.candlestick.
 """
 
-from typing import Dict, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.candlestick import FALLBACK_PATTERNS
+
+try:
+    import talib
+except ImportError:  # pragma: no cover - depends on environment
+    talib = None
+
+BACKENDS = ("auto", "talib", "numpy")
+
+
+@dataclass(frozen=True)
+class PatternScan:
+    """
+    Raw output of one batch pattern scan.
+
+    Attributes:
+        results: Pattern name -> int32 TA-Lib style signal array
+        timings_ms: Pattern name -> wall time of its kernel
+        failures: Pattern name -> reason it produced no result
+        backends: Pattern name -> backend used ('talib' or 'numpy')
+        convert_ms: Time spent building the shared OHLC buffers
+    """
+
+    results: Dict[str, np.ndarray]
+    timings_ms: Dict[str, float]
+    failures: Dict[str, str]
+    backends: Dict[str, str]
+    convert_ms: float
+
+    @property
+    def total_ms(self) -> float:
+        """Conversion time plus the sum of kernel times."""
+        return self.convert_ms + sum(self.timings_ms.values())
+
+
+def _ohlc_buffers(df: pd.DataFrame) -> Tuple[np.ndarray, ...]:
+    """Convert OHLC columns to contiguous float64 arrays once."""
+    required = ["open", "high", "low", "close"]
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        raise KeyError(f"DataFrame missing required columns: {missing}")
+
+    return tuple(
+        np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)) for col in required
+    )
+
+
+def _resolve(pattern: str, backend: str) -> Tuple[Optional[Callable], str, str]:
+    """
+    Find the kernel for a pattern.
+
+    Returns:
+        Tuple of (kernel or None, backend name, failure reason)
+    """
+    if backend != "numpy" and talib is not None:
+        func = getattr(talib, pattern, None)
+        if func is not None:
+            return func, "talib", ""
+        if backend == "talib" or pattern not in FALLBACK_PATTERNS:
+            return None, "talib", "unknown TA-Lib pattern"
+
+    if backend == "talib":
+        return None, "talib", "TA-Lib not installed"
+
+    func = FALLBACK_PATTERNS.get(pattern)
+    if func is not None:
+        return func, "numpy", ""
+
+    if backend == "auto":
+        return None, "numpy", "TA-Lib not installed and no NumPy fallback"
+    return None, "numpy", "no NumPy fallback"
+
+
+def scan_patterns(
+    df: pd.DataFrame,
+    patterns: Sequence[str],
+    max_workers: int = 1,
+    backend: str = "auto",
+) -> PatternScan:
+    """
+    Run many CDL pattern functions over one shared OHLC buffer.
+
+    TA-Lib releases the GIL inside its C kernels, so max_workers > 1
+    scans patterns concurrently on a thread pool.
+
+    Args:
+        df: DataFrame with open, high, low, close columns
+        patterns: TA-Lib function names (e.g. 'CDLHAMMER')
+        max_workers: Threads used for scanning (1 = sequential)
+        backend: 'auto' (TA-Lib, else NumPy), 'talib' or 'numpy'
+
+    Returns:
+        PatternScan with per-pattern results, timings and failures
+
+    Raises:
+        KeyError: If required columns missing
+        ValueError: If backend or max_workers is invalid
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {list(BACKENDS)}, got: {backend}")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got: {max_workers}")
+
+    start = time.perf_counter()
+    buffers = _ohlc_buffers(df)
+    convert_ms = (time.perf_counter() - start) * 1e3
+
+    failures: Dict[str, str] = {}
+    backends: Dict[str, str] = {}
+    jobs: List[Tuple[str, Callable]] = []
+    for pattern in dict.fromkeys(patterns):
+        func, used, reason = _resolve(pattern, backend)
+        backends[pattern] = used
+        if func is None:
+            failures[pattern] = reason
+        else:
+            jobs.append((pattern, func))
+
+    def run(job: Tuple[str, Callable]) -> Tuple[str, Optional[np.ndarray], float, str]:
+        pattern, func = job
+        begin = time.perf_counter()
+        try:
+            result = np.asarray(func(*buffers))
+            error = ""
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        return pattern, result, (time.perf_counter() - begin) * 1e3, error
+
+    if max_workers > 1 and len(jobs) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+            outcomes = list(pool.map(run, jobs))
+    else:
+        outcomes = [run(job) for job in jobs]
+
+    results: Dict[str, np.ndarray] = {}
+    timings: Dict[str, float] = {}
+    for pattern, result, elapsed, error in outcomes:
+        timings[pattern] = elapsed
+        if result is None:
+            failures[pattern] = error
+        else:
+            results[pattern] = result
+
+    return PatternScan(results, timings, failures, backends, convert_ms)
 
 
 class PatternIndicator(BaseIndicator):
@@ -17,12 +167,18 @@ class PatternIndicator(BaseIndicator):
     Candlestick pattern recognition using TA-Lib.
 
     Detects multiple bullish/bearish patterns and aggregates them into scores.
+    OHLC columns are converted to float64 buffers once per call and every
+    requested pattern is scanned over them (optionally on a thread pool).
 
     Parameters:
         bullish (list): List of bullish pattern names (e.g., ['CDLHAMMER'])
         bearish (list): List of bearish pattern names (e.g., ['CDLSHOOTINGSTAR'])
         lookback_window (int): Candles to check for patterns (default: 5)
         aggregate_method (str): Aggregation method - 'weighted_sum', 'simple_sum', 'count'
+        max_workers (int): Threads used to scan patterns (default: 1)
+        backend (str): 'auto' (TA-Lib, NumPy fallback), 'talib' or 'numpy'
+        strict (bool): Raise if any pattern fails instead of skipping it;
+            skipped patterns are listed under 'failures' in the result
 
     Example:
         >>> patterns = PatternIndicator(
@@ -31,7 +187,9 @@ class PatternIndicator(BaseIndicator):
         ...     aggregate_method='weighted_sum'
         ... )
         >>> result = patterns.calculate(df)
-        >>> print(result.iloc[-1])  # Aggregate score
+        >>> print(result['aggregate'].iloc[-1])  # Aggregate score
+        >>> scan = patterns.scan(df)
+        >>> print(scan.timings_ms, scan.failures)
     """
 
     def __init__(
@@ -40,6 +198,9 @@ class PatternIndicator(BaseIndicator):
         bearish: list = None,
         lookback_window: int = 5,
         aggregate_method: str = "weighted_sum",
+        max_workers: int = 1,
+        backend: str = "auto",
+        strict: bool = False,
     ):
         """
         Initialize pattern indicator.
@@ -49,17 +210,26 @@ class PatternIndicator(BaseIndicator):
             bearish: List of bearish pattern names
             lookback_window: Candles to check for patterns
             aggregate_method: How to combine patterns
+            max_workers: Threads used to scan patterns
+            backend: Pattern kernel backend
+            strict: Raise ValueError on any failed pattern
         """
         super().__init__(
             bullish=bullish or [],
             bearish=bearish or [],
             lookback_window=lookback_window,
             aggregate_method=aggregate_method,
+            max_workers=max_workers,
+            backend=backend,
+            strict=strict,
         )
         self.bullish_patterns = self.params["bullish"]
         self.bearish_patterns = self.params["bearish"]
         self.lookback_window = self.params["lookback_window"]
         self.aggregate_method = self.params["aggregate_method"]
+        self.max_workers = self.params["max_workers"]
+        self.backend = self.params["backend"]
+        self.strict = self.params["strict"]
 
     def validate_params(self) -> None:
         """
@@ -73,6 +243,8 @@ class PatternIndicator(BaseIndicator):
         bearish = self.params.get("bearish", [])
         lookback_window = self.params.get("lookback_window", 5)
         aggregate_method = self.params.get("aggregate_method", "weighted_sum")
+        max_workers = self.params.get("max_workers", 1)
+        backend = self.params.get("backend", "auto")
 
         if not bullish and not bearish:
             raise ValueError(
@@ -91,6 +263,32 @@ class PatternIndicator(BaseIndicator):
                 f"got: {aggregate_method}"
             )
 
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ValueError(f"max_workers must be integer >= 1, got: {max_workers}")
+
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {list(BACKENDS)}, got: {backend}")
+
+    def scan(self, df: pd.DataFrame) -> PatternScan:
+        """
+        Scan all configured patterns with timings and failures.
+
+        Args:
+            df: DataFrame with OHLC columns (open, high, low, close)
+
+        Returns:
+            PatternScan (raw signals, not sign-adjusted for bearish)
+
+        Raises:
+            KeyError: If required columns missing
+        """
+        return scan_patterns(
+            df,
+            self.bullish_patterns + self.bearish_patterns,
+            max_workers=self.max_workers,
+            backend=self.backend,
+        )
+
     def calculate(
         self, df: pd.DataFrame
     ) -> Union[pd.Series, Dict[str, Union[pd.Series, Dict]]]:
@@ -101,76 +299,58 @@ class PatternIndicator(BaseIndicator):
             df: DataFrame with OHLC columns (open, high, low, close)
 
         Returns:
-            Dict with 'aggregate' Series and 'individual' pattern dict
+            Dict with 'aggregate' Series, 'individual' pattern dict and
+            'failures' (pattern name -> reason it was left out, so a
+            missing pattern is not mistaken for one that never fired)
 
         Raises:
-            ImportError: If TA-Lib not installed
+            ImportError: If backend is 'talib' and TA-Lib not installed
             KeyError: If required columns missing
+            ValueError: If strict and any pattern failed
         """
-        # Check for TA-Lib
-        try:
-            import talib
-        except ImportError:
+        if self.backend == "talib" and talib is None:
             raise ImportError(
                 "TA-Lib required for pattern recognition. "
                 "Install with: pip install TA-Lib"
             )
 
-        # Validate required columns
-        required = ["open", "high", "low", "close"]
-        missing = [col for col in required if col not in df.columns]
-        if missing:
-            raise KeyError(f"DataFrame missing required columns: {missing}")
+        scan = self.scan(df)
 
-        open_prices = df["open"]
-        high_prices = df["high"]
-        low_prices = df["low"]
-        close_prices = df["close"]
+        if self.strict and scan.failures:
+            details = ", ".join(f"{k} ({v})" for k, v in scan.failures.items())
+            raise ValueError(f"Pattern scan failed: {details}")
 
-        # Detect all patterns
+        # Bullish patterns keep their sign, bearish patterns are inverted
         pattern_results = {}
-
-        # Bullish patterns (positive values)
         for pattern_name in self.bullish_patterns:
-            pattern_func = getattr(talib, pattern_name, None)
-            if pattern_func is None:
-                # Skip unknown patterns silently (caller can validate)
-                continue
-
-            try:
-                result = pattern_func(
-                    open_prices, high_prices, low_prices, close_prices
+            if pattern_name in scan.results:
+                pattern_results[pattern_name] = pd.Series(
+                    scan.results[pattern_name], index=df.index
                 )
-                pattern_results[pattern_name] = result
-            except Exception:
-                # Skip failed pattern computation
-                continue
-
-        # Bearish patterns (negative values)
         for pattern_name in self.bearish_patterns:
-            pattern_func = getattr(talib, pattern_name, None)
-            if pattern_func is None:
-                continue
-
-            try:
-                result = pattern_func(
-                    open_prices, high_prices, low_prices, close_prices
+            if pattern_name in scan.results:
+                pattern_results[pattern_name] = pd.Series(
+                    -scan.results[pattern_name], index=df.index
                 )
-                # Invert bearish patterns (negative score)
-                pattern_results[pattern_name] = -result
-            except Exception:
-                continue
 
         # Handle case where no patterns computed
         if not pattern_results:
             empty_series = pd.Series(0.0, index=df.index)
-            return {"aggregate": empty_series, "individual": {}}
+            return {
+                "aggregate": empty_series,
+                "individual": {},
+                "failures": dict(scan.failures),
+            }
 
         # Aggregate patterns
         aggregate_score = self._aggregate_patterns(pattern_results, df.index)
 
-        # Return both aggregate and individual patterns
-        return {"aggregate": aggregate_score, "individual": pattern_results}
+        # Return aggregate, individual patterns and any skipped patterns
+        return {
+            "aggregate": aggregate_score,
+            "individual": pattern_results,
+            "failures": dict(scan.failures),
+        }
 
     def _aggregate_patterns(
         self, pattern_results: Dict[str, pd.Series], index: pd.Index
@@ -185,22 +365,20 @@ class PatternIndicator(BaseIndicator):
         Returns:
             Aggregated score series
         """
+        stacked = np.vstack([result.to_numpy() for result in pattern_results.values()])
+
         if self.aggregate_method == "simple_sum":
             # Simple sum of all patterns
-            aggregate = sum(pattern_results.values())
+            aggregate = stacked.sum(axis=0)
 
         elif self.aggregate_method == "count":
             # Count number of active patterns
-            aggregate = pd.Series(0, index=index)
-            for result in pattern_results.values():
-                aggregate += (result != 0).astype(int)
+            aggregate = np.count_nonzero(stacked, axis=0)
 
         else:  # weighted_sum (default)
             # Weighted by pattern strength (values are -100, 0, or 100)
-            aggregate = sum(pattern_results.values())
             # Normalize to -100 to 100 range
             max_possible = len(pattern_results) * 100
-            if max_possible > 0:
-                aggregate = (aggregate / max_possible) * 100
+            aggregate = stacked.sum(axis=0) / max_possible * 100
 
-        return aggregate
+        return pd.Series(aggregate, index=index)
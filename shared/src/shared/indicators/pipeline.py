@@ -0,0 +1,448 @@
+"""
+Shared-intermediate indicator pipeline.
+
+Compiles a strategy's configured indicators into a DAG of intermediate
+series (price diffs, True Range, EWMs keyed by smoothing factor,
+rolling windows keyed by period) so that each intermediate is computed
+once per DataFrame, no matter how many indicators depend on it.
+Results equal each indicator's own calculate().
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators.adx import ADXIndicator
+from shared.indicators.atr import ATRIndicator
+from shared.indicators.base import BaseIndicator
+from shared.indicators.bb import BollingerBandsIndicator
+from shared.indicators.ema import EMAIndicator
+from shared.indicators.macd import MACDIndicator
+from shared.indicators.rsi import RSIIndicator
+from shared.indicators.sma import SMAIndicator
+from shared.indicators.stochastic import StochasticIndicator
+from shared.indicators.streaming import span_to_alpha
+from shared.indicators.volume import VolumeIndicator
+
+NodeKey = Tuple[Any, ...]
+IndicatorResult = Union[pd.Series, Dict[str, pd.Series]]
+Finalizer = Callable[[Dict[NodeKey, pd.Series], pd.DataFrame], IndicatorResult]
+
+
+def _true_range(high: pd.Series, low: pd.Series, prev_close: pd.Series) -> pd.Series:
+    tr1 = high - low
+    tr2 = abs(high - prev_close)
+    tr3 = abs(low - prev_close)
+    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+
+def _directional_movement(high_diff: pd.Series, low_diff: pd.Series) -> pd.DataFrame:
+    """+DM and -DM as columns "plus" and "minus", computed together."""
+    plus_dm = high_diff.copy()
+    minus_dm = -low_diff
+    plus_dm[plus_dm < 0] = 0
+    minus_dm[minus_dm < 0] = 0
+    plus_dm[plus_dm < minus_dm] = 0
+    minus_dm[minus_dm < plus_dm] = 0
+    return pd.DataFrame({"plus": plus_dm, "minus": minus_dm})
+
+
+def _obv(volume: pd.Series, delta: pd.Series) -> pd.Series:
+    return (volume * np.sign(delta).fillna(0.0)).cumsum()
+
+
+# Operation name -> function of (input series..., params...)
+_OPERATIONS: Dict[str, Callable[..., pd.Series]] = {
+    "shift": lambda s: s.shift(1),
+    "diff": lambda s, periods: s.diff(periods),
+    "sub": lambda a, b: a - b,
+    "true_range": _true_range,
+    "gains": lambda delta: delta.where(delta > 0, 0.0),
+    "losses": lambda delta: -delta.where(delta < 0, 0.0),
+    "directional_movement": _directional_movement,
+    "pick": lambda frame, column: frame[column],
+    "ewm": lambda s, alpha: s.ewm(alpha=alpha, adjust=False).mean(),
+    "min_periods": lambda s, source, m: s.where(source.notna().cumsum() >= m),
+    "di": lambda dm, atr: 100 * (dm / atr),
+    "dx": lambda plus, minus: 100 * (abs(plus - minus) / (plus + minus)),
+    "rolling_mean": lambda s, w: s.rolling(window=w, min_periods=w).mean(),
+    "rolling_std": lambda s, w: s.rolling(window=w, min_periods=w).std(),
+    "rolling_min": lambda s, w: s.rolling(window=w, min_periods=w).min(),
+    "rolling_max": lambda s, w: s.rolling(window=w, min_periods=w).max(),
+    "stoch_raw": lambda close, low, high: (close - low) / (high - low) * 100,
+    "obv": _obv,
+}
+
+
+@dataclass(frozen=True)
+class PipelineStats:
+    """
+    Deduplication statistics for a compiled pipeline.
+
+    Attributes:
+        indicators: Number of configured indicators
+        node_requests: Intermediate series requested across all indicators
+        unique_nodes: Intermediate series actually evaluated per run
+        eliminated: Redundant evaluations removed (requests - unique)
+        opaque: Indicators without a plan, evaluated via calculate()
+    """
+
+    indicators: int
+    node_requests: int
+    unique_nodes: int
+    eliminated: int
+    opaque: int
+
+    @property
+    def reduction_pct(self) -> float:
+        """Share of requested intermediates that were deduplicated."""
+        if self.node_requests == 0:
+            return 0.0
+        return self.eliminated / self.node_requests * 100
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (includes reduction_pct)."""
+        data = asdict(self)
+        data["reduction_pct"] = self.reduction_pct
+        return data
+
+
+@dataclass(frozen=True)
+class _Plan:
+    """Compiled plan for one indicator."""
+
+    required_columns: Tuple[str, ...]
+    min_bars: int
+    finalize: Optional[Finalizer]
+
+
+class IndicatorPipeline:
+    """
+    Evaluate a set of indicators over shared intermediate series.
+
+    Each indicator is compiled into nodes of a DAG. Nodes are interned
+    by (operation, inputs, params), so e.g. ATR(14) and ADX(14) share one
+    True Range and one Wilder-smoothed TR, MACD(12, 26) and EMA(12) share
+    one EWM, and SMA(20) and Bollinger(20) share one rolling mean.
+
+    Indicators without a plan (e.g. PatternIndicator) are evaluated with
+    their own calculate().
+
+    Example:
+        >>> pipeline = IndicatorPipeline([RSIIndicator(14), ATRIndicator(14),
+        ...                               ADXIndicator(14), EMAIndicator(12),
+        ...                               MACDIndicator()])
+        >>> rsi, atr, adx, ema, macd = pipeline.run(df)
+        >>> pipeline.stats.eliminated
+        5
+    """
+
+    def __init__(self, indicators: Sequence[BaseIndicator]):
+        """
+        Compile indicators into a shared DAG.
+
+        Args:
+            indicators: Configured indicator instances
+        """
+        self.indicators: List[BaseIndicator] = list(indicators)
+        self._nodes: Dict[NodeKey, Tuple[str, Tuple[NodeKey, ...], Tuple]] = {}
+        self._requests = 0
+
+        planners = {
+            EMAIndicator: self._plan_ema,
+            SMAIndicator: self._plan_sma,
+            RSIIndicator: self._plan_rsi,
+            MACDIndicator: self._plan_macd,
+            ATRIndicator: self._plan_atr,
+            ADXIndicator: self._plan_adx,
+            BollingerBandsIndicator: self._plan_bollinger,
+            StochasticIndicator: self._plan_stochastic,
+            VolumeIndicator: self._plan_volume,
+        }
+
+        self._plans: List[_Plan] = []
+        for indicator in self.indicators:
+            planner = planners.get(type(indicator))
+            if planner is None:
+                self._plans.append(_Plan((), 0, None))
+            else:
+                self._plans.append(planner(indicator))
+
+    # ================================================================
+    # DAG construction
+    # ================================================================
+
+    def _node(self, op: str, *inputs: NodeKey, params: Tuple = ()) -> NodeKey:
+        """Intern a node and return its key."""
+        self._requests += 1
+        key = (op, inputs, params)
+        if key not in self._nodes:
+            self._nodes[key] = (op, inputs, params)
+        return key
+
+    def _column(self, name: str) -> NodeKey:
+        """Raw DataFrame column (free, not counted as work)."""
+        return ("column", name)
+
+    def _delta(self, column: str) -> NodeKey:
+        return self._node("diff", self._column(column), params=(1,))
+
+    def _ewm(self, source: NodeKey, alpha: float, min_periods: int = 0) -> NodeKey:
+        """Unmasked EWM shared across min_periods, masked on demand."""
+        smoothed = self._node("ewm", source, params=(alpha,))
+        if min_periods <= 1:
+            return smoothed
+        return self._node("min_periods", smoothed, source, params=(min_periods,))
+
+    def _rolling(self, op: str, source: NodeKey, window: int) -> NodeKey:
+        return self._node(op, source, params=(window,))
+
+    def _true_range(self) -> NodeKey:
+        prev_close = self._node("shift", self._column("close"))
+        return self._node(
+            "true_range", self._column("high"), self._column("low"), prev_close
+        )
+
+    # ================================================================
+    # Indicator plans (mirror each indicator's calculate())
+    # ================================================================
+
+    def _plan_ema(self, ind: EMAIndicator) -> _Plan:
+        ema = self._ewm(self._column("close"), span_to_alpha(ind.period), ind.period)
+
+        def finalize(values, df):
+            if not ind.compute_distance:
+                return values[ema]
+            close = df["close"]
+            distance = ((close - values[ema]) / values[ema]) * 100
+            return {"ema": values[ema], "distance_pct": distance}
+
+        return _Plan(("close",), ind.period, finalize)
+
+    def _plan_sma(self, ind: SMAIndicator) -> _Plan:
+        sma = self._rolling("rolling_mean", self._column("close"), ind.period)
+
+        def finalize(values, df):
+            result = values[sma]
+            if not any([ind.compute_distance, ind.compute_slope, ind.compute_position]):
+                return result
+
+            close = df["close"]
+            results = {"sma": result}
+            if ind.compute_distance:
+                results["distance_pct"] = ((close - result) / result) * 100
+            if ind.compute_slope:
+                results["slope"] = result.diff(ind.SLOPE_LAG)
+            if ind.compute_position:
+                results["position"] = (close > result).astype(int) - (
+                    close < result
+                ).astype(int)
+            return results
+
+        return _Plan(("close",), ind.period, finalize)
+
+    def _plan_rsi(self, ind: RSIIndicator) -> _Plan:
+        delta = self._delta("close")
+        alpha = 1 / ind.period
+        avg_gain = self._ewm(self._node("gains", delta), alpha, ind.period)
+        avg_loss = self._ewm(self._node("losses", delta), alpha, ind.period)
+
+        def finalize(values, df):
+            rs = values[avg_gain] / values[avg_loss]
+            rsi = 100 - (100 / (1 + rs))
+            return rsi.fillna(50.0)
+
+        return _Plan(("close",), ind.period, finalize)
+
+    def _plan_macd(self, ind: MACDIndicator) -> _Plan:
+        close = self._column("close")
+        fast = self._ewm(close, span_to_alpha(ind.fast_period), ind.fast_period)
+        slow = self._ewm(close, span_to_alpha(ind.slow_period), ind.slow_period)
+        macd = self._node("sub", fast, slow)
+        signal = self._ewm(macd, span_to_alpha(ind.signal_period), ind.signal_period)
+
+        def finalize(values, df):
+            return {
+                "macd": values[macd],
+                "signal": values[signal],
+                "histogram": values[macd] - values[signal],
+            }
+
+        return _Plan(("close",), ind.slow_period + ind.signal_period, finalize)
+
+    def _plan_atr(self, ind: ATRIndicator) -> _Plan:
+        atr = self._ewm(self._true_range(), 1.0 / ind.period, ind.period)
+
+        def finalize(values, df):
+            results = {"atr": values[atr]}
+            if ind.compute_percent:
+                results["atr_percent"] = (values[atr] / df["close"]) * 100
+            return results
+
+        return _Plan(("high", "low", "close"), ind.period + 1, finalize)
+
+    def _plan_adx(self, ind: ADXIndicator) -> _Plan:
+        alpha = 1.0 / ind.period
+        high_diff = self._delta("high")
+        low_diff = self._delta("low")
+
+        atr = self._ewm(self._true_range(), alpha)
+        dm = self._node("directional_movement", high_diff, low_diff)
+        plus_dm = self._ewm(self._node("pick", dm, params=("plus",)), alpha)
+        minus_dm = self._ewm(self._node("pick", dm, params=("minus",)), alpha)
+        plus_di = self._node("di", plus_dm, atr)
+        minus_di = self._node("di", minus_dm, atr)
+        adx = self._ewm(self._node("dx", plus_di, minus_di), alpha)
+
+        def finalize(values, df):
+            if not ind.return_components:
+                return values[adx]
+            return {
+                "adx": values[adx],
+                "plus_di": values[plus_di],
+                "minus_di": values[minus_di],
+            }
+
+        return _Plan(("high", "low", "close"), ind.period * 2, finalize)
+
+    def _plan_bollinger(self, ind: BollingerBandsIndicator) -> _Plan:
+        close = self._column("close")
+        middle = self._rolling("rolling_mean", close, ind.period)
+        std = self._rolling("rolling_std", close, ind.period)
+
+        def finalize(values, df):
+            upper = values[middle] + (values[std] * ind.std_multiplier)
+            lower = values[middle] - (values[std] * ind.std_multiplier)
+            results = {"middle": values[middle], "upper": upper, "lower": lower}
+            if ind.compute_width:
+                results["bb_width"] = (upper - lower) / values[middle] * 100
+            if ind.compute_percent:
+                results["bb_percent"] = (df["close"] - lower) / (upper - lower)
+            return results
+
+        return _Plan(("close",), ind.period, finalize)
+
+    def _plan_stochastic(self, ind: StochasticIndicator) -> _Plan:
+        lowest_low = self._rolling("rolling_min", self._column("low"), ind.k_period)
+        highest_high = self._rolling("rolling_max", self._column("high"), ind.k_period)
+        raw = self._node("stoch_raw", self._column("close"), lowest_low, highest_high)
+        stoch_k = self._rolling("rolling_mean", raw, ind.smooth_k)
+        stoch_d = self._rolling("rolling_mean", stoch_k, ind.d_period)
+
+        def finalize(values, df):
+            return {"stoch_k": values[stoch_k], "stoch_d": values[stoch_d]}
+
+        return _Plan(
+            ("high", "low", "close"),
+            ind.k_period + ind.smooth_k + ind.d_period,
+            finalize,
+        )
+
+    def _plan_volume(self, ind: VolumeIndicator) -> _Plan:
+        if ind.compute_vwap or ind.compute_mfi or ind.compute_ad:
+            return _Plan((), 0, None)
+
+        volume = self._column("volume")
+        volume_sma = self._rolling("rolling_mean", volume, ind.sma_period)
+        obv = (
+            self._node("obv", volume, self._delta("close")) if ind.compute_obv else None
+        )
+
+        def finalize(values, df):
+            results = {"volume_sma": values[volume_sma]}
+            if obv is not None:
+                results["obv"] = values[obv]
+            if ind.compute_ratio:
+                results["volume_ratio"] = df["volume"] / values[volume_sma]
+            return results
+
+        return _Plan(("close", "volume"), ind.sma_period, finalize)
+
+    # ================================================================
+    # Evaluation
+    # ================================================================
+
+    @property
+    def stats(self) -> PipelineStats:
+        """Deduplication statistics of the compiled DAG."""
+        return PipelineStats(
+            indicators=len(self.indicators),
+            node_requests=self._requests,
+            unique_nodes=len(self._nodes),
+            eliminated=self._requests - len(self._nodes),
+            opaque=sum(1 for plan in self._plans if plan.finalize is None),
+        )
+
+    def _validate(self, df: pd.DataFrame) -> None:
+        for indicator, plan in zip(self.indicators, self._plans):
+            name = indicator.__class__.__name__
+            for col in plan.required_columns:
+                if col not in df.columns:
+                    raise KeyError(
+                        f"DataFrame must have '{col}' column for {name} calculation"
+                    )
+            if len(df) < plan.min_bars:
+                raise ValueError(
+                    f"Insufficient data for {name}: need {plan.min_bars} candles, "
+                    f"got {len(df)}"
+                )
+
+    def evaluate_nodes(self, df: pd.DataFrame) -> Dict[NodeKey, pd.Series]:
+        """
+        Evaluate every DAG node exactly once.
+
+        Args:
+            df: DataFrame with OHLCV columns
+
+        Returns:
+            Mapping of node key to computed series
+        """
+        values: Dict[NodeKey, pd.Series] = {}
+
+        def resolve(key: NodeKey) -> pd.Series:
+            if key[0] == "column":
+                return df[key[1]]
+            return values[key]
+
+        # Insertion order is topological: inputs are interned before users
+        for key, (op, inputs, params) in self._nodes.items():
+            args = [resolve(k) for k in inputs]
+            values[key] = _OPERATIONS[op](*args, *params)
+
+        return values
+
+    def run(self, df: pd.DataFrame) -> List[IndicatorResult]:
+        """
+        Calculate all indicators over one DataFrame.
+
+        Args:
+            df: DataFrame with OHLCV columns
+
+        Returns:
+            Results in indicator order, each equal to indicator.calculate(df)
+
+        Raises:
+            KeyError: If required columns missing
+            ValueError: If insufficient data for any indicator
+        """
+        self._validate(df)
+        values = self.evaluate_nodes(df)
+
+        results = []
+        for indicator, plan in zip(self.indicators, self._plans):
+            if plan.finalize is None:
+                results.append(indicator.calculate(df))
+            else:
+                results.append(plan.finalize(values, df))
+
+        return results
+
+    def __repr__(self) -> str:
+        """String representation."""
+        stats = self.stats
+        return (
+            f"IndicatorPipeline(indicators={stats.indicators}, "
+            f"nodes={stats.unique_nodes}, eliminated={stats.eliminated})"
+        )
@@ -4,10 +4,13 @@ RSI (Relative Strength Index) indicator implementation.
 Pure Wilder's smoothing calculation with zero dependencies.
 """
 
+from typing import Any, Dict, Mapping, Tuple
+
 import numpy as np
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import divide
 
 
 class RSIIndicator(BaseIndicator):
@@ -72,90 +75,115 @@ class RSIIndicator(BaseIndicator):
             KeyError: If 'close' column missing
             ValueError: If insufficient data (< period candles)
         """
-        # Validate DataFrame
-        if "close" not in df.columns:
-            raise KeyError("DataFrame must have 'close' column for RSI calculation")
+        rsi, _, _ = self._wilder_pass(df)
+        return rsi
 
-        if len(df) < self.period:
-            raise ValueError(
-                f"Insufficient data: need {self.period} candles, got {len(df)}"
-            )
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[pd.Series, Dict[str, Any]]:
+        """
+        Calculate RSI and return final Wilder's smoothing state.
 
-        close = df["close"]
+        Series and state come from the same single smoothing pass, so
+        update() continues exactly where calculate() stopped.
 
-        # Calculate price changes
-        delta = close.diff()
+        Args:
+            df: DataFrame with 'close' column
 
-        # Separate gains and losses
-        gains = delta.where(delta > 0, 0.0)
-        losses = -delta.where(delta < 0, 0.0)
+        Returns:
+            Tuple of (rsi_series, state_dict) where state_dict contains:
+                - 'avg_gain': final average gain value
+                - 'avg_loss': final average loss value
+                - 'prev_close': last close price
 
-        # Calculate Wilder's smoothed averages using EWM
-        # alpha = 1/period matches Wilder's smoothing formula
-        avg_gain = gains.ewm(
-            alpha=1 / self.period, min_periods=self.period, adjust=False
-        ).mean()
+        Raises:
+            KeyError: If 'close' column missing
+            ValueError: If insufficient data
+        """
+        rsi, avg_gain, avg_loss = self._wilder_pass(df)
 
-        avg_loss = losses.ewm(
-            alpha=1 / self.period, min_periods=self.period, adjust=False
-        ).mean()
+        state = {
+            "avg_gain": float(avg_gain[-1]),
+            "avg_loss": float(avg_loss[-1]),
+            "prev_close": float(df["close"].iloc[-1]),
+        }
 
-        # Calculate Relative Strength (RS) and RSI
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+        return rsi, state
 
-        # Handle edge cases (neutral value when no data)
-        rsi = rsi.fillna(50.0)
+    def _step(self, state: Dict[str, Any], candle: Mapping[str, float]) -> float:
+        """Advance Wilder's averages by one candle and return RSI."""
+        close = float(candle["close"])
+        delta = close - state["prev_close"]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
 
-        return rsi
+        # Same normalization as pandas EWM (adjust=False) for exact parity
+        alpha = 1 / self.period
+        decay = 1.0 - alpha
+        state["avg_gain"] = (decay * state["avg_gain"] + alpha * gain) / (decay + alpha)
+        state["avg_loss"] = (decay * state["avg_loss"] + alpha * loss) / (decay + alpha)
+        state["prev_close"] = close
+
+        rs = divide(state["avg_gain"], state["avg_loss"])
+        rsi = 100 - (100 / (1 + rs))
+
+        return 50.0 if rsi != rsi else rsi
 
-    def calculate_with_state(self, df: pd.DataFrame) -> tuple:
+    def _wilder_pass(
+        self, df: pd.DataFrame
+    ) -> Tuple[pd.Series, np.ndarray, np.ndarray]:
         """
-        Calculate RSI and return final Wilder's smoothing state.
+        Single pass producing RSI and Wilder's smoothed averages.
 
-        Useful for initializing streaming/stateful indicators that need
-        to continue RSI calculation incrementally.
+        Gains and losses are written into one preallocated (bars, 2)
+        float64 buffer and smoothed together by a single EWM scan.
 
         Args:
             df: DataFrame with 'close' column
 
         Returns:
-            Tuple of (rsi_series, state_dict) where state_dict contains:
-                - 'avg_gain': final average gain value
-                - 'avg_loss': final average loss value
-                - 'prev_close': last close price
+            Tuple of (rsi series, avg_gain array, avg_loss array)
 
         Raises:
             KeyError: If 'close' column missing
             ValueError: If insufficient data
         """
-        # Calculate RSI series
-        rsi_series = self.calculate(df)
+        # Validate DataFrame
+        if "close" not in df.columns:
+            raise KeyError("DataFrame must have 'close' column for RSI calculation")
+
+        if len(df) < self.period:
+            raise ValueError(
+                f"Insufficient data: need {self.period} candles, got {len(df)}"
+            )
 
-        # Extract state using iterative Wilder's smoothing
-        closes = df["close"].values
-        deltas = np.diff(closes)
+        close = df["close"].to_numpy(dtype=np.float64)
 
-        # Separate gains and losses
-        gains = np.where(deltas > 0, deltas, 0.0)
-        losses = np.where(deltas < 0, -deltas, 0.0)
+        # Price changes (first bar has no change)
+        delta = np.empty_like(close)
+        delta[0] = np.nan
+        np.subtract(close[1:], close[:-1], out=delta[1:])
 
-        # Initial averages
-        avg_gain = np.mean(gains[: self.period])
-        avg_loss = np.mean(losses[: self.period])
+        # Separate gains and losses (undefined changes count as zero)
+        flows = np.zeros((len(close), 2), dtype=np.float64)
+        np.copyto(flows[:, 0], delta, where=delta > 0)
+        np.negative(delta, out=flows[:, 1], where=delta < 0)
 
-        # Apply Wilder's smoothing for remaining values
-        for i in range(self.period, len(gains)):
-            gain = gains[i]
-            loss = losses[i]
-            avg_gain = (avg_gain * (self.period - 1) + gain) / self.period
-            avg_loss = (avg_loss * (self.period - 1) + loss) / self.period
+        # Wilder's smoothing: EWM with alpha = 1/period, both columns at once
+        averages = (
+            pd.DataFrame(flows, copy=False)
+            .ewm(alpha=1 / self.period, min_periods=self.period, adjust=False)
+            .mean()
+            .to_numpy()
+        )
+        avg_gain = averages[:, 0]
+        avg_loss = averages[:, 1]
 
-        # Build state dict
-        state = {
-            "avg_gain": float(avg_gain),
-            "avg_loss": float(avg_loss),
-            "prev_close": float(closes[-1]),
-        }
+        # Calculate Relative Strength (RS) and RSI
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+
+        # Handle edge cases (neutral value when no data)
+        rsi[np.isnan(rsi)] = 50.0
 
-        return rsi_series, state
+        return pd.Series(rsi, index=df.index, name="close"), avg_gain, avg_loss
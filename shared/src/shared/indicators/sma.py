@@ -4,11 +4,13 @@ SMA (Simple Moving Average) indicator implementation.
 Pure calculation with optional additional metrics (distance, slope, position, crossover).
 """
 
-from typing import Dict, Union
+from collections import deque
+from typing import Any, Dict, Mapping, Tuple, Union
 
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import RollingWindow, divide
 
 
 class SMAIndicator(BaseIndicator):
@@ -42,6 +44,9 @@ class SMAIndicator(BaseIndicator):
         >>> print(result['distance_pct'].iloc[-1])
     """
 
+    # Candles between SMA values used for slope
+    SLOPE_LAG = 5
+
     def __init__(
         self,
         period: int = 20,
@@ -133,7 +138,7 @@ class SMAIndicator(BaseIndicator):
 
         if self.compute_slope:
             # SMA slope: change over last 5 candles
-            slope = sma.diff(5)
+            slope = sma.diff(self.SLOPE_LAG)
             results["slope"] = slope
 
         if self.compute_position:
@@ -142,3 +147,61 @@ class SMAIndicator(BaseIndicator):
             results["position"] = position
 
         return results
+
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Union[pd.Series, Dict[str, pd.Series]], Dict[str, Any]]:
+        """
+        Calculate SMA and return rolling window state.
+
+        Args:
+            df: DataFrame with 'close' column
+
+        Returns:
+            Tuple of (calculate() result, state dict with close window
+            and recent SMA values for slope)
+        """
+        result = self.calculate(df)
+        close = df["close"]
+        sma = result["sma"] if isinstance(result, dict) else result
+
+        state = {
+            "window": RollingWindow(self.period, close.iloc[-self.period :]),
+            "sma_history": deque(
+                (float(x) for x in sma.iloc[-(self.SLOPE_LAG + 1) :]),
+                maxlen=self.SLOPE_LAG + 1,
+            ),
+        }
+
+        return result, state
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Union[float, Dict[str, float]]:
+        """Advance SMA by one candle."""
+        close = float(candle["close"])
+        window = state["window"]
+        window.push(close)
+        sma = window.mean
+
+        history = state["sma_history"]
+        history.append(sma)
+
+        if not any([self.compute_distance, self.compute_slope, self.compute_position]):
+            return sma
+
+        results = {"sma": sma}
+
+        if self.compute_distance:
+            results["distance_pct"] = divide(close - sma, sma) * 100
+
+        if self.compute_slope:
+            if len(history) > self.SLOPE_LAG:
+                results["slope"] = sma - history[0]
+            else:
+                results["slope"] = float("nan")
+
+        if self.compute_position:
+            results["position"] = int(close > sma) - int(close < sma)
+
+        return results
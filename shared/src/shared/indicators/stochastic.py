@@ -5,11 +5,12 @@ Calculates momentum indicator comparing closing price to price range.
 Pure calculation with %K and %D lines.
 """
 
-from typing import Dict
+from typing import Any, Dict, Mapping, Tuple
 
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import RollingExtremum, RollingWindow, divide
 
 
 class StochasticIndicator(BaseIndicator):
@@ -135,3 +136,66 @@ class StochasticIndicator(BaseIndicator):
             "stoch_k": stoch_k,
             "stoch_d": stoch_d,
         }
+
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Dict[str, pd.Series], Dict[str, Any]]:
+        """
+        Calculate Stochastic and return rolling window state.
+
+        Args:
+            df: DataFrame with 'high', 'low', 'close' columns
+
+        Returns:
+            Tuple of (calculate() result, state dict with rolling high/low
+            extrema and %K smoothing windows)
+        """
+        result = self.calculate(df)
+
+        high = df["high"]
+        low = df["low"]
+        close = df["close"]
+
+        # Rebuild only the tail of raw %K needed to fill the smoothing window
+        tail = self.k_period + self.smooth_k
+        lowest_low = low.iloc[-tail:].rolling(window=self.k_period).min()
+        highest_high = high.iloc[-tail:].rolling(window=self.k_period).max()
+        stoch_k_raw = (
+            (close.iloc[-tail:] - lowest_low) / (highest_high - lowest_low) * 100
+        )
+
+        state = {
+            "highest_high": RollingExtremum(
+                self.k_period, "max", high.iloc[-self.k_period :]
+            ),
+            "lowest_low": RollingExtremum(
+                self.k_period, "min", low.iloc[-self.k_period :]
+            ),
+            "k_raw": RollingWindow(self.smooth_k, stoch_k_raw.iloc[-self.smooth_k :]),
+            "k": RollingWindow(self.d_period, result["stoch_k"].iloc[-self.d_period :]),
+        }
+
+        return result, state
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Dict[str, float]:
+        """Advance Stochastic by one candle."""
+        close = float(candle["close"])
+        state["highest_high"].push(float(candle["high"]))
+        state["lowest_low"].push(float(candle["low"]))
+
+        highest_high = state["highest_high"].value
+        lowest_low = state["lowest_low"].value
+        stoch_k_raw = divide(close - lowest_low, highest_high - lowest_low) * 100
+
+        state["k_raw"].push(stoch_k_raw)
+        stoch_k = state["k_raw"].mean
+
+        state["k"].push(stoch_k)
+        stoch_d = state["k"].mean
+
+        return {
+            "stoch_k": stoch_k,
+            "stoch_d": stoch_d,
+        }
@@ -0,0 +1,353 @@
+"""
+Streaming primitives for incremental indicator updates.
+
+O(1) building blocks used by BaseIndicator.update() implementations.
+Each primitive mirrors the semantics of the pandas operation it replaces
+(EWM with adjust=False, fixed-window rolling mean/std/min/max) so that
+streamed values stay equal to a full recalculation.
+"""
+
+import math
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Iterable, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def span_to_alpha(span: int) -> float:
+    """
+    Convert EWM span to smoothing factor.
+
+    Args:
+        span: EWM span (period)
+
+    Returns:
+        Smoothing factor alpha = 2 / (span + 1)
+    """
+    return 2.0 / (span + 1.0)
+
+
+def divide(numerator: float, denominator: float) -> float:
+    """
+    Float division with pandas semantics for zero denominators.
+
+    Args:
+        numerator: Dividend
+        denominator: Divisor
+
+    Returns:
+        numerator / denominator, ±inf for x/0 and NaN for 0/0
+    """
+    if denominator == 0:
+        if numerator == 0 or numerator != numerator:
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+    return numerator / denominator
+
+
+def true_range(high: float, low: float, prev_close: float) -> float:
+    """
+    True Range of a single candle.
+
+    Args:
+        high: Candle high
+        low: Candle low
+        prev_close: Previous candle close (NaN for the first candle)
+
+    Returns:
+        max(high - low, |high - prev_close|, |low - prev_close|),
+        ignoring NaN terms like pandas max(axis=1)
+    """
+    ranges = [
+        r for r in (high - low, abs(high - prev_close), abs(low - prev_close)) if r == r
+    ]
+    return max(ranges) if ranges else math.nan
+
+
+class EWMState:
+    """
+    Incremental exponential weighted mean (adjust=False).
+
+    Reproduces pandas ``Series.ewm(alpha=..., adjust=False).mean()``
+    including its handling of NaN observations (ignore_na=False) and
+    min_periods masking.
+
+    Attributes:
+        alpha: Smoothing factor
+        min_periods: Observations required before a value is emitted
+        value: Current internal weighted mean (NaN until first observation)
+        weight: Weight of current value relative to a fresh observation
+        nobs: Number of non-NaN observations seen
+    """
+
+    __slots__ = ("alpha", "min_periods", "value", "weight", "nobs")
+
+    def __init__(self, alpha: float, min_periods: int = 0):
+        """
+        Initialize empty EWM state.
+
+        Args:
+            alpha: Smoothing factor in (0, 1]
+            min_periods: Observations required before a value is emitted
+        """
+        self.alpha = alpha
+        self.min_periods = max(min_periods, 1)
+        self.value = math.nan
+        self.weight = 1.0
+        self.nobs = 0
+
+    @classmethod
+    def from_series(
+        cls,
+        source: "pd.Series",
+        smoothed: "pd.Series",
+        alpha: float,
+        min_periods: int = 0,
+    ) -> "EWMState":
+        """
+        Recover final state from a series already smoothed by pandas.
+
+        Args:
+            source: Input series that was smoothed
+            smoothed: Output of ``source.ewm(..., adjust=False).mean()``
+            alpha: Smoothing factor used
+            min_periods: min_periods used
+
+        Returns:
+            EWMState positioned after the last element of ``source``
+        """
+        state = cls(alpha, min_periods)
+        values = source.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        state.nobs = int(valid.sum())
+
+        if state.nobs == 0:
+            return state
+
+        # Trailing NaNs decay the weight of the carried value
+        last_valid = int(np.flatnonzero(valid)[-1])
+        trailing_nans = len(values) - 1 - last_valid
+
+        # pandas carries the internal mean forward through NaN inputs, so the
+        # last element holds it once min_periods is met. Before that the output
+        # is masked, so fall back to replaying the short prefix.
+        last = float(smoothed.iloc[-1])
+        if math.isnan(last):
+            state.nobs = 0
+            for x in values:
+                state.update(float(x))
+            return state
+
+        state.value = last
+        state.weight = (1.0 - alpha) ** trailing_nans
+        return state
+
+    def update(self, x: float) -> float:
+        """
+        Add observation and return smoothed value.
+
+        Args:
+            x: New observation (NaN allowed)
+
+        Returns:
+            Smoothed value, or NaN if fewer than min_periods observations
+        """
+        is_obs = x == x
+        if self.value != self.value:
+            if is_obs:
+                self.value = x
+                self.weight = 1.0
+        else:
+            self.weight *= 1.0 - self.alpha
+            if is_obs:
+                self.value = (self.weight * self.value + self.alpha * x) / (
+                    self.weight + self.alpha
+                )
+                self.weight = 1.0
+
+        if is_obs:
+            self.nobs += 1
+
+        return self.current
+
+    @property
+    def current(self) -> float:
+        """Current smoothed value (NaN until min_periods met)."""
+        return self.value if self.nobs >= self.min_periods else math.nan
+
+
+class RollingWindow:
+    """
+    Fixed-size rolling window with O(1) mean and sample std.
+
+    Uses Welford add/remove updates for numerical stability. NaN values
+    are counted but excluded from moments; any NaN in the window makes
+    mean/std NaN, matching pandas rolling with min_periods=window.
+
+    Attributes:
+        size: Window length
+    """
+
+    __slots__ = ("size", "_values", "_count", "_nan_count", "_mean", "_m2")
+
+    def __init__(self, size: int, values: Iterable[float] = ()):
+        """
+        Initialize rolling window.
+
+        Args:
+            size: Window length
+            values: Optional initial values (only the last ``size`` are kept)
+        """
+        self.size = size
+        self._values: Deque[float] = deque()
+        self._count = 0
+        self._nan_count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+        for x in values:
+            self.push(float(x))
+
+    def push(self, x: float) -> None:
+        """
+        Append value, evicting the oldest once the window is full.
+
+        Args:
+            x: New value (NaN allowed)
+        """
+        self._values.append(x)
+        self._add(x)
+
+        if len(self._values) > self.size:
+            self._remove(self._values.popleft())
+
+    def _add(self, x: float) -> None:
+        if x != x:
+            self._nan_count += 1
+            return
+        self._count += 1
+        delta = x - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (x - self._mean)
+
+    def _remove(self, x: float) -> None:
+        if x != x:
+            self._nan_count -= 1
+            return
+        self._count -= 1
+        if self._count == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = x - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (x - self._mean)
+
+    @property
+    def is_full(self) -> bool:
+        """True when the window holds ``size`` non-NaN values."""
+        return self._count == self.size and self._nan_count == 0
+
+    @property
+    def mean(self) -> float:
+        """Window mean (NaN until the window is full of valid values)."""
+        return self._mean if self.is_full else math.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation, ddof=1 (NaN until full)."""
+        if not self.is_full or self.size < 2:
+            return math.nan
+        return math.sqrt(max(self._m2, 0.0) / (self.size - 1))
+
+    @property
+    def last(self) -> float:
+        """Most recent value (NaN if empty)."""
+        return self._values[-1] if self._values else math.nan
+
+    @property
+    def first(self) -> float:
+        """Oldest value in the window (NaN if empty)."""
+        return self._values[0] if self._values else math.nan
+
+    def __len__(self) -> int:
+        """Number of values currently held."""
+        return len(self._values)
+
+
+class RollingExtremum:
+    """
+    Rolling max or min over a fixed window in O(1) amortized time.
+
+    Keeps a monotonic deque of (position, value) pairs. NaN values occupy
+    a slot but never become the extremum; any NaN in the window yields NaN,
+    matching pandas rolling with min_periods=window.
+
+    Attributes:
+        size: Window length
+        mode: 'max' or 'min'
+    """
+
+    __slots__ = ("size", "mode", "_deque", "_pos", "_nan_positions")
+
+    def __init__(self, size: int, mode: str = "max", values: Iterable[float] = ()):
+        """
+        Initialize rolling extremum.
+
+        Args:
+            size: Window length
+            mode: 'max' or 'min'
+            values: Optional initial values
+
+        Raises:
+            ValueError: If mode is not 'max' or 'min'
+        """
+        if mode not in ("max", "min"):
+            raise ValueError(f"mode must be 'max' or 'min', got: {mode}")
+
+        self.size = size
+        self.mode = mode
+        self._deque: Deque[Tuple[int, float]] = deque()
+        self._pos = 0
+        self._nan_positions: Deque[int] = deque()
+
+        for x in values:
+            self.push(float(x))
+
+    def push(self, x: float) -> None:
+        """
+        Append value and evict positions that left the window.
+
+        Args:
+            x: New value (NaN allowed)
+        """
+        pos = self._pos
+        self._pos += 1
+        window_start = self._pos - self.size
+
+        if x != x:
+            self._nan_positions.append(pos)
+        else:
+            dq = self._deque
+            if self.mode == "max":
+                while dq and dq[-1][1] <= x:
+                    dq.pop()
+            else:
+                while dq and dq[-1][1] >= x:
+                    dq.pop()
+            dq.append((pos, x))
+
+        while self._deque and self._deque[0][0] < window_start:
+            self._deque.popleft()
+        while self._nan_positions and self._nan_positions[0] < window_start:
+            self._nan_positions.popleft()
+
+    @property
+    def value(self) -> float:
+        """Current extremum (NaN until the window is full of valid values)."""
+        if self._pos < self.size or self._nan_positions or not self._deque:
+            return math.nan
+        return self._deque[0][1]
@@ -1,15 +1,55 @@
 """
 Volume indicators implementation.
 
-Calculates volume-based indicators: OBV and Volume SMA.
+Calculates volume-based indicators: OBV, Volume SMA, session VWAP,
+Money Flow Index and Accumulation/Distribution.
 Pure calculation for volume analysis.
 """
 
-from typing import Dict
+import math
+from typing import Any, Dict, List, Mapping, Tuple
 
+import numpy as np
 import pandas as pd
 
 from shared.indicators.base import BaseIndicator
+from shared.indicators.streaming import RollingWindow, divide
+
+
+def _direction(close: pd.Series) -> pd.Series:
+    """Sign of close-to-close change (+1, -1, 0; 0 for first/NaN bars)."""
+    return np.sign(close.diff()).fillna(0.0)
+
+
+def _last_valid(series: pd.Series) -> float:
+    """Last non-NaN value of a running total (0.0 if there is none)."""
+    valid = series.dropna()
+    return float(valid.iloc[-1]) if len(valid) else 0.0
+
+
+def _typical_price(df: pd.DataFrame) -> pd.Series:
+    """(high + low + close) / 3."""
+    return (df["high"] + df["low"] + df["close"]) / 3
+
+
+def _close_location(df: pd.DataFrame) -> pd.Series:
+    """Close location value in [-1, 1] (0 for zero-range candles)."""
+    high, low, close = df["high"], df["low"], df["close"]
+    spread = high - low
+    clv = ((close - low) - (high - close)) / spread.where(spread != 0)
+    return clv.where(spread != 0, 0.0).where(spread.notna())
+
+
+def _money_flows(df: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+    """Positive and negative raw money flow (NaN on the first bar)."""
+    typical = _typical_price(df)
+    prev_typical = typical.shift(1)
+    raw_flow = typical * df["volume"]
+    defined = typical.notna() & prev_typical.notna()
+
+    positive = raw_flow.where(typical > prev_typical, 0.0).where(defined)
+    negative = raw_flow.where(typical < prev_typical, 0.0).where(defined)
+    return positive, negative
 
 
 class VolumeIndicator(BaseIndicator):
@@ -20,11 +60,20 @@ class VolumeIndicator(BaseIndicator):
     - OBV (On-Balance Volume): Cumulative volume flow
     - Volume SMA: Simple moving average of volume
     - Volume ratio: Current volume / Volume SMA
+    - VWAP: Volume-weighted typical price, reset each session (optional)
+    - MFI (Money Flow Index): Volume-weighted RSI of typical price (optional)
+    - A/D (Accumulation/Distribution): Cumulative close-location volume
+      (optional)
 
     Parameters:
         sma_period (int): Period for volume SMA (default: 20)
         compute_obv (bool): Calculate OBV (default: True)
         compute_ratio (bool): Calculate volume ratio (default: True)
+        compute_vwap (bool): Calculate session VWAP (default: False)
+        vwap_anchor (str): Fixed session frequency for VWAP reset (default: "D")
+        compute_mfi (bool): Calculate MFI (default: False)
+        mfi_period (int): Period for MFI (default: 14)
+        compute_ad (bool): Calculate A/D line (default: False)
 
     Example:
         >>> vol = VolumeIndicator(sma_period=20, compute_obv=True)
@@ -32,10 +81,22 @@ class VolumeIndicator(BaseIndicator):
         >>> print(result['obv'].iloc[-1])
         >>> print(result['volume_sma'].iloc[-1])
         >>> print(result['volume_ratio'].iloc[-1])
+        >>>
+        >>> flow = VolumeIndicator(compute_vwap=True, compute_mfi=True)
+        >>> result = flow.calculate(df)
+        >>> print(result['vwap'].iloc[-1], result['mfi'].iloc[-1])
     """
 
     def __init__(
-        self, sma_period: int = 20, compute_obv: bool = True, compute_ratio: bool = True
+        self,
+        sma_period: int = 20,
+        compute_obv: bool = True,
+        compute_ratio: bool = True,
+        compute_vwap: bool = False,
+        vwap_anchor: str = "D",
+        compute_mfi: bool = False,
+        mfi_period: int = 14,
+        compute_ad: bool = False,
     ):
         """
         Initialize Volume indicator.
@@ -44,13 +105,30 @@ class VolumeIndicator(BaseIndicator):
             sma_period: Period for volume SMA
             compute_obv: Calculate OBV
             compute_ratio: Calculate volume ratio
+            compute_vwap: Calculate session-anchored VWAP
+            vwap_anchor: Fixed pandas frequency defining a VWAP session
+            compute_mfi: Calculate Money Flow Index
+            mfi_period: Period for MFI
+            compute_ad: Calculate Accumulation/Distribution line
         """
         super().__init__(
-            sma_period=sma_period, compute_obv=compute_obv, compute_ratio=compute_ratio
+            sma_period=sma_period,
+            compute_obv=compute_obv,
+            compute_ratio=compute_ratio,
+            compute_vwap=compute_vwap,
+            vwap_anchor=vwap_anchor,
+            compute_mfi=compute_mfi,
+            mfi_period=mfi_period,
+            compute_ad=compute_ad,
         )
         self.sma_period = self.params["sma_period"]
         self.compute_obv = self.params["compute_obv"]
         self.compute_ratio = self.params["compute_ratio"]
+        self.compute_vwap = self.params["compute_vwap"]
+        self.vwap_anchor = self.params["vwap_anchor"]
+        self.compute_mfi = self.params["compute_mfi"]
+        self.mfi_period = self.params["mfi_period"]
+        self.compute_ad = self.params["compute_ad"]
 
     def validate_params(self) -> None:
         """
@@ -60,6 +138,8 @@ class VolumeIndicator(BaseIndicator):
             ValueError: If parameters are invalid
         """
         sma_period = self.params.get("sma_period", 20)
+        mfi_period = self.params.get("mfi_period", 14)
+        vwap_anchor = self.params.get("vwap_anchor", "D")
 
         if not isinstance(sma_period, int):
             raise ValueError(
@@ -70,30 +150,62 @@ class VolumeIndicator(BaseIndicator):
         if sma_period < 1:
             raise ValueError(f"Volume sma_period must be >= 1, got: {sma_period}")
 
+        if not isinstance(mfi_period, int):
+            raise ValueError(
+                f"Volume mfi_period must be integer, "
+                f"got: {type(mfi_period).__name__}"
+            )
+
+        if mfi_period < 1:
+            raise ValueError(f"Volume mfi_period must be >= 1, got: {mfi_period}")
+
+        try:
+            # Sessions use index.floor(), which needs a fixed duration;
+            # calendar offsets such as "W" or "MS" have none
+            pd.tseries.frequencies.to_offset(vwap_anchor).nanos
+        except (AttributeError, TypeError, ValueError) as e:
+            raise ValueError(
+                f"Volume vwap_anchor must be a fixed pandas frequency "
+                f"(e.g. 'D', '4h'), got: {vwap_anchor}"
+            ) from e
+
+    @property
+    def _required_columns(self) -> List[str]:
+        if self.compute_vwap or self.compute_mfi or self.compute_ad:
+            return ["high", "low", "close", "volume"]
+        return ["close", "volume"]
+
+    @property
+    def _min_bars(self) -> int:
+        if self.compute_mfi:
+            return max(self.sma_period, self.mfi_period + 1)
+        return self.sma_period
+
     def calculate(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
         """
         Calculate volume indicators.
 
         Args:
-            df: DataFrame with 'close', 'volume' columns
+            df: DataFrame with 'close', 'volume' columns ('high', 'low'
+                also required for VWAP, MFI and A/D)
 
         Returns:
             Dict[str, pd.Series]: Dictionary with volume indicators
 
         Raises:
             KeyError: If required columns missing
-            ValueError: If insufficient data
+            ValueError: If insufficient data, or VWAP requested on a
+                frame without DatetimeIndex
         """
-        required_cols = ["close", "volume"]
-        for col in required_cols:
+        for col in self._required_columns:
             if col not in df.columns:
                 raise KeyError(
                     f"DataFrame must have '{col}' column " f"for Volume calculation"
                 )
 
-        if len(df) < self.sma_period:
+        if len(df) < self._min_bars:
             raise ValueError(
-                f"Insufficient data: need {self.sma_period} candles, " f"got {len(df)}"
+                f"Insufficient data: need {self._min_bars} candles, " f"got {len(df)}"
             )
 
         close = df["close"]
@@ -108,15 +220,166 @@ class VolumeIndicator(BaseIndicator):
         }
 
         if self.compute_obv:
-            price_direction = close.diff()
-            obv = (
-                volume
-                * price_direction.apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
-            ).cumsum()
-            results["obv"] = obv
+            results["obv"] = (volume * _direction(close)).cumsum()
 
         if self.compute_ratio:
             volume_ratio = volume / volume_sma
             results["volume_ratio"] = volume_ratio
 
+        if self.compute_vwap:
+            results["vwap"] = self._vwap(df)
+
+        if self.compute_mfi:
+            positive, negative = _money_flows(df)
+            window = dict(window=self.mfi_period, min_periods=self.mfi_period)
+            positive_sum = positive.rolling(**window).sum()
+            negative_sum = negative.rolling(**window).sum()
+            results["mfi"] = 100 * positive_sum / (positive_sum + negative_sum)
+
+        if self.compute_ad:
+            results["ad"] = (_close_location(df) * volume).cumsum()
+
+        return results
+
+    def _vwap(self, df: pd.DataFrame) -> pd.Series:
+        """Session-anchored VWAP via per-session cumulative sums."""
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("VWAP requires a DatetimeIndex to anchor sessions")
+
+        volume = df["volume"]
+        session = df.index.floor(self.vwap_anchor)
+        price_volume = (_typical_price(df) * volume).groupby(session).cumsum()
+        cumulative_volume = volume.groupby(session).cumsum()
+
+        vwap = price_volume / cumulative_volume
+        vwap.index = df.index
+        return vwap
+
+    def calculate_with_state(
+        self, df: pd.DataFrame
+    ) -> Tuple[Dict[str, pd.Series], Dict[str, Any]]:
+        """
+        Calculate volume indicators and return streaming state.
+
+        Args:
+            df: DataFrame with 'close', 'volume' columns
+
+        Returns:
+            Tuple of (calculate() result, state dict with volume window,
+            running OBV/A-D, money flow windows and previous close)
+
+        Raises:
+            NotImplementedError: If VWAP is enabled (sessions need candle
+                timestamps, which update() does not receive)
+        """
+        if self.compute_vwap:
+            raise NotImplementedError(
+                "VolumeIndicator with compute_vwap does not support streaming updates"
+            )
+
+        result = self.calculate(df)
+
+        state = {
+            "window": RollingWindow(
+                self.sma_period, df["volume"].iloc[-self.sma_period :]
+            ),
+            "obv": _last_valid(result["obv"]) if self.compute_obv else 0.0,
+            "prev_close": float(df["close"].iloc[-1]),
+        }
+
+        if self.compute_mfi:
+            positive, negative = _money_flows(df)
+            state["positive_flow"] = RollingWindow(
+                self.mfi_period, positive.iloc[-self.mfi_period :]
+            )
+            state["negative_flow"] = RollingWindow(
+                self.mfi_period, negative.iloc[-self.mfi_period :]
+            )
+            state["prev_typical"] = float(_typical_price(df).iloc[-1])
+
+        if self.compute_ad:
+            ad = result["ad"].dropna()
+            state["ad"] = float(ad.iloc[-1]) if len(ad) else 0.0
+
+        return result, state
+
+    def _step(
+        self, state: Dict[str, Any], candle: Mapping[str, float]
+    ) -> Dict[str, float]:
+        """Advance volume indicators by one candle."""
+        close = float(candle["close"])
+        volume = float(candle["volume"])
+
+        window = state["window"]
+        window.push(volume)
+        volume_sma = window.mean
+
+        results = {
+            "volume_sma": volume_sma,
+        }
+
+        if self.compute_obv:
+            # NaN closes give direction 0 and NaN volumes are skipped, as
+            # calculate()'s cumsum does; the skipped bar itself reads NaN
+            direction = close - state["prev_close"]
+            sign = 1.0 if direction > 0 else -1.0 if direction < 0 else 0.0
+            flow = sign * volume
+            if math.isfinite(flow):
+                state["obv"] += flow
+                results["obv"] = state["obv"]
+            else:
+                results["obv"] = math.nan
+
+        state["prev_close"] = close
+
+        if self.compute_ratio:
+            results["volume_ratio"] = divide(volume, volume_sma)
+
+        if self.compute_mfi:
+            results["mfi"] = self._step_mfi(state, candle, volume)
+
+        if self.compute_ad:
+            results["ad"] = self._step_ad(state, candle, close, volume)
+
         return results
+
+    @staticmethod
+    def _step_mfi(
+        state: Dict[str, Any], candle: Mapping[str, float], volume: float
+    ) -> float:
+        typical = (
+            float(candle["high"]) + float(candle["low"]) + float(candle["close"])
+        ) / 3
+        prev_typical = state["prev_typical"]
+        raw_flow = typical * volume
+
+        positive = negative = math.nan
+        if typical == typical and prev_typical == prev_typical:
+            positive = raw_flow if typical > prev_typical else 0.0
+            negative = raw_flow if typical < prev_typical else 0.0
+
+        state["positive_flow"].push(positive)
+        state["negative_flow"].push(negative)
+        state["prev_typical"] = typical
+
+        positive_mean = state["positive_flow"].mean
+        negative_mean = state["negative_flow"].mean
+        return 100 * divide(positive_mean, positive_mean + negative_mean)
+
+    @staticmethod
+    def _step_ad(
+        state: Dict[str, Any], candle: Mapping[str, float], close: float, volume: float
+    ) -> float:
+        high = float(candle["high"])
+        low = float(candle["low"])
+        spread = high - low
+
+        if spread != spread:
+            return math.nan
+        clv = ((close - low) - (high - close)) / spread if spread != 0 else 0.0
+
+        flow = clv * volume
+        if flow != flow:
+            return math.nan
+        state["ad"] += flow
+        return state["ad"]
@@ -0,0 +1,17 @@
+"""
+Market data storage.
+
+Compact, shareable OHLCV histories and incremental timeframe
+aggregation for indicator inputs.
+"""
+
+from shared.market_data.candle_store import COLUMNS, CandleArrays, CandleStore
+from shared.market_data.resampler import MultiTimeframeResampler, parse_timeframe
+
+__all__ = [
+    "CandleStore",
+    "CandleArrays",
+    "COLUMNS",
+    "MultiTimeframeResampler",
+    "parse_timeframe",
+]
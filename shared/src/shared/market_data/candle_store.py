@@ -0,0 +1,399 @@
+"""
+Memory-mapped columnar OHLCV candle store.
+
+Each (symbol, timeframe) series lives in one file laid out as a fixed
+header followed by contiguous columns sized to the file's capacity:
+
+    header (64 bytes) | timestamp int64[capacity] | ohlcv float64[5, capacity]
+
+Appends write into the unused tail and then commit the new length in
+the header, so readers mapping the same file never see partial rows.
+When the tail is full the file is rewritten with doubled capacity and
+atomically swapped in. Reads return zero-copy NumPy/DataFrame views
+backed by the OS page cache, so many worker processes can share one
+history without duplicating it in RAM.
+
+One writer per series is assumed; any number of readers is supported.
+"""
+
+import os
+import re
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+
+COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
+
+_MAGIC = b"LUMOHLCV"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ")  # magic, version, reserved, length, capacity
+_HEADER_SIZE = 64
+_LENGTH_OFFSET = 16
+_SUFFIX = ".ohlcv"
+_TIMEFRAME = re.compile(r"^[0-9A-Za-z]+$")
+
+Timestamp = Union[str, pd.Timestamp, np.datetime64]
+
+
+def _file_size(capacity: int) -> int:
+    return _HEADER_SIZE + capacity * 8 * (1 + len(COLUMNS))
+
+
+def _to_utc_ns(index: pd.Index) -> np.ndarray:
+    """Convert a DatetimeIndex to naive-UTC int64 nanoseconds."""
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("Candles must have a DatetimeIndex")
+    if index.tz is not None:
+        index = index.tz_convert("UTC").tz_localize(None)
+    return index.as_unit("ns").asi8
+
+
+def _to_ns(value: Timestamp) -> int:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts.as_unit("ns").value
+
+
+@dataclass(frozen=True)
+class CandleArrays:
+    """
+    Zero-copy views of a stored candle series.
+
+    Attributes:
+        timestamp: int64 nanoseconds since epoch (naive UTC)
+        open, high, low, close, volume: float64 columns
+    """
+
+    timestamp: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Wrap the views in a DataFrame without copying.
+
+        Returns:
+            DataFrame with OHLCV columns and a DatetimeIndex
+        """
+        index = pd.DatetimeIndex(self.timestamp.view("M8[ns]"), copy=False)
+        return pd.DataFrame(
+            {c: getattr(self, c) for c in COLUMNS}, index=index, copy=False
+        )
+
+
+class _CandleFile:
+    """One memory-mapped series file."""
+
+    def __init__(self, path: Path, writable: bool):
+        self.path = path
+        self.writable = writable
+        self._map()
+
+    def _map(self) -> None:
+        mode = "r+" if self.writable else "r"
+        self._mm = np.memmap(self.path, dtype=np.uint8, mode=mode)
+        self._inode = os.stat(self.path).st_ino
+
+        magic, version, _, _, capacity = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a candle file: {self.path}")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported candle file version {version}: {self.path}")
+
+        self.capacity = capacity
+        self._length = np.ndarray(
+            (1,), dtype="<u8", buffer=self._mm, offset=_LENGTH_OFFSET
+        )
+        self._timestamps = np.ndarray(
+            (capacity,), dtype="<i8", buffer=self._mm, offset=_HEADER_SIZE
+        )
+        self._values = np.ndarray(
+            (len(COLUMNS), capacity),
+            dtype="<f8",
+            buffer=self._mm,
+            offset=_HEADER_SIZE + capacity * 8,
+        )
+
+    @classmethod
+    def create(cls, path: Path, capacity: int) -> "_CandleFile":
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, 0, capacity))
+            f.truncate(_file_size(capacity))
+        os.replace(tmp, path)
+        return cls(path, writable=True)
+
+    @property
+    def length(self) -> int:
+        return int(self._length[0])
+
+    def refresh(self) -> None:
+        """Remap if the writer swapped in a grown file."""
+        if os.stat(self.path).st_ino != self._inode:
+            self._map()
+
+    def arrays(self) -> CandleArrays:
+        n = self.length
+        views = [self._timestamps[:n], *self._values[:, :n]]
+        for view in views:
+            # Stored history is immutable to callers, even in the writer
+            view.flags.writeable = False
+        return CandleArrays(*views)
+
+    def append(self, timestamps: np.ndarray, values: np.ndarray) -> int:
+        n = self.length
+        added = len(timestamps)
+        if n + added > self.capacity:
+            self._grow(max(self.capacity * 2, n + added))
+
+        self._timestamps[n : n + added] = timestamps
+        self._values[:, n : n + added] = values
+        self._mm.flush()
+
+        # Commit: readers only see rows below the stored length
+        self._length[0] = n + added
+        self._mm.flush()
+        return n + added
+
+    def _grow(self, capacity: int) -> None:
+        n = self.length
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, 0, n, capacity))
+            f.truncate(_file_size(capacity))
+
+        grown = np.memmap(tmp, dtype=np.uint8, mode="r+")
+        np.ndarray((capacity,), dtype="<i8", buffer=grown, offset=_HEADER_SIZE)[:n] = (
+            self._timestamps[:n]
+        )
+        np.ndarray(
+            (len(COLUMNS), capacity),
+            dtype="<f8",
+            buffer=grown,
+            offset=_HEADER_SIZE + capacity * 8,
+        )[:, :n] = self._values[:, :n]
+        grown.flush()
+        del grown
+
+        # Readers holding the old mapping keep a valid (older) snapshot
+        os.replace(tmp, self.path)
+        self._map()
+
+
+class CandleStore:
+    """
+    Persistent per-symbol/timeframe OHLCV store on memory-mapped files.
+
+    Example:
+        >>> store = CandleStore("/var/lib/lumiere/candles")
+        >>> store.append("SOL/USDC", "1m", candles_df)
+        >>> df = store.read("SOL/USDC", "1m")           # zero-copy view
+        >>> rsi = RSIIndicator(period=14).calculate(df)
+        >>>
+        >>> # In worker processes
+        >>> reader = CandleStore("/var/lib/lumiere/candles", readonly=True)
+        >>> close = reader.arrays("SOL/USDC", "1m").close
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        readonly: bool = False,
+        initial_capacity: int = 4096,
+    ):
+        """
+        Initialize candle store.
+
+        Args:
+            root: Directory holding series files
+            readonly: Open files read-only (for worker processes)
+            initial_capacity: Rows allocated when a series is created
+
+        Raises:
+            ValueError: If initial_capacity is invalid
+        """
+        if initial_capacity < 1:
+            raise ValueError(f"initial_capacity must be >= 1, got: {initial_capacity}")
+
+        self.root = Path(root)
+        self.readonly = readonly
+        self.initial_capacity = initial_capacity
+        self._files: Dict[Tuple[str, str], _CandleFile] = {}
+
+    def _path(self, symbol: str, timeframe: str) -> Path:
+        if not symbol:
+            raise ValueError("Symbol must be a non-empty string")
+        if not _TIMEFRAME.match(timeframe):
+            raise ValueError(f"Invalid timeframe: {timeframe!r}")
+        return self.root / quote(symbol, safe="") / f"{timeframe}{_SUFFIX}"
+
+    def _file(self, symbol: str, timeframe: str, create: bool = False) -> _CandleFile:
+        key = (symbol, timeframe)
+        handle = self._files.get(key)
+        if handle is not None:
+            handle.refresh()
+            return handle
+
+        path = self._path(symbol, timeframe)
+        if path.exists():
+            handle = _CandleFile(path, writable=not self.readonly)
+        elif create:
+            handle = _CandleFile.create(path, self.initial_capacity)
+        else:
+            raise KeyError(f"No candles stored for {symbol} {timeframe}")
+
+        self._files[key] = handle
+        return handle
+
+    def append(self, symbol: str, timeframe: str, df: pd.DataFrame) -> int:
+        """
+        Append candles to the tail of a series (created on first append).
+
+        Args:
+            symbol: Trading symbol (e.g. "SOL/USDC")
+            timeframe: Timeframe label (e.g. "1m", "1h")
+            df: DataFrame with OHLCV columns and a strictly increasing
+                DatetimeIndex after the last stored candle
+
+        Returns:
+            Series length after the append
+
+        Raises:
+            PermissionError: If the store is read-only
+            KeyError: If required columns are missing
+            ValueError: If timestamps are not strictly increasing
+        """
+        if self.readonly:
+            raise PermissionError("CandleStore is read-only")
+
+        for col in COLUMNS:
+            if col not in df.columns:
+                raise KeyError(f"DataFrame must have '{col}' column for CandleStore")
+
+        timestamps = _to_utc_ns(df.index)
+        if len(timestamps) == 0:
+            return self.length(symbol, timeframe) if self.has(symbol, timeframe) else 0
+
+        if np.any(np.diff(timestamps) <= 0):
+            raise ValueError("Candle timestamps must be strictly increasing")
+
+        handle = self._file(symbol, timeframe, create=True)
+        n = handle.length
+        if n and timestamps[0] <= handle.arrays().timestamp[-1]:
+            last = pd.Timestamp(int(handle.arrays().timestamp[-1]))
+            raise ValueError(
+                f"Candles must start after last stored candle ({last}) "
+                f"for {symbol} {timeframe}"
+            )
+
+        values = df[list(COLUMNS)].to_numpy(dtype=np.float64).T
+        return handle.append(timestamps, values)
+
+    def arrays(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+    ) -> CandleArrays:
+        """
+        Zero-copy column views, optionally limited to [start, end].
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe label
+            start: First timestamp to include (inclusive)
+            end: Last timestamp to include (inclusive)
+
+        Returns:
+            CandleArrays backed by the memory-mapped file
+
+        Raises:
+            KeyError: If the series does not exist
+        """
+        arrays = self._file(symbol, timeframe).arrays()
+        if start is None and end is None:
+            return arrays
+
+        lo = 0 if start is None else np.searchsorted(arrays.timestamp, _to_ns(start))
+        hi = (
+            len(arrays)
+            if end is None
+            else np.searchsorted(arrays.timestamp, _to_ns(end), side="right")
+        )
+        return CandleArrays(
+            *(getattr(arrays, name)[lo:hi] for name in ("timestamp",) + COLUMNS)
+        )
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start: Optional[Timestamp] = None,
+        end: Optional[Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        Zero-copy DataFrame view for BaseIndicator.calculate().
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe label
+            start: First timestamp to include (inclusive)
+            end: Last timestamp to include (inclusive)
+
+        Returns:
+            DataFrame with OHLCV columns and a (naive UTC) DatetimeIndex
+
+        Raises:
+            KeyError: If the series does not exist
+        """
+        return self.arrays(symbol, timeframe, start, end).to_frame()
+
+    def length(self, symbol: str, timeframe: str) -> int:
+        """
+        Number of committed candles in a series.
+
+        Raises:
+            KeyError: If the series does not exist
+        """
+        return self._file(symbol, timeframe).length
+
+    def has(self, symbol: str, timeframe: str) -> bool:
+        """True if the series exists on disk."""
+        return self._path(symbol, timeframe).exists()
+
+    def series(self) -> List[Tuple[str, str]]:
+        """
+        List stored (symbol, timeframe) pairs.
+
+        Returns:
+            Sorted list of (symbol, timeframe)
+        """
+        if not self.root.exists():
+            return []
+        return sorted(
+            (unquote(path.parent.name), path.stem)
+            for path in self.root.glob(f"*/*{_SUFFIX}")
+        )
+
+    def close(self) -> None:
+        """Release all memory mappings held by this store."""
+        self._files.clear()
+
+    def __repr__(self) -> str:
+        """String representation."""
+        mode = "readonly" if self.readonly else "readwrite"
+        return f"CandleStore(root='{self.root}', mode={mode})"
@@ -0,0 +1,400 @@
+"""
+Incremental multi-timeframe bar aggregation.
+
+Consumes base (e.g. 1m) candles one at a time and emits closed
+higher-timeframe bars plus the in-progress partial bar for each
+registered timeframe. Timeframes are arranged in a cascade: each one
+aggregates closed bars of the largest registered timeframe that divides
+it, so 1m -> 5m -> 15m -> 1h does one fold per 1m candle plus one per
+closed 5m and 15m bar. Per-candle cost is O(1) amortized no matter how
+many nested timeframes are registered.
+
+Buckets are aligned to the Unix epoch (UTC) and labeled by their open
+time, matching pandas resample(origin="epoch", label="left").
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from shared.indicators.base import BaseIndicator
+
+Bar = Dict[str, Any]
+BarCallback = Callable[[Bar], Any]
+
+# Exchange-style labels ("1m", "4h", "1d", "1w") -> pandas Timedelta units
+_TIMEFRAME = re.compile(r"^(\d+)([smhdw])$")
+_UNITS = {"s": "s", "m": "min", "h": "h", "d": "D", "w": "W"}
+
+
+def parse_timeframe(timeframe: str) -> pd.Timedelta:
+    """
+    Convert a timeframe label ("1m", "15m", "4h", "1d") to a Timedelta.
+
+    Args:
+        timeframe: Timeframe label
+
+    Returns:
+        Positive Timedelta
+
+    Raises:
+        ValueError: If the label is not a fixed positive duration
+    """
+    match = _TIMEFRAME.match(timeframe) if isinstance(timeframe, str) else None
+    try:
+        if match:
+            count, unit = match.groups()
+            duration = pd.Timedelta(int(count), unit=_UNITS[unit])
+        else:
+            duration = pd.Timedelta(timeframe)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid timeframe: {timeframe!r}")
+
+    if duration <= pd.Timedelta(0):
+        raise ValueError(f"Timeframe must be positive, got: {timeframe!r}")
+
+    return duration
+
+
+class _Aggregator:
+    """Running OHLCV bucket for one timeframe in the cascade."""
+
+    __slots__ = (
+        "timeframe",
+        "duration",
+        "parent",
+        "children",
+        "callbacks",
+        "start",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+    )
+
+    def __init__(self, timeframe: str, duration: int):
+        self.timeframe = timeframe
+        self.duration = duration
+        self.parent: Optional["_Aggregator"] = None
+        self.children: List["_Aggregator"] = []
+        self.callbacks: List[BarCallback] = []
+        self.start: Optional[int] = None
+        self.open = self.high = self.low = self.close = self.volume = 0.0
+
+    def fold(
+        self,
+        start: int,
+        end: int,
+        o: float,
+        h: float,
+        lo: float,
+        c: float,
+        v: float,
+        closed: Dict[str, List[tuple]],
+    ) -> None:
+        """Fold one input bar [start, end) into the current bucket."""
+        bucket = start - start % self.duration
+
+        # Input belongs to a later bucket: close the stale one first (gap)
+        if self.start is not None and bucket != self.start:
+            self._emit(closed)
+
+        if self.start is None:
+            self.start = bucket
+            self.open, self.high, self.low = o, h, lo
+            self.volume = 0.0
+        else:
+            if h > self.high:
+                self.high = h
+            if lo < self.low:
+                self.low = lo
+
+        self.close = c
+        self.volume += v
+
+        if end >= self.start + self.duration:
+            self._emit(closed)
+
+    def flush(self, start: int, closed: Dict[str, List[tuple]]) -> None:
+        """Close buckets here and below that end at or before start (gap)."""
+        if self.start is not None:
+            # Buckets below contain this one, so none of them can be done
+            if start < self.start + self.duration:
+                return
+            self._emit(closed)
+
+        for child in self.children:
+            child.flush(start, closed)
+
+    def _emit(self, closed: Dict[str, List[tuple]]) -> None:
+        start, end = self.start, self.start + self.duration
+        bar = (start, end, self.open, self.high, self.low, self.close, self.volume)
+        closed.setdefault(self.timeframe, []).append(bar)
+        self.start = None
+
+        for child in self.children:
+            child.fold(*bar, closed)
+
+    def partial(self) -> Optional[tuple]:
+        """In-progress bar including unclosed input from the cascade below."""
+        below = self.parent.partial() if self.parent is not None else None
+
+        if below is not None:
+            bucket = below[0] - below[0] % self.duration
+            if self.start != bucket:
+                return (bucket, bucket + self.duration) + below[2:]
+
+            return (
+                self.start,
+                self.start + self.duration,
+                self.open,
+                max(self.high, below[3]),
+                min(self.low, below[4]),
+                below[5],
+                self.volume + below[6],
+            )
+
+        if self.start is None:
+            return None
+
+        return (
+            self.start,
+            self.start + self.duration,
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.volume,
+        )
+
+
+class MultiTimeframeResampler:
+    """
+    Incremental resampler from base candles to higher timeframes.
+
+    Closed bars are returned from update() and pushed to callbacks
+    registered with on_close() or attach(). attach() feeds a seeded
+    indicator's update(), so higher-timeframe indicators stay current
+    without re-resampling history.
+
+    Example:
+        >>> resampler = MultiTimeframeResampler("1m", ["5m", "15m", "1h"])
+        >>> rsi_15m = RSIIndicator(period=14)
+        >>> rsi_15m.seed(history_15m)
+        >>> resampler.attach("15m", rsi_15m)
+        >>>
+        >>> closed = resampler.update(timestamp, candle)   # each 1m candle
+        >>> for bar in closed.get("15m", []):
+        ...     print(bar["close"])
+        >>> resampler.partial("1h")                       # in-progress bar
+    """
+
+    def __init__(self, base_timeframe: str, timeframes: Sequence[str]):
+        """
+        Initialize resampler.
+
+        Args:
+            base_timeframe: Timeframe of input candles (e.g. "1m")
+            timeframes: Higher timeframes to build (multiples of base)
+
+        Raises:
+            ValueError: If a timeframe is invalid, duplicated or not a
+                multiple of the base timeframe
+        """
+        self.base_timeframe = base_timeframe
+        self._base = parse_timeframe(base_timeframe).value
+
+        durations: Dict[str, int] = {}
+        for timeframe in timeframes:
+            duration = parse_timeframe(timeframe).value
+            if duration <= self._base or duration % self._base:
+                raise ValueError(
+                    f"Timeframe {timeframe} must be a multiple of base "
+                    f"timeframe {base_timeframe}"
+                )
+            if duration in durations.values():
+                raise ValueError(f"Duplicate timeframe: {timeframe}")
+            durations[timeframe] = duration
+
+        self._nodes: Dict[str, _Aggregator] = {}
+        self._roots: List[_Aggregator] = []
+
+        # Shortest first, so each timeframe's parent already exists
+        for timeframe, duration in sorted(durations.items(), key=lambda x: x[1]):
+            node = _Aggregator(timeframe, duration)
+            parents = [p for p in self._nodes.values() if duration % p.duration == 0]
+            if parents:
+                node.parent = max(parents, key=lambda p: p.duration)
+                node.parent.children.append(node)
+            else:
+                self._roots.append(node)
+            self._nodes[timeframe] = node
+
+        self._last: Optional[int] = None
+        self._tz = None
+
+    @property
+    def timeframes(self) -> List[str]:
+        """Registered timeframes, shortest first."""
+        return list(self._nodes)
+
+    def source_of(self, timeframe: str) -> str:
+        """
+        Timeframe whose closed bars feed the given timeframe.
+
+        Raises:
+            KeyError: If timeframe is not registered
+        """
+        parent = self._node(timeframe).parent
+        return parent.timeframe if parent is not None else self.base_timeframe
+
+    def _node(self, timeframe: str) -> _Aggregator:
+        node = self._nodes.get(timeframe)
+        if node is None:
+            raise KeyError(f"Timeframe {timeframe} is not registered")
+        return node
+
+    def on_close(self, timeframe: str, callback: BarCallback) -> None:
+        """
+        Call callback(bar) whenever a bar of timeframe closes.
+
+        Raises:
+            KeyError: If timeframe is not registered
+        """
+        self._node(timeframe).callbacks.append(callback)
+
+    def attach(self, timeframe: str, indicator: BaseIndicator) -> None:
+        """
+        Stream closed bars of timeframe into indicator.update().
+
+        Args:
+            timeframe: Registered timeframe
+            indicator: Indicator already seeded with seed()
+
+        Raises:
+            KeyError: If timeframe is not registered
+            ValueError: If indicator has not been seeded
+        """
+        if not indicator.is_seeded:
+            raise ValueError(
+                f"{indicator.__class__.__name__} must be seeded with seed(df) "
+                f"before attach()"
+            )
+        self.on_close(timeframe, indicator.update)
+
+    def update(
+        self, timestamp: Any, candle: Mapping[str, float]
+    ) -> Dict[str, List[Bar]]:
+        """
+        Consume one closed base candle.
+
+        Args:
+            timestamp: Open time of the candle
+            candle: Mapping with OHLCV keys
+
+        Returns:
+            Bars closed by this candle per timeframe, oldest first. After
+            a gap one candle can close the stale bucket and its own.
+
+        Raises:
+            ValueError: If timestamp is not after the previous candle
+            KeyError: If required candle fields are missing
+        """
+        ts = pd.Timestamp(timestamp)
+        start = ts.value
+        if self._last is not None and start <= self._last:
+            raise ValueError(
+                f"Candle at {ts} is not after previous candle "
+                f"{pd.Timestamp(self._last, tz='UTC')}"
+            )
+        gap = self._last is not None and start > self._last + self._base
+        self._last = start
+        self._tz = ts.tz
+
+        closed: Dict[str, List[tuple]] = {}
+        bar = (
+            start,
+            start + self._base,
+            float(candle["open"]),
+            float(candle["high"]),
+            float(candle["low"]),
+            float(candle["close"]),
+            float(candle["volume"]),
+        )
+        for root in self._roots:
+            # Close buckets the gap skipped before folding, so no timeframe
+            # waits for its source to emit to release a finished bar
+            if gap:
+                root.flush(start, closed)
+            root.fold(*bar, closed)
+
+        if not closed:
+            return {}
+
+        bars: Dict[str, List[Bar]] = {}
+        for timeframe, raws in closed.items():
+            callbacks = self._nodes[timeframe].callbacks
+            bars[timeframe] = [self._to_bar(raw) for raw in raws]
+            for bar in bars[timeframe]:
+                for callback in callbacks:
+                    callback(bar)
+        return bars
+
+    def consume(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """
+        Feed a DataFrame of base candles and collect closed bars.
+
+        Args:
+            df: DataFrame with OHLCV columns and DatetimeIndex
+
+        Returns:
+            Closed bars per timeframe as DataFrames indexed by open time
+        """
+        collected: Dict[str, List[Bar]] = {tf: [] for tf in self._nodes}
+        for timestamp, candle in zip(df.index, df.to_dict("records")):
+            for timeframe, bars in self.update(timestamp, candle).items():
+                collected[timeframe].extend(bars)
+
+        return {tf: self._to_frame(bars) for tf, bars in collected.items()}
+
+    def partial(self, timeframe: str) -> Optional[Bar]:
+        """
+        In-progress bar of timeframe, or None if no candle is pending.
+
+        Raises:
+            KeyError: If timeframe is not registered
+        """
+        raw = self._node(timeframe).partial()
+        return self._to_bar(raw) if raw is not None else None
+
+    def _to_bar(self, raw: tuple) -> Bar:
+        timestamp = pd.Timestamp(raw[0], tz="UTC")
+        timestamp = (
+            timestamp.tz_convert(self._tz) if self._tz else timestamp.tz_localize(None)
+        )
+        return {
+            "timestamp": timestamp,
+            "open": raw[2],
+            "high": raw[3],
+            "low": raw[4],
+            "close": raw[5],
+            "volume": raw[6],
+        }
+
+    @staticmethod
+    def _to_frame(bars: List[Bar]) -> pd.DataFrame:
+        columns = ["open", "high", "low", "close", "volume"]
+        if not bars:
+            return pd.DataFrame(columns=columns, dtype=float)
+        frame = pd.DataFrame(bars).set_index("timestamp")
+        frame.index.name = None
+        return frame[columns]
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"MultiTimeframeResampler(base='{self.base_timeframe}', "
+            f"timeframes={self.timeframes})"
+        )
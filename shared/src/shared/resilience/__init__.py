@@ -7,42 +7,83 @@ This module provides production-ready resilience patterns including:
 - Retry: Automatic retry with exponential backoff
 - Rate Limiting: Token bucket rate limiter
 - Idempotency: Exactly-once execution guarantee
+
+Exports are imported lazily on first access.
 """
 
-from shared.resilience.circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerConfig,
-    CircuitBreakerState,
-)
-from shared.resilience.exceptions import (
-    CircuitBreakerError,
-    CircuitBreakerOpenError,
-)
-from shared.resilience.idempotency import (
-    DuplicateRequestError,
-    IdempotencyError,
-    IdempotencyKey,
-    IdempotencyStore,
-    InMemoryIdempotencyStore,
-    idempotent,
-)
-from shared.resilience.rate_limiter import (
-    RateLimitConfig,
-    RateLimiterRegistry,
-    RateLimitExceeded,
-    TokenBucket,
-)
-from shared.resilience.retry import (
-    BackoffStrategy,
-    Retry,
-    RetryConfig,
-    RetryError,
-    with_retry,
-)
-from shared.resilience.timeout import (
-    TimeoutContext,
-    TimeoutError,
-    timeout,
+from typing import TYPE_CHECKING
+
+from shared._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from shared.resilience.circuit_breaker import (
+        CircuitBreaker,
+        CircuitBreakerConfig,
+        CircuitBreakerState,
+    )
+    from shared.resilience.exceptions import (
+        CircuitBreakerError,
+        CircuitBreakerOpenError,
+    )
+    from shared.resilience.idempotency import (
+        DuplicateRequestError,
+        IdempotencyError,
+        IdempotencyKey,
+        IdempotencyStore,
+        InMemoryIdempotencyStore,
+        idempotent,
+    )
+    from shared.resilience.rate_limiter import (
+        RateLimitConfig,
+        RateLimiterRegistry,
+        RateLimitExceeded,
+        TokenBucket,
+    )
+    from shared.resilience.retry import (
+        BackoffStrategy,
+        Retry,
+        RetryConfig,
+        RetryError,
+        with_retry,
+    )
+    from shared.resilience.timeout import (
+        TimeoutContext,
+        TimeoutError,
+        timeout,
+    )
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".circuit_breaker": [
+            "CircuitBreaker",
+            "CircuitBreakerConfig",
+            "CircuitBreakerState",
+        ],
+        ".exceptions": ["CircuitBreakerError", "CircuitBreakerOpenError"],
+        ".idempotency": [
+            "DuplicateRequestError",
+            "IdempotencyError",
+            "IdempotencyKey",
+            "IdempotencyStore",
+            "InMemoryIdempotencyStore",
+            "idempotent",
+        ],
+        ".rate_limiter": [
+            "RateLimitConfig",
+            "RateLimiterRegistry",
+            "RateLimitExceeded",
+            "TokenBucket",
+        ],
+        ".retry": [
+            "BackoffStrategy",
+            "Retry",
+            "RetryConfig",
+            "RetryError",
+            "with_retry",
+        ],
+        ".timeout": ["TimeoutContext", "TimeoutError", "timeout"],
+    },
 )
 
 __all__ = [
@@ -3,26 +3,70 @@ Trading Strategy Domain Package.
 
 This package contains the base classes and utilities for trading strategies.
 Generated strategies from TSDL inherit from TradingStrategy base class.
+
+Exports are imported lazily on first access: workers that only need
+Position or the enums do not import pandas or the indicator modules.
 """
 
-from shared.strategy.base_strategy import TradingStrategy
-from shared.strategy.enums import (
-    OrderType,
-    PositionSide,
-    PositionStatus,
-)
-from shared.strategy.exceptions import (
-    InsufficientDataError,
-    InvalidIndicatorError,
-    PositionError,
-    RiskLimitError,
-    StrategyError,
+from typing import TYPE_CHECKING
+
+from shared._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from shared.strategy.base_strategy import TradingStrategy
+    from shared.strategy.conditions import CompiledConditions, Condition
+    from shared.strategy.enums import OrderType, PositionSide, PositionStatus
+    from shared.strategy.exceptions import (
+        InsufficientDataError,
+        InvalidIndicatorError,
+        PositionError,
+        RiskLimitError,
+        SnapshotError,
+        StrategyError,
+    )
+    from shared.strategy.fleet import FleetSignal, GroupLatency, StrategyFleet
+    from shared.strategy.history import IndicatorHistory
+    from shared.strategy.position import Position
+    from shared.strategy.position_book import PositionBook, PositionTriggers
+    from shared.strategy.risk_ledger import RiskLedger
+    from shared.strategy.vectorized import VectorizedOperators
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".base_strategy": ["TradingStrategy"],
+        ".conditions": ["CompiledConditions", "Condition"],
+        ".enums": ["OrderType", "PositionSide", "PositionStatus"],
+        ".exceptions": [
+            "InsufficientDataError",
+            "InvalidIndicatorError",
+            "PositionError",
+            "RiskLimitError",
+            "SnapshotError",
+            "StrategyError",
+        ],
+        ".fleet": ["FleetSignal", "GroupLatency", "StrategyFleet"],
+        ".history": ["IndicatorHistory"],
+        ".position": ["Position"],
+        ".position_book": ["PositionBook", "PositionTriggers"],
+        ".risk_ledger": ["RiskLedger"],
+        ".vectorized": ["VectorizedOperators"],
+    },
 )
-from shared.strategy.position import Position
 
 __all__ = [
     "TradingStrategy",
     "Position",
+    "PositionBook",
+    "PositionTriggers",
+    "RiskLedger",
+    "IndicatorHistory",
+    "VectorizedOperators",
+    "Condition",
+    "CompiledConditions",
+    "StrategyFleet",
+    "FleetSignal",
+    "GroupLatency",
     "PositionSide",
     "OrderType",
     "PositionStatus",
@@ -31,4 +75,5 @@ __all__ = [
     "InvalidIndicatorError",
     "PositionError",
     "RiskLimitError",
+    "SnapshotError",
 ]
@@ -8,10 +8,21 @@ Plugin-specific features (like indicators) are added by plugin compilers.
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
-from shared.strategy.exceptions import RiskLimitError
+from shared.strategy.exceptions import RiskLimitError, SnapshotError
+from shared.strategy.history import IndicatorHistory
 from shared.strategy.position import Position
+from shared.strategy.snapshot import (
+    FULL,
+    INCREMENTAL,
+    SnapshotReader,
+    SnapshotWriter,
+)
+
+# History records in a snapshot
+_REPLACE = 0
+_APPEND = 1
 
 logger = logging.getLogger(__name__)
 
@@ -53,9 +64,13 @@ class TradingStrategy(ABC):
 
         # State management for indicator history
         self._prev_indicators: Dict[str, Any] = {}
-        self._indicator_history: Dict[str, List[Any]] = {}
+        self._indicator_history: Dict[str, IndicatorHistory] = {}
         self._max_history_length: int = 100
 
+        # Snapshot chain: last sequence number and history pushes at it
+        self._snapshot_sequence: int = 0
+        self._snapshot_marks: Dict[str, int] = {}
+
     @abstractmethod
     def check_entry_conditions(
         self,
@@ -104,16 +119,14 @@ class TradingStrategy(ABC):
         # Store for crosses detection (only need 1 previous value)
         self._prev_indicators = indicators.copy()
 
-        # Store in history buffer for highest/lowest detection
+        # Store in bounded ring buffers for highest/lowest/trend detection
         for name, value in indicators.items():
-            if name not in self._indicator_history:
-                self._indicator_history[name] = []
+            history = self._indicator_history.get(name)
+            if history is None:
+                history = IndicatorHistory(self._max_history_length)
+                self._indicator_history[name] = history
 
-            self._indicator_history[name].append(value)
-
-            # Limit history size
-            if len(self._indicator_history[name]) > self._max_history_length:
-                self._indicator_history[name].pop(0)
+            history.push(value)
 
     def _get_previous_value(self, indicator_name: str, default: Any = 0) -> Any:
         """Get previous value of an indicator.
@@ -136,21 +149,14 @@ class TradingStrategy(ABC):
             periods: Number of periods to look back
 
         Returns:
-            True if current value is max over last N periods
+            True if current value is max over last N stored periods
         """
-        if value_name not in self._indicator_history:
-            return False
-
-        history = self._indicator_history[value_name]
-
-        if len(history) < periods:
+        history = self._indicator_history.get(value_name)
+        if history is None:
             return False
 
-        # Get last N values (including current which was just added)
-        recent_values = history[-periods:]
-
         try:
-            return current_value == max(recent_values)
+            return current_value == history.rolling_max(periods)
         except (TypeError, ValueError):
             return False
 
@@ -163,21 +169,14 @@ class TradingStrategy(ABC):
             periods: Number of periods to look back
 
         Returns:
-            True if current value is min over last N periods
+            True if current value is min over last N stored periods
         """
-        if value_name not in self._indicator_history:
-            return False
-
-        history = self._indicator_history[value_name]
-
-        if len(history) < periods:
+        history = self._indicator_history.get(value_name)
+        if history is None:
             return False
 
-        # Get last N values (including current which was just added)
-        recent_values = history[-periods:]
-
         try:
-            return current_value == min(recent_values)
+            return current_value == history.rolling_min(periods)
         except (TypeError, ValueError):
             return False
 
@@ -217,13 +216,20 @@ class TradingStrategy(ABC):
 
         return size
 
-    def can_trade(self) -> bool:
+    def can_trade(self, now: Optional[datetime] = None) -> bool:
         """Check if trading is allowed based on risk limits.
 
+        Args:
+            now: Current time (default: datetime.now()); pass a clock
+                tick or candle time to avoid a wall-clock call per check
+
         Returns:
             True if trading is allowed, False otherwise
+
+        See RiskLedger for evaluating many strategies at once.
         """
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
 
         # Reset daily counters at start of new day
         if self.last_reset_date is None or self.last_reset_date.date() != now.date():
@@ -244,6 +250,167 @@ class TradingStrategy(ABC):
         """
         self.daily_pnl += pnl
 
+    def snapshot(
+        self, positions: Sequence[Position] = (), incremental: bool = False
+    ) -> bytes:
+        """Serialize runtime state into a compact binary blob.
+
+        Captures daily PnL and its reset date, previous indicator values,
+        indicator history and the given positions, so a restarted
+        process can trade without replaying bars.
+
+        With incremental=True only history rows pushed since the previous
+        snapshot are written (a full snapshot if there is none yet).
+        Restore the full snapshot, then each incremental one in order.
+
+        Args:
+            positions: Positions to include (e.g. the open ones)
+            incremental: Write only new history rows
+
+        Returns:
+            Snapshot bytes
+
+        Raises:
+            SnapshotError: If an indicator or metadata value cannot be encoded
+        """
+        base = self._snapshot_sequence
+        kind = INCREMENTAL if incremental and base else FULL
+        marks = self._snapshot_marks if kind == INCREMENTAL else {}
+
+        writer = SnapshotWriter()
+        writer.header(kind, base + 1, base if kind == INCREMENTAL else 0)
+        writer.string(self.name)
+        writer.f64(self.daily_pnl)
+        writer.value(self.last_reset_date)
+        writer.value(self._prev_indicators)
+
+        records = []
+        for name, history in self._indicator_history.items():
+            new = history.pushes - marks.get(name, 0)
+            if new > 0:
+                records.append((name, history, new))
+
+        writer.u32(len(records))
+        for name, history, new in records:
+            values = history.to_numpy()
+            append = new <= len(values)
+            writer.string(name)
+            writer.u8(_APPEND if append else _REPLACE)
+            writer.u32(history.capacity)
+            writer.u64(history.pushes)
+            writer.u32(history.rising_run)
+            writer.u32(history.falling_run)
+            writer.floats(values[len(values) - new :] if append else values)
+
+        writer.u32(len(positions))
+        for position in positions:
+            position.write_snapshot(writer)
+
+        self._snapshot_sequence = base + 1
+        self._snapshot_marks = {
+            name: history.pushes for name, history in self._indicator_history.items()
+        }
+        return writer.getvalue()
+
+    def restore(self, data: bytes) -> List[Position]:
+        """Restore runtime state from snapshot() output.
+
+        A full snapshot replaces all state; an incremental one must
+        directly follow the last snapshot restored (or taken). State is
+        only changed once the whole snapshot has been validated.
+
+        Args:
+            data: Snapshot bytes
+
+        Returns:
+            Positions included in the snapshot
+
+        Raises:
+            SnapshotError: If the data is corrupt, for another strategy,
+                or an incremental snapshot is out of order
+        """
+        reader = SnapshotReader(data)
+        kind, sequence, base = reader.header()
+        if kind not in (FULL, INCREMENTAL):
+            raise SnapshotError(f"Not a strategy snapshot (kind {kind})")
+        if kind == INCREMENTAL and base != self._snapshot_sequence:
+            raise SnapshotError(
+                f"Incremental snapshot {sequence} follows {base}, "
+                f"strategy is at {self._snapshot_sequence}"
+            )
+
+        name = reader.string()
+        if name != self.name:
+            raise SnapshotError(f"Snapshot is for strategy {name!r}, not {self.name!r}")
+
+        daily_pnl = reader.f64()
+        last_reset_date = reader.value()
+        prev_indicators = reader.value()
+        valid_date = last_reset_date is None or isinstance(last_reset_date, datetime)
+        if not valid_date or not isinstance(prev_indicators, dict):
+            raise SnapshotError("Invalid strategy state in snapshot")
+
+        current = {} if kind == FULL else self._indicator_history
+        records = []
+        for _ in range(reader.u32()):
+            key = reader.string()
+            mode = reader.u8()
+            capacity = reader.u32()
+            pushes = reader.u64()
+            runs = (reader.u32(), reader.u32())
+            values = reader.floats()
+
+            # Bound capacity before it sizes a buffer in the apply phase
+            limit = max(self._max_history_length, len(values))
+            if (
+                mode not in (_REPLACE, _APPEND)
+                or not max(len(values), 1) <= capacity <= limit
+                or pushes < len(values)
+            ):
+                raise SnapshotError(f"Invalid history record {key!r}")
+            if mode == _APPEND:
+                history = current.get(key)
+                before = history.pushes if history is not None else 0
+                if history is not None and history.capacity != capacity:
+                    raise SnapshotError(
+                        f"History {key!r} has capacity {history.capacity}, "
+                        f"snapshot expects {capacity}"
+                    )
+                if before + len(values) != pushes:
+                    raise SnapshotError(
+                        f"History {key!r} has {before} values, snapshot "
+                        f"expects {pushes - len(values)}"
+                    )
+            records.append((key, mode, capacity, pushes, runs, values))
+
+        positions = [Position.read_snapshot(reader) for _ in range(reader.u32())]
+        if not reader.done:
+            raise SnapshotError("Unexpected bytes after snapshot")
+
+        # Validated: apply
+        histories = dict(current)
+        for key, mode, capacity, pushes, runs, values in records:
+            if mode == _REPLACE:
+                histories[key] = IndicatorHistory.from_state(
+                    capacity, values, *runs, pushes
+                )
+                continue
+            history = histories.get(key)
+            if history is None:
+                history = histories[key] = IndicatorHistory(capacity)
+            for value in values:
+                history.push(value)
+
+        self.daily_pnl = daily_pnl
+        self.last_reset_date = last_reset_date
+        self._prev_indicators = prev_indicators
+        self._indicator_history = histories
+        self._snapshot_sequence = sequence
+        self._snapshot_marks = {
+            key: history.pushes for key, history in histories.items()
+        }
+        return positions
+
     def __repr__(self) -> str:
         """String representation."""
         return (
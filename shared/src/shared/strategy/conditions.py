@@ -0,0 +1,498 @@
+"""
+Compiled strategy conditions.
+
+TSDL entry/exit conditions expressed as a Condition tree are compiled
+into a flat evaluation plan: indicator names are resolved once to slot
+indices, leaves become closures over slot-indexed value lists, and
+all_of/any_of/not are resolved at compile time into each leaf's
+next-leaf targets on true/false, so short-circuiting costs one index
+lookup per evaluated leaf. Per
+bar, the evaluator reads values by slot and advances previous values
+and ring-buffer histories in place, with no dict copies or name lookups.
+
+The same tree evaluates in bulk over indicator series through
+VectorizedOperators, so one definition serves live trading and
+backtests.
+"""
+
+import math
+import operator
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from shared.strategy.history import IndicatorHistory
+from shared.strategy.vectorized import VectorizedOperators
+
+Operand = Union[str, float]
+
+_COMPARISONS: Dict[str, Callable[[Any, Any], Any]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+# Terminal targets of the flat plan (non-negative targets are leaf indices)
+_TRUE, _FALSE = -1, -2
+
+
+@dataclass(frozen=True)
+class Condition:
+    """
+    Node of a strategy condition tree.
+
+    Build nodes with the module-level constructors (crosses_above,
+    rising_for, compare, all_of, ...) and combine them with &, | and ~.
+
+    Attributes:
+        op: Operator name
+        args: Operator arguments (indicator names, periods, thresholds)
+        children: Sub-conditions of all/any/not nodes
+    """
+
+    op: str
+    args: Tuple[Any, ...] = ()
+    children: Tuple["Condition", ...] = ()
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return all_of(self, other)
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return any_of(self, other)
+
+    def __invert__(self) -> "Condition":
+        return Condition("not", children=(self,))
+
+    def names(self) -> List[str]:
+        """Indicator names referenced by the tree, in first-use order."""
+        found: Dict[str, None] = {}
+        self._collect_names(found)
+        return list(found)
+
+    def _collect_names(self, found: Dict[str, None]) -> None:
+        for arg in self._name_args():
+            found.setdefault(arg, None)
+        for child in self.children:
+            child._collect_names(found)
+
+    def _name_args(self) -> List[str]:
+        if self.op == "compare":
+            return [a for a in (self.args[0], self.args[2]) if isinstance(a, str)]
+        if self.op in ("crosses_above", "crosses_below"):
+            return list(self.args)
+        if self.op in ("divergence_bullish", "divergence_bearish"):
+            return list(self.args[:2])
+        if self.op in ("all", "any", "not"):
+            return []
+        return [self.args[0]]
+
+    def evaluate(self, ops: VectorizedOperators) -> np.ndarray:
+        """
+        Evaluate the condition for every bar.
+
+        Args:
+            ops: Operators over indicator series
+
+        Returns:
+            Boolean array, one element per bar
+        """
+        if self.op == "all":
+            result = np.ones(ops.length, dtype=bool)
+            for child in self.children:
+                result &= child.evaluate(ops)
+            return result
+        if self.op == "any":
+            result = np.zeros(ops.length, dtype=bool)
+            for child in self.children:
+                result |= child.evaluate(ops)
+            return result
+        if self.op == "not":
+            return ~self.children[0].evaluate(ops)
+        if self.op == "compare":
+            left, symbol, right = self.args
+            return np.asarray(
+                _COMPARISONS[symbol](_series(ops, left), _series(ops, right)),
+                dtype=bool,
+            )
+        return getattr(ops, _VECTORIZED[self.op])(*self.args)
+
+
+_VECTORIZED = {
+    "rising": "is_rising",
+    "falling": "is_falling",
+    "rising_for": "is_rising_for",
+    "falling_for": "is_falling_for",
+    "highest": "is_highest",
+    "lowest": "is_lowest",
+    "divergence_bullish": "divergence_bullish",
+    "divergence_bearish": "divergence_bearish",
+    "crosses_above": "crosses_above",
+    "crosses_below": "crosses_below",
+    "crosses_above_threshold": "crosses_above_threshold",
+    "crosses_below_threshold": "crosses_below_threshold",
+}
+
+
+def _series(ops: VectorizedOperators, operand: Operand):
+    return ops.value(operand) if isinstance(operand, str) else float(operand)
+
+
+# Condition constructors
+
+
+def compare(left: Operand, symbol: str, right: Operand) -> Condition:
+    """
+    Compare current values: indicator names (str) or numeric constants.
+
+    Raises:
+        ValueError: If symbol is not a comparison operator
+    """
+    if symbol not in _COMPARISONS:
+        raise ValueError(
+            f"Comparison must be one of {list(_COMPARISONS)}, got: {symbol}"
+        )
+    return Condition("compare", (left, symbol, right))
+
+
+def rising(name: str) -> Condition:
+    """Current value > previous value."""
+    return Condition("rising", (name,))
+
+
+def falling(name: str) -> Condition:
+    """Current value < previous value."""
+    return Condition("falling", (name,))
+
+
+def rising_for(name: str, periods: int) -> Condition:
+    """History rose strictly for the last `periods` steps."""
+    return Condition("rising_for", (name, periods))
+
+
+def falling_for(name: str, periods: int) -> Condition:
+    """History fell strictly for the last `periods` steps."""
+    return Condition("falling_for", (name, periods))
+
+
+def highest(name: str, periods: int) -> Condition:
+    """Current value equals the max of the last `periods` stored values."""
+    return Condition("highest", (name, periods))
+
+
+def lowest(name: str, periods: int) -> Condition:
+    """Current value equals the min of the last `periods` stored values."""
+    return Condition("lowest", (name, periods))
+
+
+def divergence_bullish(
+    price_name: str, indicator_name: str, lookback: int = 14
+) -> Condition:
+    """Price lower low while indicator makes a higher low."""
+    return Condition("divergence_bullish", (price_name, indicator_name, lookback))
+
+
+def divergence_bearish(
+    price_name: str, indicator_name: str, lookback: int = 14
+) -> Condition:
+    """Price higher high while indicator makes a lower high."""
+    return Condition("divergence_bearish", (price_name, indicator_name, lookback))
+
+
+def crosses_above(left_name: str, right_name: str) -> Condition:
+    """Left crosses above right."""
+    return Condition("crosses_above", (left_name, right_name))
+
+
+def crosses_below(left_name: str, right_name: str) -> Condition:
+    """Left crosses below right."""
+    return Condition("crosses_below", (left_name, right_name))
+
+
+def crosses_above_threshold(name: str, threshold: float) -> Condition:
+    """Value crosses above a threshold."""
+    return Condition("crosses_above_threshold", (name, threshold))
+
+
+def crosses_below_threshold(name: str, threshold: float) -> Condition:
+    """Value crosses below a threshold."""
+    return Condition("crosses_below_threshold", (name, threshold))
+
+
+def all_of(*conditions: Condition) -> Condition:
+    """True when every condition is true (short-circuits)."""
+    flat: List[Condition] = []
+    for condition in conditions:
+        flat.extend(condition.children if condition.op == "all" else (condition,))
+    return Condition("all", children=tuple(flat))
+
+
+def any_of(*conditions: Condition) -> Condition:
+    """True when any condition is true (short-circuits)."""
+    flat: List[Condition] = []
+    for condition in conditions:
+        flat.extend(condition.children if condition.op == "any" else (condition,))
+    return Condition("any", children=tuple(flat))
+
+
+Leaf = Callable[[], bool]
+Instruction = Tuple[Leaf, int, int]
+
+
+class CompiledConditions:
+    """
+    Entry/exit conditions compiled to flat plans over slot-indexed values.
+
+    Per bar, pass indicator values as a sequence in slot order (see
+    slots / pack()). step() evaluates entry and exit against the
+    previous bar and history, then stores the bar, exactly like calling
+    check_entry_conditions()/check_exit_conditions() followed by
+    _update_previous_values() on IndicatorBasedStrategy.
+
+    Example:
+        >>> compiled = CompiledConditions(
+        ...     entry=crosses_above("EMA_FAST", "EMA_SLOW") & compare("RSI", "<", 70),
+        ...     exit=crosses_below_threshold("RSI", 30),
+        ... )
+        >>> compiled.slots
+        {'EMA_FAST': 0, 'EMA_SLOW': 1, 'RSI': 2}
+        >>> entry, exit_ = compiled.step([101.2, 100.9, 55.0])
+    """
+
+    def __init__(
+        self,
+        entry: Condition,
+        exit: Condition,
+        names: Optional[Sequence[str]] = None,
+        history_length: int = 100,
+    ):
+        """
+        Compile conditions.
+
+        Args:
+            entry: Entry condition tree
+            exit: Exit condition tree
+            names: Slot order (default: names in order of first use);
+                must include every referenced name
+            history_length: Capacity of per-indicator history
+                (TradingStrategy._max_history_length)
+
+        Raises:
+            ValueError: If names omit a referenced indicator or
+                history_length < 1
+        """
+        if history_length < 1:
+            raise ValueError(f"history_length must be >= 1, got: {history_length}")
+
+        referenced = list(dict.fromkeys(entry.names() + exit.names()))
+        names = list(names) if names is not None else referenced
+        missing = [name for name in referenced if name not in names]
+        if missing:
+            raise ValueError(f"Slot names missing referenced indicators: {missing}")
+
+        self.entry_condition = entry
+        self.exit_condition = exit
+        self.history_length = history_length
+        self.slots: Dict[str, int] = {name: i for i, name in enumerate(names)}
+
+        self._current: List[float] = [math.nan] * len(names)
+        self._previous: List[float] = [math.nan] * len(names)
+        self._histories: Dict[int, IndicatorHistory] = {}
+
+        self._entry_plan = self._compile(entry)
+        self._exit_plan = self._compile(exit)
+        self._tracked = sorted(self._histories.items())
+
+    @property
+    def plan_size(self) -> int:
+        """Total leaves in the entry and exit plans."""
+        return len(self._entry_plan[1]) + len(self._exit_plan[1])
+
+    def pack(self, values: Mapping[str, Any]) -> List[float]:
+        """
+        Convert a name -> value mapping to slot order.
+
+        Raises:
+            KeyError: If a slot name is missing from values
+        """
+        return [values[name] for name in self.slots]
+
+    def step(self, values: Sequence[Any]) -> Tuple[bool, bool]:
+        """
+        Evaluate entry and exit for one bar, then store the bar.
+
+        Args:
+            values: Indicator values in slot order
+
+        Returns:
+            Tuple of (entry, exit)
+        """
+        self._load(values)
+        entry = self._run(self._entry_plan)
+        exit_ = self._run(self._exit_plan)
+        self._commit()
+        return entry, exit_
+
+    def check_entry(self, values: Sequence[Any]) -> bool:
+        """Evaluate entry for a bar without storing it."""
+        self._load(values)
+        return self._run(self._entry_plan)
+
+    def check_exit(self, values: Sequence[Any]) -> bool:
+        """Evaluate exit for a bar without storing it."""
+        self._load(values)
+        return self._run(self._exit_plan)
+
+    def commit(self, values: Sequence[Any]) -> None:
+        """Store a bar as previous values and history."""
+        self._load(values)
+        self._commit()
+
+    def _load(self, values: Sequence[Any]) -> None:
+        if len(values) != len(self._current):
+            raise ValueError(
+                f"Expected {len(self._current)} values in slot order, "
+                f"got {len(values)}"
+            )
+        self._current[:] = values
+
+    def _commit(self) -> None:
+        self._previous[:] = self._current
+        current = self._current
+        for slot, history in self._tracked:
+            history.push(current[slot])
+
+    @staticmethod
+    def _run(plan: Tuple[int, List[Instruction]]) -> bool:
+        pc, leaves = plan
+        while pc >= 0:
+            leaf, on_true, on_false = leaves[pc]
+            try:
+                pc = on_true if leaf() else on_false
+            except (TypeError, ValueError):
+                pc = on_false
+        return pc == _TRUE
+
+    # Compilation
+
+    def _compile(self, condition: Condition) -> Tuple[int, List[Instruction]]:
+        leaves: List[Instruction] = []
+        start = self._emit(condition, _TRUE, _FALSE, leaves)
+        return start, leaves
+
+    def _emit(
+        self,
+        condition: Condition,
+        on_true: int,
+        on_false: int,
+        leaves: List[Instruction],
+    ) -> int:
+        """Append leaves for condition; return the target that evaluates it."""
+        if condition.op == "all":
+            # Each child continues to the next on true, fails fast on false
+            target = on_true
+            for child in reversed(condition.children):
+                target = self._emit(child, target, on_false, leaves)
+            return target
+
+        if condition.op == "any":
+            target = on_false
+            for child in reversed(condition.children):
+                target = self._emit(child, on_true, target, leaves)
+            return target
+
+        if condition.op == "not":
+            return self._emit(condition.children[0], on_false, on_true, leaves)
+
+        leaves.append((self._leaf(condition), on_true, on_false))
+        return len(leaves) - 1
+
+    def _history(self, name: str) -> IndicatorHistory:
+        slot = self.slots[name]
+        history = self._histories.get(slot)
+        if history is None:
+            history = IndicatorHistory(self.history_length)
+            self._histories[slot] = history
+        return history
+
+    def _leaf(self, condition: Condition) -> Leaf:
+        """Closure evaluating one operator from slot-indexed lists."""
+        v, p = self._current, self._previous
+        op, args = condition.op, condition.args
+
+        if op == "compare":
+            left, symbol, right = args
+            fn = _COMPARISONS[symbol]
+            if isinstance(left, str) and isinstance(right, str):
+                i, j = self.slots[left], self.slots[right]
+                return lambda: fn(v[i], v[j])
+            if isinstance(left, str):
+                i, constant = self.slots[left], float(right)
+                return lambda: fn(v[i], constant)
+            if isinstance(right, str):
+                j, constant = self.slots[right], float(left)
+                return lambda: fn(constant, v[j])
+            result = bool(fn(float(left), float(right)))
+            return lambda: result
+
+        if op == "rising":
+            i = self.slots[args[0]]
+            return lambda: v[i] > p[i]
+        if op == "falling":
+            i = self.slots[args[0]]
+            return lambda: v[i] < p[i]
+
+        if op in ("crosses_above", "crosses_below"):
+            i, j = self.slots[args[0]], self.slots[args[1]]
+            if op == "crosses_above":
+                return lambda: p[i] <= p[j] and v[i] > v[j]
+            return lambda: p[i] >= p[j] and v[i] < v[j]
+
+        if op in ("crosses_above_threshold", "crosses_below_threshold"):
+            i, threshold = self.slots[args[0]], float(args[1])
+            if op == "crosses_above_threshold":
+                return lambda: p[i] <= threshold and v[i] > threshold
+            return lambda: p[i] >= threshold and v[i] < threshold
+
+        if op in ("rising_for", "falling_for"):
+            name, periods = args
+            history = self._history(name)
+            if periods + 1 > self.history_length:
+                return lambda: False
+            needed = periods + 1
+            if op == "rising_for":
+                return lambda: len(history) >= needed and history.rising_run >= periods
+            return lambda: len(history) >= needed and history.falling_run >= periods
+
+        if op in ("highest", "lowest"):
+            name, periods = args
+            i = self.slots[name]
+            mode = "max" if op == "highest" else "min"
+            tracker = self._history(name).track(mode, periods)
+            if tracker is None:
+                return lambda: False
+            return lambda: v[i] == tracker.value
+
+        if op in ("divergence_bullish", "divergence_bearish"):
+            price_name, indicator_name, lookback = args
+            i, j = self.slots[price_name], self.slots[indicator_name]
+            mode = "min" if op == "divergence_bullish" else "max"
+            price = self._history(price_name).track(mode, lookback - 1, lag=1)
+            value = self._history(indicator_name).track(mode, lookback - 1, lag=1)
+            if price is None or value is None:
+                return lambda: False
+            if op == "divergence_bullish":
+                return lambda: v[i] < price.value and v[j] > value.value
+            return lambda: v[i] > price.value and v[j] < value.value
+
+        raise ValueError(f"Unknown condition operator: {op}")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"CompiledConditions(slots={len(self.slots)}, "
+            f"instructions={self.plan_size}, histories={len(self._histories)})"
+        )
@@ -41,6 +41,10 @@ class PositionError(StrategyError):
     """Raised when there is an error with position management."""
 
 
+class SnapshotError(StrategyError):
+    """Raised when strategy state cannot be snapshotted or restored."""
+
+
 class RiskLimitError(StrategyError):
     """Raised when a risk limit would be violated."""
 
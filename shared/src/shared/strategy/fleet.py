@@ -0,0 +1,487 @@
+"""
+Multi-strategy runner.
+
+Evaluates many TradingStrategy instances per tick. Strategies are
+grouped by (symbol, timeframe); each group compiles the indicators of
+all its strategies into one IndicatorPipeline, with identical
+indicators (same class and parameters) computed once per tick no
+matter how many strategies use them.
+
+Condition evaluation runs inline or fans out across worker processes.
+Workers are long-lived and own their strategies, so indicator history
+and previous values stay in the worker between ticks; per tick only the
+group's latest indicator values and open positions are sent.
+
+Usage:
+    fleet = StrategyFleet(workers=4)
+    fleet.add(strategy, {"RSI": RSIIndicator(period=14),
+                         "EMA_FAST": EMAIndicator(period=12)})
+    with fleet:
+        signals = fleet.tick("SOL/USDC", "1m", candles_df)
+        fleet.latency()[("SOL/USDC", "1m")].p95_ms
+"""
+
+import logging
+import math
+import multiprocessing
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+import pandas as pd
+
+from shared.indicators.base import BaseIndicator, indicator_key
+from shared.indicators.pipeline import IndicatorPipeline
+from shared.strategy.base_strategy import TradingStrategy
+from shared.strategy.exceptions import StrategyError
+from shared.strategy.position import Position
+
+logger = logging.getLogger(__name__)
+
+GroupKey = Tuple[str, str]
+# Strategy-local indicator name -> shared indicator key
+Binding = Dict[str, str]
+# Latest value of one indicator (per output for multi-output indicators)
+Column = Union[float, Dict[str, float]]
+
+
+@dataclass(frozen=True)
+class FleetSignal:
+    """
+    Condition results of one strategy for one tick.
+
+    Entry is evaluated only without an open position and exit only with
+    one; the other is False.
+
+    Attributes:
+        strategy: Strategy name
+        entry: Entry conditions met
+        exit: Exit conditions met
+        error: Exception raised by the strategy, if any
+    """
+
+    strategy: str
+    entry: bool
+    exit: bool
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class GroupLatency:
+    """
+    Tick latency of one (symbol, timeframe) group, in milliseconds.
+
+    Percentiles and means cover the most recent ticks (latency_window).
+
+    Attributes:
+        symbol: Group symbol
+        timeframe: Group timeframe
+        strategies: Strategies in the group
+        indicators: Unique indicators computed per tick
+        ticks: Ticks processed since start
+        last_ms: Latest tick, end to end
+        mean_ms: Mean tick
+        p95_ms: 95th percentile tick
+        max_ms: Slowest tick
+        indicators_ms: Mean time computing shared indicators
+        evaluate_ms: Mean time evaluating conditions
+    """
+
+    symbol: str
+    timeframe: str
+    strategies: int
+    indicators: int
+    ticks: int
+    last_ms: float
+    mean_ms: float
+    p95_ms: float
+    max_ms: float
+    indicators_ms: float
+    evaluate_ms: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+def _last_value(series: pd.Series) -> float:
+    if len(series) == 0:
+        return math.nan
+    try:
+        return float(series.iloc[-1])
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _evaluate(
+    strategies: List[Tuple[TradingStrategy, Binding]],
+    market_data: Dict[str, Any],
+    columns: Mapping[str, Column],
+    positions: Mapping[str, Position],
+) -> List[FleetSignal]:
+    """Evaluate strategies against one tick and store their values."""
+    signals = []
+    for strategy, binding in strategies:
+        indicators = {}
+        for name, key in binding.items():
+            value = columns[key]
+            if isinstance(value, dict):
+                for output, output_value in value.items():
+                    indicators[f"{name}.{output}"] = output_value
+            else:
+                indicators[name] = value
+        data = dict(market_data, indicators=indicators)
+        position = positions.get(strategy.name)
+        entry = exit_ = False
+        error = None
+        try:
+            if position is None:
+                entry = bool(strategy.check_entry_conditions(data))
+            else:
+                exit_ = bool(strategy.check_exit_conditions(position, data))
+            strategy._update_previous_values(indicators)
+        except Exception as e:
+            error = f"{e.__class__.__name__}: {e}"
+        signals.append(FleetSignal(strategy.name, entry, exit_, error))
+    return signals
+
+
+def _worker_main(connection, groups: Dict[GroupKey, list]) -> None:
+    """Worker process loop: evaluate owned strategies on request."""
+    while True:
+        message = connection.recv()
+        command = message[0]
+        if command == "tick":
+            _, group, market_data, columns, positions = message
+            connection.send(
+                _evaluate(groups.get(group, []), market_data, columns, positions)
+            )
+        elif command == "collect":
+            connection.send(groups)
+        else:
+            break
+    connection.close()
+
+
+class _Group:
+    """Strategies and shared indicators of one (symbol, timeframe)."""
+
+    def __init__(self, latency_window: int):
+        self.strategies: List[Tuple[TradingStrategy, Binding]] = []
+        self.indicators: Dict[str, BaseIndicator] = {}
+        self.pipeline: Optional[IndicatorPipeline] = None
+        self.workers: List[int] = []
+        self.ticks = 0
+        self.max_ms = 0.0
+        self.samples: Deque[Tuple[float, float, float]] = deque(maxlen=latency_window)
+
+    def compile(self) -> None:
+        self.pipeline = IndicatorPipeline(list(self.indicators.values()))
+
+    def columns(self, df: pd.DataFrame) -> Dict[str, Column]:
+        """Latest value of every shared indicator."""
+        columns: Dict[str, Column] = {}
+        for key, result in zip(self.indicators, self.pipeline.run(df)):
+            if isinstance(result, dict):
+                columns[key] = {k: _last_value(v) for k, v in result.items()}
+            else:
+                columns[key] = _last_value(result)
+        return columns
+
+
+class StrategyFleet:
+    """
+    Runs many strategies per tick with shared indicator computation.
+
+    Each strategy is added with its indicators as {name: indicator};
+    the strategy receives market_data["indicators"] = {name: latest
+    value}. Multi-output indicators (e.g. MACD) expose one value per
+    output as "name.output" (e.g. "MACD.histogram").
+
+    With workers > 0, strategies of each group are spread round-robin
+    over worker processes, so a tick evaluates one group in parallel.
+    Strategies must be picklable. After close(), the fleet's strategy
+    objects reflect the state accumulated in the workers.
+
+    Example:
+        >>> fleet = StrategyFleet(workers=2)
+        >>> for strategy in strategies:
+        ...     fleet.add(strategy, {"RSI": RSIIndicator(period=14)})
+        >>> with fleet:
+        ...     for df in candle_stream:
+        ...         signals = fleet.tick("SOL/USDC", "1m", df)
+    """
+
+    def __init__(
+        self,
+        workers: int = 0,
+        latency_window: int = 1000,
+        mp_context: Optional[Any] = None,
+    ):
+        """
+        Initialize fleet.
+
+        Args:
+            workers: Worker processes (0 evaluates in this process)
+            latency_window: Recent ticks kept per group for latency stats
+            mp_context: multiprocessing context (default: platform default)
+
+        Raises:
+            ValueError: If workers < 0 or latency_window < 1
+        """
+        if workers < 0:
+            raise ValueError(f"workers must be >= 0, got: {workers}")
+        if latency_window < 1:
+            raise ValueError(f"latency_window must be >= 1, got: {latency_window}")
+
+        self.workers = workers
+        self.latency_window = latency_window
+        self._context = mp_context or multiprocessing.get_context()
+        self._groups: Dict[GroupKey, _Group] = {}
+        self._names: Dict[str, GroupKey] = {}
+        self._connections: List[Any] = []
+        self._processes: List[Any] = []
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        """Whether start() has compiled groups (and started workers)."""
+        return self._running
+
+    @property
+    def strategies(self) -> List[TradingStrategy]:
+        """All strategies, in insertion order per group."""
+        return [s for group in self._groups.values() for s, _ in group.strategies]
+
+    @property
+    def groups(self) -> List[GroupKey]:
+        """(symbol, timeframe) groups."""
+        return list(self._groups)
+
+    def add(
+        self, strategy: TradingStrategy, indicators: Mapping[str, BaseIndicator]
+    ) -> None:
+        """
+        Add a strategy with its configured indicators.
+
+        Args:
+            strategy: Strategy instance (name must be unique in the fleet)
+            indicators: Indicator name as used by the strategy -> indicator
+
+        Raises:
+            ValueError: If a strategy with the same name was added
+            StrategyError: If the fleet is running
+        """
+        if self._running:
+            raise StrategyError("Cannot add strategies to a running fleet")
+        if strategy.name in self._names:
+            raise ValueError(f"Duplicate strategy name: {strategy.name}")
+
+        key = (strategy.symbol, strategy.timeframe)
+        group = self._groups.get(key)
+        if group is None:
+            group = _Group(self.latency_window)
+            self._groups[key] = group
+
+        binding: Binding = {}
+        for name, indicator in indicators.items():
+            shared = indicator_key(indicator)
+            group.indicators.setdefault(shared, indicator)
+            binding[name] = shared
+
+        group.strategies.append((strategy, binding))
+        self._names[strategy.name] = key
+
+    def start(self) -> None:
+        """Compile group pipelines and start worker processes."""
+        if self._running:
+            return
+
+        for group in self._groups.values():
+            group.compile()
+            group.workers = []
+
+        if self.workers:
+            shards: List[Dict[GroupKey, list]] = [{} for _ in range(self.workers)]
+            for key, group in self._groups.items():
+                for i, entry in enumerate(group.strategies):
+                    shards[i % self.workers].setdefault(key, []).append(entry)
+                group.workers = sorted(
+                    i for i, shard in enumerate(shards) if key in shard
+                )
+
+            for shard in shards:
+                parent, child = self._context.Pipe()
+                process = self._context.Process(
+                    target=_worker_main, args=(child, shard), daemon=True
+                )
+                process.start()
+                child.close()
+                self._connections.append(parent)
+                self._processes.append(process)
+
+        self._running = True
+
+    def tick(
+        self,
+        symbol: str,
+        timeframe: str,
+        df: pd.DataFrame,
+        positions: Optional[Mapping[str, Position]] = None,
+    ) -> List[FleetSignal]:
+        """
+        Evaluate every strategy of a group on the latest candle.
+
+        Args:
+            symbol: Group symbol
+            timeframe: Group timeframe
+            df: Candle history ending at the current candle (OHLCV)
+            positions: Open positions by strategy name
+
+        Returns:
+            Signals of the group's strategies (empty for unknown groups)
+
+        Raises:
+            KeyError: If required columns are missing
+            ValueError: If there is not enough data for an indicator
+            StrategyError: If a worker process has died
+        """
+        group = self._groups.get((symbol, timeframe))
+        if group is None:
+            return []
+        if not self._running:
+            self.start()
+
+        start = time.perf_counter()
+        columns = group.columns(df)
+        computed = time.perf_counter()
+
+        market_data = {"symbol": symbol, "timeframe": timeframe}
+        if len(df):
+            market_data.update(df.iloc[-1].to_dict())
+        positions = positions or {}
+
+        if group.workers:
+            signals = self._dispatch(
+                group, (symbol, timeframe), market_data, columns, positions
+            )
+        else:
+            signals = _evaluate(group.strategies, market_data, columns, positions)
+
+        end = time.perf_counter()
+        self._record(group, start, computed, end)
+
+        for signal in signals:
+            if signal.error:
+                logger.warning(f"Strategy {signal.strategy} failed: {signal.error}")
+        return signals
+
+    def _dispatch(
+        self,
+        group: _Group,
+        key: GroupKey,
+        market_data: Dict[str, Any],
+        columns: Dict[str, Column],
+        positions: Mapping[str, Position],
+    ) -> List[FleetSignal]:
+        names = {strategy.name for strategy, _ in group.strategies}
+        relevant = {k: v for k, v in positions.items() if k in names}
+        message = ("tick", key, market_data, columns, relevant)
+        try:
+            for worker in group.workers:
+                self._connections[worker].send(message)
+            results = [self._connections[w].recv() for w in group.workers]
+        except (EOFError, OSError, BrokenPipeError) as e:
+            raise StrategyError(f"Fleet worker failed: {e}") from e
+
+        # Round-robin sharding: restore insertion order
+        signals = []
+        for i in range(len(group.strategies)):
+            signals.append(results[i % len(results)][i // len(results)])
+        return signals
+
+    def _record(self, group: _Group, start: float, computed: float, end: float) -> None:
+        total_ms = (end - start) * 1000
+        group.ticks += 1
+        group.max_ms = max(group.max_ms, total_ms)
+        group.samples.append(
+            (total_ms, (computed - start) * 1000, (end - computed) * 1000)
+        )
+
+    def latency(self) -> Dict[GroupKey, GroupLatency]:
+        """
+        Per-group tick latency.
+
+        Returns:
+            GroupLatency by (symbol, timeframe), for groups that ticked
+        """
+        report = {}
+        for (symbol, timeframe), group in self._groups.items():
+            if not group.samples:
+                continue
+            totals = sorted(sample[0] for sample in group.samples)
+            count = len(totals)
+            report[(symbol, timeframe)] = GroupLatency(
+                symbol=symbol,
+                timeframe=timeframe,
+                strategies=len(group.strategies),
+                indicators=len(group.indicators),
+                ticks=group.ticks,
+                last_ms=group.samples[-1][0],
+                mean_ms=sum(totals) / count,
+                p95_ms=totals[min(count - 1, math.ceil(0.95 * count) - 1)],
+                max_ms=group.max_ms,
+                indicators_ms=sum(s[1] for s in group.samples) / count,
+                evaluate_ms=sum(s[2] for s in group.samples) / count,
+            )
+        return report
+
+    def close(self) -> None:
+        """Stop workers and take back their strategy state."""
+        if not self._running:
+            return
+
+        collected: Dict[GroupKey, list] = {}
+        for connection in self._connections:
+            try:
+                connection.send(("collect",))
+                for key, entries in connection.recv().items():
+                    collected.setdefault(key, []).append(entries)
+                connection.send(("stop",))
+            except (EOFError, OSError):
+                logger.warning("Fleet worker exited before close")
+            connection.close()
+
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+        for key, shards in collected.items():
+            group = self._groups[key]
+            if len(shards) == len(group.workers):
+                group.strategies = [
+                    shards[i % len(shards)][i // len(shards)]
+                    for i in range(len(group.strategies))
+                ]
+
+        self._connections = []
+        self._processes = []
+        self._running = False
+
+    def __enter__(self) -> "StrategyFleet":
+        """Start fleet."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Close fleet."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"StrategyFleet(groups={len(self._groups)}, "
+            f"strategies={len(self._names)}, workers={self.workers})"
+        )
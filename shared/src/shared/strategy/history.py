@@ -0,0 +1,245 @@
+"""
+Bounded indicator history for strategy helpers.
+
+Fixed-capacity, array-backed ring buffer of one indicator's past values
+with O(1) queries for the TSDL trend operators: rolling highest/lowest
+(monotonic deques, registered lazily per window), and lengths of the
+current strictly rising/falling runs.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from shared.indicators.streaming import RollingExtremum
+
+
+def _as_float(value: Any) -> float:
+    """Numeric value as float; NaN for None and non-numeric values."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class IndicatorHistory:
+    """
+    Ring buffer of one indicator's values with O(1) trend queries.
+
+    Values are stored as float64; None and non-numeric values become
+    NaN. NaN never counts as highest/lowest or as a rising/falling step,
+    and a window containing NaN has no extremum.
+
+    Rolling extrema are computed by monotonic deques created on the
+    first query for a given (mode, window, lag) and then maintained on
+    every push, so repeated queries cost O(1) amortized.
+
+    Example:
+        >>> history = IndicatorHistory(capacity=100)
+        >>> for value in (1.0, 3.0, 2.0, 4.0):
+        ...     history.push(value)
+        >>> history.rolling_max(3)        # max of 3.0, 2.0, 4.0
+        4.0
+        >>> history.rolling_min(2, lag=1) # min of 3.0, 2.0
+        2.0
+        >>> history.rising_run
+        1
+    """
+
+    __slots__ = (
+        "capacity",
+        "_values",
+        "_start",
+        "_length",
+        "_rising_run",
+        "_falling_run",
+        "_pushes",
+        "_extrema",
+    )
+
+    def __init__(self, capacity: int):
+        """
+        Initialize history.
+
+        Args:
+            capacity: Maximum number of values kept
+
+        Raises:
+            ValueError: If capacity < 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got: {capacity}")
+
+        self.capacity = capacity
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._length = 0
+        self._rising_run = 0
+        self._falling_run = 0
+        self._pushes = 0
+        self._extrema: Dict[Tuple[str, int, int], RollingExtremum] = {}
+
+    def push(self, value: Any) -> None:
+        """
+        Append a value, overwriting the oldest once full.
+
+        Args:
+            value: New indicator value
+        """
+        x = _as_float(value)
+        self._pushes += 1
+
+        if self._length:
+            last = self._values[(self._start + self._length - 1) % self.capacity]
+            self._rising_run = self._rising_run + 1 if x > last else 0
+            self._falling_run = self._falling_run + 1 if x < last else 0
+
+        if self._length < self.capacity:
+            self._values[(self._start + self._length) % self.capacity] = x
+            self._length += 1
+        else:
+            self._values[self._start] = x
+            self._start = (self._start + 1) % self.capacity
+
+        for (_, _, lag), extremum in self._extrema.items():
+            if lag == 0:
+                extremum.push(x)
+            elif self._length > lag:
+                extremum.push(self[-1 - lag])
+
+    @classmethod
+    def from_state(
+        cls,
+        capacity: int,
+        values: np.ndarray,
+        rising_run: int,
+        falling_run: int,
+        pushes: int,
+    ) -> "IndicatorHistory":
+        """
+        Rebuild a history from its values and counters (see snapshots).
+
+        Rolling extrema are re-seeded from the values on first query.
+
+        Args:
+            capacity: Maximum number of values kept
+            values: Held values, oldest first
+            rising_run: Current strictly rising run
+            falling_run: Current strictly falling run
+            pushes: Values pushed since creation
+
+        Raises:
+            ValueError: If more values than capacity are given
+        """
+        history = cls(capacity)
+        length = len(values)
+        if length > capacity:
+            raise ValueError(f"{length} values exceed capacity {capacity}")
+
+        history._values[:length] = values
+        history._length = length
+        history._rising_run = rising_run
+        history._falling_run = falling_run
+        history._pushes = pushes
+        return history
+
+    @property
+    def pushes(self) -> int:
+        """Values pushed since creation, including overwritten ones."""
+        return self._pushes
+
+    @property
+    def rising_run(self) -> int:
+        """Consecutive strictly increasing steps ending at the newest value."""
+        return self._rising_run
+
+    @property
+    def falling_run(self) -> int:
+        """Consecutive strictly decreasing steps ending at the newest value."""
+        return self._falling_run
+
+    def rolling_max(self, window: int, lag: int = 0) -> float:
+        """
+        Max of `window` values ending `lag` values before the newest.
+
+        Args:
+            window: Number of values
+            lag: Most recent values to skip (0 includes the newest)
+
+        Returns:
+            Maximum, or NaN if fewer values are held or any is NaN
+        """
+        return self._extremum("max", window, lag)
+
+    def rolling_min(self, window: int, lag: int = 0) -> float:
+        """
+        Min of `window` values ending `lag` values before the newest.
+
+        Args:
+            window: Number of values
+            lag: Most recent values to skip (0 includes the newest)
+
+        Returns:
+            Minimum, or NaN if fewer values are held or any is NaN
+        """
+        return self._extremum("min", window, lag)
+
+    def track(self, mode: str, window: int, lag: int = 0) -> Optional[RollingExtremum]:
+        """
+        Register (or reuse) a maintained rolling extremum.
+
+        The returned tracker's .value is kept current by push(), so
+        callers can hold on to it and skip the per-query lookup.
+
+        Args:
+            mode: 'max' or 'min'
+            window: Number of values
+            lag: Most recent values to skip
+
+        Returns:
+            RollingExtremum, or None if the window can never be filled
+        """
+        if window < 1 or lag < 0 or window + lag > self.capacity:
+            return None
+
+        key = (mode, window, lag)
+        extremum = self._extrema.get(key)
+        if extremum is None:
+            seed = self.to_numpy()[: max(self._length - lag, 0)]
+            extremum = RollingExtremum(window, mode, seed[-window:])
+            self._extrema[key] = extremum
+
+        return extremum
+
+    def _extremum(self, mode: str, window: int, lag: int) -> float:
+        extremum = self.track(mode, window, lag)
+        return extremum.value if extremum is not None else math.nan
+
+    def to_numpy(self) -> np.ndarray:
+        """Values oldest to newest (copy)."""
+        end = self._start + self._length
+        if end <= self.capacity:
+            return self._values[self._start : end].copy()
+        return np.concatenate(
+            (self._values[self._start :], self._values[: end - self.capacity])
+        )
+
+    def __len__(self) -> int:
+        """Number of values held (at most capacity)."""
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[float, List[float]]:
+        """Value(s) by position, oldest first; negative indices supported."""
+        if isinstance(index, slice):
+            return self.to_numpy()[index].tolist()
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("history index out of range")
+        return float(self._values[(self._start + index) % self.capacity])
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"IndicatorHistory(length={self._length}, capacity={self.capacity})"
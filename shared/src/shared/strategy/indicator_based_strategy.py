@@ -5,9 +5,14 @@ Extends TradingStrategy with indicator-specific helper methods
 for TSDL v2 indicator_based plugin.
 """
 
-from typing import Any
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import pandas as pd
 
 from shared.strategy.base_strategy import TradingStrategy
+from shared.strategy.conditions import CompiledConditions, Condition
+from shared.strategy.vectorized import VectorizedOperators
 
 
 class IndicatorBasedStrategy(TradingStrategy):
@@ -19,8 +24,106 @@ class IndicatorBasedStrategy(TradingStrategy):
     - divergence_bullish/divergence_bearish - divergence detection
     - crosses_above/crosses_below - indicator crossover detection
     - crosses_above_threshold/crosses_below_threshold - threshold crossover
+
+    For backtests, generated strategies may also implement
+    vectorized_entry_conditions()/vectorized_exit_conditions() with the
+    same operators from VectorizedOperators; generate_signals() then
+    evaluates entry/exit for every bar at once, with results identical
+    to calling the helpers bar by bar.
+
+    Strategies that declare entry_condition/exit_condition as Condition
+    trees get both for free: compile_conditions() builds a slot-indexed
+    per-bar evaluator, and the vectorized hooks evaluate the trees.
     """
 
+    entry_condition: Optional[Condition] = None
+    exit_condition: Optional[Condition] = None
+
+    def compile_conditions(
+        self, names: Optional[Sequence[str]] = None
+    ) -> CompiledConditions:
+        """Compile entry_condition/exit_condition into a per-bar evaluator.
+
+        Args:
+            names: Slot order of indicator values (default: order of use)
+
+        Returns:
+            CompiledConditions with fresh previous values and history
+
+        Raises:
+            NotImplementedError: If the strategy declares no condition trees
+        """
+        if self.entry_condition is None or self.exit_condition is None:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not declare condition trees"
+            )
+        return CompiledConditions(
+            self.entry_condition,
+            self.exit_condition,
+            names=names,
+            history_length=self._max_history_length,
+        )
+
+    def vectorized_entry_conditions(self, ops: VectorizedOperators) -> np.ndarray:
+        """Entry conditions for every bar as a boolean array.
+
+        Args:
+            ops: Operators over the strategy's indicator series
+
+        Returns:
+            Boolean array, one element per bar
+
+        Raises:
+            NotImplementedError: If the strategy has no vectorized form
+        """
+        if self.entry_condition is not None:
+            return self.entry_condition.evaluate(ops)
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support vectorized evaluation"
+        )
+
+    def vectorized_exit_conditions(self, ops: VectorizedOperators) -> np.ndarray:
+        """Exit conditions for every bar as a boolean array.
+
+        Position-dependent checks are left to the backtester; this covers
+        the indicator conditions only.
+
+        Args:
+            ops: Operators over the strategy's indicator series
+
+        Returns:
+            Boolean array, one element per bar
+
+        Raises:
+            NotImplementedError: If the strategy has no vectorized form
+        """
+        if self.exit_condition is not None:
+            return self.exit_condition.evaluate(ops)
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support vectorized evaluation"
+        )
+
+    def generate_signals(self, indicators: pd.DataFrame) -> pd.DataFrame:
+        """Evaluate entry/exit conditions over whole indicator series.
+
+        Args:
+            indicators: One column per indicator name, one row per bar
+
+        Returns:
+            DataFrame with boolean 'entry' and 'exit' columns
+
+        Raises:
+            NotImplementedError: If the strategy has no vectorized form
+        """
+        ops = VectorizedOperators(indicators, history_length=self._max_history_length)
+        return pd.DataFrame(
+            {
+                "entry": np.asarray(self.vectorized_entry_conditions(ops), dtype=bool),
+                "exit": np.asarray(self.vectorized_exit_conditions(ops), dtype=bool),
+            },
+            index=indicators.index,
+        )
+
     def _is_rising(self, indicator_name: str, current_value: Any) -> bool:
         """Check if indicator is rising (current > previous).
 
@@ -74,27 +177,12 @@ class IndicatorBasedStrategy(TradingStrategy):
         Returns:
             True if indicator has been rising for specified periods
         """
-        if indicator_name not in self._indicator_history:
+        history = self._indicator_history.get(indicator_name)
+        if history is None:
             return False
 
-        history = self._indicator_history[indicator_name]
-
         # Need N+1 values to check N periods of rising
-        if len(history) < periods + 1:
-            return False
-
-        try:
-            # Get last N+1 values (including current)
-            recent_values = history[-(periods + 1) :]
-
-            # Check each period is higher than previous
-            for i in range(1, len(recent_values)):
-                if recent_values[i] <= recent_values[i - 1]:
-                    return False
-
-            return True
-        except (TypeError, ValueError, IndexError):
-            return False
+        return len(history) >= periods + 1 and history.rising_run >= periods
 
     def _is_falling_for(
         self, indicator_name: str, current_value: Any, periods: int
@@ -109,27 +197,12 @@ class IndicatorBasedStrategy(TradingStrategy):
         Returns:
             True if indicator has been falling for specified periods
         """
-        if indicator_name not in self._indicator_history:
+        history = self._indicator_history.get(indicator_name)
+        if history is None:
             return False
 
-        history = self._indicator_history[indicator_name]
-
         # Need N+1 values to check N periods of falling
-        if len(history) < periods + 1:
-            return False
-
-        try:
-            # Get last N+1 values (including current)
-            recent_values = history[-(periods + 1) :]
-
-            # Check each period is lower than previous
-            for i in range(1, len(recent_values)):
-                if recent_values[i] >= recent_values[i - 1]:
-                    return False
-
-            return True
-        except (TypeError, ValueError, IndexError):
-            return False
+        return len(history) >= periods + 1 and history.falling_run >= periods
 
     def _divergence_bullish(
         self,
@@ -151,32 +224,22 @@ class IndicatorBasedStrategy(TradingStrategy):
         Returns:
             True if bullish divergence detected
         """
-        if price_name not in self._indicator_history:
-            return False
-        if indicator_name not in self._indicator_history:
+        price_history = self._indicator_history.get(price_name)
+        indicator_history = self._indicator_history.get(indicator_name)
+        if price_history is None or indicator_history is None:
             return False
 
-        price_history = self._indicator_history[price_name]
-        indicator_history = self._indicator_history[indicator_name]
-
-        if len(price_history) < lookback or len(indicator_history) < lookback:
-            return False
+        # Previous lows: last `lookback` stored values minus the newest
+        prev_price_low = price_history.rolling_min(lookback - 1, lag=1)
+        prev_indicator_low = indicator_history.rolling_min(lookback - 1, lag=1)
 
         try:
-            # Find previous low in price
-            recent_prices = price_history[-lookback:]
-            prev_price_low = min(recent_prices[:-1])  # Exclude current
-
-            # Find previous low in indicator
-            recent_indicators = indicator_history[-lookback:]
-            prev_indicator_low = min(recent_indicators[:-1])  # Exclude current
-
             # Bullish divergence: price makes lower low, indicator makes higher low
             price_lower_low = current_price < prev_price_low
             indicator_higher_low = current_indicator > prev_indicator_low
 
-            return price_lower_low and indicator_higher_low
-        except (TypeError, ValueError, IndexError):
+            return bool(price_lower_low and indicator_higher_low)
+        except (TypeError, ValueError):
             return False
 
     def _divergence_bearish(
@@ -199,32 +262,22 @@ class IndicatorBasedStrategy(TradingStrategy):
         Returns:
             True if bearish divergence detected
         """
-        if price_name not in self._indicator_history:
-            return False
-        if indicator_name not in self._indicator_history:
+        price_history = self._indicator_history.get(price_name)
+        indicator_history = self._indicator_history.get(indicator_name)
+        if price_history is None or indicator_history is None:
             return False
 
-        price_history = self._indicator_history[price_name]
-        indicator_history = self._indicator_history[indicator_name]
-
-        if len(price_history) < lookback or len(indicator_history) < lookback:
-            return False
+        # Previous highs: last `lookback` stored values minus the newest
+        prev_price_high = price_history.rolling_max(lookback - 1, lag=1)
+        prev_indicator_high = indicator_history.rolling_max(lookback - 1, lag=1)
 
         try:
-            # Find previous high in price
-            recent_prices = price_history[-lookback:]
-            prev_price_high = max(recent_prices[:-1])  # Exclude current
-
-            # Find previous high in indicator
-            recent_indicators = indicator_history[-lookback:]
-            prev_indicator_high = max(recent_indicators[:-1])  # Exclude current
-
             # Bearish divergence: price makes higher high, indicator makes lower high
             price_higher_high = current_price > prev_price_high
             indicator_lower_high = current_indicator < prev_indicator_high
 
-            return price_higher_high and indicator_lower_high
-        except (TypeError, ValueError, IndexError):
+            return bool(price_higher_high and indicator_lower_high)
+        except (TypeError, ValueError):
             return False
 
     def _crosses_above(
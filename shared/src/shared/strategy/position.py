@@ -4,14 +4,53 @@ Position Entity.
 Represents an open or closed trading position.
 """
 
+import math
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from shared.strategy.enums import PositionSide, PositionStatus
+from shared.strategy.exceptions import SnapshotError
+from shared.strategy.snapshot import POSITION, SnapshotReader, SnapshotWriter
+
+# Optional float fields, snapshotted as float64 with NaN for None
+_FLOAT_FIELDS = (
+    "entry_price",
+    "size",
+    "stop_loss",
+    "take_profit",
+    "trailing_stop",
+    "exit_price",
+    "realized_pnl",
+    "highest_price",
+    "lowest_price",
+)
 
 
 class Position:
-    """Trading position entity."""
+    """Trading position entity.
+
+    Slotted (no per-instance dict) to keep large position sets compact;
+    see PositionBook for evaluating many positions per tick.
+    """
+
+    __slots__ = (
+        "position_id",
+        "symbol",
+        "side",
+        "entry_price",
+        "size",
+        "entry_time",
+        "stop_loss",
+        "take_profit",
+        "trailing_stop",
+        "metadata",
+        "exit_price",
+        "exit_time",
+        "status",
+        "realized_pnl",
+        "highest_price",
+        "lowest_price",
+    )
 
     def __init__(
         self,
@@ -97,6 +136,69 @@ class Position:
         self.realized_pnl = self.calculate_unrealized_pnl(exit_price)
         return self.realized_pnl
 
+    def to_bytes(self) -> bytes:
+        """Snapshot all fields into a compact binary blob."""
+        writer = SnapshotWriter()
+        writer.header(POSITION, 0, 0)
+        self.write_snapshot(writer)
+        return writer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Position":
+        """
+        Restore a position from to_bytes() output.
+
+        Raises:
+            SnapshotError: If data is not a position snapshot
+        """
+        reader = SnapshotReader(data)
+        kind, _, _ = reader.header()
+        if kind != POSITION:
+            raise SnapshotError(f"Not a position snapshot (kind {kind})")
+        return cls.read_snapshot(reader)
+
+    def write_snapshot(self, writer: SnapshotWriter) -> None:
+        """Append fields to a snapshot being written."""
+        writer.string(self.position_id)
+        writer.string(self.symbol)
+        writer.string(self.side.value)
+        writer.string(self.status.value)
+        for name in _FLOAT_FIELDS:
+            value = getattr(self, name)
+            writer.f64(math.nan if value is None else value)
+        writer.value(self.entry_time)
+        writer.value(self.exit_time)
+        writer.value(self.metadata)
+
+    @classmethod
+    def read_snapshot(cls, reader: SnapshotReader) -> "Position":
+        """
+        Read fields written by write_snapshot().
+
+        Raises:
+            SnapshotError: If a field is invalid
+        """
+        position = cls.__new__(cls)
+        position.position_id = reader.string()
+        position.symbol = reader.string()
+        side, status = reader.string(), reader.string()
+        try:
+            position.side = PositionSide(side)
+            position.status = PositionStatus(status)
+        except ValueError as e:
+            raise SnapshotError(f"Invalid position in snapshot: {e}") from e
+        for name in _FLOAT_FIELDS:
+            value = reader.f64()
+            setattr(position, name, None if math.isnan(value) else value)
+        position.entry_time = reader.value()
+        position.exit_time = reader.value()
+        position.metadata = reader.value()
+        if not isinstance(position.metadata, dict):
+            raise SnapshotError(
+                f"Invalid position metadata in snapshot: {position.position_id!r}"
+            )
+        return position
+
     def __repr__(self) -> str:
         """String representation."""
         return (
@@ -0,0 +1,282 @@
+"""
+Array-backed book of open positions.
+
+Stores the price-dependent fields of many positions as parallel NumPy
+arrays (struct-of-arrays) so that trailing-stop updates and stop
+loss / take profit checks run for every position of a symbol in one
+vectorized step, with results identical to calling
+Position.update_price() followed by should_stop_loss() and
+should_take_profit() on each position.
+
+Usage:
+    book = PositionBook()
+    index = book.add(position)
+    triggers = book.update("SOL/USDC", 101.5)
+    for index in triggers.stop_loss:
+        book.close(index, 101.5, now)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+from shared.strategy.enums import PositionSide, PositionStatus
+from shared.strategy.exceptions import PositionError
+from shared.strategy.position import Position
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+@dataclass(frozen=True)
+class PositionTriggers:
+    """
+    Book indices whose exits fired on a price update.
+
+    Attributes:
+        stop_loss: Indices whose stop loss fired
+        take_profit: Indices whose take profit fired
+    """
+
+    stop_loss: np.ndarray
+    take_profit: np.ndarray
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Sorted indices where either exit fired."""
+        return np.union1d(self.stop_loss, self.take_profit)
+
+    def __len__(self) -> int:
+        """Number of positions where either exit fired."""
+        return len(self.indices)
+
+
+class PositionBook:
+    """
+    Open positions as parallel arrays, evaluated per symbol.
+
+    Each added Position gets a stable integer index (reused after the
+    position is removed). The book keeps the Position objects and
+    writes array state back into them on position()/remove()/close(),
+    so callers can still hand out ordinary Position instances.
+
+    Example:
+        >>> book = PositionBook()
+        >>> i = book.add(Position("p1", "SOL/USDC", PositionSide.LONG,
+        ...                       100.0, 1.0, now, stop_loss=95.0,
+        ...                       trailing_stop=2.0))
+        >>> book.update("SOL/USDC", 110.0).stop_loss   # stop trails to 107.8
+        array([], dtype=int64)
+        >>> book.update("SOL/USDC", 107.0).stop_loss
+        array([0])
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initialize book.
+
+        Args:
+            capacity: Initial number of rows (grows as needed)
+
+        Raises:
+            ValueError: If capacity < 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got: {capacity}")
+
+        self._capacity = capacity
+        self._long = np.zeros(capacity, dtype=bool)
+        self._stop_loss = np.full(capacity, np.nan)
+        self._take_profit = np.full(capacity, np.nan)
+        self._trailing = np.full(capacity, np.nan)
+        self._highest = np.full(capacity, np.nan)
+        self._lowest = np.full(capacity, np.nan)
+
+        self._positions: List[Optional[Position]] = [None] * capacity
+        self._free: List[int] = list(range(capacity - 1, -1, -1))
+        self._symbols: Dict[str, Dict[int, None]] = {}
+        self._rows: Dict[str, np.ndarray] = {}
+
+    def add(self, position: Position) -> int:
+        """
+        Add an open position.
+
+        Args:
+            position: Position to track
+
+        Returns:
+            Book index of the position
+
+        Raises:
+            PositionError: If the position is not open
+        """
+        if position.status != PositionStatus.OPEN:
+            raise PositionError(
+                f"Only open positions can be added, got: {position.status}"
+            )
+
+        if not self._free:
+            self._grow()
+        index = self._free.pop()
+
+        self._positions[index] = position
+        self._long[index] = position.side == PositionSide.LONG
+        self._stop_loss[index] = _or_nan(position.stop_loss)
+        self._take_profit[index] = _or_nan(position.take_profit)
+        self._trailing[index] = position.trailing_stop or np.nan
+        self._highest[index] = position.highest_price
+        self._lowest[index] = position.lowest_price
+
+        self._symbols.setdefault(position.symbol, {})[index] = None
+        self._rows.pop(position.symbol, None)
+        return index
+
+    def update(self, symbol: str, price: float) -> PositionTriggers:
+        """
+        Apply a price to every position of a symbol.
+
+        Updates highest/lowest prices and trailing stops, then checks
+        stop loss and take profit against the same price.
+
+        Args:
+            symbol: Symbol whose positions to update
+            price: Current market price
+
+        Returns:
+            PositionTriggers with the indices whose exits fired
+        """
+        rows = self.rows(symbol)
+        if not len(rows):
+            return PositionTriggers(_EMPTY, _EMPTY)
+
+        price = float(price)
+        long = self._long[rows]
+
+        # fmax/fmin skip a NaN price, as Position.update_price() does
+        highest = np.fmax(self._highest[rows], price)
+        lowest = np.fmin(self._lowest[rows], price)
+        self._highest[rows] = highest
+        self._lowest[rows] = lowest
+
+        stop = self._stop_loss[rows]
+        trailing = self._trailing[rows]
+        trails = ~np.isnan(trailing)
+        if trails.any():
+            trail_stop = np.where(
+                long, highest * (1 - trailing / 100), lowest * (1 + trailing / 100)
+            )
+            tighter = np.where(long, trail_stop > stop, trail_stop < stop)
+            stop = np.where(trails & (np.isnan(stop) | tighter), trail_stop, stop)
+            self._stop_loss[rows] = stop
+
+        target = self._take_profit[rows]
+        stop_hit = np.where(long, price <= stop, price >= stop)
+        target_hit = np.where(long, price >= target, price <= target)
+
+        return PositionTriggers(rows[stop_hit], rows[target_hit])
+
+    def rows(self, symbol: str) -> np.ndarray:
+        """Book indices of a symbol's positions, ascending."""
+        rows = self._rows.get(symbol)
+        if rows is None:
+            members = self._symbols.get(symbol, {})
+            rows = np.sort(np.fromiter(members, dtype=np.intp, count=len(members)))
+            self._rows[symbol] = rows
+        return rows
+
+    def position(self, index: int) -> Position:
+        """
+        Position at an index, with current stops and extremes.
+
+        Raises:
+            KeyError: If no position is stored at index
+        """
+        position = self._get(index)
+        self._sync(index, position)
+        return position
+
+    def remove(self, index: int) -> Position:
+        """
+        Stop tracking a position and free its index.
+
+        Raises:
+            KeyError: If no position is stored at index
+        """
+        position = self.position(index)
+        self._positions[index] = None
+        self._free.append(index)
+
+        members = self._symbols[position.symbol]
+        del members[index]
+        if not members:
+            del self._symbols[position.symbol]
+        self._rows.pop(position.symbol, None)
+        return position
+
+    def close(self, index: int, exit_price: float, exit_time: datetime) -> Position:
+        """
+        Close a position and remove it from the book.
+
+        Returns:
+            The closed Position (realized_pnl set)
+
+        Raises:
+            KeyError: If no position is stored at index
+        """
+        position = self.remove(index)
+        position.close(exit_price, exit_time)
+        return position
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols with open positions."""
+        return list(self._symbols)
+
+    def _get(self, index: int) -> Position:
+        position = self._positions[index] if 0 <= index < self._capacity else None
+        if position is None:
+            raise KeyError(f"No position at index {index}")
+        return position
+
+    def _sync(self, index: int, position: Position) -> None:
+        stop = self._stop_loss[index]
+        position.stop_loss = None if np.isnan(stop) else float(stop)
+        position.highest_price = float(self._highest[index])
+        position.lowest_price = float(self._lowest[index])
+
+    def _grow(self) -> None:
+        old = self._capacity
+        new = old * 2
+        for name in (
+            "_long",
+            "_stop_loss",
+            "_take_profit",
+            "_trailing",
+            "_highest",
+            "_lowest",
+        ):
+            array = getattr(self, name)
+            grown = np.full(new, False if array.dtype == bool else np.nan, array.dtype)
+            grown[:old] = array
+            setattr(self, name, grown)
+
+        self._positions.extend([None] * old)
+        self._free.extend(range(new - 1, old - 1, -1))
+        self._capacity = new
+
+    def __len__(self) -> int:
+        """Number of positions in the book."""
+        return self._capacity - len(self._free)
+
+    def __iter__(self) -> Iterator[int]:
+        """Indices of all positions, ascending."""
+        return (i for i, p in enumerate(self._positions) if p is not None)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"PositionBook(positions={len(self)}, symbols={len(self._symbols)})"
+
+
+def _or_nan(value: Optional[float]) -> float:
+    return np.nan if value is None else value
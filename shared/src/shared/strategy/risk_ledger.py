@@ -0,0 +1,254 @@
+"""
+Fleet-wide risk ledger.
+
+Keeps the daily PnL and risk limits of many strategies in parallel
+NumPy arrays, so that "which strategies may trade now" is one
+vectorized comparison instead of a can_trade() call per strategy.
+The trading day is advanced by an explicit clock tick (one date
+comparison for the whole fleet) instead of datetime.now() per call.
+
+Limits follow TradingStrategy: max_daily_loss blocks trading once
+daily PnL <= -abs(max_daily_loss); max_position_size caps a position's
+value as a fraction of balance; unset (None or 0) limits never block.
+
+Usage:
+    ledger = RiskLedger()
+    for strategy in strategies:
+        ledger.add(strategy)
+
+    ledger.tick(candle_time)            # rolls daily PnL at midnight
+    ledger.record("rsi_fast", -42.0)
+    mask = ledger.may_trade()           # aligned with ledger.names
+"""
+
+from datetime import date, datetime
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+from shared.strategy.base_strategy import TradingStrategy
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class RiskLedger:
+    """
+    Daily PnL and risk limits of many strategies.
+
+    Rows are assigned in add() order and never move, so masks and
+    arrays returned by the ledger are aligned with names.
+
+    Example:
+        >>> ledger = RiskLedger()
+        >>> ledger.add(TradingStrategyA("a", "SOL/USDC", "1m",
+        ...                             {"max_daily_loss": 100}))
+        0
+        >>> ledger.tick(datetime(2025, 1, 1, 9, 30))
+        True
+        >>> ledger.record("a", -150.0)
+        >>> ledger.may_trade()
+        array([False])
+        >>> ledger.tick(datetime(2025, 1, 2, 0, 0))   # new day resets PnL
+        True
+        >>> ledger.may_trade()
+        array([ True])
+    """
+
+    def __init__(self, capacity: int = 256):
+        """
+        Initialize ledger.
+
+        Args:
+            capacity: Initial number of rows (grows as needed)
+
+        Raises:
+            ValueError: If capacity < 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got: {capacity}")
+
+        self._size = 0
+        self._daily_pnl = np.zeros(capacity)
+        self._loss_floor = np.full(capacity, -np.inf)
+        self._position_fraction = np.full(capacity, np.inf)
+        self._names: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._day: Optional[date] = None
+
+    def add(self, strategy: TradingStrategy) -> int:
+        """
+        Track a strategy's limits and daily PnL.
+
+        The strategy's daily_pnl is carried over if it was last reset
+        on the ledger's current day.
+
+        Args:
+            strategy: Strategy with max_daily_loss / max_position_size
+
+        Returns:
+            Row of the strategy
+
+        Raises:
+            ValueError: If a strategy with the same name is tracked
+        """
+        if strategy.name in self._index:
+            raise ValueError(f"Duplicate strategy name: {strategy.name}")
+
+        if self._size == len(self._daily_pnl):
+            self._grow()
+        row = self._size
+        self._size += 1
+        self._names.append(strategy.name)
+        self._index[strategy.name] = row
+
+        reset = strategy.last_reset_date
+        same_day = reset is not None and reset.date() == self._day
+        self._daily_pnl[row] = strategy.daily_pnl if same_day else 0.0
+        self.set_limits(row, strategy.max_daily_loss, strategy.max_position_size)
+        return row
+
+    def set_limits(
+        self,
+        row: int,
+        max_daily_loss: Optional[float],
+        max_position_size: Optional[float],
+    ) -> None:
+        """
+        Replace the limits of a row (None or 0 disables a limit).
+
+        Raises:
+            KeyError: If row is not tracked
+        """
+        self._check(row)
+        self._loss_floor[row] = -abs(max_daily_loss) if max_daily_loss else -np.inf
+        self._position_fraction[row] = max_position_size or np.inf
+
+    def tick(self, now: datetime) -> bool:
+        """
+        Advance the ledger clock.
+
+        Args:
+            now: Current time (wall clock or candle time)
+
+        Returns:
+            True if a new day started and daily PnL was reset
+        """
+        today = now.date()
+        if today == self._day:
+            return False
+        self._day = today
+        self._daily_pnl[: self._size] = 0.0
+        return True
+
+    def record(self, name: str, pnl: float) -> None:
+        """
+        Add a closed trade's PnL to a strategy's daily PnL.
+
+        Raises:
+            KeyError: If the strategy is not tracked
+        """
+        self._daily_pnl[self.index(name)] += pnl
+
+    def record_many(self, rows: np.ndarray, pnl: np.ndarray) -> None:
+        """
+        Add many trades' PnL at once (rows may repeat).
+
+        Args:
+            rows: Row per trade
+            pnl: PnL per trade
+
+        Raises:
+            KeyError: If a row is not tracked
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        if len(rows) and (rows.min() < 0 or rows.max() >= self._size):
+            raise KeyError(f"Rows out of range 0..{self._size - 1}")
+        np.add.at(self._daily_pnl, rows, pnl)
+
+    def may_trade(self) -> np.ndarray:
+        """
+        Boolean mask of strategies within their daily loss limit.
+
+        Equivalent to can_trade() of every strategy on the current day.
+        """
+        size = self._size
+        return self._daily_pnl[:size] > self._loss_floor[:size]
+
+    def max_position_value(self, balance: ArrayLike) -> np.ndarray:
+        """
+        Largest position value each strategy may open.
+
+        Args:
+            balance: Balance in quote currency (scalar or per strategy)
+
+        Returns:
+            Value per strategy (inf without a limit)
+        """
+        fraction = self._position_fraction[: self._size]
+        limited = np.isfinite(fraction)
+        balance = np.asarray(balance, dtype=np.float64)
+        return np.where(limited, balance * np.where(limited, fraction, 0.0), np.inf)
+
+    def within_position_limit(self, value: ArrayLike, balance: ArrayLike) -> np.ndarray:
+        """
+        Mask of position values allowed by max_position_size.
+
+        Matches calculate_position_size() not raising RiskLimitError.
+
+        Args:
+            value: Position value per strategy (size * price)
+            balance: Balance in quote currency (scalar or per strategy)
+        """
+        return np.asarray(value, dtype=np.float64) <= self.max_position_value(balance)
+
+    def index(self, name: str) -> int:
+        """
+        Row of a strategy.
+
+        Raises:
+            KeyError: If the strategy is not tracked
+        """
+        try:
+            return self._index[name]
+        except KeyError:
+            raise KeyError(f"Strategy not in ledger: {name}") from None
+
+    @property
+    def names(self) -> List[str]:
+        """Strategy names in row order."""
+        return list(self._names)
+
+    @property
+    def daily_pnl(self) -> np.ndarray:
+        """Daily PnL per strategy (read-only view)."""
+        view = self._daily_pnl[: self._size]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def day(self) -> Optional[date]:
+        """Current trading day (None before the first tick)."""
+        return self._day
+
+    def _check(self, row: int) -> None:
+        if not 0 <= row < self._size:
+            raise KeyError(f"No strategy at row {row}")
+
+    def _grow(self) -> None:
+        old = len(self._daily_pnl)
+        for name, fill in (
+            ("_daily_pnl", 0.0),
+            ("_loss_floor", -np.inf),
+            ("_position_fraction", np.inf),
+        ):
+            grown = np.full(old * 2, fill)
+            grown[:old] = getattr(self, name)
+            setattr(self, name, grown)
+
+    def __len__(self) -> int:
+        """Number of tracked strategies."""
+        return self._size
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"RiskLedger(strategies={self._size}, day={self._day})"
@@ -0,0 +1,263 @@
+"""
+Binary codec for strategy state snapshots.
+
+Little-endian, length-prefixed encoding used by
+TradingStrategy.snapshot() and Position.to_bytes(). Fixed fields are
+packed with struct, float arrays are written as raw float64 bytes, and
+free-form values (indicator values, metadata, timestamps) use a small
+tagged encoding. Every snapshot ends with a CRC32 of the preceding
+bytes, checked when the header is read.
+
+    N None    T/F bool    i int64    f float64    s str    b bytes
+    d datetime (ISO 8601)    l list/tuple    m dict (str keys)
+
+Usage:
+    writer = SnapshotWriter()
+    writer.string("SOL/USDC")
+    writer.value({"RSI": 41.5, "trend": "up"})
+    blob = writer.getvalue()
+
+    reader = SnapshotReader(blob)
+    reader.string(), reader.value()
+"""
+
+import struct
+import sys
+import zlib
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, List
+
+from shared.strategy.exceptions import SnapshotError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+MAGIC = b"LMSS"
+VERSION = 2
+
+# Snapshot kinds
+FULL = 0
+INCREMENTAL = 1
+POSITION = 2
+
+_U8 = struct.Struct("<B")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_HEADER = struct.Struct("<4sBBQQ")
+
+
+class SnapshotWriter:
+    """Appends encoded fields to a growing buffer."""
+
+    def __init__(self):
+        """Initialize empty writer."""
+        self._parts: List[bytes] = []
+
+    def header(self, kind: int, sequence: int, base: int) -> None:
+        """Write magic, version, kind and sequence numbers."""
+        self._parts.append(_HEADER.pack(MAGIC, VERSION, kind, sequence, base))
+
+    def u8(self, value: int) -> None:
+        self._parts.append(_U8.pack(value))
+
+    def u32(self, value: int) -> None:
+        self._parts.append(_U32.pack(value))
+
+    def u64(self, value: int) -> None:
+        self._parts.append(_U64.pack(value))
+
+    def f64(self, value: float) -> None:
+        self._parts.append(_F64.pack(value))
+
+    def string(self, value: str) -> None:
+        self.blob(value.encode("utf-8"))
+
+    def blob(self, value: bytes) -> None:
+        self._parts.append(_U32.pack(len(value)))
+        self._parts.append(value)
+
+    def floats(self, values: "np.ndarray") -> None:
+        """Write a float64 array (count + raw values)."""
+        import numpy as np
+
+        values = np.ascontiguousarray(values, dtype="<f8")
+        self._parts.append(_U32.pack(len(values)))
+        self._parts.append(values.tobytes())
+
+    def value(self, value: Any) -> None:
+        """
+        Write a tagged value.
+
+        Raises:
+            SnapshotError: If the value (or a nested one) is unsupported
+        """
+        parts = self._parts
+        if value is None:
+            parts.append(b"N")
+        elif value is True or value is False:
+            parts.append(b"T" if value else b"F")
+        elif isinstance(value, int):
+            try:
+                parts.append(b"i" + _I64.pack(value))
+            except struct.error:
+                raise SnapshotError(f"Integer out of int64 range: {value}") from None
+        elif isinstance(value, float):
+            parts.append(b"f" + _F64.pack(value))
+        elif isinstance(value, str):
+            parts.append(b"s")
+            self.string(value)
+        elif isinstance(value, (bytes, bytearray)):
+            parts.append(b"b")
+            self.blob(bytes(value))
+        elif isinstance(value, datetime):
+            parts.append(b"d")
+            # Base-class isoformat: pandas Timestamps would add nanoseconds
+            self.string(datetime.isoformat(value))
+        elif isinstance(value, (list, tuple)):
+            parts.append(b"l" + _U32.pack(len(value)))
+            for item in value:
+                self.value(item)
+        elif isinstance(value, dict):
+            parts.append(b"m" + _U32.pack(len(value)))
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise SnapshotError(f"Dict keys must be str, got: {key!r}")
+                self.string(key)
+                self.value(item)
+        elif _is_numpy_scalar(value):
+            self.value(value.item())
+        else:
+            raise SnapshotError(f"Cannot snapshot value of type {type(value).__name__}")
+
+    def getvalue(self) -> bytes:
+        """Encoded bytes, followed by their CRC32."""
+        body = b"".join(self._parts)
+        return body + _U32.pack(zlib.crc32(body))
+
+
+class SnapshotReader:
+    """Reads fields written by SnapshotWriter, in the same order."""
+
+    def __init__(self, data: bytes):
+        """
+        Initialize reader.
+
+        Args:
+            data: Encoded bytes
+        """
+        self._data = memoryview(data)
+        self._offset = 0
+
+    def header(self) -> tuple:
+        """
+        Read and check the header and the CRC32 trailer.
+
+        Must be read first; the trailer is excluded from later fields.
+
+        Returns:
+            (kind, sequence, base)
+
+        Raises:
+            SnapshotError: If magic, version or checksum do not match
+        """
+        magic, version, kind, sequence, base = self._unpack(_HEADER)
+        if magic != MAGIC:
+            raise SnapshotError("Not a strategy snapshot")
+        if version != VERSION:
+            raise SnapshotError(f"Unsupported snapshot version: {version}")
+
+        end = len(self._data) - _U32.size
+        if end < self._offset:
+            raise SnapshotError("Snapshot is truncated")
+        (checksum,) = _U32.unpack(self._data[end:])
+        if zlib.crc32(self._data[:end]) != checksum:
+            raise SnapshotError("Snapshot checksum mismatch")
+        self._data = self._data[:end]
+        return kind, sequence, base
+
+    def u8(self) -> int:
+        return self._unpack(_U8)[0]
+
+    def u32(self) -> int:
+        return self._unpack(_U32)[0]
+
+    def u64(self) -> int:
+        return self._unpack(_U64)[0]
+
+    def f64(self) -> float:
+        return self._unpack(_F64)[0]
+
+    def string(self) -> str:
+        try:
+            return self.blob().decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise SnapshotError(f"Invalid string in snapshot: {e}") from e
+
+    def blob(self) -> bytes:
+        return self._take(self.u32()).tobytes()
+
+    def floats(self) -> "np.ndarray":
+        """Read a float64 array (copy)."""
+        import numpy as np
+
+        count = self.u32()
+        return np.frombuffer(self._take(count * 8), dtype="<f8").astype(np.float64)
+
+    def value(self) -> Any:
+        """
+        Read a tagged value.
+
+        Raises:
+            SnapshotError: If the tag or an encoded value is invalid
+        """
+        tag = self._take(1).tobytes()
+        if tag == b"N":
+            return None
+        if tag == b"T":
+            return True
+        if tag == b"F":
+            return False
+        if tag == b"i":
+            return self._unpack(_I64)[0]
+        if tag == b"f":
+            return self.f64()
+        if tag == b"s":
+            return self.string()
+        if tag == b"b":
+            return self.blob()
+        if tag == b"d":
+            text = self.string()
+            try:
+                return datetime.fromisoformat(text)
+            except ValueError as e:
+                raise SnapshotError(f"Invalid timestamp in snapshot: {text!r}") from e
+        if tag == b"l":
+            return [self.value() for _ in range(self.u32())]
+        if tag == b"m":
+            count = self.u32()
+            return {self.string(): self.value() for _ in range(count)}
+        raise SnapshotError(f"Unknown value tag: {tag!r}")
+
+    @property
+    def done(self) -> bool:
+        """All bytes consumed."""
+        return self._offset == len(self._data)
+
+    def _unpack(self, fmt: struct.Struct) -> tuple:
+        return fmt.unpack(self._take(fmt.size))
+
+    def _take(self, size: int) -> memoryview:
+        end = self._offset + size
+        if end > len(self._data):
+            raise SnapshotError("Snapshot is truncated")
+        view = self._data[self._offset : end]
+        self._offset = end
+        return view
+
+
+def _is_numpy_scalar(value: Any) -> bool:
+    """NumPy scalar check that does not import numpy."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.generic)
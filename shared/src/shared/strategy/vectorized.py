@@ -0,0 +1,227 @@
+"""
+Vectorized condition operators for backtesting.
+
+Evaluates the IndicatorBasedStrategy operators (rising, rising_for,
+highest, divergence, crosses, ...) over whole indicator series at once.
+Each operator returns a boolean array whose element t equals what the
+bar-by-bar helper returns at bar t, i.e. when called with the bar's
+values before _update_previous_values() stores them:
+
+- previous value: the value at t-1 (False at t=0)
+- history: values t-H..t-1, where H is the strategy's
+  _max_history_length (windows longer than H are never satisfied)
+
+NaN behaves as in IndicatorHistory: it never compares true, never
+counts as a rising/falling step and blanks any window containing it.
+"""
+
+from typing import Mapping, Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[pd.Series, np.ndarray]
+
+
+def _shift(values: np.ndarray, periods: int = 1) -> np.ndarray:
+    """Shift forward by periods, filling with NaN."""
+    shifted = np.full(len(values), np.nan)
+    if periods < len(values):
+        shifted[periods:] = values[: len(values) - periods]
+    return shifted
+
+
+def _run_lengths(steps: np.ndarray) -> np.ndarray:
+    """Length of the run of True ending at each position (steps[0] ignored)."""
+    positions = np.arange(len(steps))
+    resets = np.where(steps, 0, positions)
+    if len(resets):
+        resets[0] = 0
+    return positions - np.maximum.accumulate(resets)
+
+
+class VectorizedOperators:
+    """
+    Condition operators over whole indicator series.
+
+    Example:
+        >>> ops = VectorizedOperators(indicators_df, history_length=100)
+        >>> entry = ops.crosses_above("EMA_FAST", "EMA_SLOW") & ~ops.is_falling(
+        ...     "RSI"
+        ... )
+        >>> exit_ = ops.crosses_below_threshold("RSI", 30.0)
+    """
+
+    def __init__(
+        self,
+        indicators: Union[pd.DataFrame, Mapping[str, ArrayLike]],
+        history_length: int = 100,
+    ):
+        """
+        Initialize operators.
+
+        Args:
+            indicators: Indicator values per name, one row per bar
+            history_length: History capacity of the bar-by-bar strategy
+                (TradingStrategy._max_history_length)
+
+        Raises:
+            ValueError: If series lengths differ or history_length < 1
+        """
+        if history_length < 1:
+            raise ValueError(f"history_length must be >= 1, got: {history_length}")
+
+        if isinstance(indicators, pd.DataFrame):
+            self.index = indicators.index
+            columns = {name: indicators[name] for name in indicators.columns}
+        else:
+            columns = dict(indicators)
+            first = next(iter(columns.values()), None)
+            self.index = first.index if isinstance(first, pd.Series) else None
+
+        self._values = {
+            name: np.asarray(values, dtype=np.float64)
+            for name, values in columns.items()
+        }
+        lengths = {len(values) for values in self._values.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Indicator series lengths differ: {sorted(lengths)}")
+
+        self.length = lengths.pop() if lengths else 0
+        self.history_length = history_length
+        self._cache: dict = {}
+
+    def value(self, name: str) -> np.ndarray:
+        """
+        Values of an indicator as float64.
+
+        Raises:
+            KeyError: If indicator is missing
+        """
+        try:
+            return self._values[name]
+        except KeyError:
+            raise KeyError(f"Indicator '{name}' not found in series")
+
+    def previous(self, name: str) -> np.ndarray:
+        """Values at t-1 (NaN at t=0)."""
+        return self._cached(("previous", name), lambda: _shift(self.value(name)))
+
+    def _cached(self, key: tuple, compute) -> np.ndarray:
+        result = self._cache.get(key)
+        if result is None:
+            result = compute()
+            self._cache[key] = result
+        return result
+
+    def _false(self) -> np.ndarray:
+        return np.zeros(self.length, dtype=bool)
+
+    def _window(self, name: str, window: int, lag: int, mode: str) -> np.ndarray:
+        """Extremum of history values t-lag-window..t-lag-1 (NaN if unavailable)."""
+
+        def compute() -> np.ndarray:
+            rolling = pd.Series(self.value(name)).rolling(window, min_periods=window)
+            extremum = rolling.max() if mode == "max" else rolling.min()
+            return _shift(extremum.to_numpy(), lag + 1)
+
+        return self._cached(("window", name, window, lag, mode), compute)
+
+    # Trend operators
+
+    def is_rising(self, name: str) -> np.ndarray:
+        """Current value > previous value."""
+        return self.value(name) > self.previous(name)
+
+    def is_falling(self, name: str) -> np.ndarray:
+        """Current value < previous value."""
+        return self.value(name) < self.previous(name)
+
+    def is_rising_for(self, name: str, periods: int) -> np.ndarray:
+        """Stored history has risen strictly for the last `periods` steps."""
+        return self._sustained(name, periods, rising=True)
+
+    def is_falling_for(self, name: str, periods: int) -> np.ndarray:
+        """Stored history has fallen strictly for the last `periods` steps."""
+        return self._sustained(name, periods, rising=False)
+
+    def _sustained(self, name: str, periods: int, rising: bool) -> np.ndarray:
+        if periods + 1 > self.history_length:
+            return self._false()
+
+        values = self.value(name)
+        previous = self.previous(name)
+        steps = values > previous if rising else values < previous
+
+        # Run ending at t-1, over history that holds at least periods+1 values
+        runs = _shift(_run_lengths(steps).astype(np.float64))
+        result = runs >= periods
+        result[: periods + 1] = False
+        return result
+
+    def is_highest(self, name: str, periods: int) -> np.ndarray:
+        """Current value equals the max of the last `periods` stored values."""
+        if not 1 <= periods <= self.history_length:
+            return self._false()
+        return self.value(name) == self._window(name, periods, 0, "max")
+
+    def is_lowest(self, name: str, periods: int) -> np.ndarray:
+        """Current value equals the min of the last `periods` stored values."""
+        if not 1 <= periods <= self.history_length:
+            return self._false()
+        return self.value(name) == self._window(name, periods, 0, "min")
+
+    # Divergence operators
+
+    def divergence_bullish(
+        self, price_name: str, indicator_name: str, lookback: int = 14
+    ) -> np.ndarray:
+        """Price below its previous low while indicator is above its own."""
+        if not 2 <= lookback <= self.history_length:
+            return self._false()
+
+        price_low = self._window(price_name, lookback - 1, 1, "min")
+        indicator_low = self._window(indicator_name, lookback - 1, 1, "min")
+        return (self.value(price_name) < price_low) & (
+            self.value(indicator_name) > indicator_low
+        )
+
+    def divergence_bearish(
+        self, price_name: str, indicator_name: str, lookback: int = 14
+    ) -> np.ndarray:
+        """Price above its previous high while indicator is below its own."""
+        if not 2 <= lookback <= self.history_length:
+            return self._false()
+
+        price_high = self._window(price_name, lookback - 1, 1, "max")
+        indicator_high = self._window(indicator_name, lookback - 1, 1, "max")
+        return (self.value(price_name) > price_high) & (
+            self.value(indicator_name) < indicator_high
+        )
+
+    # Crossover operators
+
+    def crosses_above(self, left_name: str, right_name: str) -> np.ndarray:
+        """Left was <= right on the previous bar and is > right now."""
+        was_below = self.previous(left_name) <= self.previous(right_name)
+        return was_below & (self.value(left_name) > self.value(right_name))
+
+    def crosses_below(self, left_name: str, right_name: str) -> np.ndarray:
+        """Left was >= right on the previous bar and is < right now."""
+        was_above = self.previous(left_name) >= self.previous(right_name)
+        return was_above & (self.value(left_name) < self.value(right_name))
+
+    def crosses_above_threshold(self, name: str, threshold: float) -> np.ndarray:
+        """Value was <= threshold on the previous bar and is > threshold now."""
+        return (self.previous(name) <= threshold) & (self.value(name) > threshold)
+
+    def crosses_below_threshold(self, name: str, threshold: float) -> np.ndarray:
+        """Value was >= threshold on the previous bar and is < threshold now."""
+        return (self.previous(name) >= threshold) & (self.value(name) < threshold)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"VectorizedOperators(indicators={list(self._values)}, "
+            f"bars={self.length}, history_length={self.history_length})"
+        )
@@ -0,0 +1,113 @@
+"""
+Benchmark: backtest engine throughput in bars per second.
+
+Runs an EMA crossover strategy with an RSI filter through
+BacktestEngine for several history lengths, then a small parameter
+sweep inline and over a process pool.
+
+Usage:
+    python tests/benchmarks/bench_backtest.py
+    python tests/benchmarks/bench_backtest.py --bars 10000 100000 --workers 4
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Sequence
+
+from shared.backtest import BacktestConfig, BacktestEngine, expand_grid
+from shared.indicators import EMAIndicator, RSIIndicator
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests.fixtures import generate_candles
+
+GRID = {"fast": [5, 8, 12], "slow": [21, 34]}
+
+
+class _Strategy(IndicatorBasedStrategy):
+    def check_entry_conditions(self, market_data):
+        ind = market_data["indicators"]
+        return (
+            self._crosses_above("FAST", "SLOW", ind["FAST"], ind["SLOW"])
+            and ind["RSI"] < 70
+        )
+
+    def check_exit_conditions(self, position, market_data):
+        ind = market_data["indicators"]
+        return self._crosses_below("FAST", "SLOW", ind["FAST"], ind["SLOW"])
+
+
+def _indicators(params: Dict[str, Any]):
+    return {
+        "FAST": EMAIndicator(period=params.get("fast", 8)),
+        "SLOW": EMAIndicator(period=params.get("slow", 21)),
+        "RSI": RSIIndicator(period=14),
+    }
+
+
+def run_benchmark(
+    bar_counts: Sequence[int] = (10_000, 100_000), workers: int = 2
+) -> List[Dict[str, Any]]:
+    """
+    Measure single-run and sweep throughput.
+
+    Args:
+        bar_counts: History lengths for single runs
+        workers: Worker processes for the parallel sweep
+
+    Returns:
+        List of result dicts (mode, bars, runs, seconds, bars_per_second)
+    """
+    engine = BacktestEngine(BacktestConfig(stop_loss_pct=2.0, warmup=50))
+    results = []
+    for bars in bar_counts:
+        candles = generate_candles(bars)
+        start = time.perf_counter()
+        engine.run(_Strategy("bench", "SOL/USDC", "1m"), _indicators({}), candles)
+        seconds = time.perf_counter() - start
+        results.append(
+            {
+                "mode": "run",
+                "bars": bars,
+                "runs": 1,
+                "seconds": seconds,
+                "bars_per_second": bars / seconds,
+            }
+        )
+
+    bars = bar_counts[-1]
+    candles = generate_candles(bars)
+    runs = len(expand_grid(GRID))
+    for n in (0, workers):
+        start = time.perf_counter()
+        engine.sweep(_Strategy, GRID, _indicators, candles, "SOL/USDC", "1m", n)
+        seconds = time.perf_counter() - start
+        results.append(
+            {
+                "mode": f"sweep (workers={n})",
+                "bars": bars,
+                "runs": runs,
+                "seconds": seconds,
+                "bars_per_second": bars * runs / seconds,
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.bars, args.workers)
+
+    print(f"{'mode':>20}{'bars':>10}{'runs':>6}{'seconds':>10}{'bars/s':>12}")
+    for r in results:
+        print(
+            f"{r['mode']:>20}{r['bars']:>10}{r['runs']:>6}{r['seconds']:>10.2f}"
+            f"{r['bars_per_second']:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark: BatchIndicatorEngine vs per-symbol calculate() loop.
+
+Computes EMA, RSI, ATR, ADX, MACD and Bollinger Bands for many symbols,
+once through the vectorized engine and once by calling each indicator's
+calculate() per symbol DataFrame.
+
+Usage:
+    python tests/benchmarks/bench_batch.py
+    python tests/benchmarks/bench_batch.py --symbols 500 --bars 10000
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from shared.indicators import (
+    ADXIndicator,
+    ATRIndicator,
+    BatchIndicatorEngine,
+    BollingerBandsIndicator,
+    EMAIndicator,
+    MACDIndicator,
+    RSIIndicator,
+)
+from shared.tests.fixtures import generate_candles
+
+
+def _indicators() -> List[Any]:
+    """Indicator set evaluated for every symbol."""
+    return [
+        EMAIndicator(period=12),
+        RSIIndicator(period=14),
+        ATRIndicator(period=14),
+        ADXIndicator(period=14),
+        MACDIndicator(),
+        BollingerBandsIndicator(period=20),
+    ]
+
+
+def run_benchmark(symbols: int = 200, bars: int = 5_000) -> List[Dict[str, Any]]:
+    """
+    Time batch engine and per-symbol loop for each indicator.
+
+    Args:
+        symbols: Number of symbols
+        bars: Bars per symbol
+
+    Returns:
+        List of result dicts (indicator, loop_ms, batch_ms, speedup)
+    """
+    frames = {f"SYM{i}": generate_candles(bars, seed=i) for i in range(symbols)}
+
+    start = time.perf_counter()
+    engine = BatchIndicatorEngine.from_frames(frames)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    results = []
+    for indicator in _indicators():
+        start = time.perf_counter()
+        for df in frames.values():
+            indicator.calculate(df)
+        loop_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        engine.calculate(indicator)
+        batch_ms = (time.perf_counter() - start) * 1e3
+
+        results.append(
+            {
+                "indicator": indicator.__class__.__name__,
+                "loop_ms": loop_ms,
+                "batch_ms": batch_ms,
+                "speedup": loop_ms / batch_ms,
+            }
+        )
+
+    results.append(
+        {
+            "indicator": "(block build)",
+            "loop_ms": 0.0,
+            "batch_ms": build_ms,
+            "speedup": 0.0,
+        }
+    )
+
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=200)
+    parser.add_argument("--bars", type=int, default=5_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.symbols, args.bars)
+
+    print(f"{args.symbols} symbols x {args.bars} bars")
+    print(f"{'indicator':<26}{'loop (ms)':>12}{'batch (ms)':>12}{'speedup':>10}")
+    for r in results:
+        speedup = f"{r['speedup']:>9.1f}x" if r["speedup"] else f"{'':>10}"
+        print(
+            f"{r['indicator']:<26}{r['loop_ms']:>12.1f}"
+            f"{r['batch_ms']:>12.1f}{speedup}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark: compiled condition plans vs interpreted strategy helpers.
+
+Simulates a generated strategy with a growing number of indicators,
+evaluating entry/exit conditions and storing values on every bar: once
+the way generated code does it (dict lookups, helper calls,
+_update_previous_values with a dict copy) and once with
+CompiledConditions.step() over slot-ordered rows.
+
+Usage:
+    python tests/benchmarks/bench_compiled_conditions.py
+    python tests/benchmarks/bench_compiled_conditions.py --indicators 8 32 --bars 5000
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from shared.strategy import CompiledConditions
+from shared.strategy import conditions as c
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+
+
+def _names(count: int) -> List[str]:
+    return [f"IND_{i}" for i in range(count)]
+
+
+def _trees(names: List[str]) -> Tuple[c.Condition, c.Condition]:
+    pairs = list(zip(names[::2], names[1::2]))
+    entry = c.all_of(
+        c.any_of(*(c.crosses_above(a, b) for a, b in pairs)),
+        *(c.compare(name, ">", -50.0) for name in names),
+        c.rising_for(names[0], 3),
+    )
+    exit_ = c.any_of(
+        *(c.crosses_below(a, b) for a, b in pairs), c.highest(names[-1], 20)
+    )
+    return entry, exit_
+
+
+class _Interpreted(IndicatorBasedStrategy):
+    """Hand-written equivalent of the generated check methods."""
+
+    def __init__(self, names: List[str]):
+        super().__init__("bench", "SOL/USDC", "1m")
+        self.names = names
+        self.pairs = list(zip(names[::2], names[1::2]))
+
+    def check_entry_conditions(self, market_data: Dict[str, Any]) -> bool:
+        indicators = market_data["indicators"]
+        return (
+            any(
+                self._crosses_above(a, b, indicators[a], indicators[b])
+                for a, b in self.pairs
+            )
+            and all(indicators[name] > -50.0 for name in self.names)
+            and self._is_rising_for(self.names[0], indicators[self.names[0]], 3)
+        )
+
+    def check_exit_conditions(self, position, market_data: Dict[str, Any]) -> bool:
+        indicators = market_data["indicators"]
+        last = self.names[-1]
+        return any(
+            self._crosses_below(a, b, indicators[a], indicators[b])
+            for a, b in self.pairs
+        ) or self._is_highest(last, indicators[last], 20)
+
+
+def _run_interpreted(rows: List[Dict[str, float]], names: List[str]) -> List[Tuple]:
+    strategy = _Interpreted(names)
+    signals = []
+    for indicators in rows:
+        market_data = {"indicators": indicators}
+        signals.append(
+            (
+                strategy.check_entry_conditions(market_data),
+                strategy.check_exit_conditions(None, market_data),
+            )
+        )
+        strategy._update_previous_values(indicators)
+    return signals
+
+
+def _run_compiled(matrix: np.ndarray, names: List[str]) -> List[Tuple]:
+    compiled = CompiledConditions(*_trees(names), names=names)
+    step = compiled.step
+    return [step(row) for row in matrix.tolist()]
+
+
+def run_benchmark(
+    counts: Sequence[int] = (4, 16, 64), bars: int = 5_000
+) -> List[Dict[str, Any]]:
+    """
+    Time per-bar condition evaluation for each indicator count.
+
+    Args:
+        counts: Indicators per strategy
+        bars: Bars simulated
+
+    Returns:
+        List of result dicts (indicators, interpreted_us, compiled_us, speedup)
+    """
+    rng = np.random.default_rng(0)
+    results = []
+    for count in counts:
+        names = _names(count)
+        matrix = np.cumsum(rng.normal(size=(bars, count)), axis=0)
+        rows = [dict(zip(names, row)) for row in matrix.tolist()]
+
+        timings = {}
+        outputs = {}
+        for label, fn, data in (
+            ("interpreted", _run_interpreted, rows),
+            ("compiled", _run_compiled, matrix),
+        ):
+            start = time.perf_counter()
+            outputs[label] = fn(data, names)
+            timings[label] = (time.perf_counter() - start) * 1e6 / bars
+
+        if outputs["interpreted"] != outputs["compiled"]:
+            raise AssertionError(f"Signals differ at {count} indicators")
+
+        results.append(
+            {
+                "indicators": count,
+                "interpreted_us": timings["interpreted"],
+                "compiled_us": timings["compiled"],
+                "speedup": timings["interpreted"] / timings["compiled"],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--indicators", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--bars", type=int, default=5_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.indicators, args.bars)
+
+    print(f"{args.bars} bars")
+    print(
+        f"{'indicators':>11}{'interpreted (us/bar)':>22}"
+        f"{'compiled (us/bar)':>19}{'speedup':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['indicators']:>11}{r['interpreted_us']:>22.1f}"
+            f"{r['compiled_us']:>19.1f}{r['speedup']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Benchmark: StrategyFleet vs evaluating strategies one by one.
+
+Simulates a fleet of crossover strategies on a few symbols, drawn from
+a small parameter grid so that many share indicators. Each tick, the
+naive loop computes every strategy's indicators itself; the fleet
+computes each distinct indicator once per (symbol, timeframe) group and
+evaluates conditions inline or across worker processes.
+
+Usage:
+    python tests/benchmarks/bench_fleet.py
+    python tests/benchmarks/bench_fleet.py --strategies 100 1000 --workers 0 4
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import EMAIndicator, RSIIndicator
+from shared.strategy import StrategyFleet
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+
+SYMBOLS = ["SOL/USDC", "BTC/USDC", "ETH/USDC", "JUP/USDC"]
+FAST = (5, 8, 12)
+SLOW = (20, 26, 50)
+
+
+class _Strategy(IndicatorBasedStrategy):
+    def check_entry_conditions(self, market_data):
+        ind = market_data["indicators"]
+        return (
+            self._crosses_above("FAST", "SLOW", ind["FAST"], ind["SLOW"])
+            and ind["RSI"] < 70
+        )
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+def _fleet_spec(count: int) -> List[tuple]:
+    spec = []
+    for i in range(count):
+        fast, slow = FAST[i % len(FAST)], SLOW[(i // len(FAST)) % len(SLOW)]
+        strategy = _Strategy(f"s{i}", SYMBOLS[i % len(SYMBOLS)], "1m")
+        indicators = {
+            "FAST": EMAIndicator(period=fast),
+            "SLOW": EMAIndicator(period=slow),
+            "RSI": RSIIndicator(period=14),
+        }
+        spec.append((strategy, indicators))
+    return spec
+
+
+def _frames(bars: int) -> Dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(0)
+    frames = {}
+    for symbol in SYMBOLS:
+        close = 100 + np.cumsum(rng.normal(size=bars))
+        frames[symbol] = pd.DataFrame(
+            {"open": close, "high": close + 1, "low": close - 1, "close": close}
+        )
+    return frames
+
+
+def _run_naive(count: int, frames, window: int, ticks: int) -> float:
+    spec = _fleet_spec(count)
+    start = time.perf_counter()
+    for t in range(ticks):
+        for symbol, df in frames.items():
+            candles = df.iloc[t : t + window]
+            for strategy, indicators in spec:
+                if strategy.symbol != symbol:
+                    continue
+                values = {
+                    name: float(ind.calculate(candles).iloc[-1])
+                    for name, ind in indicators.items()
+                }
+                strategy.check_entry_conditions({"indicators": values})
+                strategy._update_previous_values(values)
+    return time.perf_counter() - start
+
+
+def _run_fleet(count: int, frames, window: int, ticks: int, workers: int) -> float:
+    fleet = StrategyFleet(workers=workers)
+    for strategy, indicators in _fleet_spec(count):
+        fleet.add(strategy, indicators)
+    with fleet:
+        start = time.perf_counter()
+        for t in range(ticks):
+            for symbol, df in frames.items():
+                fleet.tick(symbol, "1m", df.iloc[t : t + window])
+        return time.perf_counter() - start
+
+
+def run_benchmark(
+    counts: Sequence[int] = (100, 1_000),
+    workers: Sequence[int] = (0, 2),
+    window: int = 300,
+    ticks: int = 5,
+) -> List[Dict[str, Any]]:
+    """
+    Time per-tick evaluation of all symbols.
+
+    Args:
+        counts: Fleet sizes
+        workers: Worker process counts to run the fleet with
+        window: Candles passed per tick
+        ticks: Ticks simulated
+
+    Returns:
+        List of result dicts (strategies, mode, tick_ms, speedup)
+    """
+    frames = _frames(window + ticks)
+    results = []
+    for count in counts:
+        naive_ms = _run_naive(count, frames, window, ticks) * 1000 / ticks
+        results.append(
+            {"strategies": count, "mode": "naive", "tick_ms": naive_ms, "speedup": 1.0}
+        )
+        for n in workers:
+            tick_ms = _run_fleet(count, frames, window, ticks, n) * 1000 / ticks
+            results.append(
+                {
+                    "strategies": count,
+                    "mode": f"fleet (workers={n})",
+                    "tick_ms": tick_ms,
+                    "speedup": naive_ms / tick_ms,
+                }
+            )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--strategies", type=int, nargs="+", default=[100, 1_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2])
+    parser.add_argument("--window", type=int, default=300)
+    parser.add_argument("--ticks", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.strategies, args.workers, args.window, args.ticks)
+
+    print(f"{len(SYMBOLS)} symbols, {args.window} candles per tick")
+    print(f"{'strategies':>11}{'mode':>22}{'tick (ms)':>12}{'speedup':>10}")
+    for r in results:
+        print(
+            f"{r['strategies']:>11}{r['mode']:>22}{r['tick_ms']:>12.1f}"
+            f"{r['speedup']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
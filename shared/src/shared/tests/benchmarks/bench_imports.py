@@ -0,0 +1,104 @@
+"""
+Benchmark: cold import time of the shared packages.
+
+Runs each import statement in a fresh interpreter (best of N runs) and
+reports wall time plus whether pandas was pulled in, including the
+time to spawn a multiprocessing worker that imports Position. Compare
+against a checkout before lazy exports to see the difference.
+
+Usage:
+    python tests/benchmarks/bench_imports.py
+    python tests/benchmarks/bench_imports.py --runs 10
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from typing import Any, Dict, List, Sequence
+
+STATEMENTS = [
+    "import shared",
+    "import shared.strategy",
+    "from shared.strategy import Position, PositionSide",
+    "from shared.strategy import TradingStrategy",
+    "from shared.indicators import RSIIndicator",
+    "import shared.resilience",
+]
+
+# Times one statement inside the child interpreter
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({{"ms": elapsed, "pandas": "pandas" in sys.modules}}))
+"""
+
+# Spawns a worker that imports Position (builtin exec as a picklable target)
+_SPAWN = """
+import json, multiprocessing, time
+context = multiprocessing.get_context("spawn")
+start = time.perf_counter()
+process = context.Process(target=exec, args=("from shared.strategy import Position",))
+process.start()
+process.join()
+elapsed = (time.perf_counter() - start) * 1000
+assert process.exitcode == 0, process.exitcode
+print(json.dumps({"ms": elapsed, "pandas": None}))
+"""
+
+
+def _run(code: str) -> Dict[str, Any]:
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(
+    statements: Sequence[str] = STATEMENTS, runs: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Time each import statement in fresh interpreters.
+
+    Args:
+        statements: Import statements to time
+        runs: Fresh interpreters per statement (best run reported)
+
+    Returns:
+        List of result dicts (statement, ms, pandas; pandas is None for the spawn case)
+    """
+    cases = [(s, _PROBE.format(statement=s)) for s in statements]
+    cases.append(("spawn worker + Position", _SPAWN))
+
+    results = []
+    for label, code in cases:
+        samples = [_run(code) for _ in range(runs)]
+        results.append(
+            {
+                "statement": label,
+                "ms": min(sample["ms"] for sample in samples),
+                "pandas": samples[0]["pandas"],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run_benchmark(runs=args.runs)
+
+    print(f"best of {args.runs} fresh interpreters")
+    print(f"{'statement':<52}{'ms':>10}{'pandas':>8}")
+    for r in results:
+        pandas = {True: "yes", False: "no", None: "-"}[r["pandas"]]
+        print(f"{r['statement']:<52}{r['ms']:>10.1f}{pandas:>8}")
+
+
+if __name__ == "__main__":
+    main()
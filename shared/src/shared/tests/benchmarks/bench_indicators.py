@@ -0,0 +1,117 @@
+"""
+Benchmark: indicator micro-benchmark suite with baseline comparison.
+
+Runs every computing class exported from shared.indicators at 1k, 100k
+and 1M bars (parameter grid with --grid full), records wall time, peak
+and retained memory, writes a JSON report and compares it with the
+stored baseline. Flagged cases are re-measured before being reported;
+exits with status 1 if any case still regressed. Refuses a baseline
+recorded with other NumPy/pandas/TA-Lib versions unless
+--allow-version-mismatch is given; --update-baseline replaces such a
+baseline instead of merging into it.
+
+Usage:
+    python tests/benchmarks/bench_indicators.py
+    python tests/benchmarks/bench_indicators.py --sizes 1000 100000 --grid full
+    python tests/benchmarks/bench_indicators.py --output results.json
+    python tests/benchmarks/bench_indicators.py --update-baseline
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+from shared.tests.benchmarks.indicator_suite import (
+    BASELINE_PATH,
+    SIZES,
+    confirm,
+    load_report,
+    merge_reports,
+    run_suite,
+    save_report,
+    version_mismatches,
+)
+
+
+def _print_result(result: Dict[str, Any]) -> None:
+    print(
+        f"{result['bars']:>9}  {result['case'][:58]:<58}{result['ms']:>11.2f}"
+        f"{result['peak_bytes'] / 1024:>12.0f}{result['retained_bytes'] / 1024:>12.0f}"
+    )
+
+
+def main() -> None:
+    """Run suite, print a results table and check the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--grid", choices=["default", "full"], default="default")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write JSON report here")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Merge this run into the baseline instead of checking it",
+    )
+    parser.add_argument("--time-tolerance", type=float, default=2.0)
+    parser.add_argument("--memory-tolerance", type=float, default=0.25)
+    parser.add_argument(
+        "--allow-version-mismatch",
+        action="store_true",
+        help="Compare against a baseline recorded with other library versions",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'bars':>9}  {'case':<58}{'time (ms)':>11}{'peak (KB)':>12}{'kept (KB)':>12}"
+    )
+    report = run_suite(args.sizes, args.grid, args.repeat, progress=_print_result)
+    print(f"calibration: {report['meta']['calibration_ms']:.2f} ms")
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"report written to {args.output}")
+
+    if args.update_baseline:
+        if args.baseline.exists():
+            baseline = load_report(args.baseline)
+            if version_mismatches(report, baseline):
+                print("library versions changed; replacing baseline")
+            else:
+                report = merge_reports(baseline, report)
+        save_report(report, args.baseline)
+        print(f"baseline updated: {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --update-baseline")
+        return
+
+    baseline = load_report(args.baseline)
+    mismatches = version_mismatches(report, baseline)
+    for library, (ours, theirs) in mismatches.items():
+        print(f"WARNING: {library} {ours} differs from baseline {theirs}")
+    if mismatches and not args.allow_version_mismatch:
+        print("install the pinned versions, re-record the baseline or pass")
+        print("--allow-version-mismatch")
+        sys.exit(1)
+
+    regressions = confirm(
+        report,
+        baseline,
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+        allow_version_mismatch=args.allow_version_mismatch,
+    )
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+    print("no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark: ParameterOptimizer vs BacktestEngine.sweep().
+
+Sweeps an RSI/MACD strategy over a parameter grid. sweep() recomputes
+every indicator for every combination; the optimizer computes each
+distinct configuration once and shares candles and indicator columns
+with workers through shared memory. Reports indicator time separately
+from total time, since the bar loop dominates long histories.
+
+Usage:
+    python tests/benchmarks/bench_optimizer.py
+    python tests/benchmarks/bench_optimizer.py --bars 50000 --workers 4
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from shared.backtest import (
+    BacktestConfig,
+    BacktestEngine,
+    ParameterOptimizer,
+    expand_grid,
+    indicator_columns,
+)
+from shared.indicators import EMAIndicator, MACDIndicator, RSIIndicator
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests.fixtures import generate_candles
+
+GRID = {
+    "period": [7, 14, 21],
+    "oversold": [25, 30, 35],
+    "fast": [8, 12],
+    "slow": [26, 34],
+}
+
+
+class _Strategy(IndicatorBasedStrategy):
+    def check_entry_conditions(self, market_data):
+        ind = market_data["indicators"]
+        return ind["RSI"] < self.config["oversold"] and ind["MACD.histogram"] > 0
+
+    def check_exit_conditions(self, position, market_data):
+        ind = market_data["indicators"]
+        return ind["RSI"] > 65 or market_data["close"] < ind["TREND"]
+
+
+def _indicators(params: Dict[str, Any]):
+    return {
+        "RSI": RSIIndicator(period=params["period"]),
+        "MACD": MACDIndicator(fast_period=params["fast"], slow_period=params["slow"]),
+        "TREND": EMAIndicator(period=50),
+    }
+
+
+def run_benchmark(bars: int = 20_000, workers: int = 2) -> List[Dict[str, Any]]:
+    """
+    Compare sweep() and the optimizer over GRID.
+
+    Args:
+        bars: History length
+        workers: Worker processes for the parallel optimizer
+
+    Returns:
+        List of result dicts (mode, runs, indicator_s, total_s)
+    """
+    df = generate_candles(bars, seed=7)
+    config = BacktestConfig(stop_loss_pct=2.0, warmup=50)
+    combos = expand_grid(GRID)
+    results = []
+
+    start = time.perf_counter()
+    for params in combos:
+        indicator_columns(_indicators(params), df)
+    per_combo_indicators = time.perf_counter() - start
+
+    start = time.perf_counter()
+    BacktestEngine(config).sweep(_Strategy, GRID, _indicators, df, "SOL/USDC", "1m")
+    results.append(
+        {
+            "mode": "sweep",
+            "runs": len(combos),
+            "indicator_s": per_combo_indicators,
+            "total_s": time.perf_counter() - start,
+        }
+    )
+
+    for mode, count in (("optimizer", 0), (f"optimizer x{workers}", workers)):
+        optimizer = ParameterOptimizer(
+            _Strategy, _indicators, "SOL/USDC", "1m", config=config, workers=count
+        )
+        plan = optimizer.plan(GRID)
+        distinct = {
+            (type(ind).__name__, tuple(sorted(ind.params.items()))): ind
+            for params in combos
+            for ind in _indicators(params).values()
+        }
+
+        start = time.perf_counter()
+        indicator_columns({str(k): ind for k, ind in distinct.items()}, df)
+        distinct_indicators = time.perf_counter() - start
+
+        start = time.perf_counter()
+        best = optimizer.optimize(GRID, df, top=5)
+        results.append(
+            {
+                "mode": mode,
+                "runs": plan.combinations,
+                "indicator_s": distinct_indicators,
+                "total_s": time.perf_counter() - start,
+                "distinct": plan.distinct,
+                "requested": plan.indicators,
+                "best": best[0].params,
+            }
+        )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parameter optimizer")
+    parser.add_argument("--bars", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.bars, args.workers)
+
+    print(f"\nParameter sweep over {args.bars:,} bars")
+    print(f"{'Mode':<16} {'Runs':>5} {'Indicators (s)':>15} {'Total (s)':>10}")
+    print("-" * 50)
+    for r in results:
+        print(
+            f"{r['mode']:<16} {r['runs']:>5} {r['indicator_s']:>15.3f} "
+            f"{r['total_s']:>10.2f}"
+        )
+
+    optimized = results[1]
+    print(
+        f"\nIndicator configurations: {optimized['distinct']} computed "
+        f"for {optimized['requested']} requested "
+        f"({results[0]['indicator_s'] / optimized['indicator_s']:.1f}x less "
+        f"indicator time)"
+    )
+    print(f"Best parameters: {optimized['best']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: batch candlestick pattern scanning.
+
+Times the previous PatternIndicator loop (each TA-Lib call receives the
+pandas OHLC Series) against scan_patterns() with shared contiguous
+buffers on TA-Lib, the thread pool, and the NumPy fallback kernels.
+TA-Lib rows are omitted when TA-Lib is not installed.
+
+Usage:
+    python tests/benchmarks/bench_patterns.py
+    python tests/benchmarks/bench_patterns.py --bars 100000 --workers 4
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+import pandas as pd
+
+from shared.indicators import scan_patterns
+from shared.indicators.candlestick import FALLBACK_PATTERNS
+from shared.indicators.patterns import talib
+from shared.tests.fixtures import generate_candles
+
+PATTERNS = list(FALLBACK_PATTERNS)
+
+
+def _legacy_scan(df: pd.DataFrame) -> Dict[str, Any]:
+    """Per-pattern loop as previously done in PatternIndicator.calculate()."""
+    results = {}
+    for name in PATTERNS:
+        func = getattr(talib, name)
+        results[name] = func(df["open"], df["high"], df["low"], df["close"])
+    return results
+
+
+def _time_ms(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of fn over repeat runs (ms)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1e3)
+    return min(timings)
+
+
+def run_benchmark(
+    bar_counts: Sequence[int] = (100_000, 1_000_000),
+    workers: int = 4,
+    repeat: int = 3,
+) -> List[Dict[str, Any]]:
+    """
+    Time pattern scans at each history length.
+
+    Args:
+        bar_counts: History lengths to benchmark
+        workers: Thread pool size for the parallel scan
+        repeat: Timed repetitions (best is reported)
+
+    Returns:
+        List of result dicts (bars, mode, ms, speedup)
+    """
+    results = []
+    for bars in bar_counts:
+        df = generate_candles(bars)
+
+        modes: Dict[str, Callable[[], Any]] = {}
+        if talib is not None:
+            modes["talib (series loop)"] = lambda: _legacy_scan(df)
+            modes["talib (batch)"] = lambda: scan_patterns(
+                df, PATTERNS, backend="talib"
+            )
+            modes[f"talib ({workers} threads)"] = lambda: scan_patterns(
+                df, PATTERNS, max_workers=workers, backend="talib"
+            )
+        modes["numpy (batch)"] = lambda: scan_patterns(df, PATTERNS, backend="numpy")
+
+        timings = {mode: _time_ms(fn, repeat) for mode, fn in modes.items()}
+        baseline = next(iter(timings.values()))
+
+        for mode, ms in timings.items():
+            results.append(
+                {"bars": bars, "mode": mode, "ms": ms, "speedup": baseline / ms}
+            )
+
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.bars, args.workers, args.repeat)
+
+    print(f"{len(PATTERNS)} patterns")
+    print(f"{'bars':>10}  {'mode':<22}{'time (ms)':>12}{'speedup':>10}")
+    for r in results:
+        print(f"{r['bars']:>10}  {r['mode']:<22}{r['ms']:>12.1f}{r['speedup']:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
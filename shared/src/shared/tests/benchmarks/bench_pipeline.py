@@ -0,0 +1,98 @@
+"""
+Benchmark: IndicatorPipeline vs independent calculate() calls.
+
+Evaluates a strategy-style indicator mix that overlaps on true range,
+EWM smoothing and rolling windows, once through the shared-intermediate
+pipeline and once by calling each indicator's calculate().
+
+Usage:
+    python tests/benchmarks/bench_pipeline.py
+    python tests/benchmarks/bench_pipeline.py --bars 100000 --repeat 5
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from shared.indicators import (
+    ADXIndicator,
+    ATRIndicator,
+    BollingerBandsIndicator,
+    EMAIndicator,
+    IndicatorPipeline,
+    MACDIndicator,
+    RSIIndicator,
+    SMAIndicator,
+    StochasticIndicator,
+    VolumeIndicator,
+)
+from shared.tests.fixtures import generate_candles
+
+
+def _indicators() -> List[Any]:
+    """Indicator mix with overlapping intermediates."""
+    return [
+        RSIIndicator(period=14),
+        ATRIndicator(period=14),
+        ADXIndicator(period=14),
+        EMAIndicator(period=12),
+        EMAIndicator(period=26),
+        MACDIndicator(),
+        SMAIndicator(period=20),
+        BollingerBandsIndicator(period=20),
+        StochasticIndicator(),
+        VolumeIndicator(sma_period=20),
+    ]
+
+
+def run_benchmark(bars: int = 50_000, repeat: int = 3) -> List[Dict[str, Any]]:
+    """
+    Time pipeline and independent evaluation.
+
+    Args:
+        bars: Number of candles
+        repeat: Timed repetitions (best is reported)
+
+    Returns:
+        List of result dicts (mode, ms, nodes)
+    """
+    df = generate_candles(bars)
+    indicators = _indicators()
+    pipeline = IndicatorPipeline(indicators)
+
+    def best(fn) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1e3)
+        return min(timings)
+
+    independent_ms = best(lambda: [ind.calculate(df) for ind in indicators])
+    pipeline_ms = best(lambda: pipeline.run(df))
+    stats = pipeline.stats
+
+    return [
+        {"mode": "independent", "ms": independent_ms, "nodes": stats.node_requests},
+        {"mode": "pipeline", "ms": pipeline_ms, "nodes": stats.unique_nodes},
+    ]
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.bars, args.repeat)
+
+    print(f"{args.bars} bars, {len(_indicators())} indicators")
+    print(f"{'mode':<14}{'time (ms)':>12}{'nodes':>8}")
+    for r in results:
+        print(f"{r['mode']:<14}{r['ms']:>12.1f}{r['nodes']:>8}")
+    print(f"speedup: {results[0]['ms'] / results[1]['ms']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
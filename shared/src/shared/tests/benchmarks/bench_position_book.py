@@ -0,0 +1,134 @@
+"""
+Benchmark: PositionBook vs per-position update/check loop.
+
+Simulates open positions on one symbol receiving price ticks, once by
+calling update_price(), should_stop_loss() and should_take_profit() on
+every Position and once with a single PositionBook.update() per tick.
+
+Usage:
+    python tests/benchmarks/bench_position_book.py
+    python tests/benchmarks/bench_position_book.py --positions 10000 50000 --ticks 50
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
+
+from shared.strategy import Position, PositionBook
+from shared.strategy.enums import PositionSide
+
+
+def _positions(count: int) -> List[Position]:
+    rand = random.Random(0)
+    positions = []
+    for i in range(count):
+        long = rand.random() < 0.5
+        sign = 1 if long else -1
+        positions.append(
+            Position(
+                f"p{i}",
+                "SOL/USDC",
+                PositionSide.LONG if long else PositionSide.SHORT,
+                100.0,
+                1.0,
+                datetime(2025, 1, 1),
+                stop_loss=100.0 - sign * 50,
+                take_profit=100.0 + sign * 50,
+                trailing_stop=rand.choice([None, 40.0]),
+            )
+        )
+    return positions
+
+
+def _prices(ticks: int) -> List[float]:
+    rand = random.Random(1)
+    return [100.0 + rand.uniform(-5, 5) for _ in range(ticks)]
+
+
+def _run_scalar(positions: List[Position], prices: List[float]) -> int:
+    fired = 0
+    for price in prices:
+        for position in positions:
+            position.update_price(price)
+            if position.should_stop_loss(price) or position.should_take_profit(price):
+                fired += 1
+    return fired
+
+
+def _load_book(positions: List[Position]) -> PositionBook:
+    book = PositionBook(capacity=len(positions))
+    for position in positions:
+        book.add(position)
+    return book
+
+
+def _run_book(book: PositionBook, prices: List[float]) -> int:
+    fired = 0
+    for price in prices:
+        fired += len(book.update("SOL/USDC", price))
+    return fired
+
+
+def run_benchmark(
+    counts: Sequence[int] = (1_000, 10_000, 50_000), ticks: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Time per-tick position evaluation for each open-position count.
+
+    Args:
+        counts: Open positions on the symbol
+        ticks: Price ticks simulated
+
+    Returns:
+        List of result dicts (positions, scalar_ms, book_ms, speedup)
+    """
+    prices = _prices(ticks)
+    results = []
+    for count in counts:
+        timings = {}
+        for label, load, fn in (
+            ("scalar", list, _run_scalar),
+            ("book", _load_book, _run_book),
+        ):
+            state = load(_positions(count))
+            start = time.perf_counter()
+            fn(state, prices)
+            timings[label] = (time.perf_counter() - start) * 1000 / ticks
+
+        results.append(
+            {
+                "positions": count,
+                "scalar_ms": timings["scalar"],
+                "book_ms": timings["book"],
+                "speedup": timings["scalar"] / timings["book"],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--positions", type=int, nargs="+", default=[1_000, 10_000, 50_000]
+    )
+    parser.add_argument("--ticks", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.positions, args.ticks)
+
+    print(f"{args.ticks} ticks")
+    print(
+        f"{'positions':>10}{'scalar (ms/tick)':>18}{'book (ms/tick)':>16}{'speedup':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['positions']:>10}{r['scalar_ms']:>18.2f}{r['book_ms']:>16.2f}"
+            f"{r['speedup']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: incremental multi-timeframe resampling.
+
+Measures per-candle cost of MultiTimeframeResampler.update() as more
+nested timeframes are registered, against re-running pandas resample
+over the full history for every timeframe on each new candle.
+
+Usage:
+    python tests/benchmarks/bench_resampler.py
+    python tests/benchmarks/bench_resampler.py --history 50000 --ticks 5000
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from shared.market_data import MultiTimeframeResampler, parse_timeframe
+from shared.tests.fixtures import generate_candles
+
+TIMEFRAME_SETS = [
+    ["5m"],
+    ["5m", "15m"],
+    ["5m", "15m", "1h"],
+    ["5m", "15m", "1h", "4h", "1d"],
+]
+
+OHLCV_AGG = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+# Full re-resampling is slow, so it is sampled on fewer ticks
+RESAMPLE_TICKS = 20
+
+
+def run_benchmark(history: int = 20_000, ticks: int = 20_000) -> List[Dict[str, Any]]:
+    """
+    Time incremental update() and full re-resampling per candle.
+
+    Args:
+        history: 1m candles already held when re-resampling
+        ticks: Candles streamed through the resampler
+
+    Returns:
+        List of result dicts (timeframes, update_us, resample_us, speedup)
+    """
+    df = generate_candles(history + ticks)
+    stream = df.iloc[history:]
+    candles = stream.to_dict("records")
+
+    results = []
+    for timeframes in TIMEFRAME_SETS:
+        resampler = MultiTimeframeResampler("1m", timeframes)
+        start = time.perf_counter()
+        for timestamp, candle in zip(stream.index, candles):
+            resampler.update(timestamp, candle)
+        update_us = (time.perf_counter() - start) / ticks * 1e6
+
+        start = time.perf_counter()
+        for i in range(RESAMPLE_TICKS):
+            window = df.iloc[: history + i + 1]
+            for timeframe in timeframes:
+                window.resample(parse_timeframe(timeframe)).agg(OHLCV_AGG)
+        resample_us = (time.perf_counter() - start) / RESAMPLE_TICKS * 1e6
+
+        results.append(
+            {
+                "timeframes": ",".join(timeframes),
+                "update_us": update_us,
+                "resample_us": resample_us,
+                "speedup": resample_us / update_us,
+            }
+        )
+
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--history", type=int, default=20_000)
+    parser.add_argument("--ticks", type=int, default=20_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.history, args.ticks)
+
+    print(f"Per-candle cost, {args.history} bars of history")
+    print(f"{'timeframes':<22}{'update (us)':>13}{'resample (us)':>16}{'speedup':>10}")
+    for r in results:
+        print(
+            f"{r['timeframes']:<22}{r['update_us']:>13.2f}"
+            f"{r['resample_us']:>16.1f}{r['speedup']:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: RiskLedger vs per-strategy can_trade() loop.
+
+Checks which strategies of a fleet may trade on every tick, once by
+calling can_trade() on each strategy (datetime.now() and a date
+comparison per call) and once with one RiskLedger.tick() and
+may_trade() per tick.
+
+Usage:
+    python tests/benchmarks/bench_risk_ledger.py
+    python tests/benchmarks/bench_risk_ledger.py --strategies 1000 100000 --ticks 50
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
+
+from shared.strategy import RiskLedger, TradingStrategy
+
+
+class _Strategy(TradingStrategy):
+    def check_entry_conditions(self, market_data):
+        return False
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+def _strategies(count: int) -> List[_Strategy]:
+    rand = random.Random(0)
+    strategies = []
+    for i in range(count):
+        strategy = _Strategy(f"s{i}", "SOL/USDC", "1m", {"max_daily_loss": 100.0})
+        strategy.daily_pnl = rand.uniform(-150, 50)
+        strategies.append(strategy)
+    return strategies
+
+
+def _run_scalar(strategies: List[_Strategy], ticks: int) -> int:
+    allowed = 0
+    for _ in range(ticks):
+        allowed += sum(1 for strategy in strategies if strategy.can_trade())
+    return allowed
+
+
+def _load_ledger(strategies: List[_Strategy]) -> RiskLedger:
+    ledger = RiskLedger(capacity=len(strategies))
+    ledger.tick(datetime.now())
+    for strategy in strategies:
+        strategy.can_trade()
+        ledger.add(strategy)
+    return ledger
+
+
+def _run_ledger(ledger: RiskLedger, ticks: int) -> int:
+    allowed = 0
+    for _ in range(ticks):
+        ledger.tick(datetime.now())
+        allowed += int(ledger.may_trade().sum())
+    return allowed
+
+
+def run_benchmark(
+    counts: Sequence[int] = (1_000, 10_000, 100_000), ticks: int = 20
+) -> List[Dict[str, Any]]:
+    """
+    Time per-tick risk checks for each fleet size.
+
+    Args:
+        counts: Strategies in the fleet
+        ticks: Clock ticks simulated
+
+    Returns:
+        List of result dicts (strategies, scalar_ms, ledger_ms, speedup)
+    """
+    results = []
+    for count in counts:
+        timings = {}
+        for label, load, fn in (
+            ("scalar", list, _run_scalar),
+            ("ledger", _load_ledger, _run_ledger),
+        ):
+            state = load(_strategies(count))
+            start = time.perf_counter()
+            fn(state, ticks)
+            timings[label] = (time.perf_counter() - start) * 1000 / ticks
+
+        results.append(
+            {
+                "strategies": count,
+                "scalar_ms": timings["scalar"],
+                "ledger_ms": timings["ledger"],
+                "speedup": timings["scalar"] / timings["ledger"],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--strategies", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--ticks", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.strategies, args.ticks)
+
+    print(f"{args.ticks} ticks")
+    print(
+        f"{'strategies':>11}{'scalar (ms/tick)':>18}{'ledger (ms/tick)':>18}"
+        f"{'speedup':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['strategies']:>11}{r['scalar_ms']:>18.3f}{r['ledger_ms']:>18.3f}"
+            f"{r['speedup']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark: strategy snapshot/restore vs replaying bars.
+
+Rebuilds the indicator history of a strategy after a restart, once by
+replaying the last bars through _update_previous_values() and once by
+restoring a snapshot; also reports full and incremental snapshot sizes.
+
+Usage:
+    python tests/benchmarks/bench_snapshot.py
+    python tests/benchmarks/bench_snapshot.py --indicators 10 100 --bars 500
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Sequence
+
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+
+
+class _Strategy(IndicatorBasedStrategy):
+    def check_entry_conditions(self, market_data):
+        return False
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+def _rows(indicators: int, bars: int) -> List[Dict[str, float]]:
+    rand = random.Random(0)
+    names = [f"IND_{i}" for i in range(indicators)]
+    return [{name: rand.uniform(0, 100) for name in names} for _ in range(bars)]
+
+
+def _replay(rows: List[Dict[str, float]]) -> _Strategy:
+    strategy = _Strategy("s", "SOL/USDC", "1m")
+    for row in rows:
+        strategy._update_previous_values(row)
+    return strategy
+
+
+def run_benchmark(
+    counts: Sequence[int] = (10, 50, 200), bars: int = 500, repeat: int = 5
+) -> List[Dict[str, Any]]:
+    """
+    Time history rebuild by replay and by restore.
+
+    Args:
+        counts: Indicators per strategy
+        bars: Bars replayed (history keeps the last 100)
+        repeat: Timing repetitions (best is reported)
+
+    Returns:
+        List of result dicts (indicators, replay_ms, restore_ms, speedup,
+        full_bytes, incremental_bytes)
+    """
+    results = []
+    for count in counts:
+        rows = _rows(count, bars + 1)
+        live = _replay(rows[:-1])
+        full = live.snapshot()
+        live._update_previous_values(rows[-1])
+        incremental = live.snapshot(incremental=True)
+
+        replay = restore = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            _replay(rows[:-1])
+            replay = min(replay, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            _Strategy("s", "SOL/USDC", "1m").restore(full)
+            restore = min(restore, time.perf_counter() - start)
+
+        results.append(
+            {
+                "indicators": count,
+                "replay_ms": replay * 1000,
+                "restore_ms": restore * 1000,
+                "speedup": replay / restore,
+                "full_bytes": len(full),
+                "incremental_bytes": len(incremental),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--indicators", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--bars", type=int, default=500)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.indicators, args.bars)
+
+    print(f"{args.bars} bars replayed")
+    print(
+        f"{'indicators':>11}{'replay (ms)':>13}{'restore (ms)':>14}{'speedup':>10}"
+        f"{'full (B)':>11}{'incr. (B)':>11}"
+    )
+    for r in results:
+        print(
+            f"{r['indicators']:>11}{r['replay_ms']:>13.2f}{r['restore_ms']:>14.3f}"
+            f"{r['speedup']:>9.1f}x{r['full_bytes']:>11,}{r['incremental_bytes']:>11,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
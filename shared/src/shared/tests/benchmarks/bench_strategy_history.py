@@ -0,0 +1,153 @@
+"""
+Benchmark: ring-buffer strategy history vs list-based history.
+
+Simulates a strategy storing several indicators per bar and evaluating
+highest/lowest, rising_for and divergence helpers, once with the
+previous list implementation (append + pop(0), slice + max/min) and
+once with IndicatorBasedStrategy's ring buffers and rolling extrema.
+
+Usage:
+    python tests/benchmarks/bench_strategy_history.py
+    python tests/benchmarks/bench_strategy_history.py --history 1000 --bars 20000
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+
+INDICATORS = ["CLOSE", "RSI", "EMA_FAST", "EMA_SLOW", "ATR", "VOLUME"]
+
+
+class _Strategy(IndicatorBasedStrategy):
+    def check_entry_conditions(self, market_data):
+        return False
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+class _ListStrategy:
+    """Previous list-based history helpers."""
+
+    def __init__(self, max_length: int):
+        self.max_length = max_length
+        self.history: Dict[str, List[float]] = {}
+
+    def update(self, indicators: Dict[str, float]) -> None:
+        for name, value in indicators.items():
+            history = self.history.setdefault(name, [])
+            history.append(value)
+            if len(history) > self.max_length:
+                history.pop(0)
+
+    def is_highest(self, name: str, current: float, periods: int) -> bool:
+        history = self.history.get(name, [])
+        return len(history) >= periods and current == max(history[-periods:])
+
+    def is_rising_for(self, name: str, periods: int) -> bool:
+        recent = self.history.get(name, [])[-(periods + 1) :]
+        if len(recent) < periods + 1:
+            return False
+        return all(recent[i] > recent[i - 1] for i in range(1, len(recent)))
+
+    def divergence_bullish(
+        self, price: str, indicator: str, cur_price: float, cur_ind: float, n: int
+    ) -> bool:
+        prices = self.history.get(price, [])
+        values = self.history.get(indicator, [])
+        if len(prices) < n or len(values) < n:
+            return False
+        return cur_price < min(prices[-n:][:-1]) and cur_ind > min(values[-n:][:-1])
+
+
+def _series(bars: int) -> Dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    return {name: np.cumsum(rng.normal(size=bars)) for name in INDICATORS}
+
+
+def _run_list(series: Dict[str, np.ndarray], bars: int, history: int) -> None:
+    strategy = _ListStrategy(history)
+    window = history // 2
+    for i in range(bars):
+        values = {name: float(s[i]) for name, s in series.items()}
+        for name, value in values.items():
+            strategy.is_highest(name, value, window)
+            strategy.is_rising_for(name, 5)
+        strategy.divergence_bullish(
+            "CLOSE", "RSI", values["CLOSE"], values["RSI"], window
+        )
+        strategy.update(values)
+
+
+def _run_ring(series: Dict[str, np.ndarray], bars: int, history: int) -> None:
+    strategy = _Strategy("bench", "SOL/USDC", "1m")
+    strategy._max_history_length = history
+    window = history // 2
+    for i in range(bars):
+        values = {name: float(s[i]) for name, s in series.items()}
+        for name, value in values.items():
+            strategy._is_highest(name, value, window)
+            strategy._is_rising_for(name, value, 5)
+        strategy._divergence_bullish(
+            "CLOSE", "RSI", values["CLOSE"], values["RSI"], window
+        )
+        strategy._update_previous_values(values)
+
+
+def run_benchmark(
+    histories: Sequence[int] = (100, 1_000, 5_000), bars: int = 20_000
+) -> List[Dict[str, Any]]:
+    """
+    Time per-bar helper evaluation for each history length.
+
+    Args:
+        histories: Values of _max_history_length (queried window is half)
+        bars: Bars simulated
+
+    Returns:
+        List of result dicts (history, list_us, ring_us, speedup)
+    """
+    series = _series(bars)
+    results = []
+    for history in histories:
+        timings = {}
+        for label, fn in (("list", _run_list), ("ring", _run_ring)):
+            start = time.perf_counter()
+            fn(series, bars, history)
+            timings[label] = (time.perf_counter() - start) * 1e6 / bars
+
+        results.append(
+            {
+                "history": history,
+                "list_us": timings["list"],
+                "ring_us": timings["ring"],
+                "speedup": timings["list"] / timings["ring"],
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--history", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--bars", type=int, default=20_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.history, args.bars)
+
+    print(f"{len(INDICATORS)} indicators, {args.bars} bars")
+    print(f"{'history':>8}{'list (us/bar)':>16}{'ring (us/bar)':>16}{'speedup':>10}")
+    for r in results:
+        print(
+            f"{r['history']:>8}{r['list_us']:>16.1f}{r['ring_us']:>16.1f}"
+            f"{r['speedup']:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
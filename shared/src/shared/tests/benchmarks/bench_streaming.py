@@ -0,0 +1,117 @@
+"""
+Benchmark: streaming update() vs full calculate() per tick.
+
+Seeds every streaming indicator with a long history (timing the
+warm start) and measures the per-tick latency of update() against
+re-running calculate() on the history plus the new candle.
+
+Usage:
+    python tests/benchmarks/bench_streaming.py
+    python tests/benchmarks/bench_streaming.py --history 10000 --ticks 2000
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List
+
+from shared.indicators import (
+    ADXIndicator,
+    ATRIndicator,
+    BollingerBandsIndicator,
+    EMAIndicator,
+    MACDIndicator,
+    RSIIndicator,
+    SMAIndicator,
+    StochasticIndicator,
+    VolumeIndicator,
+)
+from shared.tests.fixtures import generate_candles
+
+# Full recalculation is slow, so it is sampled on fewer ticks
+RECALC_TICKS = 50
+
+
+def _indicators() -> List[Any]:
+    """Indicators under benchmark with their default parameters."""
+    return [
+        EMAIndicator(period=12),
+        SMAIndicator(period=20),
+        RSIIndicator(period=14),
+        MACDIndicator(),
+        ATRIndicator(period=14),
+        ADXIndicator(period=14),
+        BollingerBandsIndicator(period=20),
+        StochasticIndicator(),
+        VolumeIndicator(sma_period=20),
+    ]
+
+
+def run_benchmark(history: int = 10_000, ticks: int = 1_000) -> List[Dict[str, Any]]:
+    """
+    Measure per-tick latency of update() and calculate().
+
+    Args:
+        history: Candles used to seed each indicator
+        ticks: Streamed candles timed for update()
+
+    Returns:
+        List of result dicts (indicator, seed_ms, update_us, calculate_us,
+        speedup)
+    """
+    df = generate_candles(history + ticks)
+    seed_df = df.iloc[:history]
+    candles = df.iloc[history:].to_dict("records")
+
+    results = []
+    for indicator in _indicators():
+        start = time.perf_counter()
+        indicator.seed(seed_df)
+        seed_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        for candle in candles:
+            indicator.update(candle)
+        update_us = (time.perf_counter() - start) / ticks * 1e6
+
+        recalc_ticks = min(RECALC_TICKS, ticks)
+        start = time.perf_counter()
+        for i in range(recalc_ticks):
+            indicator.calculate(df.iloc[: history + i + 1])
+        calculate_us = (time.perf_counter() - start) / recalc_ticks * 1e6
+
+        results.append(
+            {
+                "indicator": indicator.__class__.__name__,
+                "seed_ms": seed_ms,
+                "update_us": update_us,
+                "calculate_us": calculate_us,
+                "speedup": calculate_us / update_us,
+            }
+        )
+
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--history", type=int, default=10_000)
+    parser.add_argument("--ticks", type=int, default=1_000)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.history, args.ticks)
+
+    print(f"Per-tick latency at {args.history} bars of history")
+    print(
+        f"{'indicator':<26}{'seed (ms)':>11}{'update (us)':>14}"
+        f"{'calculate (us)':>17}{'speedup':>10}"
+    )
+    for r in results:
+        print(
+            f"{r['indicator']:<26}{r['seed_ms']:>11.2f}{r['update_us']:>14.2f}"
+            f"{r['calculate_us']:>17.1f}{r['speedup']:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark: vectorized strategy signals vs bar-by-bar condition checks.
+
+Evaluates the same entry/exit conditions (crossover, sustained trend,
+divergence, threshold cross, highest) once through per-bar
+IndicatorBasedStrategy helper calls and once through generate_signals().
+
+Usage:
+    python tests/benchmarks/bench_vectorized_signals.py
+    python tests/benchmarks/bench_vectorized_signals.py --bars 525600
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import EMAIndicator, RSIIndicator
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests.fixtures import generate_candles
+
+
+class _Strategy(IndicatorBasedStrategy):
+    def check_entry_conditions(self, market_data):
+        return (
+            self._crosses_above(
+                "FAST", "SLOW", market_data["FAST"], market_data["SLOW"]
+            )
+            and self._is_rising_for("RSI", market_data["RSI"], 3)
+        ) or self._divergence_bullish(
+            "CLOSE", "RSI", market_data["CLOSE"], market_data["RSI"], 14
+        )
+
+    def check_exit_conditions(self, position, market_data):
+        return self._crosses_below_threshold(
+            "RSI", market_data["RSI"], 70.0
+        ) or self._is_highest("CLOSE", market_data["CLOSE"], 50)
+
+    def vectorized_entry_conditions(self, ops):
+        return (
+            ops.crosses_above("FAST", "SLOW") & ops.is_rising_for("RSI", 3)
+        ) | ops.divergence_bullish("CLOSE", "RSI", 14)
+
+    def vectorized_exit_conditions(self, ops):
+        return ops.crosses_below_threshold("RSI", 70.0) | ops.is_highest("CLOSE", 50)
+
+
+def _indicators(bars: int) -> pd.DataFrame:
+    df = generate_candles(bars)
+    return pd.DataFrame(
+        {
+            "CLOSE": df["close"],
+            "RSI": RSIIndicator(period=14).calculate(df),
+            "FAST": EMAIndicator(period=12).calculate(df),
+            "SLOW": EMAIndicator(period=26).calculate(df),
+        }
+    )
+
+
+def _bar_by_bar(indicators: pd.DataFrame) -> np.ndarray:
+    strategy = _Strategy("bench", "SOL/USDC", "1m")
+    entries = []
+    for row in indicators.to_dict("records"):
+        entries.append(strategy.check_entry_conditions(row))
+        strategy.check_exit_conditions(None, row)
+        strategy._update_previous_values(row)
+    return np.array(entries)
+
+
+def run_benchmark(
+    bar_counts: Sequence[int] = (10_000, 100_000)
+) -> List[Dict[str, Any]]:
+    """
+    Time both evaluation paths at each history length.
+
+    Args:
+        bar_counts: Number of bars evaluated
+
+    Returns:
+        List of result dicts (bars, loop_ms, vectorized_ms, speedup, equal)
+    """
+    results = []
+    for bars in bar_counts:
+        indicators = _indicators(bars)
+
+        start = time.perf_counter()
+        loop_entries = _bar_by_bar(indicators)
+        loop_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        signals = _Strategy("bench", "SOL/USDC", "1m").generate_signals(indicators)
+        vectorized_ms = (time.perf_counter() - start) * 1e3
+
+        results.append(
+            {
+                "bars": bars,
+                "loop_ms": loop_ms,
+                "vectorized_ms": vectorized_ms,
+                "speedup": loop_ms / vectorized_ms,
+                "equal": bool((signals["entry"].to_numpy() == loop_entries).all()),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    results = run_benchmark(args.bars)
+
+    print(f"{'bars':>9}{'loop (ms)':>12}{'vector (ms)':>13}{'speedup':>10}  equal")
+    for r in results:
+        print(
+            f"{r['bars']:>9}{r['loop_ms']:>12.1f}{r['vectorized_ms']:>13.2f}"
+            f"{r['speedup']:>9.0f}x  {r['equal']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark: vectorized volume kernels vs per-element OBV.
+
+Times the previous OBV formulation (Series.apply with a Python lambda)
+against the vectorized sign kernel, and the new VWAP, MFI and A/D
+outputs, at 100k and 1M bars by default.
+
+Usage:
+    python tests/benchmarks/bench_volume.py
+    python tests/benchmarks/bench_volume.py --bars 100000 250000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+import pandas as pd
+
+from shared.indicators import VolumeIndicator
+from shared.tests.fixtures import generate_candles
+
+
+def _legacy_obv(df: pd.DataFrame) -> pd.Series:
+    """OBV as previously computed in VolumeIndicator.calculate()."""
+    price_direction = df["close"].diff()
+    return (
+        df["volume"]
+        * price_direction.apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
+    ).cumsum()
+
+
+def _time_ms(fn: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of fn over repeat runs (ms)."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1e3)
+    return min(timings)
+
+
+def run_benchmark(
+    bar_counts: Sequence[int] = (100_000, 1_000_000), repeat: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Time volume kernels at each history length.
+
+    Args:
+        bar_counts: History lengths to benchmark
+        repeat: Timed repetitions (best is reported)
+
+    Returns:
+        List of result dicts (bars, kernel, ms, speedup)
+    """
+    results = []
+    for bars in bar_counts:
+        df = generate_candles(bars)
+
+        obv_only = VolumeIndicator(compute_ratio=False)
+        kernels = {
+            "obv (lambda)": lambda: _legacy_obv(df),
+            "obv (vectorized)": lambda: obv_only.calculate(df),
+            "vwap": lambda: VolumeIndicator(
+                compute_obv=False, compute_ratio=False, compute_vwap=True
+            ).calculate(df),
+            "mfi": lambda: VolumeIndicator(
+                compute_obv=False, compute_ratio=False, compute_mfi=True
+            ).calculate(df),
+            "ad": lambda: VolumeIndicator(
+                compute_obv=False, compute_ratio=False, compute_ad=True
+            ).calculate(df),
+        }
+
+        timings = {name: _time_ms(fn, repeat) for name, fn in kernels.items()}
+        baseline = timings["obv (lambda)"]
+
+        for name, ms in timings.items():
+            results.append(
+                {
+                    "bars": bars,
+                    "kernel": name,
+                    "ms": ms,
+                    "speedup": baseline / ms if name.startswith("obv") else 0.0,
+                }
+            )
+
+    return results
+
+
+def main() -> None:
+    """Run benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bars", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run_benchmark(args.bars, args.repeat)
+
+    print(f"{'bars':>10}  {'kernel':<20}{'time (ms)':>12}{'speedup':>10}")
+    for r in results:
+        speedup = f"{r['speedup']:>9.1f}x" if r["speedup"] else f"{'':>10}"
+        print(f"{r['bars']:>10}  {r['kernel']:<20}{r['ms']:>12.1f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""Shared test fixtures."""
+
+from shared.tests.fixtures.candles import generate_candles
+
+__all__ = ["generate_candles"]
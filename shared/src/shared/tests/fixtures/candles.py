@@ -0,0 +1,52 @@
+"""
+Synthetic OHLCV candle generator for indicator tests and benchmarks.
+
+Produces a deterministic geometric random walk with consistent
+open/high/low/close relationships and positive volume.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def generate_candles(
+    bars: int,
+    seed: int = 42,
+    start_price: float = 100.0,
+    freq: str = "1min",
+) -> pd.DataFrame:
+    """
+    Generate deterministic OHLCV candles.
+
+    Args:
+        bars: Number of candles
+        seed: Random seed
+        start_price: First open price
+        freq: Candle frequency for the DatetimeIndex
+
+    Returns:
+        DataFrame with open, high, low, close, volume columns
+    """
+    rng = np.random.default_rng(seed)
+
+    returns = rng.normal(0.0, 0.002, bars)
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = np.concatenate(([start_price], close[:-1]))
+
+    wick = np.abs(rng.normal(0.0, 0.001, (2, bars))) * close
+    high = np.maximum(open_, close) + wick[0]
+    low = np.minimum(open_, close) - wick[1]
+    volume = rng.lognormal(mean=10.0, sigma=0.5, size=bars)
+
+    index = pd.date_range("2024-01-01", periods=bars, freq=freq)
+
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+        },
+        index=index,
+    )
@@ -0,0 +1,77 @@
+"""
+Performance regression gate for shared.indicators.
+
+Runs the indicator micro-benchmark suite at 1k and 100k bars and checks
+it against the stored baseline. Peak and retained memory come from
+tracemalloc and do not depend on scheduler load, so they are held to a
+25% tolerance. Wall times are normalized by a calibration workload run
+in the same process and only fail at 3x, after flagged cases are
+re-measured.
+
+The baseline must be recorded with the same NumPy, pandas and TA-Lib
+versions (see requirements-full.txt). Refresh it after an intentional
+change with:
+    python tests/benchmarks/bench_indicators.py --grid full --update-baseline
+
+Usage:
+    python tests/integration/indicators/test_benchmark_gate.py
+    laborant test shared --integration
+"""
+
+from shared.tests import LaborantTest
+from shared.tests.benchmarks.indicator_suite import (
+    BASELINE_PATH,
+    confirm,
+    load_report,
+    run_suite,
+    version_mismatches,
+)
+
+GATE_SIZES = (1_000, 100_000)
+
+
+class TestIndicatorBenchmarkGate(LaborantTest):
+    """Indicator memory and time against the stored baseline."""
+
+    component_name = "shared"
+    test_category = "integration"
+
+    def setup(self):
+        """Run the suite once; each test checks its own metrics."""
+        self.baseline = load_report(BASELINE_PATH)
+        self.report = run_suite(GATE_SIZES)
+
+    def _assert_no_regressions(self, metrics, **tolerances) -> None:
+        regressions = confirm(self.report, self.baseline, metrics=metrics, **tolerances)
+        assert not regressions, "Indicator regressions:\n" + "\n".join(
+            str(r) for r in regressions
+        )
+
+    def test_library_versions_match_baseline(self):
+        """Test the baseline was recorded with the installed libraries."""
+        self.reporter.info("Checking baseline library versions", context="Test")
+
+        mismatches = version_mismatches(self.report, self.baseline)
+        assert not mismatches, f"Installed vs baseline versions: {mismatches}"
+
+        self.reporter.info("Library versions match", context="Test")
+
+    def test_memory_within_baseline(self):
+        """Test peak and retained memory against the baseline."""
+        self.reporter.info("Checking indicator memory", context="Test")
+
+        self._assert_no_regressions(("peak_memory", "retained_memory"))
+
+        self.reporter.info("Memory within baseline", context="Test")
+
+    def test_time_within_baseline(self):
+        """Test calibrated wall time against the baseline."""
+        self.reporter.info("Checking indicator time", context="Test")
+
+        self._assert_no_regressions(("time",))
+
+        self.reporter.info("Time within baseline", context="Test")
+
+
+if __name__ == "__main__":
+    TestIndicatorBenchmarkGate.run_as_main()
@@ -0,0 +1,265 @@
+"""
+Unit tests for BacktestEngine.
+
+Tests fill, fee and slippage accounting, stop loss / take profit exits,
+short positions, risk limits, daily loss resets on bar time (including
+positions held across midnight), CandleStore sources and parallel
+parameter sweeps.
+
+Usage:
+    python tests/unit/backtest/test_engine.py
+    laborant test shared --unit
+"""
+
+import dataclasses
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from shared.backtest import BacktestConfig, BacktestEngine, expand_grid
+from shared.indicators import EMAIndicator
+from shared.market_data import CandleStore
+from shared.strategy.enums import PositionSide
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+
+class _ThresholdStrategy(IndicatorBasedStrategy):
+    """Enters above one close level and exits above another."""
+
+    def check_entry_conditions(self, market_data):
+        return market_data["close"] > self.config.get("entry_above", 0)
+
+    def check_exit_conditions(self, position, market_data):
+        return market_data["close"] > self.config.get("exit_above", float("inf"))
+
+
+class _CrossStrategy(IndicatorBasedStrategy):
+    """EMA crossover strategy."""
+
+    def check_entry_conditions(self, market_data):
+        ind = market_data["indicators"]
+        return self._crosses_above("FAST", "SLOW", ind["FAST"], ind["SLOW"])
+
+    def check_exit_conditions(self, position, market_data):
+        ind = market_data["indicators"]
+        return self._crosses_below("FAST", "SLOW", ind["FAST"], ind["SLOW"])
+
+
+def _ema_indicators(params):
+    return {
+        "FAST": EMAIndicator(period=params["fast"]),
+        "SLOW": EMAIndicator(period=params["slow"]),
+    }
+
+
+def _frame(closes, freq: str = "1h") -> pd.DataFrame:
+    closes = np.asarray(closes, dtype=float)
+    index = pd.date_range("2024-01-01", periods=len(closes), freq=freq)
+    return pd.DataFrame(
+        {"open": closes, "high": closes, "low": closes, "close": closes}, index=index
+    )
+
+
+def _without_timing(stats) -> dict:
+    data = stats.to_dict()
+    data.pop("elapsed_s")
+    data.pop("bars_per_second")
+    return data
+
+
+class TestBacktestEngine(LaborantTest):
+    """Unit tests for BacktestEngine."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate candle history."""
+        self.candles = generate_candles(2000, seed=3)
+
+    def test_fill_fee_and_slippage_accounting(self):
+        """Test a single trade's fills, fees and PnL."""
+        self.reporter.info("Testing trade accounting", context="Test")
+
+        config = BacktestConfig(initial_balance=10_000, fee_rate=0.001, slippage=0.001)
+        strategy = _ThresholdStrategy(
+            "t", "SOL/USDC", "1h", {"entry_above": 105, "exit_above": 115}
+        )
+        df = _frame([100, 100, 110, 110, 120, 120])
+        result = BacktestEngine(config).run(strategy, {}, df)
+
+        entry = 110 * 1.001
+        size = 10_000 * 0.10 / entry
+        exit_ = 120 * 0.999
+        fees = size * entry * 0.001 + size * exit_ * 0.001
+
+        first = result.trades[0]
+        assert first.entry_time == df.index[2] and first.exit_time == df.index[4]
+        assert np.isclose(first.entry_price, entry)
+        assert np.isclose(first.exit_price, exit_)
+        assert np.isclose(first.size, size)
+        assert np.isclose(first.fees, fees)
+        assert np.isclose(first.pnl, (exit_ - entry) * size - fees)
+        assert first.reason == "signal"
+
+        # Re-entered on the last bar and closed at the end of data
+        assert [t.reason for t in result.trades] == ["signal", "end"]
+        total_pnl = sum(t.pnl for t in result.trades)
+        assert np.isclose(result.stats.final_equity, 10_000 + total_pnl)
+        assert np.isclose(result.equity.iloc[-1], result.stats.final_equity)
+        assert np.isclose(result.stats.fees, sum(t.fees for t in result.trades))
+        assert list(result.trade_log().columns)[:2] == ["position_id", "side"]
+
+        self.reporter.info("Trade accounting correct", context="Test")
+
+    def test_exits_and_short_positions(self):
+        """Test stop loss, take profit and trailing exits for both sides."""
+        self.reporter.info("Testing exits", context="Test")
+
+        rising = _frame([100, 101, 103, 106, 110, 108, 104, 100])
+        cases = [
+            (PositionSide.LONG, {"take_profit_pct": 5.0}, "take_profit"),
+            (PositionSide.LONG, {"trailing_stop_pct": 3.0}, "stop_loss"),
+            (PositionSide.SHORT, {"stop_loss_pct": 4.0}, "stop_loss"),
+        ]
+        for side, risk, reason in cases:
+            config = BacktestConfig(side=side, slippage=0.0, **risk)
+            strategy = _ThresholdStrategy("x", "SOL/USDC", "1h")
+            result = BacktestEngine(config).run(strategy, {}, rising)
+
+            assert result.trades[0].reason == reason, (side, risk)
+            assert result.trades[0].side == str(side)
+            total_pnl = sum(t.pnl for t in result.trades)
+            assert np.isclose(result.stats.final_equity, 10_000 + total_pnl)
+
+        # Short loses on a rising market
+        short = BacktestEngine(BacktestConfig(side=PositionSide.SHORT)).run(
+            _ThresholdStrategy("s", "SOL/USDC", "1h"), {}, rising.iloc[:5]
+        )
+        assert short.trades[0].pnl < 0
+        assert short.stats.max_drawdown_pct > 0
+
+        self.reporter.info("Exits correct", context="Test")
+
+    def test_risk_limits(self):
+        """Test size limits reject entries and daily loss resets by bar date."""
+        self.reporter.info("Testing risk limits", context="Test")
+
+        capped = _ThresholdStrategy("c", "SOL/USDC", "1h", {"max_position_size": 0.05})
+        result = BacktestEngine().run(capped, {}, _frame([100] * 10))
+        assert result.stats.trades == 0
+        assert result.stats.rejected_entries == 10
+
+        # Every trade loses; 4 bars per day, at most one loss per day
+        falling = _frame(np.linspace(100, 80, 12), freq="6h")
+        limited = _ThresholdStrategy(
+            "d", "SOL/USDC", "6h", {"max_daily_loss": 1.0, "exit_above": 0}
+        )
+        result = BacktestEngine().run(limited, {}, falling)
+        entries = [t.entry_time for t in result.trades]
+        assert entries == [falling.index[0], falling.index[4], falling.index[8]]
+
+        # A loss on a position held across midnight counts for the exit day
+        index = pd.date_range("2024-01-01 23:00", periods=6, freq="1h")
+        overnight = _frame([100, 100, 90, 90, 90, 90]).set_axis(index)
+        held = _ThresholdStrategy("n", "SOL/USDC", "1h", {"max_daily_loss": 1.0})
+        result = BacktestEngine(BacktestConfig(stop_loss_pct=5.0)).run(
+            held, {}, overnight
+        )
+        assert len(result.trades) == 1
+        assert result.trades[0].exit_time == index[2]
+        assert result.trades[0].pnl < 0
+
+        self.reporter.info("Risk limits enforced", context="Test")
+
+    def test_candle_store_source(self):
+        """Test on-disk candles give the same result as the DataFrame."""
+        self.reporter.info("Testing CandleStore source", context="Test")
+
+        root = tempfile.mkdtemp(prefix="backtest_")
+        try:
+            store = CandleStore(root)
+            store.append("SOL/USDC", "1m", self.candles)
+            engine = BacktestEngine(BacktestConfig(warmup=30))
+            params = {"fast": 8, "slow": 21}
+
+            from_store = engine.run(
+                _CrossStrategy("a", "SOL/USDC", "1m"), _ema_indicators(params), store
+            )
+            from_frame = engine.run(
+                _CrossStrategy("b", "SOL/USDC", "1m"),
+                _ema_indicators(params),
+                self.candles,
+            )
+            store.close()
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+        assert from_store.stats.trades > 5
+        assert _without_timing(from_store.stats) == _without_timing(from_frame.stats)
+        np.testing.assert_array_equal(from_store.equity, from_frame.equity)
+        assert from_store.stats.bars_per_second > 0
+
+        self.reporter.info("CandleStore source matches", context="Test")
+
+    def test_parallel_sweep(self):
+        """Test process-pool sweeps equal inline runs in grid order."""
+        self.reporter.info("Testing parameter sweep", context="Test")
+
+        grid = {"fast": [5, 8], "slow": [21, 34]}
+        engine = BacktestEngine()
+        args = (_CrossStrategy, grid, _ema_indicators, self.candles, "SOL/USDC", "1m")
+
+        inline = engine.sweep(*args)
+        parallel = engine.sweep(*args, workers=2)
+
+        assert [r.params for r in parallel] == expand_grid(grid)
+        for a, b in zip(inline, parallel):
+            assert _without_timing(a.stats) == _without_timing(b.stats)
+
+        single = engine.run(
+            _CrossStrategy("x", "SOL/USDC", "1m"),
+            _ema_indicators({"fast": 8, "slow": 34}),
+            self.candles,
+        )
+        assert _without_timing(single.stats) == _without_timing(inline[-1].stats)
+
+        self.reporter.info("Sweep results match", context="Test")
+
+    def test_config_validation(self):
+        """Test invalid settings and candles raise."""
+        self.reporter.info("Testing validation", context="Test")
+
+        for kwargs in ({"initial_balance": 0}, {"fee_rate": 1.5}, {"warmup": -1}):
+            try:
+                BacktestConfig(**kwargs)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+
+        config = BacktestConfig()
+        try:
+            config.fee_rate = 0.5
+            assert False, "Should have raised FrozenInstanceError"
+        except dataclasses.FrozenInstanceError:
+            pass
+
+        try:
+            BacktestEngine().run(
+                _ThresholdStrategy("t", "SOL/USDC", "1h"),
+                {},
+                pd.DataFrame({"open": [1.0]}),
+            )
+            assert False, "Should have raised KeyError"
+        except KeyError as e:
+            assert "close" in str(e)
+
+        self.reporter.info("Validation enforced", context="Test")
+
+
+if __name__ == "__main__":
+    TestBacktestEngine.run_as_main()
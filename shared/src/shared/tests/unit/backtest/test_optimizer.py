@@ -0,0 +1,220 @@
+"""
+Unit tests for ParameterOptimizer.
+
+Tests that every distinct indicator configuration is computed once,
+that streamed and parallel (shared memory) results equal
+BacktestEngine.sweep(), ranking, top-k selection and validation.
+
+Usage:
+    python tests/unit/backtest/test_optimizer.py
+    laborant test shared --unit
+"""
+
+import os
+
+from shared.backtest import BacktestEngine, ParameterOptimizer, expand_grid
+from shared.indicators import EMAIndicator, MACDIndicator, RSIIndicator
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+GRID = {"period": [7, 14], "oversold": [30, 40], "trend": [21, 50]}
+
+
+class _RsiStrategy(IndicatorBasedStrategy):
+    """Buys oversold RSI above the trend EMA, exits on MACD turning down."""
+
+    def check_entry_conditions(self, market_data):
+        ind = market_data["indicators"]
+        return (
+            ind["RSI"] < self.config["oversold"] and market_data["close"] > ind["TREND"]
+        )
+
+    def check_exit_conditions(self, position, market_data):
+        ind = market_data["indicators"]
+        return ind["RSI"] > 60 or ind["MACD.histogram"] < 0
+
+
+def _indicators(params):
+    return {
+        "RSI": RSIIndicator(period=params["period"]),
+        "TREND": EMAIndicator(period=params["trend"]),
+        "MACD": MACDIndicator(),
+    }
+
+
+class _CountingEMA(EMAIndicator):
+    """EMA that counts its calculations (evaluated outside the DAG)."""
+
+    calls = 0
+
+    def calculate(self, df):
+        _CountingEMA.calls += 1
+        return super().calculate(df)
+
+
+class _TrendStrategy(IndicatorBasedStrategy):
+    """Holds while the close is above the trend EMA."""
+
+    def check_entry_conditions(self, market_data):
+        return market_data["close"] > market_data["indicators"]["TREND"]
+
+    def check_exit_conditions(self, position, market_data):
+        return market_data["close"] < market_data["indicators"]["TREND"]
+
+
+def _counting_indicators(params):
+    return {"TREND": _CountingEMA(period=params["trend"])}
+
+
+def _without_timing(stats) -> dict:
+    data = stats.to_dict()
+    data.pop("elapsed_s")
+    data.pop("bars_per_second")
+    return data
+
+
+def _key(params) -> tuple:
+    return tuple(sorted(params.items()))
+
+
+def _shared_blocks() -> set:
+    return set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else set()
+
+
+class TestParameterOptimizer(LaborantTest):
+    """Unit tests for ParameterOptimizer."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate candle history and the reference sweep."""
+        self.candles = generate_candles(1500, seed=11)
+        self.reference = {
+            _key(r.params): r.stats
+            for r in BacktestEngine().sweep(
+                _RsiStrategy, GRID, _indicators, self.candles, "SOL/USDC", "1m"
+            )
+        }
+
+    def test_distinct_indicators_computed_once(self):
+        """Test each indicator configuration is calculated exactly once."""
+        self.reporter.info("Testing indicator deduplication", context="Test")
+
+        optimizer = ParameterOptimizer(_RsiStrategy, _indicators, "SOL/USDC", "1m")
+        plan = optimizer.plan(GRID)
+        assert plan.combinations == 8
+        assert plan.indicators == 24
+        # RSI(7), RSI(14), EMA(21), EMA(50), MACD()
+        assert plan.distinct == 5
+        assert round(plan.reduction_pct, 6) == round((1 - 5 / 24) * 100, 6)
+
+        _CountingEMA.calls = 0
+        counting = ParameterOptimizer(
+            _TrendStrategy, _counting_indicators, "SOL/USDC", "1m"
+        )
+        grid = {"trend": [21, 50], "stop_loss_pct": [1.0, 2.0, 3.0]}
+        results = list(counting.stream(grid, self.candles))
+        assert len(results) == 6
+        assert _CountingEMA.calls == 2
+
+        self.reporter.info("Indicators computed once", context="Test")
+
+    def test_stream_matches_sweep(self):
+        """Test streamed results equal sweep() with running ranks."""
+        self.reporter.info("Testing streamed results", context="Test")
+
+        optimizer = ParameterOptimizer(_RsiStrategy, _indicators, "SOL/USDC", "1m")
+        results = list(optimizer.stream(GRID, self.candles))
+
+        assert [r.params for r in results] == expand_grid(GRID)
+        assert any(r.stats.trades > 0 for r in results)
+        for result in results:
+            expected = self.reference[_key(result.params)]
+            assert _without_timing(result.stats) == _without_timing(expected)
+            assert result.score == expected.total_return_pct
+
+        # Running rank: 1 + number of earlier results with a better score
+        for i, result in enumerate(results):
+            better = sum(1 for r in results[:i] if r.score > result.score)
+            assert result.rank == better + 1
+
+        self.reporter.info("Stream matches sweep", context="Test")
+
+    def test_parallel_shared_memory(self):
+        """Test worker processes give the same results and free the block."""
+        self.reporter.info("Testing parallel optimizer", context="Test")
+
+        before = _shared_blocks()
+        optimizer = ParameterOptimizer(
+            _RsiStrategy, _indicators, "SOL/USDC", "1m", workers=2
+        )
+        results = list(optimizer.stream(GRID, self.candles))
+
+        assert sorted(_key(r.params) for r in results) == sorted(self.reference)
+        for result in results:
+            expected = self.reference[_key(result.params)]
+            assert _without_timing(result.stats) == _without_timing(expected)
+        assert _shared_blocks() == before
+
+        # Closing the stream early cancels the rest and still frees the block
+        stream = optimizer.stream(GRID, self.candles)
+        next(stream)
+        stream.close()
+        assert _shared_blocks() == before
+
+        self.reporter.info("Parallel results match", context="Test")
+
+    def test_optimize_top_k(self):
+        """Test optimize() keeps the best results, best first."""
+        self.reporter.info("Testing top-k selection", context="Test")
+
+        for metric, maximize in (
+            ("total_return_pct", True),
+            ("max_drawdown_pct", False),
+        ):
+            optimizer = ParameterOptimizer(
+                _RsiStrategy,
+                _indicators,
+                "SOL/USDC",
+                "1m",
+                metric=metric,
+                maximize=maximize,
+            )
+            best = optimizer.optimize(GRID, self.candles, top=3)
+
+            scores = sorted(
+                (getattr(stats, metric) for stats in self.reference.values()),
+                reverse=maximize,
+            )
+            assert [r.score for r in best] == scores[:3]
+            assert [r.rank for r in best] == [1, 2, 3]
+
+        self.reporter.info("Top-k selection correct", context="Test")
+
+    def test_validation(self):
+        """Test invalid metric, workers and top raise."""
+        self.reporter.info("Testing validation", context="Test")
+
+        for kwargs in ({"metric": "sharpe"}, {"workers": -1}):
+            try:
+                ParameterOptimizer(
+                    _RsiStrategy, _indicators, "SOL/USDC", "1m", **kwargs
+                )
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+
+        optimizer = ParameterOptimizer(_RsiStrategy, _indicators, "SOL/USDC", "1m")
+        try:
+            optimizer.optimize(GRID, self.candles, top=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Validation enforced", context="Test")
+
+
+if __name__ == "__main__":
+    TestParameterOptimizer.run_as_main()
@@ -0,0 +1,256 @@
+"""
+Unit tests for BatchIndicatorEngine.
+
+Verifies that the vectorized multi-symbol engine matches per-symbol
+BaseIndicator.calculate() results, including symbols padded with
+leading NaN for shorter history, and rejection of frames missing
+interior bars.
+
+Usage:
+    python tests/unit/indicators/test_batch.py
+    laborant test shared --unit
+"""
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import (
+    ADXIndicator,
+    ATRIndicator,
+    BatchIndicatorEngine,
+    BollingerBandsIndicator,
+    EMAIndicator,
+    MACDIndicator,
+    RSIIndicator,
+    SMAIndicator,
+)
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+BARS = 400
+
+# Shorter histories end on the same bar, so they are padded at the front
+HISTORY = {"SOL": BARS, "BTC": BARS, "ETH": 300, "JUP": 150}
+
+
+def _assert_matches(expected, actual, symbol: str, label: str) -> None:
+    """Compare per-symbol Series with the unpadded tail of a batch row."""
+    tail = actual[-len(expected) :]
+    np.testing.assert_allclose(
+        tail,
+        expected.to_numpy(dtype=np.float64),
+        rtol=1e-9,
+        atol=1e-9,
+        equal_nan=True,
+        err_msg=f"{symbol}:{label}",
+    )
+    assert np.isnan(actual[: -len(expected)]).all(), f"{symbol}:{label} padding"
+
+
+class TestBatchIndicatorEngine(LaborantTest):
+    """Unit tests for BatchIndicatorEngine."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Build per-symbol frames and the batch engine."""
+        self.frames = {
+            symbol: generate_candles(BARS, seed=i).iloc[BARS - bars :]
+            for i, (symbol, bars) in enumerate(HISTORY.items())
+        }
+        self.engine = BatchIndicatorEngine.from_frames(self.frames)
+
+    def _assert_parity(self, indicator) -> None:
+        """Check engine.calculate(indicator) against per-symbol calculate()."""
+        batch = self.engine.calculate(indicator)
+
+        for row, symbol in enumerate(self.engine.symbols):
+            expected = indicator.calculate(self.frames[symbol])
+
+            if isinstance(expected, dict):
+                assert set(batch) == set(expected)
+                for key, series in expected.items():
+                    _assert_matches(series, batch[key][row], symbol, key)
+            else:
+                _assert_matches(expected, batch[row], symbol, "value")
+
+    def test_shape_and_alignment(self):
+        """Test engine exposes (symbols, bars) shape and labels."""
+        self.reporter.info("Testing shape and alignment", context="Test")
+
+        assert self.engine.shape == (len(HISTORY), BARS)
+        assert self.engine.symbols == list(HISTORY)
+        assert self.engine.rsi(14).shape == (len(HISTORY), BARS)
+
+        self.reporter.info("Shape and alignment correct", context="Test")
+
+    def test_ema_parity(self):
+        """Test EMA matches per-symbol calculate()."""
+        self.reporter.info("Testing EMA parity", context="Test")
+
+        self._assert_parity(EMAIndicator(period=12))
+        self._assert_parity(EMAIndicator(period=30, compute_distance=True))
+
+        self.reporter.info("EMA parity verified", context="Test")
+
+    def test_rsi_parity(self):
+        """Test RSI matches per-symbol calculate()."""
+        self.reporter.info("Testing RSI parity", context="Test")
+
+        self._assert_parity(RSIIndicator(period=14))
+
+        self.reporter.info("RSI parity verified", context="Test")
+
+    def test_atr_parity(self):
+        """Test ATR matches per-symbol calculate()."""
+        self.reporter.info("Testing ATR parity", context="Test")
+
+        self._assert_parity(ATRIndicator(period=14))
+
+        self.reporter.info("ATR parity verified", context="Test")
+
+    def test_adx_parity(self):
+        """Test ADX matches per-symbol calculate()."""
+        self.reporter.info("Testing ADX parity", context="Test")
+
+        self._assert_parity(ADXIndicator(period=14))
+        self._assert_parity(ADXIndicator(period=14, return_components=True))
+
+        self.reporter.info("ADX parity verified", context="Test")
+
+    def test_macd_parity(self):
+        """Test MACD matches per-symbol calculate()."""
+        self.reporter.info("Testing MACD parity", context="Test")
+
+        self._assert_parity(MACDIndicator())
+
+        self.reporter.info("MACD parity verified", context="Test")
+
+    def test_bollinger_parity(self):
+        """Test Bollinger Bands match per-symbol calculate()."""
+        self.reporter.info("Testing Bollinger parity", context="Test")
+
+        self._assert_parity(BollingerBandsIndicator(period=20))
+
+        self.reporter.info("Bollinger parity verified", context="Test")
+
+    def test_interior_gap_matches_pandas(self):
+        """Test a missing bar inside history follows pandas NaN semantics."""
+        self.reporter.info("Testing interior gap", context="Test")
+
+        df = generate_candles(200, seed=7)
+        df.iloc[120] = np.nan
+        engine = BatchIndicatorEngine.from_frames({"GAP": df})
+
+        expected = EMAIndicator(period=10).calculate(df)
+        _assert_matches(expected, engine.ema(10)[0], "GAP", "ema")
+
+        self.reporter.info("Interior gap handled", context="Test")
+
+    def test_frames_missing_interior_bars(self):
+        """Test frames missing bars other frames have are rejected."""
+        self.reporter.info("Testing misaligned frames", context="Test")
+
+        full = generate_candles(200, seed=1)
+        gapped = generate_candles(200, seed=2).drop(full.index[100:105])
+        try:
+            BatchIndicatorEngine.from_frames({"FULL": full, "GAP": gapped})
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "GAP" in str(e)
+
+        # Alone, the gapped frame has no NaN rows and matches calculate()
+        engine = BatchIndicatorEngine.from_frames({"GAP": gapped})
+        expected = RSIIndicator(period=14).calculate(gapped)
+        _assert_matches(expected, engine.rsi(14)[0], "GAP", "rsi")
+
+        # A history that ends early is accepted; its bars still match
+        engine = BatchIndicatorEngine.from_frames(
+            {"FULL": full, "EARLY": gapped.iloc[:90]}
+        )
+        expected = EMAIndicator(period=10).calculate(gapped.iloc[:90])
+        np.testing.assert_allclose(
+            engine.ema(10)[1][:90], expected.to_numpy(), rtol=1e-9, equal_nan=True
+        )
+
+        self.reporter.info("Misaligned frames rejected", context="Test")
+
+    def test_calculate_many(self):
+        """Test calculate_many preserves order."""
+        self.reporter.info("Testing calculate_many", context="Test")
+
+        results = self.engine.calculate_many([RSIIndicator(14), EMAIndicator(20)])
+
+        np.testing.assert_array_equal(results[0], self.engine.rsi(14))
+        np.testing.assert_array_equal(results[1], self.engine.ema(20))
+
+        self.reporter.info("calculate_many order preserved", context="Test")
+
+    def test_to_frame(self):
+        """Test to_frame wraps results with index and symbol columns."""
+        self.reporter.info("Testing to_frame", context="Test")
+
+        frame = self.engine.to_frame(self.engine.rsi(14))
+
+        assert isinstance(frame, pd.DataFrame)
+        assert list(frame.columns) == list(HISTORY)
+        assert frame.index.equals(self.frames["SOL"].index)
+
+        self.reporter.info("to_frame correct", context="Test")
+
+    def test_unsupported_indicator(self):
+        """Test indicator without batch kernel raises NotImplementedError."""
+        self.reporter.info("Testing unsupported indicator", context="Test")
+
+        try:
+            self.engine.calculate(SMAIndicator(period=20))
+            assert False, "Should have raised NotImplementedError"
+        except NotImplementedError as e:
+            assert "SMAIndicator" in str(e)
+
+        self.reporter.info("Unsupported indicator rejected", context="Test")
+
+    def test_shape_mismatch(self):
+        """Test mismatched block shapes raise ValueError."""
+        self.reporter.info("Testing shape mismatch", context="Test")
+
+        try:
+            BatchIndicatorEngine(close=np.ones((3, 50)), high=np.ones((2, 50)))
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "high" in str(e)
+
+        self.reporter.info("Shape mismatch rejected", context="Test")
+
+    def test_missing_block(self):
+        """Test ATR without high/low raises KeyError."""
+        self.reporter.info("Testing missing block", context="Test")
+
+        engine = BatchIndicatorEngine(close=np.ones((2, 50)))
+
+        try:
+            engine.atr(14)
+            assert False, "Should have raised KeyError"
+        except KeyError as e:
+            assert "high" in str(e)
+
+        self.reporter.info("Missing block rejected", context="Test")
+
+    def test_insufficient_data(self):
+        """Test too few bars raises ValueError."""
+        self.reporter.info("Testing insufficient data", context="Test")
+
+        engine = BatchIndicatorEngine(close=np.ones((2, 10)))
+
+        try:
+            engine.rsi(14)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "Insufficient data" in str(e)
+
+        self.reporter.info("Insufficient data rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestBatchIndicatorEngine.run_as_main()
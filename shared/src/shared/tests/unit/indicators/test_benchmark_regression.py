@@ -0,0 +1,209 @@
+"""
+Structure checks for the shared.indicators benchmark suite.
+
+Checks the suite covers every exported class, runs end to end, the
+stored baseline loads and reports match the schema, and the regression
+logic flags what it should. Nothing here is timed; the baseline gate
+runs in tests/integration/indicators/test_benchmark_gate.py.
+
+Refresh the baseline after an intentional change with:
+    python tests/benchmarks/bench_indicators.py --update-baseline
+
+Usage:
+    python tests/unit/indicators/test_benchmark_regression.py
+    laborant test shared --unit
+"""
+
+import tempfile
+from pathlib import Path
+
+from shared.tests import LaborantTest
+from shared.tests.benchmarks.indicator_suite import (
+    BASELINE_PATH,
+    RESULT_FIELDS,
+    SCHEMA_VERSION,
+    build_cases,
+    compare,
+    load_report,
+    merge_reports,
+    run_suite,
+    save_report,
+    library_versions,
+    uncovered_exports,
+    validate_report,
+)
+
+SMOKE_BARS = 300
+
+
+def _report(relative: float, peak_bytes: int, calibration_ms: float = 10.0):
+    """Minimal single-result report."""
+    return {
+        "meta": {
+            "schema": SCHEMA_VERSION,
+            "grid": "default",
+            "sizes": [100_000],
+            "repeat": 3,
+            "calibration_ms": calibration_ms,
+            **library_versions(),
+        },
+        "results": [
+            {
+                "case": "RSIIndicator(period=14)",
+                "target": "RSIIndicator",
+                "bars": 100_000,
+                "ms": relative * calibration_ms,
+                "peak_bytes": peak_bytes,
+                "retained_bytes": 0,
+                "retained_blocks": 0,
+                "relative": relative,
+            }
+        ],
+    }
+
+
+class TestIndicatorBenchmarkRegression(LaborantTest):
+    """Benchmark suite coverage, report schema and comparison logic."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def test_suite_covers_exports(self):
+        """Test every exported indicator class has a benchmark case."""
+        self.reporter.info("Testing benchmark coverage", context="Test")
+
+        for grid in ("default", "full"):
+            uncovered = uncovered_exports(build_cases(grid))
+            assert not uncovered, f"No {grid} benchmark for: {uncovered}"
+
+        names = [case.name for case in build_cases("full")]
+        assert len(names) == len(set(names))
+
+        self.reporter.info("All exports benchmarked", context="Test")
+
+    def test_compare_flags_slowdown(self):
+        """Test compare() reports time and memory regressions."""
+        self.reporter.info("Testing regression detection", context="Test")
+
+        baseline = _report(relative=1.0, peak_bytes=1_000_000)
+
+        regressions = compare(_report(4.0, 2_000_000), baseline)
+        assert [r.metric for r in regressions] == ["time", "peak_memory"]
+        assert regressions[0].ratio == 4.0
+
+        assert compare(_report(2.5, 1_100_000), baseline) == []
+
+        memory_only = compare(
+            _report(4.0, 2_000_000), baseline, metrics=("peak_memory",)
+        )
+        assert [r.metric for r in memory_only] == ["peak_memory"]
+
+        self.reporter.info("Regressions detected", context="Test")
+
+    def test_compare_ignores_noise(self):
+        """Test differences below the absolute slack are not regressions."""
+        self.reporter.info("Testing noise slack", context="Test")
+
+        # 0.01 -> 0.05 relative at 10 ms calibration is 0.4 ms: below min_ms
+        baseline = _report(relative=0.01, peak_bytes=1_000)
+        assert compare(_report(0.05, 100_000), baseline) == []
+
+        self.reporter.info("Noise ignored", context="Test")
+
+    def test_compare_rejects_schema_mismatch(self):
+        """Test an incompatible baseline raises ValueError."""
+        self.reporter.info("Testing schema check", context="Test")
+
+        baseline = _report(1.0, 1_000)
+        baseline["meta"]["schema"] = SCHEMA_VERSION + 1
+
+        try:
+            compare(_report(1.0, 1_000), baseline)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "schema" in str(e)
+
+        self.reporter.info("Schema mismatch rejected", context="Test")
+
+    def test_compare_rejects_version_mismatch(self):
+        """Test a baseline from other library versions is refused."""
+        self.reporter.info("Testing library version check", context="Test")
+
+        baseline = _report(1.0, 1_000)
+        baseline["meta"]["pandas"] = "0.0.0"
+
+        try:
+            compare(_report(1.0, 1_000), baseline)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "pandas" in str(e) and "0.0.0" in str(e)
+
+        assert compare(_report(1.0, 1_000), baseline, allow_version_mismatch=True) == []
+
+        self.reporter.info("Version mismatch refused", context="Test")
+
+    def test_report_roundtrip_and_merge(self):
+        """Test reports survive save/load and merge replaces per case."""
+        self.reporter.info("Testing report files", context="Test")
+
+        old = _report(1.0, 1_000)
+        new = _report(2.0, 2_000)
+        new["results"].append({**new["results"][0], "bars": 1_000})
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "nested" / "report.json"
+            save_report(merge_reports(old, new), path)
+            merged = load_report(path)
+
+        assert len(merged["results"]) == 2
+        assert all(r["relative"] == 2.0 for r in merged["results"])
+
+        self.reporter.info("Report files correct", context="Test")
+
+    def test_suite_runs_with_valid_schema(self):
+        """Test a small run produces a report matching the schema."""
+        self.reporter.info("Running benchmark suite smoke test", context="Test")
+
+        report = run_suite((SMOKE_BARS,), repeat=1)
+        validate_report(report)
+
+        cases = build_cases("default")
+        assert [r["case"] for r in report["results"]] == [c.name for c in cases]
+        for result in report["results"]:
+            assert result["bars"] == SMOKE_BARS
+            assert result["ms"] > 0 and result["relative"] > 0
+            assert result["peak_bytes"] >= 0
+
+        self.reporter.info("Suite report valid", context="Test")
+
+    def test_baseline_matches_schema(self):
+        """Test the stored baseline loads and covers the default grid."""
+        self.reporter.info("Testing stored baseline", context="Test")
+
+        baseline = load_report(BASELINE_PATH)
+        validate_report(baseline)
+
+        recorded = {r["case"] for r in baseline["results"]}
+        missing = [c.name for c in build_cases("default") if c.name not in recorded]
+        assert not missing, f"Baseline has no results for: {missing}"
+
+        self.reporter.info("Baseline valid", context="Test")
+
+    def test_validate_report_rejects_missing_fields(self):
+        """Test validate_report() names the missing result key."""
+        self.reporter.info("Testing report validation", context="Test")
+
+        report = _report(1.0, 1_000)
+        del report["results"][0][RESULT_FIELDS[-1]]
+
+        try:
+            validate_report(report)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert RESULT_FIELDS[-1] in str(e)
+
+        self.reporter.info("Missing fields rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestIndicatorBenchmarkRegression.run_as_main()
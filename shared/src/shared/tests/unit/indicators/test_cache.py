@@ -0,0 +1,255 @@
+"""
+Unit tests for IndicatorCache.
+
+Tests cache hits on identical frames, streaming extension of appended
+candles, parameter- and series-sensitive keys and memory-bounded LRU
+eviction.
+
+Usage:
+    python tests/unit/indicators/test_cache.py
+    laborant test shared --unit
+"""
+
+import pandas as pd
+
+from shared.indicators import (
+    ADXIndicator,
+    EMAIndicator,
+    IndicatorCache,
+    PatternIndicator,
+    RSIIndicator,
+    StochasticIndicator,
+    indicator_key,
+)
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+
+class TestIndicatorCache(LaborantTest):
+    """Unit tests for IndicatorCache."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate candle history."""
+        self.df = generate_candles(600)
+
+    def setup_test(self):
+        """Start each test with an empty cache."""
+        self.cache = IndicatorCache()
+
+    def test_identical_frame_hits(self):
+        """Test second lookup with identical inputs is a hit."""
+        self.reporter.info("Testing cache hit", context="Test")
+
+        first = self.cache.calculate(RSIIndicator(period=14), self.df)
+        second = self.cache.calculate(RSIIndicator(period=14), self.df.copy())
+
+        pd.testing.assert_series_equal(first, second)
+        pd.testing.assert_series_equal(
+            second, RSIIndicator(period=14).calculate(self.df)
+        )
+        stats = self.cache.stats
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+        self.reporter.info("Cache hit served", context="Test")
+
+    def test_params_in_key(self):
+        """Test different parameters do not share an entry."""
+        self.reporter.info("Testing parameter keys", context="Test")
+
+        self.cache.calculate(EMAIndicator(period=12), self.df)
+        self.cache.calculate(EMAIndicator(period=26), self.df)
+
+        assert self.cache.stats.misses == 2
+        assert len(self.cache) == 2
+
+        # Same class name in another module is a different indicator
+        shadow = type("EMAIndicator", (EMAIndicator,), {"__module__": "other"})
+        assert indicator_key(EMAIndicator(period=12)) == indicator_key(
+            EMAIndicator(period=12)
+        )
+        assert indicator_key(shadow(period=12)) != indicator_key(
+            EMAIndicator(period=12)
+        )
+
+        self.reporter.info("Parameters separate entries", context="Test")
+
+    def test_changed_last_row_misses(self):
+        """Test a revised last candle is not served from cache."""
+        self.reporter.info("Testing revised last row", context="Test")
+
+        self.cache.calculate(RSIIndicator(period=14), self.df)
+        revised = self.df.copy()
+        revised.iloc[-1, revised.columns.get_loc("close")] += 1.0
+
+        result = self.cache.calculate(RSIIndicator(period=14), revised)
+
+        pd.testing.assert_series_equal(
+            result, RSIIndicator(period=14).calculate(revised)
+        )
+        assert self.cache.stats.misses == 2
+
+        self.reporter.info("Revised row recomputed", context="Test")
+
+    def test_appended_rows_extend(self):
+        """Test appended candles extend cached results via streaming."""
+        self.reporter.info("Testing append extension", context="Test")
+
+        indicators = [
+            RSIIndicator(period=14),
+            ADXIndicator(period=14, return_components=True),
+            StochasticIndicator(),
+        ]
+        for indicator in indicators:
+            self.cache.calculate(indicator, self.df.iloc[:550])
+
+        for indicator in indicators:
+            result = self.cache.calculate(indicator, self.df)
+            expected = indicator.calculate(self.df)
+
+            if isinstance(expected, dict):
+                for key, series in expected.items():
+                    pd.testing.assert_series_equal(result[key], series, rtol=1e-9)
+            else:
+                pd.testing.assert_series_equal(result, expected, rtol=1e-9)
+
+        assert self.cache.stats.extensions == len(indicators)
+
+        self.reporter.info("Appended rows extended", context="Test")
+
+    def test_large_append_recomputes(self):
+        """Test appends beyond max_extend_rows fall back to calculate()."""
+        self.reporter.info("Testing large append", context="Test")
+
+        cache = IndicatorCache(max_extend_rows=10)
+        cache.calculate(RSIIndicator(period=14), self.df.iloc[:500])
+        cache.calculate(RSIIndicator(period=14), self.df)
+
+        assert cache.stats.extensions == 0
+        assert cache.stats.misses == 2
+
+        self.reporter.info("Large append recomputed", context="Test")
+
+    def test_non_streaming_indicator_cached(self):
+        """Test indicators without streaming support are still cached."""
+        self.reporter.info("Testing non-streaming indicator", context="Test")
+
+        calls = []
+
+        class CountingPattern(PatternIndicator):
+            def calculate(self, df):
+                calls.append(len(df))
+                return {"aggregate": pd.Series(0.0, index=df.index), "individual": {}}
+
+        indicator = CountingPattern(bullish=["CDLHAMMER"])
+        self.cache.calculate(indicator, self.df.iloc[:500])
+        self.cache.calculate(indicator, self.df.iloc[:500])
+        self.cache.calculate(indicator, self.df)
+
+        assert calls == [500, 600]
+        assert self.cache.stats.hits == 1
+
+        self.reporter.info("Non-streaming indicator cached", context="Test")
+
+    def test_lru_eviction_by_bytes(self):
+        """Test least recently used entry is evicted over max_bytes."""
+        self.reporter.info("Testing LRU eviction", context="Test")
+
+        one_entry = IndicatorCache()
+        one_entry.calculate(EMAIndicator(period=10), self.df)
+        cache = IndicatorCache(max_bytes=one_entry.stats.bytes * 2)
+
+        cache.calculate(EMAIndicator(period=10), self.df)
+        cache.calculate(EMAIndicator(period=20), self.df)
+        cache.calculate(EMAIndicator(period=10), self.df)  # refresh
+        cache.calculate(EMAIndicator(period=30), self.df)  # evicts 20
+
+        assert cache.stats.evictions == 1
+        assert cache.stats.bytes <= cache.max_bytes
+        cache.calculate(EMAIndicator(period=10), self.df)
+        assert cache.stats.hits == 2
+
+        self.reporter.info("LRU eviction correct", context="Test")
+
+    def test_results_are_copies(self):
+        """Test mutating a returned Series does not corrupt the cache."""
+        self.reporter.info("Testing result isolation", context="Test")
+
+        result = self.cache.calculate(EMAIndicator(period=10), self.df)
+        result.iloc[:] = 0.0
+
+        again = self.cache.calculate(EMAIndicator(period=10), self.df)
+        assert (again.dropna() != 0.0).all()
+
+        self.reporter.info("Results isolated", context="Test")
+
+    def test_series_in_key(self):
+        """Test one indicator over several series keeps an entry per series."""
+        self.reporter.info("Testing series keys", context="Test")
+
+        # Same timestamps, different prices (two symbols)
+        frames = {
+            "SOL/USDC": generate_candles(600, seed=1),
+            "BTC/USDC": generate_candles(600, seed=2, start_price=60_000.0),
+        }
+        for _ in range(5):
+            for df in frames.values():
+                result = self.cache.calculate(RSIIndicator(period=14), df)
+                pd.testing.assert_series_equal(
+                    result, RSIIndicator(period=14).calculate(df)
+                )
+
+        stats = self.cache.stats
+        assert (stats.hits, stats.misses, stats.entries) == (8, 2, 2)
+
+        # Explicit series keys replace a window that slid forward
+        sol = frames["SOL/USDC"]
+        self.cache.calculate(RSIIndicator(period=14), sol.iloc[:500], "SOL/USDC")
+        result = self.cache.calculate(
+            RSIIndicator(period=14), sol.iloc[1:501], "SOL/USDC"
+        )
+        pd.testing.assert_series_equal(
+            result, RSIIndicator(period=14).calculate(sol.iloc[1:501])
+        )
+        assert len(self.cache) == 3
+
+        self.cache.invalidate(RSIIndicator(period=14))
+        assert len(self.cache) == 0
+
+        self.reporter.info("Series isolated", context="Test")
+
+    def test_invalidate(self):
+        """Test invalidate drops one or all entries."""
+        self.reporter.info("Testing invalidate", context="Test")
+
+        self.cache.calculate(EMAIndicator(period=10), self.df)
+        self.cache.calculate(EMAIndicator(period=20), self.df)
+
+        self.cache.invalidate(EMAIndicator(period=10))
+        assert len(self.cache) == 1
+
+        self.cache.invalidate()
+        assert len(self.cache) == 0
+        assert self.cache.stats.bytes == 0
+
+        self.reporter.info("Invalidate correct", context="Test")
+
+    def test_invalid_limits(self):
+        """Test invalid constructor limits raise ValueError."""
+        self.reporter.info("Testing invalid limits", context="Test")
+
+        try:
+            IndicatorCache(max_bytes=0)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "max_bytes" in str(e)
+
+        self.reporter.info("Invalid limits rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestIndicatorCache.run_as_main()
@@ -0,0 +1,259 @@
+"""
+Unit tests for batch candlestick pattern scanning.
+
+Tests scan_patterns timings/failures reporting, thread-pool scanning,
+the NumPy fallback kernels and PatternIndicator aggregation.
+
+Usage:
+    python tests/unit/indicators/test_patterns.py
+    laborant test shared --unit
+"""
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import PatternIndicator, scan_patterns
+from shared.indicators.candlestick import FALLBACK_PATTERNS
+from shared.indicators.patterns import talib
+from shared.tests import LaborantTest
+
+
+def _random_candles(bars: int, seed: int = 0) -> pd.DataFrame:
+    """Candles with varied bodies and shadows so patterns fire often."""
+    rng = np.random.default_rng(seed)
+    mid = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    open_ = mid * (1 + rng.normal(0, 0.01, bars))
+    close = mid * (1 + rng.normal(0, 0.01, bars))
+
+    tiny = rng.random(bars) < 0.2
+    close[tiny] = open_[tiny] * (1 + rng.normal(0, 0.0005, tiny.sum()))
+
+    wick = np.abs(rng.normal(0, 0.006, (2, bars))) * (rng.random((2, bars)) < 0.7)
+    high = np.maximum(open_, close) * (1 + wick[0])
+    low = np.minimum(open_, close) * (1 - wick[1])
+
+    index = pd.date_range("2024-01-01", periods=bars, freq="1min")
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close}, index=index
+    )
+
+
+def _flat_history(bars: int = 12) -> pd.DataFrame:
+    """Uniform candles (body 1, range 2) used as averaging history."""
+    return pd.DataFrame(
+        {
+            "open": [100.0] * bars,
+            "high": [101.5] * bars,
+            "low": [99.5] * bars,
+            "close": [101.0] * bars,
+        }
+    )
+
+
+class TestPatternScanning(LaborantTest):
+    """Unit tests for scan_patterns and PatternIndicator."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate candle history."""
+        self.df = _random_candles(5000)
+
+    def test_fallback_matches_talib(self):
+        """Test NumPy kernels reproduce TA-Lib output exactly."""
+        self.reporter.info("Testing NumPy fallback parity", context="Test")
+
+        if talib is None:
+            self.reporter.info("TA-Lib not installed, parity skipped", context="Test")
+            return
+
+        patterns = list(FALLBACK_PATTERNS)
+        reference = scan_patterns(self.df, patterns, backend="talib")
+        fallback = scan_patterns(self.df, patterns, backend="numpy")
+
+        for pattern in patterns:
+            np.testing.assert_array_equal(
+                fallback.results[pattern], reference.results[pattern], err_msg=pattern
+            )
+
+        self.reporter.info("Fallback matches TA-Lib", context="Test")
+
+    def test_hammer_fallback(self):
+        """Test hammer fires on a small body with a long lower shadow."""
+        self.reporter.info("Testing hammer kernel", context="Test")
+
+        df = pd.concat(
+            [
+                _flat_history(),
+                pd.DataFrame(
+                    {"open": [99.8], "high": [100.05], "low": [97.0], "close": [100.0]}
+                ),
+            ],
+            ignore_index=True,
+        )
+        scan = scan_patterns(df, ["CDLHAMMER"], backend="numpy")
+
+        assert scan.results["CDLHAMMER"][-1] == 100
+        assert not scan.results["CDLHAMMER"][:-1].any()
+
+        self.reporter.info("Hammer detected", context="Test")
+
+    def test_engulfing_fallback(self):
+        """Test bullish engulfing scores +100 and bearish -100."""
+        self.reporter.info("Testing engulfing kernel", context="Test")
+
+        df = pd.DataFrame(
+            {
+                "open": [101.0, 101.0, 99.4, 99.0, 102.5],
+                "high": [101.5, 101.5, 102.5, 102.5, 103.0],
+                "low": [99.0, 99.0, 99.0, 98.5, 97.5],
+                "close": [99.5, 99.5, 102.0, 102.0, 98.0],
+            }
+        )
+        scan = scan_patterns(df, ["CDLENGULFING"], backend="numpy")
+
+        assert list(scan.results["CDLENGULFING"]) == [0, 0, 100, 0, -100]
+
+        self.reporter.info("Engulfing detected", context="Test")
+
+    def test_timings_and_failures_reported(self):
+        """Test every pattern gets a timing or a failure reason."""
+        self.reporter.info("Testing scan report", context="Test")
+
+        patterns = ["CDLHAMMER", "CDLDOJI", "CDLNOTAPATTERN"]
+        scan = scan_patterns(self.df, patterns)
+
+        assert set(scan.results) == {"CDLHAMMER", "CDLDOJI"}
+        assert set(scan.failures) == {"CDLNOTAPATTERN"}
+        assert set(scan.timings_ms) == {"CDLHAMMER", "CDLDOJI"}
+        assert all(ms >= 0 for ms in scan.timings_ms.values())
+        assert scan.total_ms >= scan.convert_ms
+
+        self.reporter.info("Scan report complete", context="Test")
+
+    def test_kernel_exception_reported(self):
+        """Test an exception inside a kernel becomes a failure entry."""
+        self.reporter.info("Testing kernel exception", context="Test")
+
+        def broken(o, h, low, c):
+            raise RuntimeError("bad input")
+
+        FALLBACK_PATTERNS["CDLBROKEN"] = broken
+        try:
+            scan = scan_patterns(self.df, ["CDLBROKEN", "CDLDOJI"], backend="numpy")
+        finally:
+            del FALLBACK_PATTERNS["CDLBROKEN"]
+
+        assert "RuntimeError" in scan.failures["CDLBROKEN"]
+        assert "CDLDOJI" in scan.results
+
+        self.reporter.info("Kernel exception reported", context="Test")
+
+    def test_thread_pool_matches_sequential(self):
+        """Test parallel scanning returns the same results."""
+        self.reporter.info("Testing thread pool scan", context="Test")
+
+        patterns = list(FALLBACK_PATTERNS)
+        sequential = scan_patterns(self.df, patterns, max_workers=1)
+        parallel = scan_patterns(self.df, patterns, max_workers=4)
+
+        for pattern in patterns:
+            np.testing.assert_array_equal(
+                parallel.results[pattern], sequential.results[pattern]
+            )
+
+        self.reporter.info("Thread pool results match", context="Test")
+
+    def test_indicator_aggregation(self):
+        """Test aggregate methods over bullish and inverted bearish patterns."""
+        self.reporter.info("Testing aggregation", context="Test")
+
+        kwargs = dict(
+            bullish=["CDLHAMMER", "CDLENGULFING"],
+            bearish=["CDLSHOOTINGSTAR"],
+            backend="numpy",
+        )
+        scan = scan_patterns(
+            self.df, ["CDLHAMMER", "CDLENGULFING", "CDLSHOOTINGSTAR"], backend="numpy"
+        )
+        total = (
+            scan.results["CDLHAMMER"]
+            + scan.results["CDLENGULFING"]
+            - scan.results["CDLSHOOTINGSTAR"]
+        )
+
+        weighted = PatternIndicator(**kwargs).calculate(self.df)
+        simple = PatternIndicator(aggregate_method="simple_sum", **kwargs)
+        count = PatternIndicator(aggregate_method="count", **kwargs)
+
+        np.testing.assert_allclose(weighted["aggregate"], total / 300 * 100)
+        np.testing.assert_array_equal(simple.calculate(self.df)["aggregate"], total)
+        assert count.calculate(self.df)["aggregate"].max() <= 3
+        assert (weighted["individual"]["CDLSHOOTINGSTAR"] >= 0).all()
+
+        self.reporter.info("Aggregation correct", context="Test")
+
+    def test_strict_raises_on_failure(self):
+        """Test strict mode raises ValueError naming the failed pattern."""
+        self.reporter.info("Testing strict mode", context="Test")
+
+        indicator = PatternIndicator(
+            bullish=["CDLHAMMER", "CDLNOTAPATTERN"], strict=True
+        )
+
+        try:
+            indicator.calculate(self.df)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "CDLNOTAPATTERN" in str(e)
+
+        self.reporter.info("Strict mode enforced", context="Test")
+
+    def test_non_strict_reports_failures(self):
+        """Test skipped patterns are listed on the calculate() result."""
+        self.reporter.info("Testing non-strict failures", context="Test")
+
+        indicator = PatternIndicator(bullish=["CDLDOJI", "CDLNOTAPATTERN"])
+        result = indicator.calculate(self.df)
+
+        assert set(result["individual"]) == {"CDLDOJI"}
+        assert set(result["failures"]) == {"CDLNOTAPATTERN"}
+
+        missing = PatternIndicator(bearish=["CDLNOTAPATTERN"]).calculate(self.df)
+        assert missing["individual"] == {}
+        assert set(missing["failures"]) == {"CDLNOTAPATTERN"}
+
+        clean = PatternIndicator(bullish=["CDLDOJI"]).calculate(self.df)
+        assert clean["failures"] == {}
+
+        self.reporter.info("Failures reported", context="Test")
+
+    def test_missing_columns(self):
+        """Test missing OHLC column raises KeyError."""
+        self.reporter.info("Testing missing columns", context="Test")
+
+        try:
+            scan_patterns(self.df.drop(columns=["low"]), ["CDLDOJI"])
+            assert False, "Should have raised KeyError"
+        except KeyError as e:
+            assert "low" in str(e)
+
+        self.reporter.info("Missing columns rejected", context="Test")
+
+    def test_invalid_params(self):
+        """Test invalid backend and max_workers raise ValueError."""
+        self.reporter.info("Testing invalid params", context="Test")
+
+        for kwargs in ({"backend": "gpu"}, {"max_workers": 0}):
+            try:
+                PatternIndicator(bullish=["CDLDOJI"], **kwargs)
+                assert False, f"Should have raised ValueError for {kwargs}"
+            except ValueError:
+                pass
+
+        self.reporter.info("Invalid params rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestPatternScanning.run_as_main()
@@ -0,0 +1,181 @@
+"""
+Unit tests for IndicatorPipeline.
+
+Tests that shared-intermediate evaluation matches each indicator's own
+calculate() and that redundant intermediates are deduplicated.
+
+Usage:
+    python tests/unit/indicators/test_pipeline.py
+    laborant test shared --unit
+"""
+
+import pandas as pd
+
+from shared.indicators import (
+    ADXIndicator,
+    ATRIndicator,
+    BollingerBandsIndicator,
+    EMAIndicator,
+    IndicatorPipeline,
+    MACDIndicator,
+    PatternIndicator,
+    RSIIndicator,
+    SMAIndicator,
+    StochasticIndicator,
+    VolumeIndicator,
+)
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+
+def _assert_same(expected, actual) -> None:
+    """Compare calculate() output with pipeline output."""
+    if isinstance(expected, dict):
+        assert set(expected) == set(actual)
+        for key in expected:
+            pd.testing.assert_series_equal(
+                expected[key], actual[key], check_names=False
+            )
+    else:
+        pd.testing.assert_series_equal(expected, actual, check_names=False)
+
+
+class TestIndicatorPipeline(LaborantTest):
+    """Unit tests for IndicatorPipeline."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate candle history."""
+        self.df = generate_candles(500)
+
+    def test_results_match_calculate(self):
+        """Test every planned indicator matches its calculate()."""
+        self.reporter.info("Testing pipeline parity", context="Test")
+
+        indicators = [
+            RSIIndicator(period=14),
+            ATRIndicator(period=14),
+            ADXIndicator(period=14, return_components=True),
+            EMAIndicator(period=12, compute_distance=True),
+            MACDIndicator(),
+            SMAIndicator(period=20, compute_slope=True, compute_position=True),
+            BollingerBandsIndicator(period=20),
+            StochasticIndicator(),
+            VolumeIndicator(sma_period=20),
+        ]
+        results = IndicatorPipeline(indicators).run(self.df)
+
+        for indicator, result in zip(indicators, results):
+            _assert_same(indicator.calculate(self.df), result)
+
+        self.reporter.info("Pipeline results match calculate", context="Test")
+
+    def test_shared_true_range_and_ewm(self):
+        """Test ATR/ADX share TR and EMA/MACD share an EWM."""
+        self.reporter.info("Testing shared intermediates", context="Test")
+
+        pipeline = IndicatorPipeline(
+            [
+                RSIIndicator(period=14),
+                ATRIndicator(period=14),
+                ADXIndicator(period=14),
+                EMAIndicator(period=12),
+                MACDIndicator(fast_period=12),
+            ]
+        )
+        stats = pipeline.stats
+
+        # ATR/ADX: shift, TR, smoothed TR; EMA/MACD: EWM and its mask
+        assert stats.eliminated == 5
+        assert stats.unique_nodes == stats.node_requests - stats.eliminated
+        assert stats.reduction_pct > 0
+
+        self.reporter.info(f"Eliminated {stats.eliminated} nodes", context="Test")
+
+    def test_directional_movement_computed_once(self):
+        """Test +DM and -DM come from one node shared across ADX periods."""
+        self.reporter.info("Testing shared directional movement", context="Test")
+
+        pipeline = IndicatorPipeline([ADXIndicator(period=14), ADXIndicator(period=21)])
+        ops = [op for op, _, _ in pipeline._nodes.values()]
+
+        assert ops.count("directional_movement") == 1
+        assert ops.count("pick") == 2
+
+        self.reporter.info("Directional movement shared", context="Test")
+
+    def test_duplicate_indicators_fully_shared(self):
+        """Test identical indicators add no new nodes."""
+        self.reporter.info("Testing duplicate indicators", context="Test")
+
+        single = IndicatorPipeline([RSIIndicator(period=14)]).stats
+        double = IndicatorPipeline(
+            [RSIIndicator(period=14), RSIIndicator(period=14)]
+        ).stats
+
+        assert double.unique_nodes == single.unique_nodes
+        assert double.eliminated == single.node_requests
+
+        self.reporter.info("Duplicates fully shared", context="Test")
+
+    def test_sma_and_bollinger_share_rolling_mean(self):
+        """Test SMA(20) and Bollinger(20) share the rolling mean."""
+        self.reporter.info("Testing shared rolling window", context="Test")
+
+        stats = IndicatorPipeline(
+            [SMAIndicator(period=20), BollingerBandsIndicator(period=20)]
+        ).stats
+
+        assert stats.eliminated == 1
+
+        self.reporter.info("Rolling mean shared", context="Test")
+
+    def test_unplanned_indicator_uses_calculate(self):
+        """Test indicators without a plan fall back to calculate()."""
+        self.reporter.info("Testing opaque indicator fallback", context="Test")
+
+        class ConstantPattern(PatternIndicator):
+            def calculate(self, df):
+                return {"aggregate": pd.Series(1.0, index=df.index), "individual": {}}
+
+        pipeline = IndicatorPipeline([ConstantPattern(bullish=["CDLHAMMER"])])
+        (result,) = pipeline.run(self.df)
+
+        assert pipeline.stats.opaque == 1
+        assert (result["aggregate"] == 1.0).all()
+
+        self.reporter.info("Opaque indicator evaluated", context="Test")
+
+    def test_missing_column(self):
+        """Test missing column raises KeyError."""
+        self.reporter.info("Testing missing column", context="Test")
+
+        pipeline = IndicatorPipeline([ATRIndicator(period=14)])
+
+        try:
+            pipeline.run(self.df.drop(columns=["high"]))
+            assert False, "Should have raised KeyError"
+        except KeyError as e:
+            assert "high" in str(e)
+
+        self.reporter.info("Missing column rejected", context="Test")
+
+    def test_insufficient_data(self):
+        """Test too few candles raises ValueError."""
+        self.reporter.info("Testing insufficient data", context="Test")
+
+        pipeline = IndicatorPipeline([MACDIndicator()])
+
+        try:
+            pipeline.run(self.df.iloc[:20])
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "Insufficient data" in str(e)
+
+        self.reporter.info("Insufficient data rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestIndicatorPipeline.run_as_main()
@@ -0,0 +1,223 @@
+"""
+Unit tests for streaming indicator updates.
+
+Verifies that seed() + update() reproduces calculate() bar by bar
+for every indicator that supports streaming.
+
+Usage:
+    python tests/unit/indicators/test_streaming.py
+    laborant test shared --unit
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import (
+    ADXIndicator,
+    ATRIndicator,
+    BollingerBandsIndicator,
+    EMAIndicator,
+    MACDIndicator,
+    PatternIndicator,
+    RSIIndicator,
+    SMAIndicator,
+    StochasticIndicator,
+    VolumeIndicator,
+)
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+SEED_BARS = 300
+STREAM_BARS = 200
+
+
+def _assert_close(expected: float, actual: float, label: str) -> None:
+    """Assert two floats match, treating NaN == NaN."""
+    if math.isnan(expected):
+        assert math.isnan(actual), f"{label}: expected NaN, got {actual}"
+        return
+    assert math.isclose(
+        expected, actual, rel_tol=1e-9, abs_tol=1e-9
+    ), f"{label}: expected {expected}, got {actual}"
+
+
+def _assert_stream_parity(indicator, df: pd.DataFrame) -> None:
+    """Seed on a prefix, stream the rest and compare with calculate()."""
+    full = indicator.calculate(df)
+    indicator.seed(df.iloc[:SEED_BARS])
+
+    for i in range(SEED_BARS, len(df)):
+        value = indicator.update(df.iloc[i])
+
+        if isinstance(full, dict):
+            assert set(value) == set(full), f"keys differ at bar {i}"
+            for key, series in full.items():
+                _assert_close(float(series.iloc[i]), float(value[key]), f"{key}@{i}")
+        else:
+            _assert_close(float(full.iloc[i]), float(value), f"value@{i}")
+
+
+class TestIndicatorStreaming(LaborantTest):
+    """Parity tests for BaseIndicator.seed()/update()."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate shared candle history."""
+        self.df = generate_candles(SEED_BARS + STREAM_BARS)
+
+    def test_ema_parity(self):
+        """Test EMA streaming parity (plain and with distance)."""
+        self.reporter.info("Testing EMA streaming", context="Test")
+
+        _assert_stream_parity(EMAIndicator(period=12), self.df)
+        _assert_stream_parity(EMAIndicator(period=50, compute_distance=True), self.df)
+
+        self.reporter.info("EMA streaming matches calculate", context="Test")
+
+    def test_sma_parity(self):
+        """Test SMA streaming parity with all metrics."""
+        self.reporter.info("Testing SMA streaming", context="Test")
+
+        _assert_stream_parity(SMAIndicator(period=20, compute_distance=False), self.df)
+        _assert_stream_parity(
+            SMAIndicator(period=20, compute_slope=True, compute_position=True),
+            self.df,
+        )
+
+        self.reporter.info("SMA streaming matches calculate", context="Test")
+
+    def test_rsi_parity(self):
+        """Test RSI streaming parity."""
+        self.reporter.info("Testing RSI streaming", context="Test")
+
+        _assert_stream_parity(RSIIndicator(period=14), self.df)
+
+        self.reporter.info("RSI streaming matches calculate", context="Test")
+
+    def test_rsi_state_matches_series(self):
+        """Test RSI state reproduces the last value of the series."""
+        self.reporter.info("Testing RSI state consistency", context="Test")
+
+        rsi = RSIIndicator(period=14)
+        series, state = rsi.calculate_with_state(self.df)
+
+        pd.testing.assert_series_equal(series, rsi.calculate(self.df))
+        rs = state["avg_gain"] / state["avg_loss"]
+        _assert_close(float(series.iloc[-1]), 100 - 100 / (1 + rs), "rsi")
+        assert state["prev_close"] == float(self.df["close"].iloc[-1])
+
+        self.reporter.info("RSI state consistent with series", context="Test")
+
+    def test_macd_parity(self):
+        """Test MACD streaming parity."""
+        self.reporter.info("Testing MACD streaming", context="Test")
+
+        _assert_stream_parity(MACDIndicator(), self.df)
+
+        self.reporter.info("MACD streaming matches calculate", context="Test")
+
+    def test_atr_parity(self):
+        """Test ATR streaming parity."""
+        self.reporter.info("Testing ATR streaming", context="Test")
+
+        _assert_stream_parity(ATRIndicator(period=14), self.df)
+
+        self.reporter.info("ATR streaming matches calculate", context="Test")
+
+    def test_adx_parity(self):
+        """Test ADX streaming parity (plain and with components)."""
+        self.reporter.info("Testing ADX streaming", context="Test")
+
+        _assert_stream_parity(ADXIndicator(period=14), self.df)
+        _assert_stream_parity(ADXIndicator(period=14, return_components=True), self.df)
+
+        self.reporter.info("ADX streaming matches calculate", context="Test")
+
+    def test_bollinger_parity(self):
+        """Test Bollinger Bands streaming parity."""
+        self.reporter.info("Testing Bollinger streaming", context="Test")
+
+        _assert_stream_parity(BollingerBandsIndicator(period=20), self.df)
+
+        self.reporter.info("Bollinger streaming matches calculate", context="Test")
+
+    def test_stochastic_parity(self):
+        """Test Stochastic streaming parity."""
+        self.reporter.info("Testing Stochastic streaming", context="Test")
+
+        _assert_stream_parity(StochasticIndicator(), self.df)
+
+        self.reporter.info("Stochastic streaming matches calculate", context="Test")
+
+    def test_volume_parity(self):
+        """Test Volume streaming parity."""
+        self.reporter.info("Testing Volume streaming", context="Test")
+
+        _assert_stream_parity(VolumeIndicator(sma_period=20), self.df)
+        _assert_stream_parity(
+            VolumeIndicator(sma_period=20, compute_mfi=True, compute_ad=True), self.df
+        )
+
+        self.reporter.info("Volume streaming matches calculate", context="Test")
+
+    def test_volume_parity_with_nan(self):
+        """Test NaN volumes and closes do not poison streamed OBV."""
+        self.reporter.info("Testing Volume streaming with NaN", context="Test")
+
+        df = self.df.copy()
+        df.iloc[SEED_BARS - 1, df.columns.get_loc("volume")] = np.nan
+        df.iloc[SEED_BARS + 30, df.columns.get_loc("volume")] = np.nan
+        df.iloc[SEED_BARS + 90, df.columns.get_loc("close")] = np.nan
+
+        _assert_stream_parity(VolumeIndicator(sma_period=20, compute_ratio=False), df)
+
+        self.reporter.info("NaN inputs skipped like calculate", context="Test")
+
+    def test_update_requires_seed(self):
+        """Test update() before seed() raises ValueError."""
+        self.reporter.info("Testing unseeded update", context="Test")
+
+        ema = EMAIndicator(period=12)
+        assert not ema.is_seeded
+
+        try:
+            ema.update({"close": 100.0})
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "seed" in str(e)
+
+        self.reporter.info("Unseeded update rejected", context="Test")
+
+    def test_seed_returns_calculate_result(self):
+        """Test seed() returns the same result as calculate()."""
+        self.reporter.info("Testing seed return value", context="Test")
+
+        rsi = RSIIndicator(period=14)
+        seeded = rsi.seed(self.df)
+
+        assert rsi.is_seeded
+        pd.testing.assert_series_equal(seeded, rsi.calculate(self.df))
+
+        self.reporter.info("seed() returns calculate() result", context="Test")
+
+    def test_pattern_streaming_not_supported(self):
+        """Test indicators without streaming raise NotImplementedError."""
+        self.reporter.info("Testing unsupported streaming", context="Test")
+
+        patterns = PatternIndicator(bullish=["CDLHAMMER"])
+
+        try:
+            patterns.seed(self.df)
+            assert False, "Should have raised NotImplementedError"
+        except NotImplementedError as e:
+            assert "PatternIndicator" in str(e)
+
+        self.reporter.info("Unsupported streaming rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestIndicatorStreaming.run_as_main()
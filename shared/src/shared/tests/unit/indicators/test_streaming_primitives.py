@@ -0,0 +1,118 @@
+"""
+Unit tests for streaming primitives.
+
+Tests EWMState, RollingWindow and RollingExtremum against the pandas
+operations they replace.
+
+Usage:
+    python tests/unit/indicators/test_streaming_primitives.py
+    laborant test shared --unit
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators.streaming import (
+    EWMState,
+    RollingExtremum,
+    RollingWindow,
+)
+from shared.tests import LaborantTest
+
+
+def _assert_close(expected: float, actual: float, label: str) -> None:
+    """Assert two floats match, treating NaN == NaN."""
+    if math.isnan(expected):
+        assert math.isnan(actual), f"{label}: expected NaN, got {actual}"
+        return
+    assert math.isclose(
+        expected, actual, rel_tol=1e-9, abs_tol=1e-9
+    ), f"{label}: expected {expected}, got {actual}"
+
+
+class TestStreamingPrimitives(LaborantTest):
+    """Unit tests for streaming building blocks."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def test_ewm_state_matches_pandas(self):
+        """Test EWMState reproduces pandas EWM including NaN gaps."""
+        self.reporter.info("Testing EWMState parity", context="Test")
+
+        values = pd.Series([1.0, 2.0, np.nan, 4.0, np.nan, np.nan, 3.0, 5.0])
+        expected = values.ewm(alpha=0.3, min_periods=2, adjust=False).mean()
+
+        state = EWMState(0.3, min_periods=2)
+        for i, x in enumerate(values):
+            _assert_close(float(expected.iloc[i]), state.update(float(x)), f"@{i}")
+
+        self.reporter.info("EWMState matches pandas", context="Test")
+
+    def test_ewm_state_from_series(self):
+        """Test EWMState recovered from smoothed series continues exactly."""
+        self.reporter.info("Testing EWMState.from_series", context="Test")
+
+        values = pd.Series(np.linspace(1.0, 20.0, 40))
+        values.iloc[-1] = np.nan
+        expected = values.ewm(alpha=0.2, adjust=False).mean()
+
+        state = EWMState.from_series(values.iloc[:30], expected.iloc[:30], alpha=0.2)
+        for i in range(30, 40):
+            _assert_close(
+                float(expected.iloc[i]), state.update(float(values.iloc[i])), f"@{i}"
+            )
+
+        self.reporter.info("EWMState resumes from series", context="Test")
+
+    def test_rolling_window_mean_std(self):
+        """Test RollingWindow mean and std match pandas rolling."""
+        self.reporter.info("Testing RollingWindow", context="Test")
+
+        values = pd.Series(np.random.default_rng(1).normal(100, 5, 100))
+        mean = values.rolling(10).mean()
+        std = values.rolling(10).std()
+
+        window = RollingWindow(10)
+        for i, x in enumerate(values):
+            window.push(float(x))
+            _assert_close(float(mean.iloc[i]), window.mean, f"mean@{i}")
+            _assert_close(float(std.iloc[i]), window.std, f"std@{i}")
+
+        self.reporter.info("RollingWindow matches pandas", context="Test")
+
+    def test_rolling_extremum(self):
+        """Test RollingExtremum max/min match pandas rolling."""
+        self.reporter.info("Testing RollingExtremum", context="Test")
+
+        values = pd.Series(np.random.default_rng(2).normal(0, 1, 100))
+        rolling_max = values.rolling(7).max()
+        rolling_min = values.rolling(7).min()
+
+        high = RollingExtremum(7, "max")
+        low = RollingExtremum(7, "min")
+        for i, x in enumerate(values):
+            high.push(float(x))
+            low.push(float(x))
+            _assert_close(float(rolling_max.iloc[i]), high.value, f"max@{i}")
+            _assert_close(float(rolling_min.iloc[i]), low.value, f"min@{i}")
+
+        self.reporter.info("RollingExtremum matches pandas", context="Test")
+
+    def test_rolling_extremum_invalid_mode(self):
+        """Test RollingExtremum rejects unknown mode."""
+        self.reporter.info("Testing invalid mode", context="Test")
+
+        try:
+            RollingExtremum(5, "median")
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "mode" in str(e)
+
+        self.reporter.info("Invalid mode rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestStreamingPrimitives.run_as_main()
@@ -0,0 +1,187 @@
+"""
+Unit tests for VolumeIndicator.
+
+Tests the vectorized OBV kernel against the per-bar definition and
+checks session VWAP, Money Flow Index and Accumulation/Distribution
+against hand-computed values.
+
+Usage:
+    python tests/unit/indicators/test_volume.py
+    laborant test shared --unit
+"""
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import IndicatorPipeline, VolumeIndicator
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+
+def _reference_obv(df: pd.DataFrame) -> pd.Series:
+    """OBV built one bar at a time."""
+    obv = [0.0]
+    for i in range(1, len(df)):
+        change = df["close"].iloc[i] - df["close"].iloc[i - 1]
+        step = df["volume"].iloc[i] if change > 0 else 0.0
+        step = -df["volume"].iloc[i] if change < 0 else step
+        obv.append(obv[-1] + step)
+    return pd.Series(obv, index=df.index)
+
+
+class TestVolumeIndicator(LaborantTest):
+    """Unit tests for VolumeIndicator."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate candle history spanning three sessions."""
+        self.df = generate_candles(3 * 1440 + 100, freq="1min")
+
+    def test_obv_matches_reference(self):
+        """Test vectorized OBV equals bar-by-bar definition."""
+        self.reporter.info("Testing OBV kernel", context="Test")
+
+        df = self.df.iloc[:500].copy()
+        df.iloc[100:110, df.columns.get_loc("close")] = df["close"].iloc[99]
+
+        result = VolumeIndicator(sma_period=20).calculate(df)
+
+        np.testing.assert_allclose(result["obv"], _reference_obv(df), rtol=1e-12)
+
+        self.reporter.info("OBV matches reference", context="Test")
+
+    def test_vwap_resets_each_session(self):
+        """Test VWAP restarts at every session boundary."""
+        self.reporter.info("Testing session VWAP", context="Test")
+
+        result = VolumeIndicator(compute_vwap=True).calculate(self.df)
+        vwap = result["vwap"]
+
+        typical = (self.df["high"] + self.df["low"] + self.df["close"]) / 3
+        day_two = self.df.index.normalize() == self.df.index[1440].normalize()
+        expected = (typical[day_two] * self.df["volume"][day_two]).sum() / (
+            self.df["volume"][day_two].sum()
+        )
+
+        assert np.isclose(vwap.iloc[1440], typical.iloc[1440], rtol=1e-12)
+        assert np.isclose(vwap[day_two].iloc[-1], expected, rtol=1e-12)
+
+        self.reporter.info("VWAP resets per session", context="Test")
+
+    def test_vwap_requires_datetime_index(self):
+        """Test VWAP on a RangeIndex raises ValueError."""
+        self.reporter.info("Testing VWAP index check", context="Test")
+
+        try:
+            VolumeIndicator(compute_vwap=True).calculate(self.df.reset_index(drop=True))
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "DatetimeIndex" in str(e)
+
+        self.reporter.info("VWAP index check enforced", context="Test")
+
+    def test_mfi_matches_definition(self):
+        """Test MFI equals 100 * positive / total flow over the window."""
+        self.reporter.info("Testing MFI", context="Test")
+
+        period = 14
+        df = self.df.iloc[:200]
+        mfi = VolumeIndicator(compute_mfi=True, mfi_period=period).calculate(df)["mfi"]
+
+        typical = ((df["high"] + df["low"] + df["close"]) / 3).to_numpy()
+        flow = typical * df["volume"].to_numpy()
+        i = 150
+        window = range(i - period + 1, i + 1)
+        positive = sum(flow[j] for j in window if typical[j] > typical[j - 1])
+        negative = sum(flow[j] for j in window if typical[j] < typical[j - 1])
+
+        assert np.isclose(mfi.iloc[i], 100 * positive / (positive + negative))
+        assert mfi.iloc[:period].isna().all()
+        assert mfi.iloc[period:].between(0, 100).all()
+
+        self.reporter.info("MFI matches definition", context="Test")
+
+    def test_ad_line(self):
+        """Test A/D accumulates close-location volume."""
+        self.reporter.info("Testing A/D line", context="Test")
+
+        df = pd.DataFrame(
+            {
+                "high": [10.0, 12.0, 11.0],
+                "low": [8.0, 10.0, 11.0],
+                "close": [10.0, 10.5, 11.0],
+                "volume": [100.0, 200.0, 300.0],
+            },
+            index=pd.date_range("2024-01-01", periods=3, freq="1min"),
+        )
+
+        ad = VolumeIndicator(sma_period=1, compute_ad=True).calculate(df)["ad"]
+
+        # CLV: +1, -0.5, 0 (zero-range candle)
+        np.testing.assert_allclose(ad, [100.0, 0.0, 0.0])
+
+        self.reporter.info("A/D line correct", context="Test")
+
+    def test_vwap_streaming_unsupported(self):
+        """Test seed() with VWAP enabled raises NotImplementedError."""
+        self.reporter.info("Testing VWAP streaming", context="Test")
+
+        try:
+            VolumeIndicator(compute_vwap=True).seed(self.df)
+            assert False, "Should have raised NotImplementedError"
+        except NotImplementedError as e:
+            assert "compute_vwap" in str(e)
+
+        self.reporter.info("VWAP streaming rejected", context="Test")
+
+    def test_pipeline_falls_back_for_flow_indicators(self):
+        """Test pipeline evaluates extended volume outputs via calculate()."""
+        self.reporter.info("Testing pipeline fallback", context="Test")
+
+        indicator = VolumeIndicator(compute_mfi=True, compute_ad=True)
+        pipeline = IndicatorPipeline([indicator])
+        (result,) = pipeline.run(self.df)
+
+        assert pipeline.stats.opaque == 1
+        assert set(result) == set(indicator.calculate(self.df))
+
+        self.reporter.info("Pipeline fallback correct", context="Test")
+
+    def test_missing_high_low(self):
+        """Test MFI without high/low columns raises KeyError."""
+        self.reporter.info("Testing missing columns", context="Test")
+
+        try:
+            VolumeIndicator(compute_mfi=True).calculate(self.df[["close", "volume"]])
+            assert False, "Should have raised KeyError"
+        except KeyError as e:
+            assert "high" in str(e)
+
+        self.reporter.info("Missing columns rejected", context="Test")
+
+    def test_invalid_params(self):
+        """Test invalid MFI period and VWAP anchor raise ValueError."""
+        self.reporter.info("Testing invalid params", context="Test")
+
+        invalid = [
+            {"mfi_period": 0},
+            {"vwap_anchor": "not-a-freq"},
+            {"vwap_anchor": None},
+            # Calendar offsets have no fixed duration to floor to
+            {"vwap_anchor": "W"},
+            {"vwap_anchor": "MS"},
+        ]
+        for kwargs in invalid:
+            try:
+                VolumeIndicator(**kwargs)
+                assert False, f"Should have raised ValueError for {kwargs}"
+            except ValueError:
+                pass
+
+        self.reporter.info("Invalid params rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestVolumeIndicator.run_as_main()
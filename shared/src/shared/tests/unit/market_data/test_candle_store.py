@@ -0,0 +1,204 @@
+"""
+Unit tests for CandleStore.
+
+Tests append/read round trips, capacity growth, zero-copy read-only
+views, reader visibility of writer appends and timestamp validation.
+
+Usage:
+    python tests/unit/market_data/test_candle_store.py
+    laborant test shared --unit
+"""
+
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import RSIIndicator
+from shared.market_data import CandleStore
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+
+def _assert_frame(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
+    """Compare stored candles ignoring index resolution and freq."""
+    pd.testing.assert_frame_equal(
+        actual, expected, check_freq=False, check_index_type=False
+    )
+
+
+class TestCandleStore(LaborantTest):
+    """Unit tests for CandleStore."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate candle history."""
+        self.df = generate_candles(1000)
+
+    def setup_test(self):
+        """Create an empty store directory per test."""
+        self.root = tempfile.mkdtemp(prefix="candle_store_")
+        self.store = CandleStore(self.root, initial_capacity=64)
+
+    def teardown_test(self):
+        """Remove store directory."""
+        self.store.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Test appended candles read back unchanged."""
+        self.reporter.info("Testing round trip", context="Test")
+
+        length = self.store.append("SOL/USDC", "1m", self.df.iloc[:50])
+
+        assert length == 50
+        _assert_frame(self.df.iloc[:50], self.store.read("SOL/USDC", "1m"))
+
+        self.reporter.info("Round trip correct", context="Test")
+
+    def test_growth_preserves_history(self):
+        """Test appends past capacity grow the file without data loss."""
+        self.reporter.info("Testing capacity growth", context="Test")
+
+        for start in range(0, len(self.df), 70):
+            self.store.append("SOL/USDC", "1m", self.df.iloc[start : start + 70])
+
+        assert self.store.length("SOL/USDC", "1m") == len(self.df)
+        _assert_frame(self.df, self.store.read("SOL/USDC", "1m"))
+
+        self.reporter.info("Growth preserved history", context="Test")
+
+    def test_reader_sees_appends(self):
+        """Test a separate read-only store sees committed appends."""
+        self.reporter.info("Testing reader visibility", context="Test")
+
+        self.store.append("SOL/USDC", "1m", self.df.iloc[:40])
+        reader = CandleStore(self.root, readonly=True)
+        assert reader.length("SOL/USDC", "1m") == 40
+
+        self.store.append("SOL/USDC", "1m", self.df.iloc[40:60])  # in place
+        assert reader.length("SOL/USDC", "1m") == 60
+
+        self.store.append("SOL/USDC", "1m", self.df.iloc[60:])  # grows file
+        _assert_frame(self.df, reader.read("SOL/USDC", "1m"))
+
+        self.reporter.info("Reader sees appends", context="Test")
+
+    def test_views_are_zero_copy_and_read_only(self):
+        """Test reads share the mapping and cannot be mutated."""
+        self.reporter.info("Testing zero-copy views", context="Test")
+
+        self.store.append("SOL/USDC", "1m", self.df)
+        arrays = self.store.arrays("SOL/USDC", "1m")
+        frame = self.store.read("SOL/USDC", "1m")
+
+        assert np.shares_memory(frame["close"].to_numpy(), arrays.close)
+        assert not arrays.close.flags.writeable
+
+        try:
+            arrays.close[0] = 0.0
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Views zero-copy and read-only", context="Test")
+
+    def test_indicator_on_view(self):
+        """Test indicators calculate directly on store views."""
+        self.reporter.info("Testing indicator input", context="Test")
+
+        self.store.append("SOL/USDC", "1m", self.df)
+        rsi = RSIIndicator(period=14)
+
+        np.testing.assert_array_equal(
+            rsi.calculate(self.store.read("SOL/USDC", "1m")).to_numpy(),
+            rsi.calculate(self.df).to_numpy(),
+        )
+
+        self.reporter.info("Indicator computed on view", context="Test")
+
+    def test_time_range(self):
+        """Test start/end select an inclusive time range."""
+        self.reporter.info("Testing time range", context="Test")
+
+        self.store.append("SOL/USDC", "1m", self.df)
+        start, end = self.df.index[100], self.df.index[199]
+
+        _assert_frame(
+            self.df.loc[start:end], self.store.read("SOL/USDC", "1m", start, end)
+        )
+
+        self.reporter.info("Time range correct", context="Test")
+
+    def test_series_listing(self):
+        """Test stored series are listed with decoded symbols."""
+        self.reporter.info("Testing series listing", context="Test")
+
+        self.store.append("SOL/USDC", "1m", self.df.iloc[:10])
+        self.store.append("SOL/USDC", "1h", self.df.iloc[:10])
+        self.store.append("BTC/USDC", "1m", self.df.iloc[:10])
+
+        assert self.store.series() == [
+            ("BTC/USDC", "1m"),
+            ("SOL/USDC", "1h"),
+            ("SOL/USDC", "1m"),
+        ]
+        assert self.store.has("SOL/USDC", "1h")
+        assert not self.store.has("ETH/USDC", "1m")
+
+        self.reporter.info("Series listed", context="Test")
+
+    def test_rejects_out_of_order(self):
+        """Test overlapping or unordered candles raise ValueError."""
+        self.reporter.info("Testing timestamp order", context="Test")
+
+        self.store.append("SOL/USDC", "1m", self.df.iloc[:50])
+
+        for bad in (self.df.iloc[40:60], self.df.iloc[60:70].iloc[::-1]):
+            try:
+                self.store.append("SOL/USDC", "1m", bad)
+                assert False, "Should have raised ValueError"
+            except ValueError:
+                pass
+
+        assert self.store.length("SOL/USDC", "1m") == 50
+
+        self.reporter.info("Out-of-order candles rejected", context="Test")
+
+    def test_missing_series_and_readonly(self):
+        """Test unknown series raise KeyError and readers cannot append."""
+        self.reporter.info("Testing missing series", context="Test")
+
+        try:
+            self.store.read("SOL/USDC", "1m")
+            assert False, "Should have raised KeyError"
+        except KeyError:
+            pass
+
+        reader = CandleStore(self.root, readonly=True)
+        try:
+            reader.append("SOL/USDC", "1m", self.df.iloc[:10])
+            assert False, "Should have raised PermissionError"
+        except PermissionError:
+            pass
+
+        self.reporter.info("Missing series and readonly enforced", context="Test")
+
+    def test_missing_column(self):
+        """Test candles without volume raise KeyError."""
+        self.reporter.info("Testing missing column", context="Test")
+
+        try:
+            self.store.append("SOL/USDC", "1m", self.df.drop(columns=["volume"]))
+            assert False, "Should have raised KeyError"
+        except KeyError as e:
+            assert "volume" in str(e)
+
+        self.reporter.info("Missing column rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestCandleStore.run_as_main()
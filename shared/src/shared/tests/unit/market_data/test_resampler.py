@@ -0,0 +1,330 @@
+"""
+Unit tests for MultiTimeframeResampler.
+
+Tests incremental aggregation against pandas resample (including
+missing candles), partial bars, cascade wiring and streaming closed
+bars into indicators.
+
+Usage:
+    python tests/unit/market_data/test_resampler.py
+    laborant test shared --unit
+"""
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import RSIIndicator
+from shared.market_data import MultiTimeframeResampler
+from shared.market_data.resampler import _Aggregator
+from shared.tests import LaborantTest
+from shared.tests.fixtures import generate_candles
+
+OHLCV_AGG = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+}
+
+
+def _pandas_resample(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Reference aggregation over the whole frame."""
+    return (
+        df.resample(pd.Timedelta(timeframe), origin="epoch", label="left")
+        .agg(OHLCV_AGG)
+        .dropna()
+    )
+
+
+class TestMultiTimeframeResampler(LaborantTest):
+    """Unit tests for MultiTimeframeResampler."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate 1m candles starting mid-bucket with a gap."""
+        df = generate_candles(3000).iloc[7:]
+        self.df = df.drop(df.index[100:110])
+
+    def test_matches_pandas_resample(self):
+        """Test closed bars equal pandas resample for every timeframe."""
+        self.reporter.info("Testing pandas parity", context="Test")
+
+        resampler = MultiTimeframeResampler("1m", ["5m", "15m", "1h", "3m"])
+        closed = resampler.consume(self.df)
+
+        for timeframe, bars in closed.items():
+            expected = _pandas_resample(self.df, timeframe).iloc[: len(bars)]
+            assert len(bars) > 0
+            pd.testing.assert_frame_equal(
+                bars, expected, check_freq=False, check_index_type=False
+            )
+
+        self.reporter.info("Closed bars match pandas", context="Test")
+
+    def test_partial_bar(self):
+        """Test partial() reflects the in-progress bucket."""
+        self.reporter.info("Testing partial bar", context="Test")
+
+        df = self.df.iloc[:-20]
+        resampler = MultiTimeframeResampler("1m", ["5m", "15m", "1h"])
+        closed = resampler.consume(df)
+
+        for timeframe in ("15m", "1h"):
+            expected = _pandas_resample(df, timeframe).iloc[len(closed[timeframe])]
+            partial = resampler.partial(timeframe)
+
+            assert partial["timestamp"] == expected.name
+            np.testing.assert_allclose(
+                [partial[k] for k in OHLCV_AGG], expected.to_numpy(), rtol=1e-12
+            )
+
+        self.reporter.info("Partial bar correct", context="Test")
+
+    def test_closes_on_last_candle(self):
+        """Test a bar closes as soon as its last base candle arrives."""
+        self.reporter.info("Testing close timing", context="Test")
+
+        resampler = MultiTimeframeResampler("1m", ["5m", "15m"])
+        df = generate_candles(15)
+
+        emitted = [
+            sorted(resampler.update(ts, row))
+            for ts, row in zip(df.index, df.to_dict("records"))
+        ]
+
+        assert emitted[4] == ["5m"]
+        assert emitted[14] == ["15m", "5m"]
+        assert resampler.partial("15m") is None
+
+        self.reporter.info("Bars close on time", context="Test")
+
+    def test_gap_closes_stale_and_current_bucket(self):
+        """Test one candle after a gap returns both bars it closes."""
+        self.reporter.info("Testing gap closing two buckets", context="Test")
+
+        df = generate_candles(10).iloc[[0, 1, 2, 9]]
+        resampler = MultiTimeframeResampler("1m", ["5m", "10m"])
+        seen = []
+        resampler.on_close("5m", lambda bar: seen.append(bar["timestamp"]))
+
+        for ts, row in zip(df.index[:3], df.to_dict("records")[:3]):
+            assert resampler.update(ts, row) == {}
+        closed = resampler.update(df.index[3], df.to_dict("records")[3])
+
+        start = df.index[0]
+        assert [bar["timestamp"] for bar in closed["5m"]] == [
+            start,
+            start + pd.Timedelta("5min"),
+        ]
+        assert closed["5m"][0]["close"] == df["close"].iloc[2]
+        assert seen == [bar["timestamp"] for bar in closed["5m"]]
+
+        # The parent timeframe folds both closed 5m bars
+        expected = _pandas_resample(df, "10m").iloc[0]
+        assert closed["10m"][0]["timestamp"] == start
+        assert closed["10m"][0]["volume"] == expected["volume"]
+        assert closed["10m"][0]["close"] == expected["close"]
+
+        self.reporter.info("Both bars emitted", context="Test")
+
+    def test_gap_emits_higher_timeframe_on_time(self):
+        """Test a gap closes a finished bar at the first candle past it."""
+        self.reporter.info("Testing streaming gap emission", context="Test")
+
+        df = generate_candles(21).iloc[list(range(10)) + [16, 20]]
+        rows = df.to_dict("records")
+        start = df.index[0]
+        resampler = MultiTimeframeResampler("1m", ["5m", "15m"])
+        seen = []
+        for timeframe in ("5m", "15m"):
+            resampler.on_close(
+                timeframe, lambda bar, tf=timeframe: seen.append((tf, bar["timestamp"]))
+            )
+
+        for ts, row in zip(df.index[:10], rows[:10]):
+            resampler.update(ts, row)
+        assert seen == [("5m", start), ("5m", start + pd.Timedelta("5min"))]
+        assert resampler.partial("15m")["timestamp"] == start
+
+        # 00:16 is past the 00:00 15m bucket, which closes now
+        closed = resampler.update(df.index[10], rows[10])
+        assert list(closed) == ["15m"]
+        expected = _pandas_resample(df.iloc[:10], "15m").iloc[0]
+        assert closed["15m"][0]["timestamp"] == start
+        assert closed["15m"][0]["close"] == expected["close"]
+        assert closed["15m"][0]["volume"] == expected["volume"]
+        assert seen[-1] == ("15m", start)
+        for timeframe in ("5m", "15m"):
+            partial = resampler.partial(timeframe)
+            assert partial["timestamp"] == start + pd.Timedelta("15min")
+            assert partial["close"] == rows[10]["close"]
+
+        # 00:20 closes the 00:15 5m bar; the 15m bucket stays open
+        closed = resampler.update(df.index[11], rows[11])
+        assert list(closed) == ["5m"]
+        assert seen[-1] == ("5m", start + pd.Timedelta("15min"))
+        assert resampler.partial("15m")["timestamp"] == start + pd.Timedelta("15min")
+        assert resampler.partial("15m")["close"] == rows[11]["close"]
+        assert len(seen) == 4
+
+        self.reporter.info("Higher timeframe emitted on time", context="Test")
+
+    def test_contiguous_candles_only_fold(self):
+        """Test candles without a gap never walk the cascade to flush."""
+        self.reporter.info("Testing fold-only cascade", context="Test")
+
+        df = generate_candles(600)
+        timeframes = ["2m", "4m", "8m", "16m", "32m", "64m", "128m", "256m"]
+        resampler = MultiTimeframeResampler("1m", timeframes)
+        calls = []
+        flush = _Aggregator.flush
+
+        def counting_flush(node, start, closed):
+            calls.append(node.timeframe)
+            flush(node, start, closed)
+
+        _Aggregator.flush = counting_flush
+        try:
+            resampler.consume(df)
+            assert calls == []
+
+            # A gap walks the cascade from the root
+            resampler.update(df.index[-1] + pd.Timedelta("3min"), df.iloc[-1])
+            assert calls[0] == "2m"
+        finally:
+            _Aggregator.flush = flush
+
+        self.reporter.info("No flush without a gap", context="Test")
+
+    def test_matches_pandas_resample_sparse(self):
+        """Test parity when a fifth of the candles are missing."""
+        self.reporter.info("Testing sparse pandas parity", context="Test")
+
+        df = generate_candles(3000)
+        keep = np.random.default_rng(5).random(len(df)) >= 0.2
+        df = df[keep]
+
+        closed = MultiTimeframeResampler("1m", ["3m", "5m", "15m"]).consume(df)
+
+        for timeframe, bars in closed.items():
+            expected = _pandas_resample(df, timeframe)
+            # Only the trailing bucket may still be open
+            assert len(expected) - len(bars) in (0, 1)
+            pd.testing.assert_frame_equal(
+                bars,
+                expected.iloc[: len(bars)],
+                check_freq=False,
+                check_index_type=False,
+            )
+
+        self.reporter.info("Sparse input matches pandas", context="Test")
+
+    def test_cascade_sources(self):
+        """Test timeframes aggregate from the largest dividing timeframe."""
+        self.reporter.info("Testing cascade", context="Test")
+
+        resampler = MultiTimeframeResampler("1m", ["1h", "5m", "15m", "3m", "4h"])
+
+        assert resampler.timeframes == ["3m", "5m", "15m", "1h", "4h"]
+        assert resampler.source_of("5m") == "1m"
+        assert resampler.source_of("15m") == "5m"
+        assert resampler.source_of("1h") == "15m"
+        assert resampler.source_of("4h") == "1h"
+
+        self.reporter.info("Cascade wired", context="Test")
+
+    def test_attach_streams_indicator(self):
+        """Test attached indicator tracks calculate() on resampled bars."""
+        self.reporter.info("Testing indicator streaming", context="Test")
+
+        bars_15m = _pandas_resample(self.df, "15m")
+        seed_bars = 100
+        cutoff = bars_15m.index[seed_bars]
+
+        rsi = RSIIndicator(period=14)
+        rsi.seed(bars_15m.iloc[:seed_bars])
+
+        resampler = MultiTimeframeResampler("1m", ["5m", "15m"])
+        resampler.attach("15m", rsi)
+        closes = []
+        resampler.on_close("15m", lambda bar: closes.append(bar["timestamp"]))
+
+        live = self.df.iloc[:-20]
+        closed = resampler.consume(live[live.index >= cutoff])["15m"]
+        expected = RSIIndicator(period=14).calculate(bars_15m)
+
+        # Next update continues exactly where the streamed bars left off
+        next_bar = bars_15m.iloc[seed_bars + len(closed)]
+        assert np.isclose(
+            rsi.update(next_bar), expected.iloc[seed_bars + len(closed)], rtol=1e-9
+        )
+        assert closes == list(closed.index)
+
+        self.reporter.info("Indicator streamed from resampler", context="Test")
+
+    def test_preserves_timezone(self):
+        """Test tz-aware input yields bars in the same timezone."""
+        self.reporter.info("Testing timezone", context="Test")
+
+        df = generate_candles(10).tz_localize("UTC")
+        resampler = MultiTimeframeResampler("1m", ["5m"])
+        bars = resampler.consume(df)["5m"]
+
+        assert str(bars.index.tz) == "UTC"
+        assert bars.index[0] == df.index[0]
+
+        self.reporter.info("Timezone preserved", context="Test")
+
+    def test_rejects_out_of_order(self):
+        """Test a candle not after the previous one raises ValueError."""
+        self.reporter.info("Testing out-of-order candle", context="Test")
+
+        resampler = MultiTimeframeResampler("1m", ["5m"])
+        row = self.df.iloc[0].to_dict()
+        resampler.update(self.df.index[1], row)
+
+        try:
+            resampler.update(self.df.index[0], row)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Out-of-order candle rejected", context="Test")
+
+    def test_invalid_timeframes(self):
+        """Test non-multiple, duplicate and unknown timeframes."""
+        self.reporter.info("Testing invalid timeframes", context="Test")
+
+        for timeframes in (["90s"], ["5m", "300s"], ["1m"], ["soon"]):
+            try:
+                MultiTimeframeResampler("1m", timeframes)
+                assert False, f"Should have raised ValueError for {timeframes}"
+            except ValueError:
+                pass
+
+        try:
+            MultiTimeframeResampler("1m", ["5m"]).partial("1h")
+            assert False, "Should have raised KeyError"
+        except KeyError:
+            pass
+
+        self.reporter.info("Invalid timeframes rejected", context="Test")
+
+    def test_attach_requires_seed(self):
+        """Test attaching an unseeded indicator raises ValueError."""
+        self.reporter.info("Testing unseeded attach", context="Test")
+
+        try:
+            MultiTimeframeResampler("1m", ["5m"]).attach("5m", RSIIndicator())
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "seed" in str(e)
+
+        self.reporter.info("Unseeded attach rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestMultiTimeframeResampler.run_as_main()
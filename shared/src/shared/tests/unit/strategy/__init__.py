@@ -0,0 +1 @@
+"""Unit tests for trading strategy base classes."""
@@ -0,0 +1,243 @@
+"""
+Unit tests for compiled strategy conditions.
+
+Tests that CompiledConditions plans and Condition.evaluate() match the
+bar-by-bar IndicatorBasedStrategy helpers on random condition trees,
+plus slot handling, validation and strategy integration.
+
+Usage:
+    python tests/unit/strategy/test_conditions.py
+    laborant test shared --unit
+"""
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from shared.strategy import CompiledConditions, VectorizedOperators
+from shared.strategy import conditions as c
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests import LaborantTest
+
+HISTORY = 25
+NAMES = ["CLOSE", "RSI", "FAST", "SLOW"]
+
+
+class _Strategy(IndicatorBasedStrategy):
+    """Strategy declaring condition trees."""
+
+    entry_condition = c.crosses_above("FAST", "SLOW") & c.compare("RSI", "<", 70)
+    exit_condition = c.crosses_below_threshold("RSI", 45) | c.highest("CLOSE", 10)
+
+    def check_entry_conditions(self, market_data):
+        return False
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+class _PlainStrategy(_Strategy):
+    """Strategy without condition trees."""
+
+    entry_condition = None
+    exit_condition = None
+
+
+def _indicators(bars: int = 300, seed: int = 9) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([-1.0, -0.5, 0.0, 0.5, 1.0], size=(4, bars))
+    df = pd.DataFrame(
+        {
+            "CLOSE": 100 + np.cumsum(steps[0]),
+            "RSI": np.clip(50 + 3 * np.cumsum(steps[1]), 0, 100),
+            "FAST": 100 + np.cumsum(steps[2]),
+            "SLOW": 100 + np.cumsum(steps[3]),
+        }
+    )
+    df.iloc[[40, 41], 0] = np.nan
+    return df
+
+
+def _random_leaf(rand: random.Random) -> c.Condition:
+    name, other = rand.sample(NAMES, 2)
+    periods = rand.choice([1, 2, 3, 10, HISTORY, HISTORY + 1])
+    return rand.choice(
+        [
+            lambda: c.rising(name),
+            lambda: c.falling(name),
+            lambda: c.rising_for(name, periods),
+            lambda: c.falling_for(name, periods),
+            lambda: c.highest(name, periods),
+            lambda: c.lowest(name, periods),
+            lambda: c.divergence_bullish("CLOSE", "RSI", periods),
+            lambda: c.divergence_bearish("CLOSE", "RSI", periods),
+            lambda: c.crosses_above(name, other),
+            lambda: c.crosses_below(name, other),
+            lambda: c.crosses_above_threshold("RSI", rand.choice([40.0, 50.0])),
+            lambda: c.crosses_below_threshold("RSI", rand.choice([50.0, 60.0])),
+            lambda: c.compare(name, rand.choice([">", "<=", "!="]), other),
+            lambda: c.compare("RSI", ">=", rand.choice([30, 50, 70])),
+        ]
+    )()
+
+
+def _random_tree(rand: random.Random, depth: int = 3) -> c.Condition:
+    if depth == 0 or rand.random() < 0.3:
+        return _random_leaf(rand)
+    children = [_random_tree(rand, depth - 1) for _ in range(rand.randint(1, 3))]
+    node = rand.choice([c.all_of, c.any_of])(*children)
+    return ~node if rand.random() < 0.2 else node
+
+
+def _helper_eval(strategy, condition: c.Condition, row) -> bool:
+    """Evaluate a tree through the bar-by-bar strategy helpers."""
+    op, args = condition.op, condition.args
+    if op == "all":
+        return all(_helper_eval(strategy, ch, row) for ch in condition.children)
+    if op == "any":
+        return any(_helper_eval(strategy, ch, row) for ch in condition.children)
+    if op == "not":
+        return not _helper_eval(strategy, condition.children[0], row)
+    if op == "compare":
+        left, symbol, right = args
+        left = row[left] if isinstance(left, str) else left
+        right = row[right] if isinstance(right, str) else right
+        return bool(c._COMPARISONS[symbol](left, right))
+    if op in ("rising", "falling"):
+        return getattr(strategy, f"_is_{op}")(args[0], row[args[0]])
+    if op in ("rising_for", "falling_for", "highest", "lowest"):
+        return getattr(strategy, f"_is_{op}")(args[0], row[args[0]], args[1])
+    if op.startswith("divergence"):
+        return getattr(strategy, f"_{op}")(
+            args[0], args[1], row[args[0]], row[args[1]], args[2]
+        )
+    if op in ("crosses_above", "crosses_below"):
+        return getattr(strategy, f"_{op}")(args[0], args[1], row[args[0]], row[args[1]])
+    return getattr(strategy, f"_{op}")(args[0], row[args[0]], args[1])
+
+
+class TestCompiledConditions(LaborantTest):
+    """Unit tests for Condition trees and CompiledConditions."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate indicator series."""
+        self.df = _indicators()
+        self.rows = self.df.to_dict("records")
+
+    def test_random_trees_match_helpers(self):
+        """Test compiled and vectorized results equal bar-by-bar helpers."""
+        self.reporter.info("Testing random condition trees", context="Test")
+
+        rand = random.Random(2)
+        ops = VectorizedOperators(self.df, history_length=HISTORY)
+
+        for _ in range(40):
+            entry, exit_ = _random_tree(rand), _random_tree(rand)
+            compiled = CompiledConditions(
+                entry, exit_, names=NAMES, history_length=HISTORY
+            )
+            strategy = _PlainStrategy("ref", "SOL/USDC", "1m")
+            strategy._max_history_length = HISTORY
+
+            expected, actual = [], []
+            for row in self.rows:
+                expected.append(
+                    (
+                        _helper_eval(strategy, entry, row),
+                        _helper_eval(strategy, exit_, row),
+                    )
+                )
+                actual.append(compiled.step(compiled.pack(row)))
+                strategy._update_previous_values(row)
+
+            assert actual == expected, f"Compiled mismatch for {entry} / {exit_}"
+            np.testing.assert_array_equal(entry.evaluate(ops), [e for e, _ in expected])
+            np.testing.assert_array_equal(exit_.evaluate(ops), [x for _, x in expected])
+
+        self.reporter.info("Random trees match helpers", context="Test")
+
+    def test_slots_and_plan(self):
+        """Test slot order, packing and flattened plans."""
+        self.reporter.info("Testing slots and plan", context="Test")
+
+        entry = c.all_of(c.rising("RSI"), c.all_of(c.rising("FAST"), c.rising("SLOW")))
+        compiled = CompiledConditions(entry, c.falling("CLOSE"))
+
+        assert compiled.slots == {"RSI": 0, "FAST": 1, "SLOW": 2, "CLOSE": 3}
+        assert len(entry.children) == 3
+        assert compiled.plan_size == 4
+        assert compiled.pack({"CLOSE": 1, "RSI": 2, "FAST": 3, "SLOW": 4}) == [
+            2,
+            3,
+            4,
+            1,
+        ]
+
+        assert compiled.step([50.0, 1.0, 1.0, 10.0]) == (False, False)
+        assert compiled.step([51.0, 2.0, 2.0, 9.0]) == (True, True)
+        assert compiled.check_entry([52.0, 3.0, 1.0, 9.0]) is False
+
+        self.reporter.info("Slots and plan correct", context="Test")
+
+    def test_empty_groups(self):
+        """Test all_of() is true and any_of() is false with no children."""
+        self.reporter.info("Testing empty groups", context="Test")
+
+        compiled = CompiledConditions(c.all_of(), c.any_of(), names=["X"])
+        assert compiled.step([1.0]) == (True, False)
+
+        self.reporter.info("Empty groups correct", context="Test")
+
+    def test_validation(self):
+        """Test invalid slot names, lengths and operators raise."""
+        self.reporter.info("Testing validation", context="Test")
+
+        try:
+            CompiledConditions(c.rising("RSI"), c.rising("EMA"), names=["RSI"])
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "EMA" in str(e)
+
+        compiled = CompiledConditions(c.rising("RSI"), c.falling("RSI"))
+        try:
+            compiled.step([1.0, 2.0])
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "slot order" in str(e)
+
+        try:
+            c.compare("RSI", "=>", 30)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Validation enforced", context="Test")
+
+    def test_strategy_integration(self):
+        """Test declared trees drive compile_conditions and generate_signals."""
+        self.reporter.info("Testing strategy integration", context="Test")
+
+        strategy = _Strategy("trees", "SOL/USDC", "1m")
+        compiled = strategy.compile_conditions(names=NAMES)
+        signals = strategy.generate_signals(self.df)
+
+        stepped = [compiled.step(compiled.pack(row)) for row in self.rows]
+        assert signals["entry"].tolist() == [e for e, _ in stepped]
+        assert signals["exit"].tolist() == [x for _, x in stepped]
+        assert signals["entry"].any() and signals["exit"].any()
+
+        try:
+            _PlainStrategy("plain", "SOL/USDC", "1m").compile_conditions()
+            assert False, "Should have raised NotImplementedError"
+        except NotImplementedError:
+            pass
+
+        self.reporter.info("Strategy integration works", context="Test")
+
+
+if __name__ == "__main__":
+    TestCompiledConditions.run_as_main()
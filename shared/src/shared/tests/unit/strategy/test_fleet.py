@@ -0,0 +1,249 @@
+"""
+Unit tests for StrategyFleet.
+
+Tests that fleet signals equal evaluating each strategy on its own
+indicators, inline and across worker processes, plus indicator
+sharing, latency reporting, positions and error isolation.
+
+Usage:
+    python tests/unit/strategy/test_fleet.py
+    laborant test shared --unit
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from shared.indicators import EMAIndicator, MACDIndicator, RSIIndicator
+from shared.strategy import FleetSignal, Position, StrategyError, StrategyFleet
+from shared.strategy.enums import PositionSide
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests import LaborantTest
+
+WARMUP = 40
+TICKS = 30
+
+
+class _CrossStrategy(IndicatorBasedStrategy):
+    """EMA crossover entry filtered by RSI, MACD histogram exit."""
+
+    def check_entry_conditions(self, market_data):
+        ind = market_data["indicators"]
+        threshold = self.config.get("rsi_max", 70)
+        return (
+            self._crosses_above("FAST", "SLOW", ind["FAST"], ind["SLOW"])
+            or self._is_rising_for("FAST", ind["FAST"], 3)
+        ) and ind["RSI"] < threshold
+
+    def check_exit_conditions(self, position, market_data):
+        ind = market_data["indicators"]
+        return ind["MACD.histogram"] < 0 or market_data["close"] < position.stop_loss
+
+
+class _FailingStrategy(_CrossStrategy):
+    """Strategy whose entry check always raises."""
+
+    def check_entry_conditions(self, market_data):
+        raise ValueError("broken")
+
+
+def _candles(bars: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(size=bars))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": rng.uniform(1, 10, bars),
+        }
+    )
+
+
+def _indicators(fast: int, slow: int):
+    return {
+        "FAST": EMAIndicator(period=fast),
+        "SLOW": EMAIndicator(period=slow),
+        "RSI": RSIIndicator(period=14),
+        "MACD": MACDIndicator(),
+    }
+
+
+def _configs():
+    """(name, symbol, fast, slow, rsi_max) for a small fleet."""
+    return [
+        ("a", "SOL/USDC", 5, 20, 70),
+        ("b", "SOL/USDC", 5, 20, 60),
+        ("c", "SOL/USDC", 8, 20, 80),
+        ("d", "BTC/USDC", 5, 20, 70),
+        ("e", "BTC/USDC", 8, 21, 65),
+    ]
+
+
+def _build(workers: int = 0) -> StrategyFleet:
+    fleet = StrategyFleet(workers=workers)
+    for name, symbol, fast, slow, rsi_max in _configs():
+        strategy = _CrossStrategy(name, symbol, "1m", {"rsi_max": rsi_max})
+        fleet.add(strategy, _indicators(fast, slow))
+    return fleet
+
+
+def _run(fleet: StrategyFleet, frames, positions=None):
+    signals = []
+    for t in range(WARMUP, WARMUP + TICKS):
+        for symbol, df in frames.items():
+            signals.extend(fleet.tick(symbol, "1m", df.iloc[: t + 1], positions))
+    return signals
+
+
+def _reference(frames):
+    """Each strategy computing its own indicators, tick by tick."""
+    strategies = []
+    for name, symbol, fast, slow, rsi_max in _configs():
+        strategy = _CrossStrategy(name, symbol, "1m", {"rsi_max": rsi_max})
+        strategies.append((strategy, _indicators(fast, slow)))
+
+    signals = []
+    for t in range(WARMUP, WARMUP + TICKS):
+        for symbol, df in frames.items():
+            window = df.iloc[: t + 1]
+            for strategy, indicators in strategies:
+                if strategy.symbol != symbol:
+                    continue
+                values = {}
+                for name, indicator in indicators.items():
+                    result = indicator.calculate(window)
+                    if isinstance(result, dict):
+                        for output, series in result.items():
+                            values[f"{name}.{output}"] = float(series.iloc[-1])
+                    else:
+                        values[name] = float(result.iloc[-1])
+                entry = strategy.check_entry_conditions({"indicators": values})
+                strategy._update_previous_values(values)
+                signals.append(FleetSignal(strategy.name, bool(entry), False))
+    return signals
+
+
+def _last_rsi(df: pd.DataFrame) -> float:
+    return float(RSIIndicator(period=14).calculate(df).iloc[-1])
+
+
+class TestStrategyFleet(LaborantTest):
+    """Unit tests for StrategyFleet."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate candles for two symbols."""
+        self.frames = {
+            "SOL/USDC": _candles(WARMUP + TICKS, seed=1),
+            "BTC/USDC": _candles(WARMUP + TICKS, seed=2),
+        }
+        self.expected = _reference(self.frames)
+
+    def test_inline_matches_individual_evaluation(self):
+        """Test shared indicators give the same signals as per-strategy ones."""
+        self.reporter.info("Testing inline fleet parity", context="Test")
+
+        signals = _run(_build(), self.frames)
+
+        assert signals == self.expected
+        assert any(s.entry for s in signals)
+
+        self.reporter.info("Inline fleet matches reference", context="Test")
+
+    def test_workers_match_inline(self):
+        """Test worker processes keep state and return signals in order."""
+        self.reporter.info("Testing worker fleet", context="Test")
+
+        fleet = _build(workers=2)
+        with fleet:
+            assert fleet.running
+            signals = _run(fleet, self.frames)
+
+        assert not fleet.running
+        assert signals == self.expected
+
+        # State accumulated in workers is taken back on close
+        strategy = fleet.strategies[0]
+        assert strategy.name == "a"
+        assert len(strategy._indicator_history["FAST"]) == TICKS
+        assert strategy._prev_indicators["RSI"] == _last_rsi(self.frames["SOL/USDC"])
+
+        self.reporter.info("Worker fleet matches inline", context="Test")
+
+    def test_shared_indicators_and_latency(self):
+        """Test identical indicators are computed once and latency reported."""
+        self.reporter.info("Testing sharing and latency", context="Test")
+
+        fleet = _build()
+        assert fleet.groups == [("SOL/USDC", "1m"), ("BTC/USDC", "1m")]
+        assert fleet.latency() == {}
+
+        _run(fleet, self.frames)
+        latency = fleet.latency()
+
+        sol = latency[("SOL/USDC", "1m")]
+        # EMA(5), EMA(8), EMA(20), RSI(14), MACD for three strategies
+        assert sol.strategies == 3 and sol.indicators == 5
+        assert latency[("BTC/USDC", "1m")].indicators == 6
+        assert sol.ticks == TICKS
+        assert 0 < sol.mean_ms <= sol.p95_ms <= sol.max_ms
+        assert sol.indicators_ms + sol.evaluate_ms <= sol.mean_ms * 1.01
+        assert set(sol.to_dict()) >= {"symbol", "p95_ms", "evaluate_ms"}
+
+        self.reporter.info("Indicators shared, latency reported", context="Test")
+
+    def test_positions_and_errors(self):
+        """Test exit is evaluated for open positions and errors are isolated."""
+        self.reporter.info("Testing positions and errors", context="Test")
+
+        fleet = StrategyFleet()
+        fleet.add(_CrossStrategy("ok", "SOL/USDC", "1m"), _indicators(5, 20))
+        fleet.add(_FailingStrategy("bad", "SOL/USDC", "1m"), _indicators(5, 20))
+        position = Position(
+            "p1", "SOL/USDC", PositionSide.LONG, 100.0, 1.0, datetime.now(), 1e9
+        )
+
+        df = self.frames["SOL/USDC"]
+        ok, bad = fleet.tick("SOL/USDC", "1m", df, positions={"ok": position})
+        assert ok == FleetSignal("ok", entry=False, exit=True)
+        assert not bad.entry and bad.error == "ValueError: broken"
+
+        assert fleet.tick("ETH/USDC", "1m", df) == []
+
+        self.reporter.info("Positions and errors handled", context="Test")
+
+    def test_validation(self):
+        """Test invalid configuration raises."""
+        self.reporter.info("Testing validation", context="Test")
+
+        fleet = _build()
+        try:
+            fleet.add(_CrossStrategy("a", "SOL/USDC", "1m"), {})
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "Duplicate" in str(e)
+
+        fleet.start()
+        try:
+            fleet.add(_CrossStrategy("z", "SOL/USDC", "1m"), {})
+            assert False, "Should have raised StrategyError"
+        except StrategyError:
+            pass
+        fleet.close()
+
+        try:
+            StrategyFleet(workers=-1)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Validation enforced", context="Test")
+
+
+if __name__ == "__main__":
+    TestStrategyFleet.run_as_main()
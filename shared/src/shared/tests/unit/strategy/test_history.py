@@ -0,0 +1,225 @@
+"""
+Unit tests for ring-buffer indicator history in trading strategies.
+
+Tests IndicatorHistory ring buffer and rolling extrema, and parity of
+the highest/lowest, rising_for/falling_for and divergence helpers with
+the previous list-based implementation.
+
+Usage:
+    python tests/unit/strategy/test_history.py
+    laborant test shared --unit
+"""
+
+import math
+import random
+
+import numpy as np
+
+from shared.strategy import IndicatorHistory
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests import LaborantTest
+
+
+class _Strategy(IndicatorBasedStrategy):
+    """Concrete strategy for exercising helper methods."""
+
+    def check_entry_conditions(self, market_data):
+        return False
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+class _ListHistory:
+    """Previous list-based history and helpers (reference behavior)."""
+
+    def __init__(self, max_length: int):
+        self.max_length = max_length
+        self.history = {}
+
+    def update(self, indicators):
+        for name, value in indicators.items():
+            self.history.setdefault(name, []).append(value)
+            if len(self.history[name]) > self.max_length:
+                self.history[name].pop(0)
+
+    def is_highest(self, name, current, periods):
+        history = self.history.get(name, [])
+        return len(history) >= periods and current == max(history[-periods:])
+
+    def is_lowest(self, name, current, periods):
+        history = self.history.get(name, [])
+        return len(history) >= periods and current == min(history[-periods:])
+
+    def is_rising_for(self, name, periods):
+        recent = self.history.get(name, [])[-(periods + 1) :]
+        if len(recent) < periods + 1:
+            return False
+        return all(recent[i] > recent[i - 1] for i in range(1, len(recent)))
+
+    def is_falling_for(self, name, periods):
+        recent = self.history.get(name, [])[-(periods + 1) :]
+        if len(recent) < periods + 1:
+            return False
+        return all(recent[i] < recent[i - 1] for i in range(1, len(recent)))
+
+    def divergence(self, price, indicator, cur_price, cur_ind, lookback, bullish):
+        prices = self.history.get(price, [])
+        values = self.history.get(indicator, [])
+        if len(prices) < lookback or len(values) < lookback or lookback < 2:
+            return False
+        if bullish:
+            return cur_price < min(prices[-lookback:][:-1]) and cur_ind > min(
+                values[-lookback:][:-1]
+            )
+        return cur_price > max(prices[-lookback:][:-1]) and cur_ind < max(
+            values[-lookback:][:-1]
+        )
+
+
+class TestIndicatorHistory(LaborantTest):
+    """Unit tests for IndicatorHistory and strategy trend helpers."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def test_ring_buffer_bounded(self):
+        """Test buffer keeps only the newest capacity values."""
+        self.reporter.info("Testing ring buffer capacity", context="Test")
+
+        history = IndicatorHistory(capacity=5)
+        for value in range(12):
+            history.push(value)
+
+        assert len(history) == 5
+        assert history[:] == [7.0, 8.0, 9.0, 10.0, 11.0]
+        assert history[-1] == 11.0
+        assert history[0] == 7.0
+        np.testing.assert_array_equal(history.to_numpy(), [7, 8, 9, 10, 11])
+
+        try:
+            history[5]
+            assert False, "Should have raised IndexError"
+        except IndexError:
+            pass
+
+        self.reporter.info("Ring buffer bounded", context="Test")
+
+    def test_rolling_extrema(self):
+        """Test rolling max/min against slicing for several windows and lags."""
+        self.reporter.info("Testing rolling extrema", context="Test")
+
+        rng = np.random.default_rng(3)
+        values = rng.integers(0, 20, 300).astype(float)
+        history = IndicatorHistory(capacity=50)
+
+        for i, value in enumerate(values):
+            history.push(value)
+            kept = values[max(0, i - 49) : i + 1]
+            for window, lag in ((1, 0), (5, 0), (13, 1), (49, 1), (50, 0)):
+                end = len(kept) - lag
+                expected = (
+                    kept[end - window : end] if end - window >= 0 else np.array([])
+                )
+                if len(expected) < window:
+                    assert math.isnan(history.rolling_max(window, lag))
+                    continue
+                assert history.rolling_max(window, lag) == expected.max()
+                assert history.rolling_min(window, lag) == expected.min()
+
+        assert math.isnan(history.rolling_max(51))
+        assert math.isnan(history.rolling_max(0))
+
+        self.reporter.info("Rolling extrema correct", context="Test")
+
+    def test_non_numeric_values(self):
+        """Test None values break runs and blank out window extrema."""
+        self.reporter.info("Testing non-numeric values", context="Test")
+
+        history = IndicatorHistory(capacity=10)
+        for value in (1.0, 2.0, None, 3.0, 4.0):
+            history.push(value)
+
+        assert history.rising_run == 1
+        assert math.isnan(history.rolling_max(3))
+        assert history.rolling_max(2) == 4.0
+
+        self.reporter.info("Non-numeric values handled", context="Test")
+
+    def test_helpers_match_list_implementation(self):
+        """Test strategy helpers match the previous list-based results."""
+        self.reporter.info("Testing helper parity", context="Test")
+
+        rand = random.Random(11)
+        strategy = _Strategy("parity", "SOL/USDC", "1m")
+        strategy._max_history_length = 40
+        reference = _ListHistory(40)
+
+        price, rsi = 100.0, 50.0
+        for _ in range(600):
+            price += rand.choice([-1.0, -0.5, 0.0, 0.5, 1.0])
+            rsi = min(100.0, max(0.0, rsi + rand.choice([-3.0, 0.0, 2.0, 3.0])))
+
+            for periods in (1, 3, 14, 40, 41):
+                for name, value in (("CLOSE", price), ("RSI", rsi)):
+                    assert strategy._is_highest(
+                        name, value, periods
+                    ) == reference.is_highest(name, value, periods)
+                    assert strategy._is_lowest(
+                        name, value, periods
+                    ) == reference.is_lowest(name, value, periods)
+                    assert strategy._is_rising_for(
+                        name, value, periods
+                    ) == reference.is_rising_for(name, periods)
+                    assert strategy._is_falling_for(
+                        name, value, periods
+                    ) == reference.is_falling_for(name, periods)
+
+            for lookback in (1, 2, 14, 40, 41):
+                for bullish in (True, False):
+                    helper = (
+                        strategy._divergence_bullish
+                        if bullish
+                        else strategy._divergence_bearish
+                    )
+                    assert helper(
+                        "CLOSE", "RSI", price, rsi, lookback
+                    ) == reference.divergence(
+                        "CLOSE", "RSI", price, rsi, lookback, bullish
+                    )
+
+            strategy._update_previous_values({"CLOSE": price, "RSI": rsi})
+            reference.update({"CLOSE": price, "RSI": rsi})
+
+        self.reporter.info("Helpers match list implementation", context="Test")
+
+    def test_unknown_indicator(self):
+        """Test helpers return False for names never stored."""
+        self.reporter.info("Testing unknown indicator", context="Test")
+
+        strategy = _Strategy("empty", "SOL/USDC", "1m")
+
+        assert not strategy._is_highest("RSI", 50.0, 3)
+        assert not strategy._is_lowest("RSI", 50.0, 3)
+        assert not strategy._is_rising_for("RSI", 50.0, 3)
+        assert not strategy._is_falling_for("RSI", 50.0, 3)
+        assert not strategy._divergence_bullish("CLOSE", "RSI", 1.0, 1.0)
+        assert not strategy._divergence_bearish("CLOSE", "RSI", 1.0, 1.0)
+
+        self.reporter.info("Unknown indicator handled", context="Test")
+
+    def test_invalid_capacity(self):
+        """Test capacity < 1 raises ValueError."""
+        self.reporter.info("Testing invalid capacity", context="Test")
+
+        try:
+            IndicatorHistory(capacity=0)
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "capacity" in str(e)
+
+        self.reporter.info("Invalid capacity rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestIndicatorHistory.run_as_main()
@@ -0,0 +1,112 @@
+"""
+Unit tests for lazy package exports.
+
+Tests that importing Position and the enums from shared.strategy does
+not import pandas or numpy, that every name in __all__ of the lazy
+packages still resolves to the object defined in its submodule, and
+that dir() and unknown attributes behave like an eager package.
+
+Usage:
+    python tests/unit/strategy/test_lazy_exports.py
+    laborant test shared --unit
+"""
+
+import importlib
+import json
+import subprocess
+import sys
+
+from shared.tests import LaborantTest
+
+LAZY_PACKAGES = ["shared", "shared.indicators", "shared.strategy", "shared.resilience"]
+
+
+def _fresh(code: str) -> dict:
+    """Run code in a new interpreter; it prints a JSON result."""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestLazyExports(LaborantTest):
+    """Unit tests for lazy __getattr__ exports."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def test_worker_imports_skip_pandas(self):
+        """Test Position and enums import without pandas or numpy."""
+        self.reporter.info("Testing light imports", context="Test")
+
+        loaded = _fresh(
+            "import json, sys\n"
+            "from shared.strategy import Position, PositionSide, PositionStatus\n"
+            "from shared.resilience import CircuitBreaker, timeout\n"
+            "import shared, shared.indicators\n"
+            "print(json.dumps({m: m in sys.modules for m in "
+            "('pandas', 'numpy', 'shared.indicators.adx', 'shared.blockchain')}))"
+        )
+        assert loaded == {
+            "pandas": False,
+            "numpy": False,
+            "shared.indicators.adx": False,
+            "shared.blockchain": False,
+        }, loaded
+
+        strategy_only = _fresh(
+            "import json, sys\n"
+            "from shared.strategy import TradingStrategy\n"
+            "print(json.dumps('pandas' in sys.modules))"
+        )
+        assert strategy_only is False
+
+        self.reporter.info("Light imports skip pandas", context="Test")
+
+    def test_all_names_resolve(self):
+        """Test every __all__ name resolves to its defining object."""
+        self.reporter.info("Testing __all__ resolution", context="Test")
+
+        for name in LAZY_PACKAGES:
+            package = importlib.import_module(name)
+            listing = dir(package)
+            for export in package.__all__:
+                value = getattr(package, export)
+                assert value is not None, (name, export)
+                assert export in listing, (name, export)
+                # Cached on the package after the first lookup
+                assert export in vars(package), (name, export)
+
+        from shared.indicators.rsi import RSIIndicator
+        from shared.resilience.timeout import timeout
+        from shared.strategy.position import Position
+
+        assert importlib.import_module("shared.indicators").RSIIndicator is RSIIndicator
+        assert importlib.import_module("shared.strategy").Position is Position
+        # Name shared with its submodule stays the decorator
+        assert importlib.import_module("shared.resilience").timeout is timeout
+
+        self.reporter.info("All exports resolve", context="Test")
+
+    def test_unknown_attribute(self):
+        """Test unknown names raise AttributeError."""
+        self.reporter.info("Testing unknown attributes", context="Test")
+
+        import shared.strategy
+
+        try:
+            shared.strategy.NoSuchStrategy
+            assert False, "Should have raised AttributeError"
+        except AttributeError as e:
+            assert "NoSuchStrategy" in str(e)
+
+        assert not hasattr(shared.strategy, "NoSuchStrategy")
+
+        self.reporter.info("Unknown attributes rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestLazyExports.run_as_main()
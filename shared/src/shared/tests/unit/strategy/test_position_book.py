@@ -0,0 +1,210 @@
+"""
+Unit tests for PositionBook.
+
+Tests that vectorized price updates fire the same stop loss / take
+profit exits and trail stops exactly like the scalar Position methods,
+plus index reuse, growth and validation.
+
+Usage:
+    python tests/unit/strategy/test_position_book.py
+    laborant test shared --unit
+"""
+
+import copy
+import pickle
+import random
+from datetime import datetime
+
+from shared.strategy import Position, PositionBook, PositionError
+from shared.strategy.enums import PositionSide, PositionStatus
+from shared.tests import LaborantTest
+
+SYMBOLS = ["SOL/USDC", "BTC/USDC", "ETH/USDC"]
+NOW = datetime(2025, 1, 1)
+
+
+def _random_position(rand: random.Random, i: int) -> Position:
+    side = rand.choice([PositionSide.LONG, PositionSide.SHORT])
+    entry = 100.0
+    sign = 1 if side == PositionSide.LONG else -1
+    return Position(
+        position_id=f"p{i}",
+        symbol=rand.choice(SYMBOLS),
+        side=side,
+        entry_price=entry,
+        size=rand.uniform(0.1, 2.0),
+        entry_time=NOW,
+        stop_loss=rand.choice([None, entry - sign * rand.uniform(1, 8)]),
+        take_profit=rand.choice([None, entry + sign * rand.uniform(1, 8)]),
+        trailing_stop=rand.choice([None, None, rand.uniform(0.5, 5)]),
+    )
+
+
+def _scalar_fired(position: Position, price: float):
+    position.update_price(price)
+    return position.should_stop_loss(price), position.should_take_profit(price)
+
+
+class TestPositionBook(LaborantTest):
+    """Unit tests for PositionBook and slotted Position."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def test_matches_scalar_positions(self):
+        """Test triggers and trailing stops equal the scalar methods."""
+        self.reporter.info("Testing parity with scalar positions", context="Test")
+
+        rand = random.Random(5)
+        book = PositionBook(capacity=16)
+        reference = {}
+        for i in range(600):
+            position = _random_position(rand, i)
+            reference[book.add(position)] = copy.copy(position)
+
+        prices = {symbol: 100.0 for symbol in SYMBOLS}
+        fired_total = 0
+        for _ in range(150):
+            symbol = rand.choice(SYMBOLS)
+            prices[symbol] += rand.uniform(-1.5, 1.5)
+            price = prices[symbol]
+
+            triggers = book.update(symbol, price)
+
+            expected_sl, expected_tp = set(), set()
+            for index, position in reference.items():
+                if position.symbol != symbol:
+                    continue
+                stop_hit, target_hit = _scalar_fired(position, price)
+                if stop_hit:
+                    expected_sl.add(index)
+                if target_hit:
+                    expected_tp.add(index)
+
+            assert set(triggers.stop_loss.tolist()) == expected_sl
+            assert set(triggers.take_profit.tolist()) == expected_tp
+
+            for index in triggers.indices.tolist():
+                closed = book.close(index, price, NOW)
+                expected = reference.pop(index)
+                assert closed.status == PositionStatus.CLOSED
+                assert closed.stop_loss == expected.stop_loss
+                fired_total += 1
+
+        assert fired_total > 50
+        for index, expected in reference.items():
+            position = book.position(index)
+            assert position.stop_loss == expected.stop_loss
+            assert position.highest_price == expected.highest_price
+            assert position.lowest_price == expected.lowest_price
+
+        self.reporter.info("Book matches scalar positions", context="Test")
+
+    def test_nan_price_matches_scalar_position(self):
+        """Test a NaN tick leaves extremes and trailing stops intact."""
+        self.reporter.info("Testing NaN price parity", context="Test")
+
+        for side, stop, prices in (
+            (PositionSide.LONG, 95.0, [101.0, float("nan"), 120.0, 110.0]),
+            (PositionSide.SHORT, 105.0, [99.0, float("nan"), 80.0, 90.0]),
+        ):
+            position = Position(
+                position_id="p",
+                symbol="SOL/USDC",
+                side=side,
+                entry_price=100.0,
+                size=1.0,
+                entry_time=NOW,
+                stop_loss=stop,
+                trailing_stop=2.0,
+            )
+            book = PositionBook()
+            index = book.add(copy.copy(position))
+
+            for price in prices:
+                triggers = book.update("SOL/USDC", price)
+                stop_hit, _ = _scalar_fired(position, price)
+                assert (index in triggers.stop_loss.tolist()) == stop_hit
+
+            assert stop_hit
+            stored = book.position(index)
+            assert stored.stop_loss == position.stop_loss
+            assert stored.highest_price == position.highest_price
+            assert stored.lowest_price == position.lowest_price
+
+        self.reporter.info("NaN tick ignored like Position", context="Test")
+
+    def test_indices_reuse_and_growth(self):
+        """Test indices are stable, reused after removal and capacity grows."""
+        self.reporter.info("Testing index management", context="Test")
+
+        rand = random.Random(1)
+        book = PositionBook(capacity=2)
+        indices = [book.add(_random_position(rand, i)) for i in range(5)]
+
+        assert indices == [0, 1, 2, 3, 4]
+        assert len(book) == 5
+
+        removed = book.remove(2)
+        assert 2 not in list(book)
+        assert 2 not in book.rows(removed.symbol).tolist()
+        assert book.add(_random_position(rand, 9)) == 2
+        assert sorted(list(book)) == indices
+
+        for symbol in SYMBOLS:
+            assert book.update(symbol, 100.0).stop_loss.dtype.kind == "i"
+        assert len(book.update("DOGE/USDC", 1.0)) == 0
+
+        self.reporter.info("Indices managed correctly", context="Test")
+
+    def test_position_is_slotted(self):
+        """Test Position has no per-instance dict and still pickles."""
+        self.reporter.info("Testing slotted Position", context="Test")
+
+        position = _random_position(random.Random(0), 0)
+        assert not hasattr(position, "__dict__")
+
+        try:
+            position.unknown_field = 1
+            assert False, "Should have raised AttributeError"
+        except AttributeError:
+            pass
+
+        restored = pickle.loads(pickle.dumps(position))
+        assert restored.position_id == position.position_id
+        assert restored.side == position.side
+
+        self.reporter.info("Position slotted", context="Test")
+
+    def test_validation(self):
+        """Test closed positions and unknown indices are rejected."""
+        self.reporter.info("Testing validation", context="Test")
+
+        book = PositionBook()
+        position = _random_position(random.Random(2), 0)
+        position.close(101.0, NOW)
+
+        try:
+            book.add(position)
+            assert False, "Should have raised PositionError"
+        except PositionError:
+            pass
+
+        for index in (0, -1, 10_000):
+            try:
+                book.position(index)
+                assert False, "Should have raised KeyError"
+            except KeyError:
+                pass
+
+        try:
+            PositionBook(capacity=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Validation enforced", context="Test")
+
+
+if __name__ == "__main__":
+    TestPositionBook.run_as_main()
@@ -0,0 +1,194 @@
+"""
+Unit tests for RiskLedger.
+
+Tests that the vectorized trade mask and position limits match
+TradingStrategy.can_trade() / calculate_position_size() across day
+rollovers, batched PnL recording, growth and validation.
+
+Usage:
+    python tests/unit/strategy/test_risk_ledger.py
+    laborant test shared --unit
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from shared.strategy import RiskLedger, RiskLimitError, TradingStrategy
+from shared.tests import LaborantTest
+
+START = datetime(2025, 3, 1, 22, 0)
+
+
+class _Strategy(TradingStrategy):
+    def check_entry_conditions(self, market_data):
+        return False
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+def _fleet(count: int, rand: random.Random):
+    strategies = []
+    for i in range(count):
+        config = {
+            "max_daily_loss": rand.choice([None, 0, 50.0, 200.0, -120.0]),
+            "max_position_size": rand.choice([None, 0, 0.05, 0.2]),
+            "position_percentage": rand.choice([5.0, 10.0, 25.0]),
+        }
+        strategies.append(_Strategy(f"s{i}", "SOL/USDC", "1m", config))
+    return strategies
+
+
+class TestRiskLedger(LaborantTest):
+    """Unit tests for RiskLedger."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def test_mask_matches_can_trade(self):
+        """Test may_trade() equals can_trade() over trades and days."""
+        self.reporter.info("Testing trade mask parity", context="Test")
+
+        rand = random.Random(4)
+        strategies = _fleet(300, rand)
+        ledger = RiskLedger(capacity=16)
+        for strategy in strategies:
+            ledger.add(strategy)
+
+        now = START
+        rollovers = 0
+        blocked_seen = False
+        for _ in range(120):
+            now += timedelta(minutes=rand.choice([5, 30, 90]))
+            rollovers += ledger.tick(now)
+            expected = np.array([s.can_trade(now) for s in strategies])
+
+            mask = ledger.may_trade()
+            assert np.array_equal(mask, expected)
+            blocked_seen |= not mask.all()
+
+            for strategy in rand.sample(strategies, 40):
+                pnl = rand.uniform(-60, 40)
+                strategy.record_trade(pnl)
+                ledger.record(strategy.name, pnl)
+
+            assert np.allclose(ledger.daily_pnl, [s.daily_pnl for s in strategies])
+
+        assert rollovers >= 3
+        assert blocked_seen
+        assert ledger.day == now.date()
+
+        self.reporter.info("Trade mask matches can_trade", context="Test")
+
+    def test_position_limits_match(self):
+        """Test position limits equal calculate_position_size() checks."""
+        self.reporter.info("Testing position limits", context="Test")
+
+        rand = random.Random(8)
+        strategies = _fleet(200, rand)
+        ledger = RiskLedger()
+        for strategy in strategies:
+            ledger.add(strategy)
+
+        price = 25.0
+        for balance in (0.0, 1_000.0, 50_000.0):
+            sizes = np.array([s.position_percentage for s in strategies])
+            values = balance * sizes / 100
+            expected = []
+            for strategy in strategies:
+                try:
+                    strategy.calculate_position_size(balance, price)
+                    expected.append(True)
+                except RiskLimitError:
+                    expected.append(False)
+
+            allowed = ledger.within_position_limit(values, balance)
+            assert np.array_equal(allowed, expected)
+
+        limits = ledger.max_position_value(1_000.0)
+        for strategy, limit in zip(strategies, limits):
+            if strategy.max_position_size:
+                assert limit == 1_000.0 * strategy.max_position_size
+            else:
+                assert limit == np.inf
+
+        self.reporter.info("Position limits match", context="Test")
+
+    def test_batched_records_and_carry_over(self):
+        """Test record_many() with repeated rows and daily_pnl carry-over."""
+        self.reporter.info("Testing batched records", context="Test")
+
+        ledger = RiskLedger(capacity=1)
+        ledger.tick(START)
+        names = []
+        for i in range(5):
+            strategy = _Strategy(f"b{i}", "SOL/USDC", "1m", {"max_daily_loss": 10})
+            strategy.can_trade(START)
+            strategy.record_trade(-1.0 * i)
+            names.append(strategy.name)
+            assert ledger.add(strategy) == i
+
+        # Carried over: last reset on the ledger's day
+        assert ledger.daily_pnl.tolist() == [0.0, -1.0, -2.0, -3.0, -4.0]
+
+        ledger.record_many(np.array([1, 1, 4, 2]), np.array([-5.0, -5.0, 3.0, 1.0]))
+        assert ledger.daily_pnl.tolist() == [0.0, -11.0, -1.0, -3.0, -1.0]
+        assert ledger.may_trade().tolist() == [True, False, True, True, True]
+
+        # Not carried over: reset on another day
+        stale = _Strategy("stale", "SOL/USDC", "1m")
+        stale.can_trade(START - timedelta(days=2))
+        stale.record_trade(-7.0)
+        ledger.add(stale)
+        assert ledger.daily_pnl[-1] == 0.0
+
+        assert ledger.tick(START + timedelta(hours=1)) is False
+        assert ledger.tick(START + timedelta(hours=3)) is True
+        assert not ledger.daily_pnl.any()
+        assert ledger.names == names + ["stale"]
+
+        self.reporter.info("Batched records correct", context="Test")
+
+    def test_validation(self):
+        """Test duplicates, unknown names/rows and read-only views."""
+        self.reporter.info("Testing validation", context="Test")
+
+        ledger = RiskLedger()
+        ledger.add(_Strategy("a", "SOL/USDC", "1m"))
+
+        try:
+            ledger.add(_Strategy("a", "SOL/USDC", "1m"))
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        for call in (
+            lambda: ledger.record("missing", 1.0),
+            lambda: ledger.record_many(np.array([0, 1]), np.array([1.0, 1.0])),
+            lambda: ledger.set_limits(3, 10.0, None),
+        ):
+            try:
+                call()
+                assert False, "Should have raised KeyError"
+            except KeyError:
+                pass
+
+        try:
+            ledger.daily_pnl[0] = 5.0
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        try:
+            RiskLedger(capacity=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        self.reporter.info("Validation enforced", context="Test")
+
+
+if __name__ == "__main__":
+    TestRiskLedger.run_as_main()
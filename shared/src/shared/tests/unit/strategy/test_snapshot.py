@@ -0,0 +1,322 @@
+"""
+Unit tests for strategy and position snapshots.
+
+Tests that restored strategies continue exactly like the original
+(history, trend runs, previous values, daily PnL), incremental snapshot
+chains, Position round trips and rejection of corrupt (including
+byte-flip fuzzed) or out-of-order snapshots without changing state.
+
+Usage:
+    python tests/unit/strategy/test_snapshot.py
+    laborant test shared --unit
+"""
+
+import math
+import random
+import struct
+import time
+import zlib
+from datetime import datetime, timezone
+
+import numpy as np
+
+from shared.strategy import Position, SnapshotError
+from shared.strategy.enums import PositionSide, PositionStatus
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests import LaborantTest
+
+NAMES = [f"IND_{i}" for i in range(20)]
+
+
+class _Strategy(IndicatorBasedStrategy):
+    """Concrete strategy for exercising state."""
+
+    def check_entry_conditions(self, market_data):
+        return False
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+def _bars(strategy: _Strategy, rand: random.Random, count: int) -> None:
+    for _ in range(count):
+        values = {name: rand.uniform(0, 100) for name in NAMES}
+        values["IND_0"] = rand.choice([None, 1.0, 2.0])
+        strategy._update_previous_values(values)
+
+
+def _state(strategy: _Strategy) -> dict:
+    histories = {
+        name: (
+            history.to_numpy().tolist(),
+            history.rising_run,
+            history.falling_run,
+            history.pushes,
+            history.rolling_max(10),
+        )
+        for name, history in strategy._indicator_history.items()
+    }
+    return {
+        "daily_pnl": strategy.daily_pnl,
+        "last_reset_date": strategy.last_reset_date,
+        "prev": strategy._prev_indicators,
+        "histories": repr(histories),
+    }
+
+
+def _position(**overrides) -> Position:
+    fields = dict(
+        position_id="p1",
+        symbol="SOL/USDC",
+        side=PositionSide.SHORT,
+        entry_price=101.5,
+        size=2.25,
+        entry_time=datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc),
+        stop_loss=104.0,
+        trailing_stop=1.5,
+        metadata={"signal": "rsi", "levels": [30, 70.5], "tags": {"live": True}},
+    )
+    fields.update(overrides)
+    return Position(**fields)
+
+
+def _resign(blob: bytes) -> bytes:
+    """Replace the CRC32 trailer so corruption reaches the decoder."""
+    body = blob[:-4]
+    return body + struct.pack("<I", zlib.crc32(body))
+
+
+def _fields(position: Position) -> dict:
+    return {name: getattr(position, name) for name in Position.__slots__}
+
+
+class TestStrategySnapshot(LaborantTest):
+    """Unit tests for TradingStrategy.snapshot() and Position.to_bytes()."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def test_full_snapshot_round_trip(self):
+        """Test a restored strategy continues exactly like the original."""
+        self.reporter.info("Testing full snapshot", context="Test")
+
+        rand = random.Random(1)
+        live = _Strategy("s", "SOL/USDC", "1m")
+        _bars(live, rand, 250)
+        live.can_trade(datetime(2025, 1, 1, 12, 0))
+        live.record_trade(-12.5)
+        position = _position()
+        position.update_price(99.0)
+
+        blob = live.snapshot([position])
+        start = time.perf_counter()
+        restored = _Strategy("s", "SOL/USDC", "1m")
+        positions = restored.restore(blob)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert _state(restored) == _state(live)
+        assert [_fields(p) for p in positions] == [_fields(position)]
+        # 20 histories of 100 float64 values, plus a small envelope
+        assert len(blob) < 20 * 100 * 8 * 1.2
+        assert elapsed_ms < 100, elapsed_ms
+
+        # Both continue identically
+        _bars(live, random.Random(2), 30)
+        _bars(restored, random.Random(2), 30)
+        assert _state(restored) == _state(live)
+        assert restored._is_highest("IND_3", 99.0, 20) == live._is_highest(
+            "IND_3", 99.0, 20
+        )
+
+        self.reporter.info("Full snapshot restored", context="Test")
+
+    def test_incremental_chain(self):
+        """Test incremental snapshots append only new rows, in order."""
+        self.reporter.info("Testing incremental snapshots", context="Test")
+
+        rand = random.Random(3)
+        live = _Strategy("s", "SOL/USDC", "1m")
+        _bars(live, rand, 150)
+        chain = [live.snapshot(incremental=True)]  # first one is full
+
+        for bars in (1, 5, 0, 120):
+            _bars(live, rand, bars)
+            live._update_previous_values({"NEW": float(bars)})
+            chain.append(live.snapshot(incremental=True))
+
+        full = live.snapshot()
+        assert len(chain[1]) < len(full) / 10
+        # 120 bars overflow the 100-value history: sent in full again
+        assert len(chain[-1]) > len(full) * 0.9
+
+        restored = _Strategy("s", "SOL/USDC", "1m")
+        for blob in chain:
+            restored.restore(blob)
+        assert _state(restored) == _state(live)
+        assert restored._snapshot_marks == live._snapshot_marks
+
+        # A restored strategy can extend the chain itself
+        _bars(restored, random.Random(9), 3)
+        _bars(live, random.Random(9), 3)
+        follower = _Strategy("s", "SOL/USDC", "1m")
+        for blob in chain:
+            follower.restore(blob)
+        follower.restore(restored.snapshot(incremental=True))
+        assert _state(follower) == _state(live)
+
+        self.reporter.info("Incremental chain restored", context="Test")
+
+    def test_position_round_trip(self):
+        """Test Position.to_bytes() keeps every field."""
+        self.reporter.info("Testing position snapshots", context="Test")
+
+        open_position = _position(take_profit=95.0)
+        closed = _position(side=PositionSide.LONG, stop_loss=None, metadata=None)
+        closed.update_price(110.0)
+        closed.close(108.0, datetime(2025, 1, 2))
+        bar_numbered = _position(entry_time=42)
+
+        for position in (open_position, closed, bar_numbered):
+            restored = Position.from_bytes(position.to_bytes())
+            assert _fields(restored) == _fields(position)
+            assert isinstance(restored.side, PositionSide)
+
+        assert closed.status == PositionStatus.CLOSED
+        assert math.isclose(closed.realized_pnl, 6.5 * 2.25)
+
+        try:
+            Position.from_bytes(_Strategy("s", "SOL/USDC", "1m").snapshot())
+            assert False, "Should have raised SnapshotError"
+        except SnapshotError:
+            pass
+
+        self.reporter.info("Positions round-trip", context="Test")
+
+    def test_rejected_snapshots_leave_state(self):
+        """Test corrupt, foreign and out-of-order snapshots raise."""
+        self.reporter.info("Testing rejected snapshots", context="Test")
+
+        rand = random.Random(5)
+        live = _Strategy("s", "SOL/USDC", "1m")
+        _bars(live, rand, 20)
+        full = live.snapshot()
+        _bars(live, rand, 2)
+        first = live.snapshot(incremental=True)
+        _bars(live, rand, 2)
+        second = live.snapshot(incremental=True)
+
+        target = _Strategy("s", "SOL/USDC", "1m")
+        target.restore(full)
+        before = _state(target)
+
+        bad = [
+            second,  # skips first
+            full[:-3],  # truncated
+            b"XXXX" + full[4:],  # wrong magic
+            full + b"\x00",  # trailing bytes
+            _Strategy("other", "SOL/USDC", "1m").snapshot(),
+        ]
+        for blob in bad:
+            try:
+                target.restore(blob)
+                assert False, "Should have raised SnapshotError"
+            except SnapshotError:
+                pass
+            assert _state(target) == before
+
+        target.restore(first)
+        target.restore(second)
+        assert _state(target) == _state(live)
+
+        unsupported = _Strategy("u", "SOL/USDC", "1m")
+        unsupported._update_previous_values({"OBJ": object()})
+        for call in (
+            unsupported.snapshot,
+            lambda: _position(metadata={1: "int key"}).to_bytes(),
+        ):
+            try:
+                call()
+                assert False, "Should have raised SnapshotError"
+            except SnapshotError:
+                pass
+
+        self.reporter.info("Rejected snapshots left state intact", context="Test")
+
+    def test_fuzzed_snapshots_raise_snapshot_error(self):
+        """Test byte-flipped snapshots only ever raise SnapshotError."""
+        self.reporter.info("Testing fuzzed snapshots", context="Test")
+
+        rand = random.Random(11)
+        live = _Strategy("s", "SOL/USDC", "1m")
+        live._prev_indicators["when"] = datetime(2025, 1, 1)
+        _bars(live, rand, 30)
+        full = live.snapshot(positions=[_position()])
+        closed = _position()
+        closed.close(99.0, datetime(2025, 1, 2, tzinfo=timezone.utc))
+        position = closed.to_bytes()
+
+        target = _Strategy("s", "SOL/USDC", "1m")
+        target.restore(full)
+        before = _state(target)
+
+        unsigned_rejected = 0
+        for trial in range(1500):
+            source = full if trial % 3 else position
+            blob = bytearray(source)
+            for _ in range(rand.randint(1, 3)):
+                blob[rand.randrange(len(blob) - 4)] ^= 1 << rand.randrange(8)
+
+            # Unsigned flips fail the checksum; re-signed ones hit the decoder
+            resign = trial % 2 == 0
+            blob = _resign(bytes(blob)) if resign else bytes(blob)
+            try:
+                if source is position:
+                    Position.from_bytes(blob)
+                else:
+                    target.restore(blob)
+                    target.restore(full)
+            except SnapshotError:
+                unsigned_rejected += not resign
+                assert _state(target) == before
+            else:
+                # Re-signed flips of float payloads decode to other values
+                assert resign
+
+        assert unsigned_rejected == 750
+        self.reporter.info("Fuzzed snapshots rejected cleanly", context="Test")
+
+    def test_values_round_trip(self):
+        """Test tagged values keep their types."""
+        self.reporter.info("Testing value types", context="Test")
+
+        strategy = _Strategy("v", "SOL/USDC", "1m")
+        values = {
+            "float": 1.5,
+            "nan": math.nan,
+            "int": -(2**40),
+            "bool": True,
+            "none": None,
+            "text": "crossed",
+            "raw": b"\x00\x01",
+            "np": np.float32(0.25),
+            "when": datetime(2025, 5, 6, 7, 8, 9, 10),
+            "nested": {"a": [1, (2, 3)]},
+        }
+        strategy._prev_indicators = values
+        restored = _Strategy("v", "SOL/USDC", "1m")
+        restored.restore(strategy.snapshot())
+
+        prev = restored._prev_indicators
+        assert math.isnan(prev.pop("nan"))
+        assert prev == {
+            **{k: v for k, v in values.items() if k != "nan"},
+            "np": 0.25,
+            "nested": {"a": [1, [2, 3]]},
+        }
+        assert type(prev["int"]) is int and type(prev["bool"]) is bool
+
+        self.reporter.info("Value types preserved", context="Test")
+
+
+if __name__ == "__main__":
+    TestStrategySnapshot.run_as_main()
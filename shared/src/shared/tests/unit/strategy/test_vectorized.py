@@ -0,0 +1,266 @@
+"""
+Unit tests for vectorized strategy condition operators.
+
+Tests that every VectorizedOperators operator and generate_signals()
+produce exactly the results of the bar-by-bar IndicatorBasedStrategy
+helpers, including NaN values and windows longer than the history.
+
+Usage:
+    python tests/unit/strategy/test_vectorized.py
+    laborant test shared --unit
+"""
+
+import numpy as np
+import pandas as pd
+
+from shared.strategy import VectorizedOperators
+from shared.strategy.indicator_based_strategy import IndicatorBasedStrategy
+from shared.tests import LaborantTest
+
+HISTORY = 30
+
+
+class _CrossStrategy(IndicatorBasedStrategy):
+    """Strategy with equivalent bar-by-bar and vectorized conditions."""
+
+    def check_entry_conditions(self, market_data):
+        return (
+            self._crosses_above(
+                "FAST", "SLOW", market_data["FAST"], market_data["SLOW"]
+            )
+            and not self._is_falling_for("RSI", market_data["RSI"], 2)
+        ) or self._divergence_bullish(
+            "CLOSE", "RSI", market_data["CLOSE"], market_data["RSI"], 10
+        )
+
+    def check_exit_conditions(self, position, market_data):
+        return self._crosses_below_threshold(
+            "RSI", market_data["RSI"], 40.0
+        ) or self._is_highest("CLOSE", market_data["CLOSE"], 20)
+
+    def vectorized_entry_conditions(self, ops):
+        return (
+            ops.crosses_above("FAST", "SLOW") & ~ops.is_falling_for("RSI", 2)
+        ) | ops.divergence_bullish("CLOSE", "RSI", 10)
+
+    def vectorized_exit_conditions(self, ops):
+        return ops.crosses_below_threshold("RSI", 40.0) | ops.is_highest("CLOSE", 20)
+
+
+class _PlainStrategy(IndicatorBasedStrategy):
+    """Strategy without a vectorized form."""
+
+    def check_entry_conditions(self, market_data):
+        return False
+
+    def check_exit_conditions(self, position, market_data):
+        return False
+
+
+def _indicators(bars: int = 400, seed: int = 5) -> pd.DataFrame:
+    """Coarse random walks (frequent ties) with a few NaN gaps."""
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([-1.0, -0.5, 0.0, 0.5, 1.0], size=(4, bars))
+    df = pd.DataFrame(
+        {
+            "CLOSE": 100 + np.cumsum(steps[0]),
+            "RSI": np.clip(50 + 3 * np.cumsum(steps[1]), 0, 100),
+            "FAST": 100 + np.cumsum(steps[2]),
+            "SLOW": 100 + np.cumsum(steps[3]),
+        },
+        index=pd.date_range("2024-01-01", periods=bars, freq="1min"),
+    )
+    df.iloc[[50, 51, 200], 0] = np.nan
+    df.iloc[[120], 1] = np.nan
+    return df
+
+
+def _bar_by_bar(df: pd.DataFrame, evaluate) -> np.ndarray:
+    """Run evaluate(strategy, row) per bar, updating history afterwards."""
+    strategy = _PlainStrategy("loop", "SOL/USDC", "1m")
+    strategy._max_history_length = HISTORY
+
+    results = []
+    for row in df.to_dict("records"):
+        results.append(bool(evaluate(strategy, row)))
+        strategy._update_previous_values(row)
+    return np.array(results)
+
+
+class TestVectorizedOperators(LaborantTest):
+    """Unit tests for VectorizedOperators and generate_signals()."""
+
+    component_name = "shared"
+    test_category = "unit"
+
+    def setup(self):
+        """Generate indicator series."""
+        self.df = _indicators()
+        self.ops = VectorizedOperators(self.df, history_length=HISTORY)
+
+    def _assert_parity(self, vectorized, evaluate, label):
+        expected = _bar_by_bar(self.df, evaluate)
+        mismatches = np.flatnonzero(np.asarray(vectorized) != expected)
+        assert not len(mismatches), f"{label}: mismatch at bars {mismatches[:10]}"
+
+    def test_trend_operators(self):
+        """Test rising/falling and rising_for/falling_for parity."""
+        self.reporter.info("Testing trend operators", context="Test")
+
+        for name in ("CLOSE", "RSI"):
+            self._assert_parity(
+                self.ops.is_rising(name),
+                lambda s, r: s._is_rising(name, r[name]),
+                f"rising {name}",
+            )
+            self._assert_parity(
+                self.ops.is_falling(name),
+                lambda s, r: s._is_falling(name, r[name]),
+                f"falling {name}",
+            )
+            for periods in (0, 1, 2, 3, HISTORY - 1, HISTORY):
+                self._assert_parity(
+                    self.ops.is_rising_for(name, periods),
+                    lambda s, r: s._is_rising_for(name, r[name], periods),
+                    f"rising_for {name} {periods}",
+                )
+                self._assert_parity(
+                    self.ops.is_falling_for(name, periods),
+                    lambda s, r: s._is_falling_for(name, r[name], periods),
+                    f"falling_for {name} {periods}",
+                )
+
+        self.reporter.info("Trend operators match", context="Test")
+
+    def test_extreme_operators(self):
+        """Test highest/lowest parity, including windows beyond history."""
+        self.reporter.info("Testing highest/lowest", context="Test")
+
+        for name in ("CLOSE", "RSI"):
+            for periods in (1, 2, 5, 20, HISTORY, HISTORY + 1):
+                self._assert_parity(
+                    self.ops.is_highest(name, periods),
+                    lambda s, r: s._is_highest(name, r[name], periods),
+                    f"highest {name} {periods}",
+                )
+                self._assert_parity(
+                    self.ops.is_lowest(name, periods),
+                    lambda s, r: s._is_lowest(name, r[name], periods),
+                    f"lowest {name} {periods}",
+                )
+
+        self.reporter.info("Highest/lowest match", context="Test")
+
+    def test_divergence_operators(self):
+        """Test bullish/bearish divergence parity."""
+        self.reporter.info("Testing divergence", context="Test")
+
+        for lookback in (1, 2, 3, 14, HISTORY, HISTORY + 1):
+            self._assert_parity(
+                self.ops.divergence_bullish("CLOSE", "RSI", lookback),
+                lambda s, r: s._divergence_bullish(
+                    "CLOSE", "RSI", r["CLOSE"], r["RSI"], lookback
+                ),
+                f"bullish {lookback}",
+            )
+            self._assert_parity(
+                self.ops.divergence_bearish("CLOSE", "RSI", lookback),
+                lambda s, r: s._divergence_bearish(
+                    "CLOSE", "RSI", r["CLOSE"], r["RSI"], lookback
+                ),
+                f"bearish {lookback}",
+            )
+
+        self.reporter.info("Divergence matches", context="Test")
+
+    def test_cross_operators(self):
+        """Test indicator and threshold crossover parity."""
+        self.reporter.info("Testing crossovers", context="Test")
+
+        self._assert_parity(
+            self.ops.crosses_above("FAST", "SLOW"),
+            lambda s, r: s._crosses_above("FAST", "SLOW", r["FAST"], r["SLOW"]),
+            "crosses_above",
+        )
+        self._assert_parity(
+            self.ops.crosses_below("FAST", "SLOW"),
+            lambda s, r: s._crosses_below("FAST", "SLOW", r["FAST"], r["SLOW"]),
+            "crosses_below",
+        )
+        for threshold in (40.0, 50.0, 60.0):
+            self._assert_parity(
+                self.ops.crosses_above_threshold("RSI", threshold),
+                lambda s, r: s._crosses_above_threshold("RSI", r["RSI"], threshold),
+                f"crosses_above_threshold {threshold}",
+            )
+            self._assert_parity(
+                self.ops.crosses_below_threshold("RSI", threshold),
+                lambda s, r: s._crosses_below_threshold("RSI", r["RSI"], threshold),
+                f"crosses_below_threshold {threshold}",
+            )
+
+        self.reporter.info("Crossovers match", context="Test")
+
+    def test_generate_signals_matches_bar_by_bar(self):
+        """Test strategy signal vectors equal per-bar condition checks."""
+        self.reporter.info("Testing generate_signals", context="Test")
+
+        strategy = _CrossStrategy("cross", "SOL/USDC", "1m")
+        strategy._max_history_length = HISTORY
+        signals = strategy.generate_signals(self.df)
+
+        loop = _CrossStrategy("cross", "SOL/USDC", "1m")
+        loop._max_history_length = HISTORY
+        entries, exits = [], []
+        for row in self.df.to_dict("records"):
+            entries.append(loop.check_entry_conditions(row))
+            exits.append(loop.check_exit_conditions(None, row))
+            loop._update_previous_values(row)
+
+        assert list(signals.columns) == ["entry", "exit"]
+        assert signals.index.equals(self.df.index)
+        np.testing.assert_array_equal(signals["entry"].to_numpy(), entries)
+        np.testing.assert_array_equal(signals["exit"].to_numpy(), exits)
+        assert signals["entry"].any() and signals["exit"].any()
+
+        self.reporter.info("Signals match bar-by-bar path", context="Test")
+
+    def test_not_implemented(self):
+        """Test strategies without vectorized conditions raise."""
+        self.reporter.info("Testing missing vectorized form", context="Test")
+
+        try:
+            _PlainStrategy("plain", "SOL/USDC", "1m").generate_signals(self.df)
+            assert False, "Should have raised NotImplementedError"
+        except NotImplementedError as e:
+            assert "_PlainStrategy" in str(e)
+
+        self.reporter.info("Missing vectorized form rejected", context="Test")
+
+    def test_invalid_inputs(self):
+        """Test length mismatch, bad history and unknown names."""
+        self.reporter.info("Testing invalid inputs", context="Test")
+
+        try:
+            VectorizedOperators({"A": np.zeros(3), "B": np.zeros(4)})
+            assert False, "Should have raised ValueError"
+        except ValueError as e:
+            assert "lengths" in str(e)
+
+        try:
+            VectorizedOperators(self.df, history_length=0)
+            assert False, "Should have raised ValueError"
+        except ValueError:
+            pass
+
+        try:
+            self.ops.is_rising("MISSING")
+            assert False, "Should have raised KeyError"
+        except KeyError as e:
+            assert "MISSING" in str(e)
+
+        self.reporter.info("Invalid inputs rejected", context="Test")
+
+
+if __name__ == "__main__":
+    TestVectorizedOperators.run_as_main()